@@ -0,0 +1,46 @@
+"""0037 매뉴얼 PDF 조각 저장소 — manual_pdf_blobs + manual_pdf_artifacts.page_manifest
+
+Revision ID: a8192b3c0037
+Revises: f7081a2b0036
+Create Date: 2026-10-18
+
+변경 페이지 번들과 검토용 전체 PDF 가 같은 페이지 bytes 를 후보·버전마다 다시 bytea 로
+저장하던 것을, 내용 hash(sha256) 주소의 조각 저장소에 1회만 두고 artifact 는 조각 목록
+(page_manifest: [{"hash", "from"?, "to"?}, ...])만 기록하도록 바꾼다. PDF 는 조회 시
+pdf_artifact_cache 가 조립한다.
+
+- 기존 artifact(pdf_blob 보유)는 그대로 서빙된다. 다음 전체 PDF 합성 때
+  배포본이 조각 저장소로 옮겨진다(manual_update_pg_service._artifact_segments).
+
+additive — 테이블 1개 + nullable 컬럼 1개, 기존 컬럼 무변경.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'a8192b3c0037'
+down_revision: Union[str, Sequence[str], None] = 'f7081a2b0036'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'manual_pdf_blobs',
+        sa.Column('content_hash', sa.Text(), primary_key=True),
+        sa.Column('pdf_blob', sa.LargeBinary(), nullable=False),
+        sa.Column('page_count', sa.Integer(), nullable=True),
+        sa.Column('byte_size', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False,
+                  server_default=sa.text('now()')),
+    )
+    op.add_column('manual_pdf_artifacts',
+                  sa.Column('page_manifest', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('manual_pdf_artifacts', 'page_manifest')
+    op.drop_table('manual_pdf_blobs')
@@ -0,0 +1,53 @@
+"""0038 일정 증분 동기화 — event_sync_states + event_date_changes
+
+GET /events 가 테넌트의 전체 일정 이력을 매번 내려주던 것을, 달력이 보는 기간(from/to)만
+읽고 이후엔 "버전 N 이후 바뀐 날짜"만 받도록 바꾼다.
+
+- event_sync_states: 테넌트별 변경 카운터(일정 저장/삭제마다 +1, 행 잠금으로 커밋 순서 보장).
+- event_date_changes: 날짜별 마지막 변경 버전 — 삭제된 날짜도 남아 증분 응답에 빈 목록으로 실린다.
+- 기존 행은 버전 0 — 첫 기간 조회(버전 0)가 이를 포함하므로 백필 불필요.
+
+additive — 테이블 2개 추가, 기존 테이블 무변경. (tenant_id, date_str) 인덱스는 0002 의
+idx_events_tenant_date 를 그대로 쓴다.
+
+Revision ID: b9203c4d0038
+Revises: a8192b3c0037
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'b9203c4d0038'
+down_revision: Union[str, Sequence[str], None] = 'a8192b3c0037'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'event_sync_states',
+        sa.Column('tenant_id', sa.Text(), primary_key=True),
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False,
+                  server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.tenant_id'], onupdate='CASCADE'),
+    )
+    op.create_table(
+        'event_date_changes',
+        sa.Column('tenant_id', sa.Text(), nullable=False),
+        sa.Column('date_str', sa.Text(), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('tenant_id', 'date_str'),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.tenant_id'], onupdate='CASCADE'),
+    )
+    op.create_index('idx_event_date_changes_tenant_version', 'event_date_changes',
+                    ['tenant_id', 'version'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_event_date_changes_tenant_version', table_name='event_date_changes')
+    op.drop_table('event_date_changes')
+    op.drop_table('event_sync_states')
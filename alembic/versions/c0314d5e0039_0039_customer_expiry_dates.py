@@ -0,0 +1,88 @@
+"""0039 고객 만기일 DATE 그림자 컬럼 — customers.card_expiry_on/passport_expiry_on
+
+Revision ID: c0314d5e0039
+Revises: b9203c4d0038
+Create Date: 2026-10-18
+
+만기 알림(GET /customers/expiry-alerts)이 테넌트 고객 전체를 읽어 pandas 로 TEXT 만기일을
+파싱하던 것을, DATE 컬럼 + 부분 인덱스 범위 조회로 바꾼다. TEXT 원문(card_expiry_date /
+passport_expiry_date)은 그대로 두고(프론트·문서 호환) 쓰기 경로가 그림자 컬럼을 함께 갱신한다
+(customer_pg_service.apply_expiry_shadows).
+
+- 기존 행은 아래 UPDATE 로 1회 backfill — date_normalize.parse_date_only 와 같은 규칙
+  ('YYYY-MM-DD[ T..]', 'YYYY.MM.DD' / 'YYYY/MM/DD', 'YYYYMMDD', 실재하는 날짜만). 나머지는 NULL.
+- idx_customers_card_expiry_on / idx_customers_passport_expiry_on:
+  (tenant_id, *_expiry_on, customer_id) WHERE deleted_at IS NULL AND *_expiry_on IS NOT NULL
+  — 테넌트별 만기 범위 + keyset 페이지 순서를 인덱스만으로 처리.
+
+additive — 컬럼 2개 + 부분 인덱스 2개, 기존 컬럼/인덱스 무변경.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c0314d5e0039'
+down_revision: Union[str, Sequence[str], None] = 'b9203c4d0038'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_PATTERNS = (
+    r'^([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})(?:[ T].*)?$',
+    r'^([0-9]{4})[./]([0-9]{1,2})[./]([0-9]{1,2})(?:[ T].*)?$',
+    r'^([0-9]{4})([0-9]{2})([0-9]{2})$',
+)
+
+
+def _parts(col: str) -> str:
+    """TEXT 날짜 → int[] {년, 월, 일} (형식 불일치면 NULL)."""
+    v = rf"btrim({col}, E' \t\r\n')"
+    return "coalesce(" + ", ".join(f"regexp_match({v}, '{p}')" for p in _PATTERNS) + ")::int[]"
+
+
+def _to_date(m: str) -> str:
+    # CASE 중첩으로 평가 순서를 고정 — 범위 밖 월에 make_date 를 호출하지 않는다.
+    return (
+        f"CASE WHEN {m}[1] >= 1 AND {m}[2] BETWEEN 1 AND 12 AND {m}[3] >= 1 THEN "
+        f"CASE WHEN {m}[3] <= extract(day from make_date({m}[1], {m}[2], 1) "
+        f"+ interval '1 month' - interval '1 day') "
+        f"THEN make_date({m}[1], {m}[2], {m}[3]) END END"
+    )
+
+
+def upgrade() -> None:
+    op.add_column('customers', sa.Column('card_expiry_on', sa.Date(), nullable=True))
+    op.add_column('customers', sa.Column('passport_expiry_on', sa.Date(), nullable=True))
+
+    op.execute(
+        f"""
+        UPDATE customers c
+        SET card_expiry_on     = {_to_date('p.card')},
+            passport_expiry_on = {_to_date('p.pass')}
+        FROM (
+            SELECT id,
+                   {_parts('card_expiry_date')} AS card,
+                   {_parts('passport_expiry_date')} AS pass
+            FROM customers
+            WHERE coalesce(card_expiry_date, '') <> '' OR coalesce(passport_expiry_date, '') <> ''
+        ) p
+        WHERE c.id = p.id
+        """
+    )
+
+    op.create_index(
+        'idx_customers_card_expiry_on', 'customers',
+        ['tenant_id', 'card_expiry_on', 'customer_id'], unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL AND card_expiry_on IS NOT NULL'))
+    op.create_index(
+        'idx_customers_passport_expiry_on', 'customers',
+        ['tenant_id', 'passport_expiry_on', 'customer_id'], unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL AND passport_expiry_on IS NOT NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('idx_customers_passport_expiry_on', table_name='customers')
+    op.drop_index('idx_customers_card_expiry_on', table_name='customers')
+    op.drop_column('customers', 'passport_expiry_on')
+    op.drop_column('customers', 'card_expiry_on')
@@ -0,0 +1,66 @@
+"""0033 통합검색 trigram 인덱스 (pg_trgm GIN 식 인덱스)
+
+통합검색(routers/search.py → services/search_pg_service.py)이 소스별 검색 문서 식
+``coalesce(col, '') || ' ' || ...`` 에 ``ILIKE '%q%'`` 를 건다. 이 식과 **같은 식**(같은 컬럼·
+같은 순서·같은 구분자)의 GIN(gin_trgm_ops) 식 인덱스를 만들어 부분일치 검색이 테넌트 전체
+스캔 없이 인덱스를 타게 한다.
+
+- pg_trgm 확장이 필요하다(``CREATE EXTENSION IF NOT EXISTS``; Render PG 허용 확장).
+- 추가만(additive) — 테이블/컬럼 변경 없음. 단일 head 유지.
+- 컬럼 목록은 search_pg_service 의 *_SEARCH_COLUMNS 와 같아야 한다(변경 시 새 migration).
+
+Revision ID: c4d5e6f70033
+Revises: b2c3d4e50032
+Create Date: 2026-10-18
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "c4d5e6f70033"
+down_revision: Union[str, Sequence[str], None] = "b2c3d4e50032"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (인덱스명, 테이블, 검색 문서 컬럼) — search_pg_service.*_SEARCH_COLUMNS 와 동일.
+_SEARCH_DOCS = (
+    ("idx_customers_search_trgm", "customers", (
+        "customer_id", "korean_name", "surname_en", "given_en", "passport_no",
+        "nationality", "reg_front", "phone1", "phone2", "phone3", "address",
+        "visa_status", "visa_type", "memo",
+    )),
+    ("idx_active_tasks_search_trgm", "active_tasks",
+     ("category", "name", "work", "details", "customer_id")),
+    ("idx_planned_tasks_search_trgm", "planned_tasks", ("period", "content", "note")),
+    ("idx_completed_tasks_search_trgm", "completed_tasks",
+     ("category", "name", "work", "details", "customer_id")),
+    ("idx_board_posts_search_trgm", "board_posts",
+     ("category", "title", "content", "office_name")),
+)
+
+
+def _doc_sql(columns: tuple[str, ...]) -> str:
+    return " || ' ' || ".join(f"coalesce({c}, '')" for c in columns)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, columns in _SEARCH_DOCS:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+            f"USING gin (({_doc_sql(columns)}) gin_trgm_ops)"
+        )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_work_ref_rows_search_trgm ON work_reference_rows "
+        "USING gin ((CAST(data AS TEXT)) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_work_ref_rows_search_trgm")
+    for name, _table, _columns in reversed(_SEARCH_DOCS):
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    # pg_trgm 확장은 다른 객체가 쓸 수 있으므로 남겨둔다.
@@ -0,0 +1,34 @@
+"""0034 고객 keyset 페이지 인덱스
+
+customer_pg_service.query_customers 는 (length(customer_id) DESC, customer_id DESC) 로 정렬하고
+마지막 고객ID 를 커서로 다음 페이지를 읽는다. 같은 식의 부분 인덱스(비삭제 행)를 만들어
+페이지 조회가 테넌트 전체 정렬 없이 인덱스 순서로 LIMIT 건만 읽게 한다.
+
+- 추가만(additive) — 테이블/컬럼 변경 없음. 단일 head 유지.
+
+Revision ID: d5e6f7080034
+Revises: c4d5e6f70033
+Create Date: 2026-10-18
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "d5e6f7080034"
+down_revision: Union[str, Sequence[str], None] = "c4d5e6f70033"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_customers_tenant_keyset ON customers "
+        "(tenant_id, length(customer_id) DESC, customer_id DESC) "
+        "WHERE deleted_at IS NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_customers_tenant_keyset")
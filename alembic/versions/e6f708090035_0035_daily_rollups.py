@@ -0,0 +1,62 @@
+"""0035 일일결산 일/월 롤업 — daily_rollups, daily_rollup_states
+
+Revision ID: e6f708090035
+Revises: d5e6f7080034
+Create Date: 2026-10-18
+
+월간결산/연간추이/카드·수입 요약/세무 요약이 매 요청마다 테넌트 전체 daily_entries 를
+읽어 파이썬에서 다시 집계하던 것을, 엔트리 저장 트랜잭션에서 증분 갱신되는 롤업 행으로
+대체한다(backend/services/daily_rollup_service.py).
+
+- daily_rollups: (tenant_id, grain 'day'|'month', period) 당 1행. 스칼라 합계 + breakdown JSONB.
+- daily_rollup_states: 테넌트별 집계 버전. 행이 없으면 첫 조회에서 전체 재집계하므로
+  이 마이그레이션은 데이터를 채우지 않는다(backfill 배치 없음).
+
+additive — 신규 테이블 2개, 기존 데이터/테이블 무변경.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'e6f708090035'
+down_revision: Union[str, Sequence[str], None] = 'd5e6f7080034'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_SCALARS = (
+    'entry_count', 'income_cash', 'income_etc', 'exp_cash', 'exp_etc', 'cash_out',
+    'card_expense', 'card_income', 'card_income_count', 'reported_sales',
+    'ops_count', 'ops_sales', 'ops_expense', 'ops_card_expense',
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'daily_rollups',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('tenant_id', sa.Text(), nullable=False),
+        sa.Column('grain', sa.Text(), nullable=False),
+        sa.Column('period', sa.Text(), nullable=False),
+        *[sa.Column(c, sa.BigInteger(), nullable=False, server_default='0') for c in _SCALARS],
+        sa.Column('breakdown', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.tenant_id'], onupdate='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('tenant_id', 'grain', 'period', name='uq_daily_rollup_period'),
+    )
+    op.create_table(
+        'daily_rollup_states',
+        sa.Column('tenant_id', sa.Text(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('rebuilt_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.tenant_id'], onupdate='CASCADE'),
+        sa.PrimaryKeyConstraint('tenant_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('daily_rollup_states')
+    op.drop_table('daily_rollups')
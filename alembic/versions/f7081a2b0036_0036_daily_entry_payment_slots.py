@@ -0,0 +1,70 @@
+"""0036 일일결산 결제 슬롯 컬럼 — daily_entries.inc_method/exp1_*/exp2_*/tax_invoice
+
+Revision ID: f7081a2b0036
+Revises: e6f708090035
+Create Date: 2026-10-18
+
+프론트가 memo 에 ``[KID]inc=..;e1=..;e1a=..;e2=..;e2a=..;tax=..[/KID]`` 로 묶어 보내는
+결제 슬롯을 쓰기 시 1회 파싱해 컬럼으로 보관한다(daily_pg_service.memo_slots). 롤업 재집계와
+진행업무 반영은 정규식 대신 컬럼을 읽는다. memo 원문은 그대로 둔다(프론트 호환).
+
+- 기존 행은 아래 UPDATE 로 memo_slots 와 같은 규칙으로 backfill(중복 키만 첫 값 기준).
+  금액은 콤마 제거 후 숫자면 정수 절사, 아니면 0. 블록 없는 레거시 행은 NULL/0/false.
+- idx_daily_tenant_inc_method: 테넌트별 결제수단 조회용.
+
+additive — 컬럼 6개 + 인덱스 1개, 기존 컬럼 무변경.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'f7081a2b0036'
+down_revision: Union[str, Sequence[str], None] = 'e6f708090035'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _slot(key: str) -> str:
+    return rf"substring(k.blk from ';{key}=([^;]*)')"
+
+
+def _amount(key: str) -> str:
+    v = f"btrim(replace(coalesce({_slot(key)}, ''), ',', ''))"
+    return (rf"CASE WHEN {v} ~ '^[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)$' "
+            rf"THEN trunc({v}::numeric)::integer ELSE 0 END")
+
+
+def upgrade() -> None:
+    op.add_column('daily_entries', sa.Column('inc_method', sa.Text(), nullable=True))
+    op.add_column('daily_entries', sa.Column('exp1_method', sa.Text(), nullable=True))
+    op.add_column('daily_entries', sa.Column('exp1_amount', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('daily_entries', sa.Column('exp2_method', sa.Text(), nullable=True))
+    op.add_column('daily_entries', sa.Column('exp2_amount', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('daily_entries', sa.Column('tax_invoice', sa.Boolean(), nullable=False,
+                                             server_default=sa.text('false')))
+    op.execute(
+        f"""
+        UPDATE daily_entries d
+        SET inc_method  = NULLIF({_slot('inc')}, ''),
+            exp1_method = NULLIF({_slot('e1')}, ''),
+            exp1_amount = {_amount('e1a')},
+            exp2_method = NULLIF({_slot('e2')}, ''),
+            exp2_amount = {_amount('e2a')},
+            tax_invoice = coalesce(btrim({_slot('tax')}) IN ('1', 'true', 'True'), false)
+        FROM (
+            SELECT id, ';' || substring(memo from '\\[KID\\](.*?)\\[/KID\\]') || ';' AS blk
+            FROM daily_entries
+            WHERE memo LIKE '%[KID]%'
+        ) k
+        WHERE d.id = k.id AND k.blk IS NOT NULL
+        """
+    )
+    op.create_index('idx_daily_tenant_inc_method', 'daily_entries', ['tenant_id', 'inc_method'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_daily_tenant_inc_method', table_name='daily_entries')
+    for col in ('tax_invoice', 'exp2_amount', 'exp2_method', 'exp1_amount', 'exp1_method', 'inc_method'):
+        op.drop_column('daily_entries', col)
@@ -74,11 +74,14 @@ def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
     # 관리자가 비활성화/삭제/강등한 계정의 기존 토큰(최대 8h)이 계속 쓰이는 것을 막는다.
     # PG 미구성 환경(레거시)에서는 JWT 값을 그대로 사용한다(가용성 우선).
     role: str = str(payload.get("role", "") or ("admin" if is_admin else "user"))
+    # 계정/테넌트/세션 상태는 짧게 캐시되고, 미스 시 1회 결합 조회로 채운다(auth_state_cache).
+    # revoke/비활성화/정지 쓰기는 커밋 후 모든 워커의 캐시를 무효화한다.
+    from backend.services.auth_state_cache import AuthState
+    auth_state = AuthState(login_id, tenant_id, payload.get("sid") or "")
     try:
         from backend.db.session import is_configured
         if is_configured():
-            from backend.services.auth_pg_service import account_auth_status
-            info = account_auth_status(login_id)
+            info = auth_state.account()
             if info["status"] in ("disabled", "missing"):
                 raise HTTPException(
                     status_code=401,
@@ -123,8 +126,7 @@ def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
         except Exception:
             enforce_tenant = False
     if enforce_tenant:
-        from backend.services.auth_pg_service import tenant_service_status
-        tst = tenant_service_status(tenant_id)  # 예외 없이 상태 문자열 반환(오류도 문자열)
+        tst = auth_state.tenant_status()  # 예외 없이 상태 문자열 반환(오류도 문자열)
         if tst not in ("active", "pending_activation"):
             _code = "TENANT_SUSPENDED" if tst in ("suspended", "terminated") else "TENANT_UNAVAILABLE"
             raise HTTPException(
@@ -154,8 +156,7 @@ def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
                                 detail={"code": "SESSION_EXPIRED", "message": "세션이 만료되었습니다. 다시 로그인해 주세요."},
                                 headers={"WWW-Authenticate": "Bearer"})
         try:
-            from backend.services.session_pg_service import session_status
-            st = session_status(sid)
+            st = auth_state.session_status()
         except Exception:
             # 세션 저장소 조회 실패 시 인증을 막지 않는다(가용성 우선) — 기존 동작 유지.
             st = "active"
@@ -13,9 +13,9 @@ from backend.db.models.tenant import Tenant  # noqa: F401
 from backend.db.models.user import AccountUser  # noqa: F401
 from backend.db.models.audit import AuditLog  # noqa: F401
 from backend.db.models.customer import Customer  # noqa: F401
-from backend.db.models.event import Event  # noqa: F401
+from backend.db.models.event import Event, EventDateChange, EventSyncState  # noqa: F401
 from backend.db.models.memo import Memo  # noqa: F401
-from backend.db.models.daily import DailyEntry, DailyBalance  # noqa: F401
+from backend.db.models.daily import DailyEntry, DailyBalance, DailyRollup, DailyRollupState  # noqa: F401
 from backend.db.models.task import ActiveTask, PlannedTask, CompletedTask  # noqa: F401
 from backend.db.models.relationship import AccommodationProvider, GuarantorConnection  # noqa: F401
 from backend.db.models.signature import (  # noqa: F401
@@ -34,7 +34,7 @@ from backend.db.models.manual_update import (  # noqa: F401
     ManualBaseVersion, ManualBasePage, ManualBaseRef,
     ManualUpdateRun, ManualUpdateVersion, ManualUpdateChangedPage,
     ManualUpdateCandidate, ManualReviewDecision, ManualReviewDecisionArchive,
-    ManualUpdateState, ManualPdfArtifact,
+    ManualUpdateState, ManualPdfArtifact, ManualPdfBlob,
     ManualUpdateAlertEvent, ManualUpdateAlertDismissal,
 )
 from backend.db.models.manual_source_pdf import ManualSourcePdf  # noqa: F401
@@ -55,7 +55,7 @@ from backend.db.models.activation_token import ActivationToken  # noqa: F401
 __all__ = [
     "Tenant", "AccountUser", "AuditLog",
     "Customer", "Event", "Memo",
-    "DailyEntry", "DailyBalance",
+    "DailyEntry", "DailyBalance", "DailyRollup", "DailyRollupState",
     "ActiveTask", "PlannedTask", "CompletedTask",
     "AccommodationProvider", "GuarantorConnection",
     "AgentSignature", "CustomerSignature", "TempSignatureSlot", "SignaturePadToken",
@@ -67,7 +67,7 @@ __all__ = [
     "ManualBaseVersion", "ManualBasePage", "ManualBaseRef",
     "ManualUpdateRun", "ManualUpdateVersion", "ManualUpdateChangedPage",
     "ManualUpdateCandidate", "ManualReviewDecision", "ManualReviewDecisionArchive",
-    "ManualUpdateState", "ManualPdfArtifact", "ManualSourcePdf",
+    "ManualUpdateState", "ManualPdfArtifact", "ManualPdfBlob", "ManualSourcePdf",
     "FixedExpense", "MonthlyTaxSummary",
     "GuidelineCategory", "GuidelineCategoryOverride", "GuidelineV3Edit",
     "UserSession", "RoiPreset",
@@ -9,7 +9,10 @@ shapes so the existing router and frontend keep working unchanged.
 Date columns are stored as TEXT (not DATE) because the app returns
 date strings as-is — and frontends already tolerate ``YYYY-MM-DD``,
 ``YYYY.MM.DD``, blanks, etc. Storing as TEXT preserves round-trip fidelity
-and avoids surprise reformatting.
+and avoids surprise reformatting. The two expiry dates additionally have
+normalized DATE shadow columns (``card_expiry_on`` / ``passport_expiry_on``,
+migration 0039) maintained by the write paths, so expiry-alert range queries
+can use partial indexes instead of parsing text across the whole book.
 
 Sensitive fields (``passport_no``, ``reg_back``) are stored as plaintext
 **for the local beta only** — a deliberate trade-off so PDF generation and
@@ -19,9 +22,9 @@ LOCAL_USABLE_POSTGRES_FINAL_REPORT.md §"Sensitive-data handling".
 """
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Text, UniqueConstraint, func
+from sqlalchemy import BigInteger, Date, DateTime, ForeignKey, Index, Text, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.db.base import Base
@@ -55,6 +58,9 @@ class Customer(Base):
     card_expiry_date: Mapped[str | None] = mapped_column(Text)       # 만기일
     passport_issue_date: Mapped[str | None] = mapped_column(Text)    # 발급
     passport_expiry_date: Mapped[str | None] = mapped_column(Text)   # 만기
+    # 만기일 DATE 그림자(migration 0039) — 쓰기 경로가 TEXT 와 함께 갱신, 판독 불가/빈값은 NULL.
+    card_expiry_on: Mapped[date | None] = mapped_column(Date)
+    passport_expiry_on: Mapped[date | None] = mapped_column(Date)
 
     address: Mapped[str | None] = mapped_column(Text)      # 주소
     phone1: Mapped[str | None] = mapped_column(Text)       # 연
@@ -91,4 +97,8 @@ class Customer(Base):
         Index("idx_customers_tenant_alive", "tenant_id", postgresql_where=(deleted_at.is_(None))),
         Index("idx_customers_card_expiry", "card_expiry_date"),
         Index("idx_customers_passport_expiry", "passport_expiry_date"),
+        Index("idx_customers_card_expiry_on", "tenant_id", "card_expiry_on", "customer_id",
+              postgresql_where=(deleted_at.is_(None) & card_expiry_on.is_not(None))),
+        Index("idx_customers_passport_expiry_on", "tenant_id", "passport_expiry_on", "customer_id",
+              postgresql_where=(deleted_at.is_(None) & passport_expiry_on.is_not(None))),
     )
@@ -4,8 +4,22 @@
 stored as INTEGER (cents-free won amounts are always integral in the
 current app); the app also coerces them via ``_safe_int``.
 
+The payment slots the frontend packs into ``memo`` as
+``[KID]inc=..;e1=..;e1a=..;e2=..;e2a=..;tax=..[/KID]`` are also stored as
+typed columns (``inc_method``, ``exp1_method``/``exp1_amount``,
+``exp2_method``/``exp2_amount``, ``tax_invoice``), parsed once on write by
+``daily_pg_service``. ``memo`` keeps the packed block for the frontend.
+
 ``daily_balances`` collapses the two-row "잔액" layout into a single
 row per tenant (cash, profit) — much simpler to keep consistent.
+
+``daily_rollups`` holds per-tenant day/month aggregates of ``daily_entries``
+(sales/expense/card totals + category/hour/weekday breakdowns). They are
+maintained incrementally by ``daily_rollup_service`` in the same transaction
+as every entry upsert/delete, so the analytics endpoints read a handful of
+rollup rows instead of the tenant's whole settlement history.
+``daily_rollup_states`` records which rollup version a tenant was last
+rebuilt with (missing/old version → rebuilt lazily on next read).
 """
 from __future__ import annotations
 
@@ -13,6 +27,7 @@ from datetime import datetime
 
 from sqlalchemy import (
     BigInteger,
+    Boolean,
     DateTime,
     ForeignKey,
     Index,
@@ -21,6 +36,7 @@ from sqlalchemy import (
     UniqueConstraint,
     func,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.db.base import Base
@@ -46,6 +62,13 @@ class DailyEntry(Base):
     cash_out: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     memo: Mapped[str | None] = mapped_column(Text)
     customer_id: Mapped[str | None] = mapped_column(Text)
+    # memo [KID] 결제 슬롯(쓰기 시 1회 파싱). 레거시(블록 없음)=NULL/0/false.
+    inc_method: Mapped[str | None] = mapped_column(Text)
+    exp1_method: Mapped[str | None] = mapped_column(Text)
+    exp1_amount: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    exp2_method: Mapped[str | None] = mapped_column(Text)
+    exp2_amount: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    tax_invoice: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default="false")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
@@ -59,6 +82,7 @@ class DailyEntry(Base):
     __table_args__ = (
         UniqueConstraint("tenant_id", "entry_id", name="uq_daily_entry_per_tenant"),
         Index("idx_daily_tenant_date", "tenant_id", "date"),
+        Index("idx_daily_tenant_inc_method", "tenant_id", "inc_method"),
     )
 
 
@@ -78,3 +102,56 @@ class DailyBalance(Base):
         server_default=func.now(),
         onupdate=func.now(),
     )
+
+
+class DailyRollup(Base):
+    __tablename__ = "daily_rollups"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    tenant_id: Mapped[str] = mapped_column(
+        Text, ForeignKey("tenants.tenant_id", onupdate="CASCADE"), nullable=False
+    )
+    grain: Mapped[str] = mapped_column(Text, nullable=False)    # "day" | "month"
+    period: Mapped[str] = mapped_column(Text, nullable=False)   # "YYYY-MM-DD" | "YYYY-MM"
+    # 전체 행 기준
+    entry_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    income_cash: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    income_etc: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    exp_cash: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    exp_etc: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    cash_out: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    card_expense: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    card_income: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    card_income_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    reported_sales: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    # 현금출금 제외(업무 실적) 기준
+    ops_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    ops_sales: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    ops_expense: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    ops_card_expense: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    # {"cat"|"ops_cat"|"hour"|"dow": {키: [합계, 건수]}} — cat/hour/dow=순이익, ops_cat=매출
+    breakdown: Mapped[dict | None] = mapped_column(JSONB)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "grain", "period", name="uq_daily_rollup_period"),
+    )
+
+
+class DailyRollupState(Base):
+    __tablename__ = "daily_rollup_states"
+
+    tenant_id: Mapped[str] = mapped_column(
+        Text,
+        ForeignKey("tenants.tenant_id", onupdate="CASCADE"),
+        primary_key=True,
+    )
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    rebuilt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
@@ -3,6 +3,13 @@
 Rows store events as a flat list of (date_str, event_text)
 rows; the frontend then groups by date_str. We keep the same shape in PG
 to make the repository translation trivial — no schema mismatch to bridge.
+
+``event_sync_states`` holds a per-tenant change counter and
+``event_date_changes`` the counter value of the last write to each date
+(saves *and* deletes). Clients that already hold a date range ask for
+"dates changed since version N" instead of re-reading the range, and deleted
+days still show up (as empty lists) because the change row outlives the
+event rows.
 """
 from __future__ import annotations
 
@@ -29,3 +36,27 @@ class Event(Base):
     )
 
     __table_args__ = (Index("idx_events_tenant_date", "tenant_id", "date_str"),)
+
+
+class EventSyncState(Base):
+    __tablename__ = "event_sync_states"
+
+    tenant_id: Mapped[str] = mapped_column(
+        Text, ForeignKey("tenants.tenant_id", onupdate="CASCADE"), primary_key=True
+    )
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+
+
+class EventDateChange(Base):
+    __tablename__ = "event_date_changes"
+
+    tenant_id: Mapped[str] = mapped_column(
+        Text, ForeignKey("tenants.tenant_id", onupdate="CASCADE"), primary_key=True
+    )
+    date_str: Mapped[str] = mapped_column(Text, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    __table_args__ = (Index("idx_event_date_changes_tenant_version", "tenant_id", "version"),)
@@ -305,6 +305,8 @@ class ManualPdfArtifact(Base):
     page_to: Mapped[int | None] = mapped_column(Integer)
     page_numbers: Mapped[list | None] = mapped_column(JSONB)        # 비연속 페이지 목록
     pdf_blob: Mapped[bytes | None] = mapped_column(LargeBinary)     # bytea (changed-page PDF 우선)
+    # pdf_blob 대신 manual_pdf_blobs 조각 목록 [{"hash", "from"?, "to"?}, ...] 로 표현(조립은 조회 시).
+    page_manifest: Mapped[list | None] = mapped_column(JSONB)
     pdf_path: Mapped[str | None] = mapped_column(Text)              # 파일 저장소 확장 대비(nullable)
     page_count: Mapped[int | None] = mapped_column(Integer)
     file_size: Mapped[int | None] = mapped_column(Integer)
@@ -323,6 +325,22 @@ class ManualPdfArtifact(Base):
     )
 
 
+class ManualPdfBlob(Base):
+    """내용 주소(sha256) PDF 조각 — 변경 페이지 1쪽 PDF, 배포본 전체 PDF 등.
+
+    같은 내용은 한 번만 저장된다. artifact.page_manifest 가 이 hash 와 페이지 범위를
+    나열하고, 번들/검토용 전체 PDF 는 조회 시 조립한다(pdf_artifact_cache)."""
+    __tablename__ = "manual_pdf_blobs"
+
+    content_hash: Mapped[str] = mapped_column(Text, primary_key=True)
+    pdf_blob: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    page_count: Mapped[int | None] = mapped_column(Integer)
+    byte_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
 # ── 매뉴얼 업데이트 알림 (첨부파일 제목 변동 → 전 사용자 최초 로그인 알림) ──────────
 class ManualUpdateAlertEvent(Base):
     """첨부파일 제목 변동 감지 시 1건 생성되는 알림 이벤트.
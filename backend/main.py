@@ -187,7 +187,40 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"[manual-alert] title-watch 등록 실패 (non-fatal): {e}")
 
+    # 응답 캐시 워커 간 무효화(PG LISTEN/NOTIFY) — PG 구성 시에만, 실패해도 기동은 계속.
+    try:
+        from backend.services.cache_service import start_bus
+        if start_bus():
+            print("[cache] cross-worker invalidation bus started (LISTEN/NOTIFY)")
+    except Exception as e:
+        print(f"[cache] invalidation bus disabled (non-fatal): {e}")
+
+    # 서명 이벤트 푸시(SSE) 워커 간 전달 — 미구성/실패 시 같은 워커 안에서만 전달.
+    try:
+        from backend.services.signature_events import start_bus as _start_sig_bus
+        if _start_sig_bus():
+            print("[signature-events] cross-worker bus started (LISTEN/NOTIFY)")
+    except Exception as e:
+        print(f"[signature-events] bus disabled (non-fatal): {e}")
+
     yield
+    try:
+        from backend.services.cache_service import stop_bus
+        stop_bus()
+    except Exception:
+        pass
+    try:
+        from backend.services.signature_events import stop_bus as _stop_sig_bus
+        _stop_sig_bus()
+    except Exception:
+        pass
+    # 감사 로그 비동기 writer — 큐에 남은 이벤트를 기록한 뒤 종료.
+    try:
+        from backend.services.audit_service import flush_and_stop
+        if not flush_and_stop(timeout=5.0):
+            print("[audit] shutdown flush timed out — some queued events may be lost")
+    except Exception as e:
+        print(f"[audit] shutdown flush failed (non-fatal): {e}")
     # server 에서는 start 하지 않았으므로, 실행 중일 때만 정리한다.
     if _scheduler.running:
         _scheduler.shutdown(wait=False)
@@ -382,6 +382,8 @@ def update_account(
                 raise HTTPException(status_code=409, detail="마지막 관리자 계정은 비활성화하거나 삭제할 수 없습니다.")
             will_deactivate = deactivating and u.is_active
             target_tenant_id = u.tenant_id
+            from backend.services.auth_state_cache import invalidate_login_on_commit
+            invalidate_login_on_commit(session, login_id)   # is_active/is_admin/소속 → 인증 캐시
             if update.is_active is not None:
                 u.is_active = bool(update.is_active)
             if update.is_admin is not None:
@@ -628,6 +630,8 @@ def delete_account(
         already = not u.is_active
         tenant_id = u.tenant_id
         u.is_active = False
+        from backend.services.auth_state_cache import invalidate_login_on_commit
+        invalidate_login_on_commit(session, login_id)
         session.commit()
     # 기존 로그인 세션 즉시 무효화(단일세션 모드 토큰 포함) — kiosk 포함 전부.
     try:
@@ -668,6 +672,8 @@ def restore_account(login_id: str, user: dict = Depends(require_admin_or_system)
         was_active = u.is_active
         tenant_id = u.tenant_id
         u.is_active = True
+        from backend.services.auth_state_cache import invalidate_login_on_commit
+        invalidate_login_on_commit(session, login_id)
         session.commit()
     _bust_tenant_cache()
     _audit_account("ACCOUNT_RESTORED", user, login_id, tenant_id, {"was_active": was_active})
@@ -701,8 +707,10 @@ def set_account_role(login_id: str, body: AccountRoleUpdate, user: dict = Depend
         if bool(u.is_admin):
             raise HTTPException(status_code=409,
                                 detail="관리자 계정의 권한은 '관리자' 토글로 변경하세요.")
+        from backend.services.auth_state_cache import invalidate_login_on_commit
         try:
             u.role = role
+            invalidate_login_on_commit(session, login_id)
             session.commit()
         except Exception:
             session.rollback()
@@ -842,6 +850,8 @@ def hard_delete_account(
                 pass
 
         session.delete(u)
+        from backend.services.auth_state_cache import invalidate_login_on_commit
+        invalidate_login_on_commit(session, login_id)
         session.commit()
 
     _bust_tenant_cache()
@@ -1041,6 +1051,7 @@ def create_workspace(
             from backend.db.models.tenant import Tenant
             from backend.db.models.user import AccountUser
             from backend.db.session import get_sessionmaker, is_configured
+            from backend.services.auth_state_cache import invalidate_login_on_commit
             if is_configured():
                 SessionLocal = get_sessionmaker()
                 with SessionLocal() as session:
@@ -1060,6 +1071,7 @@ def create_workspace(
                     )).all():
                         if not u.is_active:
                             u.is_active = True
+                            invalidate_login_on_commit(session, u.login_id)
                             activated += 1
                     session.commit()
                     result["stages"]["accounts_update"] = {
@@ -1106,3 +1118,24 @@ def create_workspace(
             "(레거시 외부 프로비저닝은 제거되었습니다.)"
         ),
     )
+
+
+@router.get("/cache/stats")
+def admin_cache_stats(_: dict = Depends(require_admin)):
+    """응답 캐시(cache_service) 적중/미스/축출 지표(프로세스 단위) + 워커 간 무효화 버스 상태."""
+    from backend.services.cache_service import cache_stats
+    return cache_stats()
+
+
+@router.get("/concurrency/stats")
+def admin_concurrency_stats(_: dict = Depends(require_admin)):
+    """OCR/DOC 전역 게이트 키별 대기·점유 시간 분포, 획득/거절 수(프로세스 단위)."""
+    from backend.services.global_concurrency import stats
+    return stats()
+
+
+@router.get("/audit/stats")
+def admin_audit_stats(_: dict = Depends(require_admin)):
+    """감사 로그 비동기 writer 큐 깊이, 기록/드롭/실패 건수, 배치 크기(프로세스 단위)."""
+    from backend.services.audit_service import audit_stats
+    return audit_stats()
@@ -2,6 +2,7 @@
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+import json
 import logging
 import threading
 from typing import Optional
@@ -9,7 +10,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request, UploadFil
 from fastapi.responses import Response
 
 from backend.auth import get_current_user
-from backend.services.cache_service import cache_get, cache_set, cache_invalidate
+from backend.services.cache_service import (
+    TTL_CUSTOMERS, cache_get_or_load,
+)
 from backend.services import audit_service as _audit
 
 
@@ -55,7 +58,7 @@ def _raise_if_quota(e: Exception) -> None:
         ) from e
 
 _CACHE_EXPIRY = "customers:expiry-alerts"
-_TTL_EXPIRY = 120.0  # seconds — extended from 30; 고객 데이터 1,451 rows is the heaviest read
+_TTL_EXPIRY = 120.0  # seconds — 인덱스 범위 조회 결과(알림 행만) 캐시
 
 # 기본 고객 컬럼 스키마 (신규 테넌트 또는 빈 시트일 때 사용)
 _DEFAULT_CUSTOMER_HEADERS = [
@@ -107,97 +110,69 @@ def _get_records(tenant_id: str) -> list:
     """고객 레코드 목록 반환 (JSON-safe) — PostgreSQL 전용.
 
     PG-only(Phase C): 항상 PostgreSQL 에서 읽어 dict 리스트를 반환한다.
+    짧은 TTL 캐시("customers:records") — customer_pg_service 쓰기가 커밋 직후 "customers:" 를
+    (전 워커) 무효화한다. 반환 리스트는 공유되므로 호출측은 수정하지 않는다.
     """
     from backend.services.customer_pg_service import list_customers
-    return list_customers(tenant_id)
+    return cache_get_or_load(tenant_id, "customers:records", TTL_CUSTOMERS,
+                             lambda: list_customers(tenant_id))
 
 
 @router.get("/expiry-alerts")
-def get_expiry_alerts(user: dict = Depends(get_current_user)):
-    """등록증/여권 만기 알림 — 등록증 4개월 이내, 여권 6개월 이내"""
-    import datetime
+def get_expiry_alerts(
+    kind: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    user: dict = Depends(get_current_user),
+):
+    """등록증/여권 만기 알림 — 등록증 4개월 이내, 여권 6개월 이내.
+
+    기본: ``{"card_alerts", "passport_alerts"}`` 전체(짧은 TTL 캐시).
+    ``kind=card|passport`` 를 주면 그 종류만 만기일 순 keyset 페이지
+    ``{"items", "next_cursor"}`` 로 반환한다(``limit`` 기본 100, ``cursor`` = 이전 next_cursor).
+    조회는 DATE 그림자 컬럼의 부분 인덱스 범위 조회 — 고객 전체를 읽지 않는다.
+    """
     import time as _time
-    try:
-        import pandas as pd
-    except ImportError:
-        return {"card_alerts": [], "passport_alerts": []}
+    from backend.services import customer_pg_service as _svc
 
     tenant_id = user["tenant_id"]
-    cached = cache_get(tenant_id, _CACHE_EXPIRY)
-    if cached is not None:
-        return cached
-    t0 = _time.time()
-    records = _get_records(tenant_id)
-    print(f"[expiry-alerts] tenant={tenant_id} rows={len(records)} read={_time.time()-t0:.2f}s")
-    if not records:
-        return {"card_alerts": [], "passport_alerts": []}
-
-    df = pd.DataFrame(records)
-    today = pd.Timestamp.today().normalize()
-    card_limit = today + pd.DateOffset(months=4)
-    pass_limit = today + pd.DateOffset(months=6)
-
-    def _parse_date(col):
-        if col not in df.columns:
-            return pd.Series([pd.NaT] * len(df))
-        return pd.to_datetime(
-            df[col].astype(str).str.replace(".", "-").str[:10],
-            format="%Y-%m-%d", errors="coerce",
-        )
-
-    def _fmt_phone(row):
-        parts = [str(row.get(c, "")).strip().split(".")[0] for c in ["연", "락", "처"]]
-        if all(p in ("", "nan") for p in parts):
-            return ""
-        return " ".join(p for p in parts if p and p != "nan")
-
-    def _fmt_birth(row):
-        s = str(row.get("등록증", "")).strip().split(".")[0]
-        if len(s) < 6 or not s[:6].isdigit():
-            return ""
-        yy, mm, dd = int(s[:2]), int(s[2:4]), int(s[4:6])
-        rb = str(row.get("번호", "")).strip().split(".")[0]
-        century = (
-            1900 if (rb and rb[0] in "1256") else
-            2000 if (rb and rb[0] in "3478") else
-            (1900 if yy > today.year % 100 else 2000)
-        )
+    if kind is not None:
+        if kind not in _svc.EXPIRY_ALERT_MONTHS:
+            raise HTTPException(status_code=400, detail="kind 는 card 또는 passport 입니다.")
+        if limit is not None and not 1 <= limit <= _svc.MAX_PAGE_SIZE:
+            raise HTTPException(status_code=400, detail=f"limit 은 1~{_svc.MAX_PAGE_SIZE} 입니다.")
+        start, end = _svc.expiry_window(kind)
         try:
-            return datetime.date(century + yy, mm, dd).isoformat()
-        except Exception:
-            return ""
-
-    card_dt = _parse_date("만기일")
-    pass_dt = _parse_date("만기")
-
-    card_mask = card_dt.notna() & (card_dt >= today) & (card_dt <= card_limit)
-    pass_mask = pass_dt.notna() & (pass_dt >= today) & (pass_dt <= pass_limit)
-
-    def _build_rows(mask, dt_series, date_label):
-        rows = []
-        for i in df.index[mask]:
-            r = df.loc[i].to_dict()
-            eng = f"{str(r.get('성', '')).strip()} {str(r.get('명', '')).strip()}".strip()
-            rows.append({
-                # 고객카드를 고유키로 열기 위함 — 이름 매칭 금지(동명이인 방지).
-                "고객ID": str(r.get("고객ID", "")),
-                "한글이름": str(r.get("한글", "")),
-                "영문이름": eng,
-                "여권번호": str(r.get("여권", "")),
-                "생년월일": _fmt_birth(r),
-                "전화번호": _fmt_phone(r),
-                date_label: dt_series[i].strftime("%Y-%m-%d") if pd.notna(dt_series[i]) else "",
-            })
-        rows.sort(key=lambda x: x[date_label])
-        return rows
-
-    result = {
-        "card_alerts": _build_rows(card_mask, card_dt, "등록증만기일"),
-        "passport_alerts": _build_rows(pass_mask, pass_dt, "여권만기일"),
-    }
-    print(f"[expiry-alerts] tenant={tenant_id} total={_time.time()-t0:.2f}s")
-    cache_set(tenant_id, _CACHE_EXPIRY, result, _TTL_EXPIRY)
-    return result
+            items, next_cursor = _svc.query_expiring(
+                tenant_id, kind, start, end, after=cursor or None,
+                limit=limit or _svc.DEFAULT_PAGE_SIZE,
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 cursor 입니다.")
+        return {"items": items, "next_cursor": next_cursor}
+
+    def _load() -> dict:
+        t0 = _time.time()
+        out = {}
+        for k, key in (("card", "card_alerts"), ("passport", "passport_alerts")):
+            start, end = _svc.expiry_window(k)
+            out[key] = _svc.query_expiring(tenant_id, k, start, end)[0]
+        print(f"[expiry-alerts] tenant={tenant_id} card={len(out['card_alerts'])} "
+              f"passport={len(out['passport_alerts'])} total={_time.time()-t0:.2f}s")
+        return out
+
+    return cache_get_or_load(tenant_id, _CACHE_EXPIRY, _TTL_EXPIRY, _load)
+
+
+def _check_date(value: Optional[str], name: str) -> Optional[str]:
+    """만기일 필터 → ``YYYY-MM-DD``. 판독 불가 값은 400 — 빈 문자열로 바뀌어 필터가 무시되지 않게."""
+    if not value or not value.strip():
+        return None
+    from backend.services.date_normalize import parse_date_only
+    d = parse_date_only(value.strip())
+    if d is None:
+        raise HTTPException(status_code=400, detail=f"{name}는 YYYY-MM-DD 형식이어야 합니다")
+    return d.isoformat()
 
 
 @router.get("")
@@ -205,10 +180,43 @@ def get_customers(
     search: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor(keyset 페이지)"),
+    name_prefix: Optional[str] = Query(None),
+    visa_status: Optional[str] = Query(None),
+    card_expiry_from: Optional[str] = Query(None),
+    card_expiry_to: Optional[str] = Query(None),
+    passport_expiry_from: Optional[str] = Query(None),
+    passport_expiry_to: Optional[str] = Query(None),
     user: dict = Depends(get_current_user),
 ):
     tenant_id = user["tenant_id"]
-    records = _get_records(tenant_id)
+    from backend.services import customer_pg_service as _cps
+    filters = {
+        k: v for k, v in {
+            "name_prefix": name_prefix, "visa_status": visa_status,
+            "card_expiry_from": _check_date(card_expiry_from, "card_expiry_from"),
+            "card_expiry_to": _check_date(card_expiry_to, "card_expiry_to"),
+            "passport_expiry_from": _check_date(passport_expiry_from, "passport_expiry_from"),
+            "passport_expiry_to": _check_date(passport_expiry_to, "passport_expiry_to"),
+        }.items() if v
+    }
+
+    if not (search and search.strip()):
+        # 검색어 없음 — 필터/정렬/페이지를 SQL 로 내려 page_size 건만 읽는다.
+        def _page():
+            total = _cps.count_customers(tenant_id, **filters)
+            total_pages = max(1, (total + page_size - 1) // page_size) if total else 0
+            items, next_cursor = _cps.query_customers(
+                tenant_id, after=cursor, limit=page_size,
+                offset=0 if cursor else (page - 1) * page_size, **filters,
+            )
+            return {"items": items, "total": total, "page": page, "page_size": page_size,
+                    "total_pages": total_pages, "next_cursor": next_cursor}
+        key = "customers:list:" + json.dumps(
+            [page, page_size, cursor, sorted(filters.items())], ensure_ascii=False)
+        return cache_get_or_load(tenant_id, key, TTL_CUSTOMERS, _page)
+
+    records = list(_cps.iter_customers(tenant_id, **filters)) if filters else _get_records(tenant_id)
     if not records:
         return {"items": [], "total": 0, "page": page, "page_size": page_size, "total_pages": 0}
 
@@ -318,7 +326,6 @@ def bulk_commit(
         raise
     except Exception:
         raise HTTPException(status_code=400, detail="엑셀을 읽는 중 오류가 발생했습니다. 양식을 확인해 주세요.")
-    cache_invalidate(tenant_id, _CACHE_EXPIRY)
     return result
 
 
@@ -382,7 +389,6 @@ def add_customer(data: dict, user: dict = Depends(get_current_user)):
     except PiiKeyMissing:
         # 운영 fail-closed: 암호화 키 미설정 시 평문 저장 금지(키명 비노출).
         raise HTTPException(status_code=503, detail="개인정보 보안 저장 설정이 완료되지 않아 저장할 수 없습니다. 관리자에게 문의하세요.")
-    cache_invalidate(tenant_id, _CACHE_EXPIRY)
     return {"ok": True, "고객ID": result["고객ID"]}
 
 
@@ -417,7 +423,6 @@ def update_customer(customer_id: str, data: dict, user: dict = Depends(get_curre
         upsert_customer(tenant_id, merged)
     except PiiKeyMissing:
         raise HTTPException(status_code=503, detail="개인정보 보안 저장 설정이 완료되지 않아 저장할 수 없습니다. 관리자에게 문의하세요.")
-    cache_invalidate(tenant_id, _CACHE_EXPIRY)
     _ip, _ua = _req_ip_ua(request)
     _pii_changed = "번호" in data  # 외국인등록번호 뒷자리 변경 여부
     _audit.log_event(action="CUSTOMER_UPDATE", actor_login_id=user.get("sub"), tenant_id=tenant_id,
@@ -440,7 +445,6 @@ def append_delegation(customer_id: str, data: dict, user: dict = Depends(get_cur
     updated = _pg_append(tenant_id, str(customer_id).strip(), entry)
     if updated is None:
         raise HTTPException(status_code=404, detail="해당 고객을 찾을 수 없습니다.")
-    cache_invalidate(tenant_id, _CACHE_EXPIRY)
     return {"ok": True, "위임내역": updated.get("위임내역", "")}
 
 
@@ -453,7 +457,6 @@ def delete_customer(customer_id: str, user: dict = Depends(get_current_user), re
     ok = _pg_delete(tenant_id, str(customer_id).strip())
     if not ok:
         raise HTTPException(status_code=404, detail="해당 고객을 찾을 수 없습니다.")
-    cache_invalidate(tenant_id, _CACHE_EXPIRY)
     _ip, _ua = _req_ip_ua(request)
     _audit.log_event(action="CUSTOMER_DELETE", actor_login_id=user.get("sub"), tenant_id=tenant_id,
                      target_type="customer", target_id=str(customer_id), ip_address=_ip, user_agent=_ua,
@@ -533,11 +536,8 @@ def _resolve_customer_tasks(
                 and str(r.get("name", "")).strip() == nm
             ]
             # name duplicate check via the same source the customers list reads (PG-only).
-            from backend.services.customer_pg_service import list_customers
-            all_customers = list_customers(tenant_id) or []
-            has_name_duplicate = (
-                sum(1 for c in all_customers if str(c.get("한글", "")).strip() == nm) >= 2
-            )
+            from backend.services.customer_pg_service import count_customers
+            has_name_duplicate = count_customers(tenant_id, korean_name=nm) >= 2
 
     active_by_id = [r for r in active if str(r.get("customer_id", "")).strip() == customer_id]
     return {
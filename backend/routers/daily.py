@@ -28,37 +28,21 @@ def _safe_int(v):
         return 0
 
 
-import re as _re_mod
+# 행 단위 카드지출/카드수입/신고매출 규칙은 daily_rollup_service, memo [KID] 결제 슬롯
+# 파싱은 daily_pg_service.memo_slots(쓰기 시 1회 → daily_entries 컬럼)로 이동.
+# 분석 엔드포인트는 일/월 롤업 행만 읽는다.
 
-_KID_RE = _re_mod.compile(r"\[KID\](.*?)\[/KID\]")
 
+def _next_ym(year: int, month: int) -> str:
+    return f"{year + 1}-01" if month == 12 else f"{year}-{month + 1:02d}"
 
-def _entry_card_expense(rec: dict) -> int:
-    """일일결산 1건의 '카드' 지출 금액(원).
 
-    결제수단/슬롯별 금액은 memo 의 ``[KID]inc=..;e1=..;e1a=..;e2=..;e2a=..[/KID]`` 블록에
-    보존된다(프론트 packMemo). 신규 형식(e1a/e2a 존재)만 카드 금액을 정확히 분리할 수 있고,
-    레거시(블록 없음)는 카드/이체/인지가 exp_etc 로 합산돼 분리 불가 → 0 으로 처리하여
-    카드지출 과대계상을 막는다. 읽기 전용 계산이며 데이터를 변경하지 않는다."""
-    memo = str(rec.get("memo", "") or "")
-    m = _KID_RE.search(memo)
-    if not m:
-        return 0
-    try:
-        parts = dict(p.split("=", 1) for p in m.group(1).split(";") if "=" in p)
-    except Exception:
-        return 0
-    total = 0
-    for t_key, a_key in (("e1", "e1a"), ("e2", "e2a")):
-        if parts.get(t_key, "") == "카드":
-            total += _safe_int(parts.get(a_key, "0"))
-    return total
-
-
-def _fetch_daily_records(tenant_id: str) -> list:
-    """일일결산 레코드 조회 — PG-only(Phase E)."""
-    from backend.services.daily_pg_service import list_entries
-    return list_entries(tenant_id) or []
+def _fetch_month_records(tenant_id: str, year: int, month: int) -> list:
+    """선택월(YYYY-MM prefix) 일일결산 레코드 — 테넌트 전체 대신 해당 월 범위만 조회."""
+    from backend.services.daily_pg_service import list_entries_range
+    prefix = f"{year}-{month:02d}"
+    rows = list_entries_range(tenant_id, prefix, _next_ym(year, month)) or []
+    return [r for r in rows if str(r.get("date", "")).startswith(prefix)]
 
 
 def _entry_sales(rec: dict) -> int:
@@ -69,46 +53,6 @@ def _entry_expense(rec: dict) -> int:
     return _safe_int(rec.get("exp_cash")) + _safe_int(rec.get("exp_etc"))
 
 
-def _entry_kid_parts(rec: dict) -> dict:
-    """memo 의 [KID] 메타(inc/e1/e1a/e2/e2a/tax) 를 dict 로 파싱. 없으면 {}."""
-    memo = str(rec.get("memo", "") or "")
-    m = _KID_RE.search(memo)
-    if not m:
-        return {}
-    try:
-        return dict(p.split("=", 1) for p in m.group(1).split(";") if "=" in p)
-    except Exception:
-        return {}
-
-
-def _entry_reported_sales(rec: dict) -> int:
-    """세무 자동 신고매출 대상 금액(원). 수입 결제수단이 카드(inc=카드)이거나
-    세금계산서 발행 체크(tax=1)면 그 행의 수입(income_cash+income_etc)을 **1회** 반환.
-    카드+세금계산서 동시 true여도 중복 없이 1회. 일반 매출에는 그대로 포함되며,
-    여기 합계는 순이익에 다시 더하지 않는 '세무 표시용' 별도 집계다."""
-    parts = _entry_kid_parts(rec)
-    is_card = parts.get("inc", "") == "카드"
-    is_tax = str(parts.get("tax", "")).strip() in ("1", "true", "True")
-    return _entry_sales(rec) if (is_card or is_tax) else 0
-
-
-def _is_card_income_method(v) -> bool:
-    """수입 결제수단이 '카드' 류인지 판정. 입력 UI(INCOME_METHODS)는 '카드'만
-    저장하지만, 표기 변형(신용카드/체크카드/영문 card)도 방어적으로 인식한다.
-    공백/대소문자 무시. 지출(e1/e2)이 아니라 수입 결제수단(inc)에만 적용한다."""
-    s = str(v or "").strip().lower()
-    if not s:
-        return False
-    return ("카드" in s) or (s in ("card", "creditcard", "credit card", "debitcard"))
-
-
-def _entry_card_income(rec: dict) -> int:
-    """일일결산 1건의 '카드' 수입 금액(원). 수입 결제수단이 카드인 행의
-    수입(income_cash+income_etc)을 반환, 아니면 0. 월간결산 '자동 카드매출' 합산용.
-    읽기 전용 — 일일결산 데이터 구조를 변경하지 않는다."""
-    return _entry_sales(rec) if _is_card_income_method(_entry_kid_parts(rec).get("inc", "")) else 0
-
-
 def _ym_to_int(s) -> Optional[int]:
     """'YYYY-MM' → 정렬/비교용 정수(year*12+month). 형식 불량이면 None."""
     s = str(s or "").strip()
@@ -240,43 +184,35 @@ def _diagnose(same_month, same_quarter, ytd, category_compare, year, month, quar
     return {"good": good, "bad": bad}
 
 
-def _build_yearly_overview(records: list, year: int, month: int,
+def _build_yearly_overview(months: dict, year: int, month: int,
                            fixed_records: Optional[list] = None,
                            pg_daily: bool = False,
                            tax_cur: Optional[dict] = None,
                            tax_prev: Optional[dict] = None) -> dict:
     """연도별 월간추이 overlay + 동월/동분기/YTD 비교 + 카테고리 증감 + 자동진단 (읽기 전용).
 
-    현금출금 카테고리는 매출/건수 집계에서 제외(진행업무 매핑 기준과 동일).
+    months 는 월 롤업(``daily_rollup_service.month_rollups``) — {'YYYY-MM': 롤업 dict}.
+    현금출금 카테고리는 매출/건수 집계에서 제외(롤업의 ops_* 항목, 진행업무 매핑 기준과 동일).
     fixed_records(고정지출, PG 전용)가 주어지면 월별 고정지출/고정차감후 순이익을 반영한다.
     """
-    from collections import defaultdict
-
-    by_ym = defaultdict(lambda: {"sales": 0, "expense": 0, "net": 0, "card": 0, "count": 0})
-    cat_by_ym: dict = defaultdict(lambda: defaultdict(int))
+    by_ym: dict = {}
+    cat_by_ym: dict = {}
     years: set = set()
 
-    for r in records:
-        date_str = str(r.get("date", "") or "")
-        if len(date_str) < 7:
-            continue
+    for ym, mr in months.items():
         try:
-            y = int(date_str[:4]); m = int(date_str[5:7])
+            y = int(ym[:4]); m = int(ym[5:7])
         except Exception:
             continue
-        cat = str(r.get("category", "") or "").strip() or "기타"
-        if cat == "현금출금":
+        if mr["ops_count"] <= 0:
             continue
         years.add(y)
-        sales = _entry_sales(r)
-        expense = _entry_expense(r)
-        cell = by_ym[(y, m)]
-        cell["sales"] += sales
-        cell["expense"] += expense
-        cell["net"] += sales - expense
-        cell["card"] += _entry_card_expense(r)
-        cell["count"] += 1
-        cat_by_ym[(y, m)][cat] += sales
+        by_ym[(y, m)] = {
+            "sales": mr["ops_sales"], "expense": mr["ops_expense"],
+            "net": mr["ops_sales"] - mr["ops_expense"],
+            "card": mr["ops_card_expense"], "count": mr["ops_count"],
+        }
+        cat_by_ym[(y, m)] = {c: v for c, (v, _n) in mr["ops_cat"].items()}
 
     # 고정지출: 반복 규칙(start~end) 기준 — 매월 row 복사 없이 유효월에 자동 반영.
     # 규칙의 start/end 연도도 overlay 표시 대상에 포함시킨다.
@@ -327,20 +263,11 @@ def _build_yearly_overview(records: list, year: int, month: int,
     )
 
     # 세무 자동 신고매출(선택월): 카드수입 + 세금계산서 발행 체크 수입 (행당 1회, 레거시 호환)
-    sel_prefix = f"{year}-{month:02d}"
-    auto_reported_sales = sum(
-        _entry_reported_sales(r) for r in records
-        if str(r.get("date", "")).startswith(sel_prefix)
-    )
     # 자동 카드매출(선택월): 결제수단이 카드인 수입 합계 + 건수 (신고/부가세 단순화 기준)
-    auto_card_sales = sum(
-        _entry_card_income(r) for r in records
-        if str(r.get("date", "")).startswith(sel_prefix)
-    )
-    auto_card_count = sum(
-        1 for r in records
-        if str(r.get("date", "")).startswith(sel_prefix) and _entry_card_income(r) > 0
-    )
+    sel = months.get(f"{year}-{month:02d}") or {}
+    auto_reported_sales = sel.get("reported_sales", 0)
+    auto_card_sales = sel.get("card_income", 0)
+    auto_card_count = sel.get("card_income_count", 0)
 
     return {
         "years": years_sorted,
@@ -1024,12 +951,10 @@ def _apply_daily_to_active_pg(rec: dict, tenant_id: str) -> None:
     Reads existing ``active_tasks`` rows from PG, decides whether to update an
     existing one (by ``source_daily_id`` or content match) or insert a new row,
     then writes via :func:`tasks_pg_service.upsert_active`. Money deltas are
-    accumulated using the same memo-encoded slot rules as the original
-    implementation.
+    accumulated from the memo-encoded payment slots (``daily_pg_service.memo_slots``).
     """
-    import re as _re
     from backend.services import tasks_pg_service as _tasks
-    from backend.services.cache_service import cache_invalidate
+    from backend.services.daily_pg_service import memo_slots
 
     category = str(rec.get("category", "")).strip()
     if category == "현금출금":
@@ -1042,23 +967,9 @@ def _apply_daily_to_active_pg(rec: dict, tenant_id: str) -> None:
     source_daily_id = str(rec.get("id", "")).strip()
     active_task_id = ("daily-" + source_daily_id) if source_daily_id else str(uuid.uuid4())
 
-    memo = str(rec.get("memo", "")) or ""
-    m = _re.search(r"\[KID\](.*?)\[/KID\]", memo)
-    inc_type = e1_type = e2_type = ""
-    e1_indiv = e2_indiv = 0
-    if m:
-        parts = dict(p.split("=", 1) for p in m.group(1).split(";") if "=" in p)
-        inc_type = parts.get("inc", "")
-        e1_type = parts.get("e1", "")
-        e2_type = parts.get("e2", "")
-        try:
-            e1_indiv = int(parts.get("e1a", "0") or "0")
-        except Exception:
-            e1_indiv = 0
-        try:
-            e2_indiv = int(parts.get("e2a", "0") or "0")
-        except Exception:
-            e2_indiv = 0
+    slots = memo_slots(rec.get("memo"))
+    e1_type, e1_indiv = slots["exp1_method"] or "", slots["exp1_amount"]
+    e2_type, e2_indiv = slots["exp2_method"] or "", slots["exp2_amount"]
 
     exp_cash = _safe_int(rec.get("exp_cash", 0))
     exp_etc = _safe_int(rec.get("exp_etc", 0))
@@ -1137,10 +1048,6 @@ def _apply_daily_to_active_pg(rec: dict, tenant_id: str) -> None:
         }
         _tasks.upsert_active(tenant_id, new_task)
 
-    # Clear the active-tasks list cache so the dashboard / tasks page
-    # see the new row on their next refetch.
-    cache_invalidate(tenant_id, "tasks:active")
-
 
 def _append_delegation_to_customer_pg(rec: dict, tenant_id: str) -> None:
     """PG mirror of :func:`_append_delegation_to_customer`.
@@ -1190,8 +1097,9 @@ def _append_delegation_to_customer_pg(rec: dict, tenant_id: str) -> None:
     # the first row matching Korean name in this tenant.
     target_id = customer_id
     if not target_id:
-        all_customers = _cust.list_customers(tenant_id)
-        matches = [c for c in all_customers if (c.get("한글") or "").strip() == name]
+        matches, _ = _cust.query_customers(
+            tenant_id, korean_name=name, columns=("고객ID",), limit=2,
+        )
         if len(matches) == 1:
             target_id = matches[0].get("고객ID", "")
     if not target_id:
@@ -1238,11 +1146,9 @@ def delete_entry(entry_id: str, user: dict = Depends(get_current_user)):
     # PG-only(Phase E): 삭제 + 파생 진행업무(PG) cascade 삭제.
     from backend.services.daily_pg_service import delete_entry as _pg_del
     from backend.services import tasks_pg_service as _tasks
-    from backend.services.cache_service import cache_invalidate
     _pg_del(user["tenant_id"], entry_id)
     try:
         _tasks.delete_active(user["tenant_id"], ["daily-" + entry_id])
-        cache_invalidate(user["tenant_id"], "tasks:active")
     except Exception as _e:
         print(f"[daily.pg] cascade delete active failed: {_e}")
     return {"deleted": entry_id}
@@ -1269,12 +1175,8 @@ def get_monthly_summary(
     month: int = Query(...),
     user: dict = Depends(get_current_user),
 ):
-    """월별 수입/지출 합계 — PG-only(Phase E)."""
-    from backend.services.daily_pg_service import list_entries
-    records = list_entries(user["tenant_id"]) or []
-
-    prefix = f"{year}-{month:02d}"
-    monthly = [r for r in records if str(r.get("date", "")).startswith(prefix)]
+    """월별 수입/지출 합계 — PG-only(Phase E). 선택월 범위만 조회."""
+    monthly = _fetch_month_records(user["tenant_id"], year, month)
 
     total_income_cash = sum(_safe_int(r.get("income_cash")) for r in monthly)
     total_income_etc  = sum(_safe_int(r.get("income_etc")) for r in monthly)
@@ -1301,69 +1203,33 @@ def get_monthly_analysis(
     month: int = Query(...),
     user: dict = Depends(get_current_user),
 ):
-    """월간 결산 분석 (요약테이블 + 추세 + 요일별 + 카테고리별 + 시간대별)"""
-    import datetime
-    from collections import defaultdict
+    """월간 결산 분석 (요약테이블 + 추세 + 요일별 + 카테고리별 + 시간대별) — 월 롤업 기준."""
+    from backend.services.daily_rollup_service import month_rollups
     # PG-only(Phase E).
-    from backend.services.daily_pg_service import list_entries
-    records = list_entries(user["tenant_id"]) or []
+    months = month_rollups(user["tenant_id"])
 
     # ── 전체 월별 요약 테이블 + 추세 ─────────────────────────────────────────
-    monthly_full: dict = defaultdict(lambda: {
-        "income_cash": 0, "income_etc": 0,
-        "exp_cash": 0, "exp_etc": 0, "net": 0,
-    })
-    for r in records:
-        date_str = str(r.get("date", ""))
-        if len(date_str) >= 7:
-            ym = date_str[:7]
-            ic = _safe_int(r.get("income_cash"))
-            ie = _safe_int(r.get("income_etc"))
-            ec = _safe_int(r.get("exp_cash"))
-            ee = _safe_int(r.get("exp_etc"))
-            monthly_full[ym]["income_cash"] += ic
-            monthly_full[ym]["income_etc"]  += ie
-            monthly_full[ym]["exp_cash"]    += ec
-            monthly_full[ym]["exp_etc"]     += ee
-            monthly_full[ym]["net"]         += (ic + ie) - (ec + ee)
-
-    summary_table = [{"month": k, **v} for k, v in sorted(monthly_full.items())]
+    summary_table = [
+        {"month": ym, "income_cash": mr["income_cash"], "income_etc": mr["income_etc"],
+         "exp_cash": mr["exp_cash"], "exp_etc": mr["exp_etc"],
+         "net": (mr["income_cash"] + mr["income_etc"]) - (mr["exp_cash"] + mr["exp_etc"])}
+        for ym, mr in sorted(months.items())
+    ]
 
     # ── 선택 월 상세 분석 ────────────────────────────────────────────────────
     prefix = f"{year}-{month:02d}"
-    monthly_entries = [r for r in records if str(r.get("date", "")).startswith(prefix)]
+    sel = months.get(prefix) or {}
 
     WEEKDAY_KR = ["월", "화", "수", "목", "금", "토", "일"]
-    dow_data:      dict = defaultdict(int)
-    category_data: dict = defaultdict(int)
-    hour_data:     dict = defaultdict(int)
-
-    for r in monthly_entries:
-        date_str = str(r.get("date", ""))
-        time_str = str(r.get("time", "00:00"))
-        cat      = str(r.get("category", "기타")).strip() or "기타"
-        net      = (_safe_int(r.get("income_cash")) + _safe_int(r.get("income_etc"))) - \
-                   (_safe_int(r.get("exp_cash"))    + _safe_int(r.get("exp_etc")))
-
-        try:
-            d = datetime.date.fromisoformat(date_str)
-            dow_data[WEEKDAY_KR[d.weekday()]] += net
-        except Exception:
-            pass
-
-        category_data[cat] += net
-
-        try:
-            hour = int(time_str.split(":")[0])
-            hour_data[hour] += net
-        except Exception:
-            pass
+    dow_data = {WEEKDAY_KR[int(k)]: v for k, (v, _n) in (sel.get("dow") or {}).items()}
+    category_data = {k: v for k, (v, _n) in (sel.get("cat") or {}).items()}
+    hour_data = {int(k): v for k, (v, _n) in (sel.get("hour") or {}).items()}
 
     return {
         "summary_table": summary_table,
         "trend": [{"month": row["month"], "net": row["net"]} for row in summary_table],
         "selected_month": prefix,
-        "dow": [{"name": n, "net": dow_data[n]} for n in WEEKDAY_KR],
+        "dow": [{"name": n, "net": dow_data.get(n, 0)} for n in WEEKDAY_KR],
         "category": sorted(
             [{"name": k, "net": v} for k, v in category_data.items()],
             key=lambda x: -x["net"],
@@ -1383,14 +1249,13 @@ def get_card_expense_summary(user: dict = Depends(get_current_user)):
     원천(일일결산 카드지출)을 날짜 기준으로 집계한다. 단일 API → 프론트 중복계산 방지.
     """
     import datetime
-    records = _fetch_daily_records(user["tenant_id"])
+    from backend.services.daily_rollup_service import day_rollup, month_rollups
     today = datetime.date.today()
     today_str = today.isoformat()
     month_prefix = today.strftime("%Y-%m")
-    today_total = sum(_entry_card_expense(r) for r in records
-                      if str(r.get("date", "")).strip() == today_str)
-    month_total = sum(_entry_card_expense(r) for r in records
-                      if str(r.get("date", "")).startswith(month_prefix))
+    today_total = (day_rollup(user["tenant_id"], today_str) or {}).get("card_expense", 0)
+    month_total = (month_rollups(user["tenant_id"], [month_prefix])
+                   .get(month_prefix, {}).get("card_expense", 0))
     return {
         "today": today_total,
         "month": month_total,
@@ -1407,14 +1272,14 @@ def get_income_summary(user: dict = Depends(get_current_user)):
     자연 포함된다. active_task 와 무관한 일일결산 기준 집계(읽기 전용). 단일 API.
     """
     import datetime
-    records = _fetch_daily_records(user["tenant_id"])
+    from backend.services.daily_rollup_service import day_rollup, month_rollups
     today = datetime.date.today()
     today_str = today.isoformat()
     month_prefix = today.strftime("%Y-%m")
-    today_total = sum(_entry_sales(r) for r in records
-                      if str(r.get("date", "")).strip() == today_str)
-    month_total = sum(_entry_sales(r) for r in records
-                      if str(r.get("date", "")).startswith(month_prefix))
+    day = day_rollup(user["tenant_id"], today_str) or {}
+    mon = month_rollups(user["tenant_id"], [month_prefix]).get(month_prefix, {})
+    today_total = day.get("income_cash", 0) + day.get("income_etc", 0)
+    month_total = mon.get("income_cash", 0) + mon.get("income_etc", 0)
     return {
         "today": today_total,
         "month": month_total,
@@ -1432,10 +1297,14 @@ def get_yearly_overview(
     """월간결산 고도화 — 연도별 월간추이 overlay + 동월/동분기/YTD 비교 + 카테고리 증감 + 자동진단.
 
     PG-only(Phase E): 고정지출(fixed_expenses)·신고/부가세(monthly_tax_summaries)도 PG에서
-    읽어 고정차감후 순이익·세무 진단까지 반영한다.
+    읽어 고정차감후 순이익·세무 진단까지 반영한다. 월별 추이는 월 롤업, 기준일 누계/업무군
+    분석은 선택월·전년 동월 레코드만 조회한다.
     """
+    from backend.services.daily_rollup_service import month_rollups
     tenant_id = user["tenant_id"]
-    records = _fetch_daily_records(tenant_id)
+    months = month_rollups(tenant_id)
+    records = (_fetch_month_records(tenant_id, year - 1, month)
+               + _fetch_month_records(tenant_id, year, month))
 
     pg = True  # PG-only
     from backend.services.fixed_expense_pg_service import list_fixed_expenses
@@ -1444,7 +1313,7 @@ def get_yearly_overview(
     tax_cur = get_tax_summary(tenant_id, f"{year}-{month:02d}")
     tax_prev = get_tax_summary(tenant_id, f"{year - 1}-{month:02d}")
 
-    overview = _build_yearly_overview(records, year, month, fixed_records=fixed_records,
+    overview = _build_yearly_overview(months, year, month, fixed_records=fixed_records,
                                       pg_daily=pg, tax_cur=tax_cur, tax_prev=tax_prev)
     # 기준일까지 누계 비교 + 일별 추이 + 시간대 비교 + 자동 분석(요구사항 1·3·5·6)
     import datetime as _dt
@@ -1540,31 +1409,22 @@ def copy_fixed_expenses_ep(
     return {"copied": n, "from": from_ym, "to": to_ym}
 
 
-def _auto_card_stats_from_records(records: list, year_month: str) -> tuple[int, int]:
-    """주어진 일일결산 레코드에서 선택월(YYYY-MM)의 카드매출 (합계원, 건수).
-    반기 6개월을 돌 때 records 를 1회만 조회해 재사용하기 위한 분리."""
-    prefix = str(year_month or "").strip()[:7]
-    if len(prefix) < 7:
-        return 0, 0
-    sales = 0
-    count = 0
-    for r in records:
-        if not str(r.get("date", "")).startswith(prefix):
-            continue
-        amt = _entry_card_income(r)
-        if amt > 0:
-            sales += amt
-            count += 1
-    return sales, count
+def _auto_card_stats_from_rollups(months: dict, year_month: str) -> tuple[int, int]:
+    """월 롤업 dict 에서 선택월(YYYY-MM)의 카드매출 (합계원, 건수).
+    반기 6개월을 돌 때 롤업을 1회만 조회해 재사용하기 위한 분리."""
+    mr = months.get(str(year_month or "").strip()[:7]) or {}
+    return mr.get("card_income", 0), mr.get("card_income_count", 0)
 
 
 def _auto_card_stats_for_month(tenant_id: str, year_month: str) -> tuple[int, int]:
     """선택월(YYYY-MM)의 자동 카드매출 (합계원, 건수). 일일결산 중 수입 결제수단이
-    카드이고 수입>0 인 행만 집계(읽기 전용). 일일결산은 하드삭제라 별도 무효상태
-    컬럼이 없으므로 조회 결과(live rows)만 합산한다 — migration/컬럼변경 없음."""
-    if len(str(year_month or "").strip()) < 7:
+    카드이고 수입>0 인 행만 집계(읽기 전용, 월 롤업의 card_income/card_income_count).
+    일일결산은 하드삭제라 삭제 시 롤업에서 즉시 빠진다."""
+    ym = str(year_month or "").strip()[:7]
+    if len(ym) < 7:
         return 0, 0
-    return _auto_card_stats_from_records(_fetch_daily_records(tenant_id), year_month)
+    from backend.services.daily_rollup_service import month_rollups
+    return _auto_card_stats_from_rollups(month_rollups(tenant_id, [ym]), ym)
 
 
 def _half_year_bounds(month: int) -> tuple[str, int, int]:
@@ -1628,13 +1488,14 @@ def get_tax_summary_ep(
         return base
 
     label, sm, em = _half_year_bounds(month)
-    records = _fetch_daily_records(tenant)   # 반기 6개월 카드집계용 1회 조회
+    from backend.services.daily_rollup_service import month_rollups
+    rollups = month_rollups(tenant, [f"{year}-{m:02d}" for m in range(sm, em + 1)])  # 반기 1회 조회
 
     months = []
     h_auto = h_cnt = h_inv = h_oth = h_cardexp = h_nond = 0
     for m in range(sm, em + 1):
         mym = f"{year}-{m:02d}"
-        m_auto, m_cnt = _auto_card_stats_from_records(records, mym)
+        m_auto, m_cnt = _auto_card_stats_from_rollups(rollups, mym)
         m_row = _month_tax_row(tenant, mym, m_auto, get_tax_summary, compute_tax)
         inv = int(m_row.get("manual_tax_invoice_revenue", 0) or 0)
         oth = int(m_row.get("manual_other_revenue", 0) or 0)
@@ -128,7 +128,7 @@ def audit_test(req: AuditTestRequest):
 
         from backend.db.models.audit import AuditLog
         from backend.db.session import get_sessionmaker
-        from backend.services.audit_service import log_event
+        from backend.services.audit_service import flush, log_event
 
         SessionLocal = get_sessionmaker()
         with SessionLocal() as session:
@@ -142,6 +142,7 @@ def audit_test(req: AuditTestRequest):
             target_id=req.target_id,
             payload={"source": "dev_pg.audit_test"},
         )
+        flush()  # log_event 는 큐에만 넣는다 — 기록된 뒤에 센다
 
         with SessionLocal() as session:
             after = int(session.scalar(select(func.count()).select_from(AuditLog)) or 0)
@@ -3,21 +3,75 @@
 일정(events)은 PostgreSQL(events_pg_service)만 사용한다. PG 미구성 시 조용한 fallback
 없이 get_sessionmaker()가 RuntimeError를 낸다. 응답 구조는 기존과 동일
 (GET: {date_str: [event_text, ...]} 맵).
+
+GET 은 기간(from/to, YYYY-MM-DD)을 주면 그 기간만 읽는다. 응답의 ETag / X-Events-Version 은
+테넌트 일정 변경 카운터다 — 클라이언트는 같은 기간을 ``since=<version>`` 으로 다시 요청해
+그 뒤 바뀐 날짜만 받는다(삭제된 날짜는 빈 목록). 변경이 없으면 304(본문 없음).
+파라미터 없이 부르면 기존처럼 전체 맵을 반환한다(구 클라이언트 호환).
 """
 import sys, os
+import re
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from backend.auth import get_current_user
 from backend.models import EventDateSaveRequest
 
 router = APIRouter()
 
 
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def _check_date(value: Optional[str], name: str) -> Optional[str]:
+    if value is None:
+        return None
+    value = value.strip()
+    if not _DATE_RE.match(value):
+        raise HTTPException(status_code=400, detail=f"{name}는 YYYY-MM-DD 형식이어야 합니다")
+    return value
+
+
 @router.get("")
-def get_events(user: dict = Depends(get_current_user)):
-    from backend.services.events_pg_service import get_events_map
-    return get_events_map(user["tenant_id"])
+def get_events(
+    request: Request,
+    response: Response,
+    date_from: Optional[str] = Query(None, alias="from"),
+    date_to: Optional[str] = Query(None, alias="to"),
+    since: Optional[int] = Query(None, ge=0),
+    user: dict = Depends(get_current_user),
+):
+    from backend.services.cache_service import TTL_EVENTS, cache_get_or_load
+    from backend.services import events_pg_service as ev
+    tenant_id = user["tenant_id"]
+    if date_from is None and date_to is None and since is None:
+        return cache_get_or_load(tenant_id, "events:map", TTL_EVENTS,
+                                 lambda: ev.get_events_map(tenant_id))
+
+    date_from = _check_date(date_from, "from")
+    date_to = _check_date(date_to, "to")
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=400, detail="from은 to보다 늦을 수 없습니다")
+
+    # 변경 여부 판단은 캐시된 버전으로(쓰기 시 events: 접두 무효화) — 304 는 DB 조회 없이 끝난다.
+    version = cache_get_or_load(tenant_id, "events:version", TTL_EVENTS,
+                                lambda: ev.events_version(tenant_id))
+    etag = f'"ev-{version}"'
+    headers = {"ETag": etag, "X-Events-Version": str(version), "Cache-Control": "private, no-cache"}
+    inm = request.headers.get("if-none-match", "")
+    if (since is not None and since >= version) or etag in [t.strip() for t in inm.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    if since is not None:
+        data, version = ev.get_events_changes(tenant_id, since, date_from, date_to)
+    else:
+        data, version = cache_get_or_load(
+            tenant_id, f"events:range:{date_from or ''}:{date_to or ''}", TTL_EVENTS,
+            lambda: ev.get_events_range(tenant_id, date_from, date_to))
+    response.headers.update({**headers, "ETag": f'"ev-{version}"', "X-Events-Version": str(version)})
+    return data
 
 
 @router.post("")
@@ -19,9 +19,11 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 import json
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, Query, Body, File, Form, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, File, Form, UploadFile, Request
 from pydantic import BaseModel
 from backend.auth import get_current_user, require_admin, require_guideline_editor
+from backend.services.data_snapshot import load_json_object, snapshot_path
+from backend.services.guideline_search_index import GuidelineSearchIndex
 
 router = APIRouter()
 
@@ -36,8 +38,9 @@ try:
 except Exception:
     _MANUALS_DIR = os.path.join(_BASE_DIR, "data", "manuals")
 
-with open(_DB_PATH, encoding="utf-8") as _f:
-    _DB = json.load(_f)
+# 원본 JSON sha256 이 일치하는 스냅샷(*.pkl.snap)이 있으면 그것을 역직렬화(파싱 생략).
+# 원본이 PATCH 등으로 바뀌면 해시가 달라져 JSON 으로 폴백하고 스냅샷을 다시 쓴다.
+_DB = load_json_object(_DB_PATH, snapshot_path(_DB_PATH, "object"), refresh=True)
 
 _MASTER_ROWS: List[dict] = _DB.get("master_rows", [])
 _RULES: List[dict] = _DB.get("rules", [])
@@ -51,15 +54,11 @@ for _row in _MASTER_ROWS:
     if _code:
         _CODE_INDEX.setdefault(_code, []).append(_row)
 
-_SEARCH_INDEX: dict = {}  # keyword → [row_id, ...]
-for _row in _MASTER_ROWS:
-    for _sk in _row.get("search_keys", []):
-        _kv = str(_sk.get("key_value", "")).lower()
-        if _kv:
-            _SEARCH_INDEX.setdefault(_kv, []).append(_row["row_id"])
-
 _ROW_INDEX: dict = {r["row_id"]: r for r in _MASTER_ROWS}
 
+# 키워드 검색 역색인(search_keys + 코드/업무명/개요/서류, 소문자 1회 전처리) + 결과 캐시.
+_SEARCH = GuidelineSearchIndex(_MASTER_ROWS)
+
 
 # ── 유틸 ──────────────────────────────────────────────────────────
 def _paginate(items: list, page: int, limit: int) -> dict:
@@ -98,36 +97,13 @@ def search_guidelines(
     user: dict = Depends(get_current_user),
 ):
     """
-    키워드 검색 (체류자격 코드, 업무명, 서류명 등)
+    키워드 검색 (체류자격 코드, 업무명, 서류명 등) — 관련도 순
     예: ?q=F-4  /  ?q=시간제취업  /  ?q=사업자등록증
     """
-    q_lower = q.lower().strip()
-    matched_ids: set = set()
-
-    # 1) SEARCH_KEYS 인덱스
-    for kv, ids in _SEARCH_INDEX.items():
-        if q_lower in kv:
-            matched_ids.update(ids)
-
-    # 2) MASTER_ROWS 풀텍스트 (코드/업무명/overview/서류)
-    for row in _MASTER_ROWS:
-        if (
-            q_lower in str(row.get("detailed_code", "")).lower()
-            or q_lower in str(row.get("business_name", "")).lower()
-            or q_lower in str(row.get("overview_short", "")).lower()
-            or q_lower in str(row.get("form_docs", "")).lower()
-            or q_lower in str(row.get("supporting_docs", "")).lower()
-        ):
-            matched_ids.add(row["row_id"])
-
-    items = [_ROW_INDEX[rid] for rid in matched_ids if rid in _ROW_INDEX]
-
-    if action_type:
-        items = [r for r in items if r.get("action_type") == action_type]
-    if domain:
-        items = [r for r in items if r.get("domain") == domain]
-
-    items.sort(key=lambda r: str(r.get("detailed_code", "") or ""))
+    # 역색인 교집합 → 후보만 부분일치 확정 → 관련도 정렬. (q, action_type, domain) 결과는
+    # 캐시되어 페이지 이동 시 재검색하지 않는다.
+    ids = _SEARCH.search_ids(q, action_type, domain)
+    items = [_ROW_INDEX[rid] for rid in ids if rid in _ROW_INDEX]
     return _paginate(items, page, limit)
 
 
@@ -1404,8 +1380,38 @@ def pg_pdf_status(manual: str, version: str = "", admin: dict = Depends(require_
     }
 
 
+def _artifact_pdf_response(request: Request, artifact_id: int, content_hash: Optional[str],
+                           headers: dict, manifest: Optional[list] = None):
+    """PDF artifact 응답 — content_hash 디스크 캐시 파일을 FileResponse(Range 지원)로 서빙.
+
+    ETag = content_hash, If-None-Match 일치 시 304. manifest artifact 는 조각 조립본을 캐시.
+    디스크 캐시를 못 만들면 DB 에서 chunk 단위 StreamingResponse(Range 미지원). blob 이 없으면 None."""
+    from fastapi.responses import Response as _Resp, StreamingResponse
+    from backend.services import pdf_artifact_cache as _pc
+    hdr = dict(headers)
+    if content_hash:
+        etag = f'"{content_hash}"'
+        hdr["ETag"] = etag
+        inm = request.headers.get("if-none-match", "")
+        if etag in [t.strip() for t in inm.split(",")] or inm.strip() == "*":
+            return _Resp(status_code=304, headers=hdr)
+    path = _pc.materialize(artifact_id, content_hash, manifest=manifest)
+    if path:
+        return FileResponse(path, media_type="application/pdf", headers=hdr)
+    chunks = iter(_pc.stream_chunks(artifact_id))
+    first = next(chunks, None)
+    if first is None:
+        return None
+    hdr.pop("ETag", None)    # 해시 검증 없이 흘려보내는 경로 — 캐시 검증자 미부여
+
+    def _body():
+        yield first
+        yield from chunks
+    return StreamingResponse(_body(), media_type="application/pdf", headers=hdr)
+
+
 @router.get("/manual-update/pdf")
-def pg_pdf(manual: str, version: str = "",
+def pg_pdf(request: Request, manual: str, version: str = "",
            token: Optional[str] = Query(None), authorization: Optional[str] = Header(None)):
     """viewer resolver — '변경 반영된 완전한 PDF'(전체 문서) 를 #page 점프와 함께 제공.
 
@@ -1415,9 +1421,9 @@ def pg_pdf(manual: str, version: str = "",
       3) 변경 페이지 artifact 를 배포본에 스플라이스한 review_splice 합성본(검토용·운영 미반영, PyMuPDF)
       4) 배포본 전체 PDF fallback
     어느 경우든 변경 페이지만 있는 bundle 이 아니라 '전체 문서'를 반환 → 앞뒤 스크롤 가능.
+    업로드본/worker artifact 는 content_hash 디스크 캐시에서 Range/ETag 로 서빙한다.
     인증: Authorization 헤더 또는 ?token= (iframe)."""
     _verify_token_flexible(token, authorization)
-    from fastapi.responses import Response as _Resp
     from urllib.parse import quote
     kr = _pdf_label_to_kr(manual)
     if not kr:
@@ -1430,9 +1436,12 @@ def pg_pdf(manual: str, version: str = "",
     # 옛 배포본이 아니라 '최신 업로드본 전체'를 열도록 최우선. 실패는 graceful(아래 체인으로 폴백).
     try:
         from backend.services import manual_pdf_upload_service as _up
-        _uploaded = _up.resolve_review_pdf(manual, version)
-        if _uploaded and _uploaded.get("blob"):
-            return _Resp(content=_uploaded["blob"], media_type="application/pdf", headers=_hdr)
+        _uploaded = _up.resolve_review_pdf_meta(manual, version)
+        if _uploaded and _uploaded.get("artifact_id"):
+            resp = _artifact_pdf_response(request, _uploaded["artifact_id"],
+                                          _uploaded.get("content_hash"), _hdr)
+            if resp is not None:
+                return resp
     except Exception:
         pass
     # 1순위: staging 전체 PDF(이미 완전한 새 매뉴얼)
@@ -1448,10 +1457,12 @@ def pg_pdf(manual: str, version: str = "",
                 # 2순위: worker/node 가 미리 만든 full_pdf artifact(저장된 blob 만 서빙).
                 worker = svc.get_worker_full_pdf(manual_norm, version or None)
                 if worker:
-                    blob = svc.get_pdf_artifact_blob(worker["id"])
-                    if blob:
-                        return _Resp(content=blob, media_type="application/pdf", headers=_hdr)
-                # ※ OOM 방지: web 요청 중 전체 PDF 합성/스플라이스(compose_full_pdf_blob) 금지.
+                    resp = _artifact_pdf_response(request, worker["id"],
+                                                  worker.get("content_hash"), _hdr,
+                                                  manifest=worker.get("page_manifest"))
+                    if resp is not None:
+                        return resp
+                # ※ OOM 방지: web 요청 중 전체 PDF 합성/스플라이스(compose_full_pdf_manifest) 금지.
                 #   업로드본/worker artifact 가 없으면 합성하지 않고 배포본 fallback 으로 간다.
         except Exception:
             pass
@@ -1484,21 +1495,25 @@ def pg_get_pdf_artifact(artifact_id: int, admin: dict = Depends(require_admin)):
 
 
 @router.get("/manual-update/pdf-artifacts/{artifact_id}/content")
-def pg_get_pdf_artifact_content(artifact_id: int,
+def pg_get_pdf_artifact_content(request: Request, artifact_id: int,
                                 token: Optional[str] = Query(None),
                                 authorization: Optional[str] = Header(None)):
-    """artifact PDF 바이트(application/pdf). iframe 용 ?token= 도 허용."""
+    """artifact PDF 바이트(application/pdf, Range/ETag 지원). iframe 용 ?token= 도 허용."""
     _verify_token_flexible(token, authorization)
-    from fastapi.responses import Response as _Resp
     from backend.services import manual_update_pg_service as svc
     if not svc.pg_enabled():
         raise HTTPException(status_code=409, detail="PG manual-update 비활성")
-    blob = svc.get_pdf_artifact_blob(artifact_id)
-    if blob is None:
+    meta = svc.get_pdf_artifact(artifact_id)
+    resp = None
+    if meta:
+        resp = _artifact_pdf_response(
+            request, artifact_id, meta.get("content_hash"),
+            {"Cache-Control": "private, max-age=600",
+             "Content-Disposition": f"inline; filename=\"artifact_{artifact_id}.pdf\""},
+            manifest=meta.get("page_manifest"))
+    if resp is None:
         raise HTTPException(status_code=404, detail=f"artifact {artifact_id} blob 없음")
-    return _Resp(content=blob, media_type="application/pdf",
-                 headers={"Cache-Control": "private, max-age=600",
-                          "Content-Disposition": f"inline; filename=\"artifact_{artifact_id}.pdf\""})
+    return resp
 
 
 _MANUAL_NORM = {"visa": "visa", "사증민원": "visa", "residence": "stay", "stay": "stay", "체류민원": "stay"}
@@ -1577,20 +1592,22 @@ def pg_promote_pdf(body: PgPromotePdfBody, admin: dict = Depends(require_admin))
 
 
 @router.get("/manual-update/uploaded-pdf")
-def pg_uploaded_pdf(manual: str, version: str = "",
+def pg_uploaded_pdf(request: Request, manual: str, version: str = "",
                     token: Optional[str] = Query(None),
                     authorization: Optional[str] = Header(None)):
-    """검토용 업로드 PDF(staging) 전체를 그대로 서빙(iframe ?token= 허용). 운영 미반영."""
+    """검토용 업로드 PDF(staging) 전체를 서빙(Range/ETag, iframe ?token= 허용). 운영 미반영."""
     _verify_token_flexible(token, authorization)
-    from fastapi.responses import Response as _Resp
     from backend.services import manual_pdf_upload_service as up
-    res = up.get_staging_blob(manual, version)
-    if res is None:
+    meta = up.get_staging_meta(manual, version)
+    resp = None
+    if meta is not None:
+        resp = _artifact_pdf_response(
+            request, meta["id"], meta.get("content_hash"),
+            {"Cache-Control": "private, max-age=120",
+             "Content-Disposition": f"inline; filename=\"staging_{meta.get('manual')}_{meta.get('version')}.pdf\""})
+    if resp is None:
         raise HTTPException(status_code=404, detail="업로드된 검토용 PDF 가 없습니다.")
-    blob, meta = res
-    return _Resp(content=blob, media_type="application/pdf",
-                 headers={"Cache-Control": "private, max-age=120",
-                          "Content-Disposition": f"inline; filename=\"staging_{meta.get('manual')}_{meta.get('version')}.pdf\""})
+    return resp
 
 
 @router.get("/manual-update/uploads")
@@ -1870,8 +1887,9 @@ def patch_guideline_field(
     if not row:
         raise HTTPException(status_code=404, detail=f"row_id '{row_id}' 를 찾을 수 없습니다.")
 
-    # 메모리 인덱스 업데이트
+    # 메모리 인덱스 업데이트(검색 역색인 포함)
     row[body.field] = body.value
+    _SEARCH.refresh_row(row)
 
     # JSON 파일 영구 저장
     try:
@@ -1,5 +1,6 @@
 """문서 자동작성 라우터 - 체류/사증 선택 트리 + 필요서류 + PDF 생성 (full injection)"""
 import sys, os, io, re, datetime
+import time as _time
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -8,7 +9,7 @@ from pydantic import BaseModel
 from typing import Optional
 
 from backend.auth import get_current_user, require_admin
-from backend.services.global_concurrency import DOC_LOCK_KEY, global_limit_sync
+from backend.services.global_concurrency import DOC_LOCK_KEY, DOC_SLOTS, ConcurrencyBusy, global_limit_sync
 
 router = APIRouter()
 
@@ -331,6 +332,11 @@ def _canonical_agent_contract_field(name: str) -> Optional[str]:
     return None
 
 
+def _template_registry():
+    from backend.services.pdf_template_registry import get_registry
+    return get_registry()
+
+
 def _agent_fields_of_template(abs_path: str) -> set:
     """PDF/HWPX 템플릿이 실제 쓰는 행정사 필드({agent_rrn,agent_tel,agent_biz_no}).
     PDF=위젯 field_name, HWPX=fieldBegin name(extract_hwpx_fields) 를 normalize 후 대조.
@@ -346,13 +352,11 @@ def _agent_fields_of_template(abs_path: str) -> set:
     found: set = set()
     if low.endswith(".pdf"):
         try:
-            import fitz  # PyMuPDF
-            with fitz.open(abs_path) as doc:
-                for page in doc:
-                    for w in (page.widgets() or []):
-                        canon = _canonical_agent_contract_field(getattr(w, "field_name", "") or "")
-                        if canon:
-                            found.add(canon)
+            tpl = _template_registry().get(abs_path, normalize_field_name)
+            for w in tpl.widgets:
+                canon = _canonical_agent_contract_field(w.name)
+                if canon:
+                    found.add(canon)
         except Exception:
             raise OfficeProfileContractUnavailable("pdf:" + os.path.basename(abs_path))
     elif low.endswith(".hwpx"):
@@ -1025,28 +1029,27 @@ def make_seal_bytes(name: Optional[str], english: bool = False) -> Optional[byte
         name_norm = normalize_seal_name(name)
     if not name_norm:
         return None
+    # 같은 (이름, 영문여부, 폰트/배경 버전) 도장은 1회만 렌더(seal_render_cache LRU).
+    from backend.services import seal_render_cache as _seal_cache
+    version = _seal_cache.asset_version(_FONT_PATH, _CIRCLE_PATH, params=(_SEAL_SIZE, _LATIN_X_SCALE))
+    return _seal_cache.get_cache().get_or_render(
+        ("quick_doc", name_norm, bool(english), version),
+        lambda: _render_seal_png(name_norm, english),
+    )
+
+
+def _render_seal_png(name_norm: str, english: bool) -> Optional[bytes]:
+    """make_seal_bytes 의 실제 렌더(캐시 미스 시). 폰트·원형 배경은 공유 객체 사용."""
     try:
-        from PIL import Image, ImageDraw, ImageFont
+        from PIL import Image, ImageDraw
         import io as _io
+        from backend.services.seal_render_cache import get_circle, get_font
 
         canvas_size = _SEAL_SIZE
         base = Image.new("RGBA", (canvas_size, canvas_size), (0, 0, 0, 0))
 
-        try:
-            circle_img = Image.open(_CIRCLE_PATH).convert("RGBA")
-        except Exception:
-            circle_img = Image.new("RGBA", (canvas_size, canvas_size), (0, 0, 0, 0))
-            d_tmp = ImageDraw.Draw(circle_img)
-            margin = int(canvas_size * 0.08)
-            d_tmp.ellipse(
-                (margin, margin, canvas_size - margin, canvas_size - margin),
-                outline=(180, 0, 0, 255),
-                width=int(canvas_size * 0.05),
-            )
-
-        scale = 1.05
-        circle_size = int(canvas_size * scale)
-        circle_img = circle_img.resize((circle_size, circle_size), Image.LANCZOS)
+        circle_img = get_circle(_CIRCLE_PATH, canvas_size, 1.05)
+        circle_size = circle_img.size[0]
         offset_x = (canvas_size - circle_size) // 2
         offset_y = (canvas_size - circle_size) // 2
         base.alpha_composite(circle_img, dest=(offset_x, offset_y))
@@ -1081,10 +1084,7 @@ def make_seal_bytes(name: Optional[str], english: bool = False) -> Optional[byte
             denom = n_chars + (n_chars - 1) * line_gap_ratio
             font_size = max(10, int(max_inner_height / denom))
 
-            try:
-                font = ImageFont.truetype(_FONT_PATH, font_size)
-            except Exception:
-                font = ImageFont.load_default()
+            font = get_font(_FONT_PATH, font_size)
 
             char_sizes = []
             for ch in name_disp:
@@ -1317,8 +1317,14 @@ def fill_and_append_pdf(template_path: str, field_values: dict,
     if not abs_path or not os.path.exists(abs_path):
         return
     try:
-        import fitz
-        doc = fitz.open(abs_path)
+        # 템플릿은 레지스트리에서 1회 파싱(경로+mtime 키), 요청마다 메모리 복제본을 연다.
+        tpl = _template_registry().get(abs_path, normalize_field_name)
+        doc = tpl.open()
+        role_bases = set(ROLE_WIDGETS.values()) | set(ROLE_SIGN_WIDGETS.values())
+
+        def _relevant(info) -> bool:
+            # 값을 넣을 필드 또는 도장/서명 자리만 로드(나머지 위젯·페이지는 건드리지 않음)
+            return info.base in field_values or info.base in role_bases
 
         if render_mode in ("overlay", "overlay_legacy"):
             # legacy 보기안정형: Text widget 제거/flatten(필드 사망). field_ap 로 대체됨 — dev fallback 전용.
@@ -1367,8 +1373,7 @@ def fill_and_append_pdf(template_path: str, field_values: dict,
         elif render_mode == "field_ap":
             # 필드 유지형 Custom Appearance: Text widget 유지(삭제·flatten 없음).
             role_names = set(ROLE_WIDGETS.values()) | set(ROLE_SIGN_WIDGETS.values())
-            for page in doc:
-                widgets = list(page.widgets() or [])
+            for page, widgets in tpl.iter_widgets(doc, _relevant):
                 for widget in widgets:
                     base = normalize_field_name(widget.field_name)
                     ftype = widget.field_type_string
@@ -1401,8 +1406,7 @@ def fill_and_append_pdf(template_path: str, field_values: dict,
                     _insert_role_images(page, widget, base, seal_bytes_by_role, sign_bytes_by_role)
             _set_need_appearances(doc, False)   # 뷰어가 우리 /AP 를 그대로 사용
         else:
-            for page in doc:
-                widgets = list(page.widgets() or [])
+            for page, widgets in tpl.iter_widgets(doc, _relevant):
                 for widget in widgets:
                     base = normalize_field_name(widget.field_name)
                     if base in field_values:
@@ -1592,6 +1596,13 @@ def admin_list_templates(_: dict = Depends(require_admin)):
     return {"templates": [{"filename": f, "display_name": f[:-4], "exists": True} for f in files]}
 
 
+@router.get("/admin/render-cache/stats")
+def admin_render_cache_stats(_: dict = Depends(require_admin)):
+    """문서 생성 렌더 캐시 지표(프로세스 단위): 도장 렌더 LRU + PDF 템플릿 레지스트리."""
+    from backend.services.seal_render_cache import get_cache as _seal_cache
+    return {"seal": _seal_cache().stats(), "templates": _template_registry().stats()}
+
+
 @router.post("/admin/nodes")
 def admin_create_node(req: NodeCreateReq, _: dict = Depends(require_admin)):
     cfg = _cfg_service()
@@ -1820,18 +1831,25 @@ def admin_hwpx_fields(filename: str, _: dict = Depends(require_admin)):
     }
 
 
+_DOC_BUSY_MESSAGE = "다른 서류 생성이 진행 중입니다. 잠시 후 다시 시도해 주세요."
+
+
 @router.post("/generate-full")
 def generate_full(req: FullDocGenRequest, user: dict = Depends(get_current_user)):
-    """[로컬 PoC] DOC 전역 동시수 1 게이트 후 실제 생성 로직 실행(combined+workers>=2 직렬화)."""
-    with global_limit_sync(DOC_LOCK_KEY):
-        return _generate_full_impl(req, user)
+    """[로컬 PoC] 문서 일괄 생성. 준비 단계(고객 조회·서명·도장·필드값)는 병렬로 돌고
+    PDF 채우기/병합 단계만 DOC N 슬롯 게이트(DOC_SLOTS)를 거친다(_generate_full_impl 참고)."""
+    return _generate_full_impl(req, user)
 
 
 def _generate_full_impl(req: FullDocGenRequest, user: dict):
     """
     역할별 고객 데이터 + 행정사 정보 기반 PDF 필드 자동 주입 + 도장 삽입 후 병합 PDF 반환.
     템플릿 파일 없는 서류는 무시(건너뜀).
+
+    단계: ① 준비(게이트 밖) → ② 채우기/병합/저장(global_limit_sync(DOC_LOCK_KEY, DOC_SLOTS)).
+    응답 헤더 X-Doc-Prep-Ms / X-Doc-Queue-Ms / X-Doc-Work-Ms(+ Server-Timing)로 단계별 시간 보고.
     """
+    t_start = _time.monotonic()
     print(f"[DEBUG] sign_agent={req.sign_agent} seal_agent={req.seal_agent} docs={req.selected_docs}")
     if not req.selected_docs:
         raise HTTPException(status_code=400, detail="선택된 서류가 없습니다.")
@@ -1845,8 +1863,8 @@ def _generate_full_impl(req: FullDocGenRequest, user: dict):
     # 주소 등 최신 편집분이 PG 기준이므로,
     # 검색 엔드포인트와 동일 분기.
     # PG-only(Phase I): 고객 데이터는 항상 PostgreSQL(Phase C 전환).
-    from backend.services.customer_pg_service import list_customers, find_customer as _svc_find_customer
-    customers = list_customers(tenant_id) or []
+    # 역할별 단건 조회만 한다(테넌트 전체 목록 로드 없음).
+    from backend.services.customer_pg_service import find_customer as _svc_find_customer
 
     def find_customer(cid: Optional[str]) -> Optional[dict]:
         # 문서출력은 reg_back(번호) 평문이 필요 → 단건만 reveal=True 로 복호화 조회.
@@ -2035,9 +2053,9 @@ def _generate_full_impl(req: FullDocGenRequest, user: dict):
     # ── PDF 병합 ──
     try:
         import fitz
-        merged  = fitz.open()
         skipped = []   # DOC_TEMPLATES 미등록 또는 파일 없는 항목
         missing = []   # None으로 명시적 미완성 항목 (파일 준비 필요)
+        plan = []      # (rel_path, field_values, seal, sign) — 게이트 안에서 채울 서류
         # 관리자 설정 출력방식(0028): hwpx=HWPX만 → PDF 생성 제외, disabled=자동작성 제외.
         # 미설정 서류는 맵에 없음 → 기존 동작 그대로(완전 무영향).
         _out_fmt = _doc_output_formats()
@@ -2068,11 +2086,29 @@ def _generate_full_impl(req: FullDocGenRequest, user: dict):
                 doc_sign = _unified_sp_role_bytes(sign_bytes_by_role, has_aggregator, p_relation)
             else:
                 doc_fv, doc_seal, doc_sign = field_values, seal_bytes_by_role, sign_bytes_by_role
-            fill_and_append_pdf(rel_path, doc_fv, doc_seal, merged, doc_sign,
-                                render_mode=req.render_mode)
+            plan.append((rel_path, doc_fv, doc_seal, doc_sign))
+
+        # 여기까지 준비(게이트 밖). PDF 채우기/병합/저장만 DOC 슬롯 안에서 실행.
+        prep_s = _time.monotonic() - t_start
+        buf = io.BytesIO()
+        page_count = 0
+        with global_limit_sync(DOC_LOCK_KEY, slots=DOC_SLOTS) as lease:
+            merged = fitz.open()
+            try:
+                for rel_path, doc_fv, doc_seal, doc_sign in plan:
+                    fill_and_append_pdf(rel_path, doc_fv, doc_seal, merged, doc_sign,
+                                        render_mode=req.render_mode)
+                page_count = merged.page_count
+                if page_count:
+                    merged.save(buf)
+            finally:
+                merged.close()
+        timing = {"prep": prep_s, "queue": lease.wait_s, "work": lease.hold_s}
+        print(f"[generate_full] docs={len(plan)} slot={lease.slot}/{DOC_SLOTS} "
+              + " ".join(f"{k}={v * 1000:.0f}ms" for k, v in timing.items()))
 
         # 누락 파일이 있으면 422로 명시적 안내 (일부라도 있으면 생성은 계속)
-        if missing and merged.page_count == 0:
+        if missing and page_count == 0:
             raise HTTPException(
                 status_code=422,
                 detail={
@@ -2082,15 +2118,12 @@ def _generate_full_impl(req: FullDocGenRequest, user: dict):
                 }
             )
 
-        if merged.page_count == 0:
+        if page_count == 0:
             raise HTTPException(
                 status_code=422,
                 detail=f"선택된 서류 중 유효한 템플릿이 없습니다. 건너뜀: {skipped}"
             )
 
-        buf = io.BytesIO()
-        merged.save(buf)
-        merged.close()
         buf.seek(0)
 
         # field_ap: 최종 PDF 에서 Text field 생존·/V 공백삽입 자동검사. 실패 시 PDF 반환 안 함.
@@ -2134,10 +2167,17 @@ def _generate_full_impl(req: FullDocGenRequest, user: dict):
                 "X-Missing-Docs":  missing_encoded,
                 "X-English-Stamp-Skipped": "true" if english_stamp_skipped else "false",
                 "X-Render-Mode": req.render_mode,
+                "X-Doc-Prep-Ms": f"{timing['prep'] * 1000:.0f}",
+                "X-Doc-Queue-Ms": f"{timing['queue'] * 1000:.0f}",
+                "X-Doc-Queue-Position": str(lease.position),
+                "X-Doc-Work-Ms": f"{timing['work'] * 1000:.0f}",
+                "Server-Timing": ", ".join(f"{k};dur={v * 1000:.1f}" for k, v in timing.items()),
             },
         )
     except HTTPException:
         raise
+    except ConcurrencyBusy:
+        raise HTTPException(status_code=503, detail=_DOC_BUSY_MESSAGE)
     except ImportError:
         raise HTTPException(status_code=500, detail="PyMuPDF(fitz) 미설치. pip install pymupdf")
     except Exception as e:
@@ -2519,7 +2559,7 @@ def _fn_part(s: Optional[str], maxlen: int = 40) -> str:
 @router.post("/generate-hwpx")
 def generate_hwpx(req: FullDocGenRequest, user: dict = Depends(get_current_user)):
     """[추가 기능] HWPX 자동작성. DOC 전역 동시수 1 게이트 후 실행. PDF 경로와 독립."""
-    with global_limit_sync(DOC_LOCK_KEY):
+    with global_limit_sync(DOC_LOCK_KEY, slots=DOC_SLOTS):
         return _generate_hwpx_impl(req, user)
 
 
@@ -2780,8 +2820,11 @@ def search_customers(q: str = "", user: dict = Depends(get_current_user)):
         return []
 
     # PG-only(Phase I): 고객 데이터는 항상 PostgreSQL(Phase C 전환).
-    from backend.services.customer_pg_service import list_customers
-    customers = list_customers(tenant_id) or []
+    # 매칭에 필요한 컬럼만 keyset 배치로 스트리밍하고, 30건이 모이면 멈춘다.
+    from backend.services.customer_pg_service import iter_customers
+    customers = iter_customers(
+        tenant_id, columns=("한글", "성", "명", "연", "락", "처", "등록증"),
+    )
 
     q_stripped = q.strip()
     q_lower = q_stripped.lower()
@@ -2815,10 +2858,15 @@ def search_customers(q: str = "", user: dict = Depends(get_current_user)):
             return True
         return False
 
-    customers = [c for c in customers if _match(c)]
+    matched = []
+    for c in customers:
+        if _match(c):
+            matched.append(c)
+            if len(matched) >= 30:
+                break
 
     results = []
-    for c in customers[:30]:
+    for c in matched:
         p1 = str(c.get("연", "")).strip()
         p2 = str(c.get("락", "")).strip()
         p3 = str(c.get("처", "")).strip()
@@ -2920,7 +2968,7 @@ def _pdf_bytes_to_jpg_or_zip(pdf_bytes: bytes, dpi: int = 200):
 @router.post("/quick-poa")
 def quick_poa(req: QuickPoaRequest, user: dict = Depends(get_current_user)):
     """[로컬 PoC] DOC 전역 동시수 1 게이트 후 실제 원클릭 생성 로직 실행."""
-    with global_limit_sync(DOC_LOCK_KEY):
+    with global_limit_sync(DOC_LOCK_KEY, slots=DOC_SLOTS):
         return _quick_poa_impl(req, user)
 
 
@@ -3139,7 +3187,7 @@ def _quick_poa_impl(req: QuickPoaRequest, user: dict):
 @router.post("/generate")
 def generate_documents(req: DocGenRequest, user: dict = Depends(get_current_user)):
     """[로컬 PoC] DOC 전역 동시수 1 게이트 후 실제 병합 로직 실행."""
-    with global_limit_sync(DOC_LOCK_KEY):
+    with global_limit_sync(DOC_LOCK_KEY, slots=DOC_SLOTS):
         return _generate_documents_impl(req, user)
 
 
@@ -32,8 +32,9 @@ def _file_to_pil(img_bytes: bytes, content_type: str = ""):
         raise ValueError(f"PDF 변환 실패: {e}")
 from pydantic import BaseModel
 from typing import Optional
-from backend.auth import get_current_user
+from backend.auth import get_current_user, require_admin
 from backend.services.ocr_service import parse_passport, parse_arc
+from backend.services import scan_result_cache as _scan_cache
 
 router = APIRouter()
 
@@ -145,6 +146,25 @@ def _ensure_tesseract():
         return None
 
 
+# ── 스캔 결과 캐시 ────────────────────────────────────────────────────────────
+# 같은 이미지(픽셀 sha256 또는 dHash+크기 일치) 재업로드는 OCR 슬롯 없이 즉시 반환.
+
+async def _cache_lookup(user: dict, kind: str, mode: str, img):
+    """(cache, hashes, cached_response|None). 캐시 비활성이면 (None, None, None)."""
+    cache = _scan_cache.get_cache()
+    if cache is None:
+        return None, None, None
+    hashes = await asyncio.to_thread(_scan_cache.image_hashes, img)
+    return cache, hashes, cache.get(user.get("tenant_id") or "", kind, mode, hashes)
+
+
+@router.get("/cache/stats")
+def scan_cache_stats(user: dict = Depends(require_admin)):
+    """스캔 결과 캐시 적중/미스 지표(프로세스 단위)."""
+    cache = _scan_cache.get_cache()
+    return {"enabled": cache is not None, **(cache.stats() if cache else {})}
+
+
 # ── OCR 엔드포인트 ────────────────────────────────────────────────────────────
 
 @router.post("/passport")
@@ -163,6 +183,11 @@ async def scan_passport(
         except Exception as exc:
             return {"debug": "passport-file-to-pil-exception", "error_type": exc.__class__.__name__, "error_message": str(exc)}
 
+        mode = _scan_cache.mode_key(fast=True)
+        cache, hashes, cached = await _cache_lookup(user, "passport", mode, img)
+        if cached is not None:
+            return {**cached, "cache": "hit"}
+
         # Tesseract MRZ 경로가 추가되어 대부분의 요청은 1-3s 내 완료.
         # OmniMRZ는 이미 로딩된 경우에만 보조로 시도하므로 콜드 스타트 블로킹 없음.
         sem = _ocr_sem()
@@ -187,12 +212,16 @@ async def scan_passport(
                 }
             except Exception as exc:
                 return {"debug": "passport-parse-exception", "error_type": exc.__class__.__name__, "error_message": str(exc), "traceback": _tb.format_exc()[-1000:]}
-            return {
+            resp = {
                 "debug": "passport-parse-done",
                 "result": result,
                 "raw_L1": result.pop("_raw_L1", None) if result else None,
                 "raw_L2": result.pop("_raw_L2", None) if result else None,
+                "ocr_report": result.pop("_ocr_report", None) if result else None,
             }
+            if cache is not None and result and not result.get("_no_mrz"):
+                cache.put(user.get("tenant_id") or "", "passport", mode, hashes, resp)
+            return {**resp, "cache": "miss"}
     except Exception as exc:
         return {
             "debug": "passport-route-exception",
@@ -218,6 +247,11 @@ async def scan_arc(
         except Exception as exc:
             return {"debug": "arc-file-to-pil-exception", "error_type": exc.__class__.__name__, "error_message": str(exc)}
 
+        mode = _scan_cache.mode_key(fast=True, passport_dob="")
+        cache, hashes, cached = await _cache_lookup(user, "arc", mode, img)
+        if cached is not None:
+            return {**cached, "cache": "hit"}
+
         sem = _ocr_sem()
         if sem.locked():
             return {
@@ -240,7 +274,10 @@ async def scan_arc(
                 }
             except Exception as exc:
                 return {"debug": "arc-parse-exception", "error_type": exc.__class__.__name__, "error_message": str(exc), "traceback": _tb.format_exc()[-1000:]}
-            return {"debug": "arc-parse-done", "result": result}
+            resp = {"debug": "arc-parse-done", "result": result}
+            if cache is not None and result:
+                cache.put(user.get("tenant_id") or "", "arc", mode, hashes, resp)
+            return {**resp, "cache": "miss"}
     except Exception as exc:
         return {
             "debug": "arc-route-exception",
@@ -443,22 +480,21 @@ def scan_register(
     if True:
         print(f"[write-path] customers(scan): PG tenant={tenant_id!r}")
         from backend.services.customer_pg_service import (
-            list_customers, next_customer_id, upsert_customer,
+            MAX_PAGE_SIZE, next_customer_id, query_customers, upsert_customer,
         )
 
         key_passport  = _norm(data.get("여권"))
         key_reg_front = _norm(data.get("등록증"))
         key_reg_back  = _norm(data.get("번호"))
 
+        # 매칭 후보만 SQL 로 좁혀 읽는다(테넌트 전체 목록 로드 없음). 순서는 고객목록과 동일.
         existing = None
         match_reason = None
-        rows = list_customers(tenant_id)
         if key_passport:
-            for r in rows:
-                if _norm(r.get("여권")) == key_passport:
-                    existing = r
-                    match_reason = f"passport match: 여권={key_passport!r}"
-                    break
+            hits, _ = query_customers(tenant_id, passport_no=key_passport, limit=1)
+            if hits:
+                existing = hits[0]
+                match_reason = f"passport match: 여권={key_passport!r}"
         if existing is None and key_reg_front and key_reg_back:
             # reg_back(번호)은 암호화되어 list 의 번호는 마스킹값이므로 직접 비교 불가.
             # HMAC 해시로 일치 고객ID 집합을 구해 등록증(앞자리)과 함께 매칭한다.
@@ -466,6 +502,8 @@ def scan_register(
             from backend.services.customer_pg_service import ids_by_reg_back_hash
             from backend.services.pii_crypto import hash_pii
             _id_set = ids_by_reg_back_hash(tenant_id, hash_pii(tenant_id, key_reg_back))
+            rows, _ = (query_customers(tenant_id, customer_ids=_id_set, limit=MAX_PAGE_SIZE)
+                       if _id_set else ([], None))
             for r in rows:
                 if str(r.get("고객ID", "")) in _id_set and _norm(r.get("등록증")) == key_reg_front:
                     existing = r
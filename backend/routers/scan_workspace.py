@@ -8,8 +8,10 @@ from fastapi.responses import Response
 
 from backend.auth import get_current_user
 from backend.routers.scan import _ensure_tesseract
+from backend.services import global_concurrency as _gc
 from backend.services.global_concurrency import (
     OCR_LOCK_KEY,
+    OCR_SLOTS,
     OCR_WAIT_SECONDS,
     ConcurrencyBusy,
     global_limit,
@@ -28,8 +30,9 @@ router = APIRouter()
 # async 핸들러 안에서 직접 호출되면 이벤트루프 전체가 블로킹된다. 아래 OCR 엔드포인트는
 # - asyncio.to_thread 로 워커스레드에 offload(이벤트루프 비블로킹),
 # - asyncio.wait_for(25s) 로 한 건의 OCR 처리시간 상한,
-# - global_limit(OCR_LOCK_KEY, wait_timeout=OCR_WAIT_SECONDS) 로 전역 동시수 1 + 대기:
-#   스캔이 겹치면 즉시 거절하지 않고 앞 스캔이 끝날 때까지 순서를 기다렸다가 이어서 처리한다.
+# - global_limit(OCR_LOCK_KEY, wait_timeout=OCR_WAIT_SECONDS) 로 전역 동시수(OCR_SLOTS, 기본 1) + 대기:
+#   스캔이 겹치면 즉시 거절하지 않고 도착 순서대로 기다렸다가 앞 스캔이 끝나는 즉시 이어서 처리한다.
+#   대기열 위치·대기 시간은 X-Queue-Position / X-Queue-Wait-Ms 응답 헤더로 알려준다.
 #   대기 시간을 넘긴 경우에만 사용자 친화 안내를 반환한다.
 # 을 적용한다. 기존 backend/routers/scan.py(/api/scan/*)와 동일한 처리기 정책.
 _OCR_TIME_BUDGET = 25.0
@@ -39,6 +42,21 @@ _PDF_RENDER_TIME_BUDGET = 20.0
 _OCR_BUSY_MESSAGE = "스캔 요청이 겹쳐 잠시 대기 중입니다. 보통 몇 초 안에 이어서 처리됩니다."
 
 
+def _ocr_gate() -> global_limit:
+    """OCR 전역 게이트(FIFO 대기). lease.headers() 로 대기열 위치·대기 시간을 응답에 싣는다."""
+    return global_limit(OCR_LOCK_KEY, wait_timeout=OCR_WAIT_SECONDS, slots=OCR_SLOTS)
+
+
+@router.get("/queue-status")
+def queue_status(user: dict = Depends(get_current_user)):
+    """OCR/DOC 전역 게이트의 현재 점유·대기 수 — 대기 중 화면에 '앞에 N건' 안내용."""
+    _ = user
+    return {
+        "ocr": _gc.queue_status(OCR_LOCK_KEY, OCR_SLOTS),
+        "doc": _gc.queue_status(_gc.DOC_LOCK_KEY, _gc.DOC_SLOTS),
+    }
+
+
 @router.post("/render-pdf")
 async def render_pdf_page(
     file: UploadFile = File(...),
@@ -117,6 +135,7 @@ async def scan_workspace_passport(
     roi_json: str | None = Form(default=None),
     rotation_deg: int = Form(default=0),
     user: dict = Depends(get_current_user),
+    response: Response = None,
 ):
     _ = user
 
@@ -131,8 +150,9 @@ async def scan_workspace_passport(
             img = file_bytes_to_pil(img_bytes, content_type)
             return extract_passport_roi(img, roi, rotation_deg=rotation_deg)
 
-        async with global_limit(OCR_LOCK_KEY, wait_timeout=OCR_WAIT_SECONDS):
+        async with _ocr_gate() as lease:
             result = await asyncio.wait_for(asyncio.to_thread(_work), timeout=_OCR_TIME_BUDGET)
+        response.headers.update(lease.headers())
         debug = result.pop("_debug", {})
         return {"result": result, "roi": roi, "debug": debug}
     except HTTPException:
@@ -155,6 +175,7 @@ async def scan_workspace_arc(
     detailed: str | None = Form(default=None),
     rotation_deg: int = Form(default=0),
     user: dict = Depends(get_current_user),
+    response: Response = None,
 ):
     _ = user
 
@@ -175,10 +196,11 @@ async def scan_workspace_arc(
                 img = file_bytes_to_pil(img_bytes, content_type)
                 return extract_arc_field(img, field, roi, rotation_deg=rotation_deg)
 
-            async with global_limit(OCR_LOCK_KEY, wait_timeout=OCR_WAIT_SECONDS):
+            async with _ocr_gate() as lease:
                 value, debug = await asyncio.wait_for(
                     asyncio.to_thread(_work_single), timeout=_OCR_TIME_BUDGET
                 )
+            response.headers.update(lease.headers())
             return {"field": field, "value": value, "roi": roi, "debug": debug}
 
         # 2) 다중 필드 추출 (확장용)
@@ -209,20 +231,22 @@ async def scan_workspace_arc(
                 img = file_bytes_to_pil(img_bytes, content_type)
                 return extract_arc_fields_detailed(img, rois, fields, rotation_deg=rotation_deg)
 
-            async with global_limit(OCR_LOCK_KEY, wait_timeout=OCR_WAIT_SECONDS):
+            async with _ocr_gate() as lease:
                 fields_result = await asyncio.wait_for(
                     asyncio.to_thread(_work_group), timeout=_OCR_TIME_BUDGET
                 )
+            response.headers.update(lease.headers())
             return {"ok": True, "fields": fields_result, "rois": rois}
 
         def _work_multi():
             img = file_bytes_to_pil(img_bytes, content_type)
             return extract_arc_fields(img, rois, fields)
 
-        async with global_limit(OCR_LOCK_KEY, wait_timeout=OCR_WAIT_SECONDS):
+        async with _ocr_gate() as lease:
             result = await asyncio.wait_for(
                 asyncio.to_thread(_work_multi), timeout=_OCR_TIME_BUDGET
             )
+        response.headers.update(lease.headers())
         return {"result": result, "rois": rois, "fields": fields or []}
 
     except HTTPException:
@@ -2,14 +2,15 @@
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+import time
 import traceback
-from typing import Optional, List
+from typing import Dict, List, Optional, Tuple
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 
 from backend.auth import get_current_user
 # PG-only(Phase F-1): 통합검색 전 소스가 PG read 서비스만 사용 → PG read 서비스만 사용.
-# 우회 검색 경로 없음.
+# 우회 검색 경로 없음. 필터/랭킹/LIMIT 은 search_pg_service 가 SQL 로 처리(테넌트 전체 로드 금지).
 
 router = APIRouter()
 
@@ -28,155 +29,106 @@ class SearchResult(BaseModel):
 class SearchResponse(BaseModel):
     query: str
     type: str
-    total: int
+    count: int                      # 이번 페이지 결과 수(전체 일치 수 아님 — 더 있으면 has_more)
     results: List[SearchResult]
+    offset: int = 0
+    limit: int = 0
+    has_more: bool = False
+    timings_ms: Dict[str, float] = {}   # 소스별 소요 시간(ms)
 
 
 VALID_TYPES = {"all", "customer", "task", "board", "reference", "memo"}
 
-
-# ── 공통 매처 ─────────────────────────────────────────────────────────────────
-
-def _match(row: dict, q: str) -> bool:
-    ql = q.lower()
-    return any(ql in str(v).lower() for v in row.values() if v)
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+MAX_OFFSET = 1000
 
 
 # ── 검색 소스별 함수 ──────────────────────────────────────────────────────────
+# 각 소스는 search_pg_service 로 필터/랭킹/LIMIT 을 SQL 에 내려 상위 ``limit`` 건만 읽고,
+# ``(score, SearchResult)`` 리스트를 돌려준다. 엔드포인트가 score 로 병합·페이지 슬라이스한다.
 
-def _search_customers(q: str, tenant_id: str) -> List[SearchResult]:
-    """고객 데이터 검색 — PG-only. tenant_id 기반 격리(customer_pg_service)."""
-    # PG-only(Phase F-1): 고객 검색은 항상 PostgreSQL(Phase C 전환 도메인). 직접 PostgreSQL 사용.
-    from backend.services.customer_pg_service import list_customers
-    rows = list_customers(tenant_id) or []
+def _search_customers(q: str, tenant_id: str, limit: int) -> List[Tuple[int, SearchResult]]:
+    """고객 데이터 검색 — PG-only. tenant_id 기반 격리(search_pg_service)."""
+    from backend.services.search_pg_service import search_customers
     results = []
-    for r in rows:
-        if not _match(r, q):
-            continue
-        # 한글이름: 실무 컬럼 "한글" 우선, fallback "한글이름"
-        name = str(r.get("한글", "") or r.get("한글이름", "")).strip()
-        # 영문이름: 실무 컬럼 "성"+"명", fallback "영문이름"
-        eng_last  = str(r.get("성", "")).strip()
-        eng_first = str(r.get("명", "")).strip()
-        eng = f"{eng_last} {eng_first}".strip() or str(r.get("영문이름", "")).strip()
+    for score, r in search_customers(tenant_id, q, limit):
+        name = str(r.get("한글", "")).strip()
+        eng = f"{r.get('성', '')} {r.get('명', '')}".strip()
         cid = str(r.get("고객ID", "")).strip()
         nationality = str(r.get("국적", "")).strip()
         visa = str(r.get("체류자격", "") or r.get("비자종류", "")).strip()
         summary_parts = [p for p in [name, eng, nationality, visa] if p]
-        results.append(SearchResult(
+        results.append((score, SearchResult(
             id=cid or name,
             type="customer",
             title=name or eng or cid or "(이름 없음)",
             summary=" · ".join(summary_parts),
             url=f"/customers?search={cid}",
-        ))
+        )))
     return results
 
 
-def _search_tasks(q: str, tenant_id: str) -> List[SearchResult]:
-    """예정/진행/완료 업무 검색 — tenant 격리.
-
-    FEATURE_PG_TASKS=true 이면 PG(active/planned/completed_tasks)에서 읽는다.
-    PG dict 는 영문 키(name/work/category)라 기존 한글 키 추출에 영문 fallback을 추가했다
-    (영문 키 보강 — 동작 변화 없음).
-    """
-    # PG-only(Phase F-1): 업무 검색은 항상 PostgreSQL(Phase D 전환 도메인). 직접 PostgreSQL 사용.
-    from backend.services.tasks_pg_service import (
-        list_planned as _pg_planned,
-        list_active as _pg_active,
-        list_completed as _pg_completed,
-    )
+def _search_tasks(q: str, tenant_id: str, limit: int) -> List[Tuple[int, SearchResult]]:
+    """예정/진행/완료 업무 검색 — tenant 격리(PG active/planned/completed_tasks)."""
+    from backend.services.search_pg_service import search_tasks
     results = []
-    for label, pg_getter in [
-        ("예정", _pg_planned),
-        ("진행", _pg_active),
-        ("완료", _pg_completed),
-    ]:
-        rows = pg_getter(tenant_id) or []
-        for r in rows:
-            if not _match(r, q):
-                continue
-            # 이름 컬럼: "이름"/"한글"/"고객명" → "name" fallback
-            name = (
-                str(r.get("이름",   "")).strip() or
-                str(r.get("한글",   "")).strip() or
-                str(r.get("고객명", "")).strip() or
-                str(r.get("name",   "")).strip()
-            )
-            tid = str(r.get("id", "") or r.get("업무ID", "") or r.get("고객ID", "") or r.get("customer_id", "")).strip()
-            minwon = str(r.get("민원", "") or r.get("업무내용", "") or r.get("work", "") or r.get("category", "")).strip()
-            status = str(r.get("상태", "")).strip()
-            summary_parts = [p for p in [label, minwon, status] if p]
-            results.append(SearchResult(
-                id=tid or name,
-                type="task",
-                title=f"[{label}] {name}" if name else f"[{label}] 업무",
-                summary=" · ".join(summary_parts),
-                url="/tasks",
-            ))
+    for score, r in search_tasks(tenant_id, q, limit):
+        label = r["label"]
+        name = str(r.get("name", "")).strip()
+        tid = str(r.get("id", "")).strip()
+        minwon = str(r.get("work", "")).strip()
+        summary_parts = [p for p in [label, minwon] if p]
+        results.append((score, SearchResult(
+            id=tid or name,
+            type="task",
+            title=f"[{label}] {name}" if name else f"[{label}] 업무",
+            summary=" · ".join(summary_parts),
+            url="/tasks",
+        )))
     return results
 
 
-def _search_board(q: str, tenant_id: str) -> List[SearchResult]:
-    """게시판 검색 — tenant 격리.
-
-    FEATURE_PG_BOARD=true 이면 PG(board posts)에서 읽는다. PG dict 는 영문 키지만
-    아래 루프가 title/content/id fallback을 이미 갖고 있어 shape 변화 없음.
-    """
-    # PG-only(Phase F-1): 게시판 검색은 PG read 서비스만 사용(직접 PostgreSQL 사용).
-    # 게시판 도메인 본전환은 Phase H이나, 검색은 read-only PG 경로로 통일.
-    from backend.services.board_pg_service import list_posts
-    rows = list_posts() or []
+def _search_board(q: str, tenant_id: str, limit: int) -> List[Tuple[int, SearchResult]]:
+    """게시판 검색 — 게시판은 전 테넌트 공유(기존 공개 게시판 의미 유지)."""
+    from backend.services.search_pg_service import search_board
     results = []
-    for r in rows:
-        if not _match(r, q):
-            continue
-        title   = str(r.get("제목", "") or r.get("title", "")).strip()
-        bid     = str(r.get("id", "") or r.get("게시판ID", "")).strip()
-        content = str(r.get("내용", "") or r.get("content", ""))
-        snip    = content[:80].replace("\n", " ")
-        results.append(SearchResult(
+    for score, r in search_board(q, limit):
+        title   = str(r.get("title", "")).strip()
+        bid     = str(r.get("id", "")).strip()
+        snip    = str(r.get("content", ""))[:80].replace("\n", " ")
+        results.append((score, SearchResult(
             id=bid or title,
             type="board",
             title=title or "게시글",
             summary=snip,
             url="/board",
-        ))
+        )))
     return results
 
 
-def _search_reference(q: str, tenant_id: str) -> List[SearchResult]:
-    """업무참고 시트 검색 — tenant 격리 (업무정리 워크북 기준).
-
-    FEATURE_PG_REFERENCE=true 이면 PG(work_reference_rows)의 행을 읽는다
-    (get_sheet_data 의 'rows' 는 header→값 dict 리스트).
-    주의: 여기선 읽기만 분기.
-    """
-    # PG-only(Phase F-1): 업무참고 검색은 PG read 서비스만 사용(직접 PostgreSQL 사용).
-    # 업무참고 '편집' 본전환은 Phase G이나, 검색은 read-only PG 경로로 통일.
-    from backend.services.reference_pg_service import get_sheet_data
-    rows = (get_sheet_data(tenant_id, "업무참고") or {}).get("rows", []) or []
+def _search_reference(q: str, tenant_id: str, limit: int) -> List[Tuple[int, SearchResult]]:
+    """업무참고 시트 검색 — tenant 격리 (업무정리 워크북 기준, PG work_reference_rows)."""
+    from backend.services.search_pg_service import search_reference
     results = []
-    for r in rows:
-        if not _match(r, q):
-            continue
+    for score, r in search_reference(tenant_id, q, limit):
         cols  = [k for k in r.keys() if k]
         title = str(r.get(cols[0], "")).strip() if cols else ""
         summary = " · ".join(
             str(r.get(c, "")).strip() for c in cols[1:3] if r.get(c)
         )
-        results.append(SearchResult(
+        results.append((score, SearchResult(
             id=title,
             type="reference",
             title=title or "업무참고",
             summary=summary,
             url="/reference",
-        ))
+        )))
     return results
 
 
-def _search_memo(q: str, tenant_id: str) -> List[SearchResult]:
-    """장기/중기 메모 검색 — tenant 격리. **PG-only(Phase F)**."""
+def _search_memo(q: str, tenant_id: str, limit: int) -> List[Tuple[int, SearchResult]]:
+    """장기/중기 메모 검색 — tenant 격리. **PG-only(Phase F)**. 테넌트당 최대 2건."""
     from backend.services.memos_pg_service import get_memo as _pg_get_memo
     results = []
     for label, kind in [
@@ -191,15 +143,25 @@ def _search_memo(q: str, tenant_id: str) -> List[SearchResult]:
             continue
         idx  = content.lower().find(q.lower())
         snip = content[max(0, idx - 20): idx + 60].replace("\n", " ")
-        results.append(SearchResult(
+        results.append((1, SearchResult(
             id=label,
             type="memo",
             title=f"{label} 메모",
             summary=snip,
             highlight=snip,
             url="/memos",
-        ))
-    return results
+        )))
+    return results[:limit]
+
+
+# 소스 순서 = 동점일 때의 표시 순서(기존 응답 순서와 동일).
+_SOURCES = (
+    ("customer", _search_customers),
+    ("task", _search_tasks),
+    ("board", _search_board),
+    ("reference", _search_reference),
+    ("memo", _search_memo),
+)
 
 
 # ── 엔드포인트 ────────────────────────────────────────────────────────────────
@@ -208,27 +170,44 @@ def _search_memo(q: str, tenant_id: str) -> List[SearchResult]:
 def search(
     q: str = Query(..., min_length=1, description="검색 키워드"),
     type: str = Query("all", description="검색 범위: all|customer|task|board|reference|memo"),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="페이지 크기"),
+    offset: int = Query(0, ge=0, le=MAX_OFFSET, description="건너뛸 결과 수"),
     user: dict = Depends(get_current_user),
 ):
-    """통합검색 — tenant_id 기반 완전 격리(PG-only). 타 tenant 데이터는 검색되지 않음."""
+    """통합검색 — tenant_id 기반 완전 격리(PG-only). 타 tenant 데이터는 검색되지 않음.
+
+    각 소스는 상위 ``offset + limit + 1`` 건만 SQL 에서 읽고, 점수(정확 > 접두 > 부분 일치)
+    내림차순 → 소스 순서로 병합한 뒤 페이지를 자른다. 비용은 테넌트 크기가 아니라 요청한
+    결과 수에 비례한다. 전체 일치 건수는 세지 않는다 — ``count`` 는 이번 페이지 건수이고,
+    다음 페이지는 ``has_more`` 일 때 ``offset += limit`` 으로 요청한다(최대 ``MAX_OFFSET``).
+    ``timings_ms`` 에 소스별 소요 시간(ms)을 담는다.
+    """
     if type not in VALID_TYPES:
         type = "all"
 
     tenant_id = user.get("tenant_id") or user.get("sub", "")
-    results: List[SearchResult] = []
-
-    try:
-        if type in ("all", "customer"):
-            results += _search_customers(q, tenant_id)
-        if type in ("all", "task"):
-            results += _search_tasks(q, tenant_id)
-        if type in ("all", "board"):
-            results += _search_board(q, tenant_id)
-        if type in ("all", "reference"):
-            results += _search_reference(q, tenant_id)
-        if type in ("all", "memo"):
-            results += _search_memo(q, tenant_id)
-    except Exception as e:
-        print(f"[search] 검색 오류 (tenant={tenant_id}, q={q}): {e}\n{traceback.format_exc()}")
-
-    return SearchResponse(query=q, type=type, total=len(results), results=results)
+    q = q.strip()
+    window = offset + limit + 1
+    merged: List[Tuple[int, int, int, SearchResult]] = []
+    timings: Dict[str, float] = {}
+
+    for src_order, (name, fn) in enumerate(_SOURCES):
+        if type not in ("all", name):
+            continue
+        t0 = time.perf_counter()
+        try:
+            hits = fn(q, tenant_id, window)
+        except Exception as e:
+            print(f"[search] 검색 오류 (tenant={tenant_id}, source={name}): {e}\n{traceback.format_exc()}")
+            hits = []
+        timings[name] = round((time.perf_counter() - t0) * 1000, 2)
+        for pos, (score, res) in enumerate(hits):
+            merged.append((-score, src_order, pos, res))
+
+    merged.sort(key=lambda t: t[:3])
+    page = [t[3] for t in merged[offset:offset + limit]]
+    return SearchResponse(
+        query=q, type=type, count=len(page), results=page,
+        offset=offset, limit=limit, has_more=len(merged) > offset + limit,
+        timings_ms=timings,
+    )
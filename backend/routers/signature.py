@@ -2,6 +2,7 @@
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+import asyncio
 import base64
 import hashlib
 import hmac as _hmac
@@ -12,7 +13,8 @@ import time
 from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from backend.auth import get_current_user
@@ -217,6 +219,8 @@ def request_signature(
     result: dict = {"token": token, "url": url}
     if body.type == "customer" and rid:
         result["request_id"] = rid
+    elif body.type == "agent":
+        result["request_id"] = token          # /stream 구독 키 (agent 는 토큰 자체)
     return result
 
 
@@ -254,6 +258,12 @@ def poll_signature(token: str, user: dict = Depends(get_current_user)):
                 _log.info("[poll] token=%s rid=%s customer_id=%s status=pending (not yet submitted)",
                           token_hint, rid, cid)
                 return {"status": "pending", "request_id": rid}
+            # 다른 워커가 받은 제출 — 이벤트 최근 목록으로 확인(요청 rid 단위라 과거 서명과 무관).
+            from backend.services.signature_events import recent
+            if recent(payload.get("csk", ""), rid) is not None:
+                _log.info("[poll] token=%s rid=%s customer_id=%s status=saved (event)",
+                          token_hint, rid, cid)
+                return {"status": "saved", "request_id": rid}
             # Pending entry gone (server restart or already cleaned up after save).
             # Do NOT fall back to the store — that would re-trigger the old signature bug.
             _log.warning("[poll] token=%s rid=%s customer_id=%s pending_entry_missing — returning pending",
@@ -272,6 +282,12 @@ def poll_signature(token: str, user: dict = Depends(get_current_user)):
     # agent/temp: _pending fallback
     entry = _pending.get(token)
     if entry is None or _is_expired(entry):
+        # agent 는 submit 시 바로 영구 저장되므로, 다른 워커가 받은 제출도 이벤트로 확인된다.
+        # (temp 는 서명 데이터가 제출받은 워커 메모리에만 있어 여기서 완료 처리할 수 없다.)
+        from backend.services.signature_events import recent
+        ev = recent(user.get("tenant_id") or user.get("sub", ""), token)
+        if ev is not None and (ev.get("data") or {}).get("type") == "agent":
+            return {"status": "done"}
         return {"status": "expired"}
     if entry.get("data") is None:
         # agent 즉시 저장 완료 → "done" 반환 (data는 save/{token}에서 저장소에서 읽음)
@@ -323,6 +339,9 @@ def submit_signature(token: str, body: SignatureSubmitBody):
         else:
             _log.warning("[submit] token=%s customer_id=%s no_rid_in_token (pre-fix token)",
                          token_hint, customer_id)
+        if rid:
+            from backend.services.signature_events import publish
+            publish(customer_sheet_key, "signature.submitted", {"request_id": rid, "type": "customer"})
         _log.info("[submit] token=%s rid=%s customer_id=%s step=done", token_hint, rid, customer_id)
         return {"status": "ok"}
 
@@ -353,10 +372,15 @@ def submit_signature(token: str, body: SignatureSubmitBody):
             "status":     "saved",        # data는 저장소에 있으므로 여기 보관 불필요
             "created_at": entry["created_at"],
         }
+        from backend.services.signature_events import publish
+        publish(tid, "signature.submitted", {"request_id": token, "type": "agent"})
         return {"status": "ok"}
     else:
         # temp: 기존 동작 유지 — /temp-slots/{slot}/save/{token}에서 저장
         _pending[token]["data"] = compressed
+        from backend.services.signature_events import publish
+        publish(entry.get("tenant_id", ""), "signature.submitted",
+                {"request_id": token, "type": "temp", "slot": entry.get("slot")})
         return {"status": "ok"}
 
 
@@ -606,6 +630,8 @@ def pad_save(body: PadSaveBody, token: str = Query(...)):
         raise HTTPException(status_code=500, detail=f"저장 실패: {e}")
     if slot is None:
         return {"status": "full"}
+    from backend.services.signature_events import publish
+    publish(tenant_id, "pad.saved", {"slot": slot})
     return {"status": "ok", "slot": slot}
 
 
@@ -633,6 +659,63 @@ def pad_events(user: dict = Depends(get_current_user)):
     return {"events": events}
 
 
+# ── 서명 이벤트 푸시 (SSE) ─────────────────────────────────────────────────────
+
+_SSE_HEARTBEAT = float(os.getenv("SIGNATURE_SSE_HEARTBEAT", "15") or "15")
+_SSE_MAX_SECONDS = float(os.getenv("SIGNATURE_SSE_MAX_SECONDS", "300") or "300")
+_SSE_RETRY_MS = 3000
+
+
+def _sse(item: dict) -> str:
+    data = json.dumps(item.get("data") or {}, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {item['e']}\ndata: {data}\n\n"
+
+
+@router.get("/stream")
+async def signature_stream(
+    request: Request,
+    request_id: Optional[str] = Query(None),
+    user: dict = Depends(get_current_user),
+):
+    """서명 이벤트 스트림(text/event-stream) — poll/pad/events 폴링 대체.
+
+    signature.submitted(request_id 별) / temp_slot.saved / pad.saved 를 로그인 tenant 기준으로
+    보낸다. request_id 를 주면 그 요청 이벤트만, 구독 전에 이미 도착한 제출도 한 번 재전송한다.
+    연결은 ``SIGNATURE_SSE_MAX_SECONDS`` 뒤 닫는다 — 클라이언트가 재연결하면서 토큰/세션을
+    다시 검증받는다. 이벤트 전달은 best-effort 이므로 클라이언트는 느린 폴링을 안전망으로 유지한다."""
+    from backend.services.signature_events import recent, subscribe, unsubscribe
+    tenant_id = user.get("tenant_id") or user.get("sub", "")
+    rid = (request_id or "").strip() or None
+
+    async def gen():
+        loop = asyncio.get_running_loop()
+        sub = subscribe(tenant_id, loop, rid)
+        try:
+            yield f"retry: {_SSE_RETRY_MS}\n\n"
+            if rid:
+                hit = recent(tenant_id, rid)
+                if hit is not None:
+                    yield _sse(hit)
+            deadline = loop.time() + _SSE_MAX_SECONDS
+            while True:
+                left = deadline - loop.time()
+                if left <= 0 or await request.is_disconnected():
+                    break
+                try:
+                    item = await asyncio.wait_for(sub.queue.get(), timeout=min(_SSE_HEARTBEAT, left))
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                yield _sse(item)
+        finally:
+            unsubscribe(sub)
+
+    return StreamingResponse(gen(), media_type="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+    })
+
+
 # ── 임시저장 슬롯 엔드포인트 ──────────────────────────────────────────────────
 
 @router.get("/temp-slots")
@@ -663,7 +746,7 @@ def request_temp_slot(slot: int, body: TempSlotRequestBody, user: dict = Depends
         "data":       None,
     }
     url = f"https://www.hanwory.com/sign/{token}"
-    return {"token": token, "url": url}
+    return {"token": token, "url": url, "request_id": token}
 
 
 @router.post("/temp-slots/{slot}/save/{token}")
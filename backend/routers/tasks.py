@@ -57,10 +57,15 @@ def _sort_key_active(t: dict):
 
 @router.get("/active", response_model=List[dict])
 def get_active_tasks(user: dict = Depends(get_current_user)):
+    from backend.services.cache_service import TTL_TASKS, cache_get_or_load
     from backend.services.tasks_pg_service import list_active
-    tasks = list_active(user["tenant_id"])
-    tasks.sort(key=_sort_key_active)
-    return tasks
+
+    def _load():
+        tasks = list_active(user["tenant_id"])
+        tasks.sort(key=_sort_key_active)
+        return tasks
+    # 쓰기는 tasks_pg_service 가 커밋 직후 "tasks:" 를 (전 워커) 무효화한다.
+    return cache_get_or_load(user["tenant_id"], "tasks:active", TTL_TASKS, _load)
 
 
 @router.post("/active", response_model=dict)
@@ -153,8 +158,10 @@ def complete_tasks(req: CompleteTasksRequest, user: dict = Depends(get_current_u
 
 @router.get("/planned", response_model=List[dict])
 def get_planned_tasks(user: dict = Depends(get_current_user)):
+    from backend.services.cache_service import TTL_TASKS, cache_get_or_load
     from backend.services.tasks_pg_service import list_planned
-    return list_planned(user["tenant_id"])
+    return cache_get_or_load(user["tenant_id"], "tasks:planned", TTL_TASKS,
+                             lambda: list_planned(user["tenant_id"]))
 
 
 @router.post("/planned", response_model=dict)
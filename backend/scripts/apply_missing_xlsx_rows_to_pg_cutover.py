@@ -135,7 +135,8 @@ def _completed_fields(d: dict) -> dict:
 
 
 def _daily_fields(d: dict) -> dict:
-    return {
+    from backend.services.daily_pg_service import memo_slots
+    fields = {
         "date": d.get("date") or None,
         "time": d.get("time") or None,
         "category": d.get("category") or None,
@@ -149,6 +150,9 @@ def _daily_fields(d: dict) -> dict:
         "memo": d.get("memo") or None,
         "customer_id": d.get("customer_id") or None,
     }
+    # 결제 슬롯 컬럼(migration 0036)도 memo 에서 함께 채운다.
+    fields.update(memo_slots(fields["memo"]))
+    return fields
 
 
 _LODGING_FIELDS = [
@@ -221,6 +225,7 @@ def run(session, wb, *, write: bool) -> list[Stat]:
     from backend.db.models.daily import DailyEntry
     from backend.db.models.event import Event
     from backend.db.models.relationship import AccommodationProvider, GuarantorConnection
+    from backend.services import daily_rollup_service
 
     t = SCOPE_TENANT
     stats: list[Stat] = []
@@ -285,6 +290,8 @@ def run(session, wb, *, write: bool) -> list[Stat]:
              lambda k, d: DailyEntry(tenant_id=t, entry_id=k, **_daily_fields(d)),
              lambda k, d: k, write=write, session=session)
     if write:
+        # 롤업을 우회한 삽입 → 상태 행 삭제, 다음 분석 조회에서 전체 재집계.
+        daily_rollup_service.invalidate(session, t)
         session.commit()
     stats.append(s)
 
@@ -19,7 +19,6 @@ import json, re, sys, csv
 from pathlib import Path
 from collections import Counter
 
-import fitz
 
 ROOT     = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(ROOT))
@@ -53,11 +52,9 @@ _BRACKET_FORMAL = re.compile(r"〔\s*([A-Z]-\d+(?:-(?:\d+|[A-Z][\w]*))?)\s*〕")
 # ─── 데이터 로딩 ────────────────────────────────────────────────
 def load_pdf_pages(path: Path) -> tuple[dict[int, str], int]:
     """{page_no(1-based): text}"""
-    doc = fitz.open(path)
-    out = {p.number + 1: p.get_text() for p in doc}
-    total = len(doc)
-    doc.close()
-    return out, total
+    from backend.services import page_text_store  # 같은 PDF 는 한 번만 파싱(공유 저장소)
+    out = page_text_store.page_texts(path).load_all()
+    return out, len(out)
 
 
 def load_structure(name: str) -> dict | None:
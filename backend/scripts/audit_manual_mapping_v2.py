@@ -27,7 +27,6 @@ import json, re, sys, csv
 from pathlib import Path
 from collections import Counter
 
-import fitz
 
 ROOT     = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(ROOT))
@@ -92,11 +91,9 @@ _BRACKET_FORMAL = re.compile(r"〔\s*([A-Z]-\d+(?:-(?:\d+|[A-Z][\w]*))?)\s*〕")
 
 
 def load_pdf_pages(path: Path) -> tuple[dict[int, str], int]:
-    doc = fitz.open(path)
-    out = {p.number + 1: p.get_text() for p in doc}
-    total = len(doc)
-    doc.close()
-    return out, total
+    from backend.services import page_text_store  # 같은 PDF 는 한 번만 파싱(공유 저장소)
+    out = page_text_store.page_texts(path).load_all()
+    return out, len(out)
 
 
 def load_structure(name: str) -> dict | None:
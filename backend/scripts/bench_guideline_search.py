@@ -0,0 +1,108 @@
+"""
+Micro-benchmark: 실무지침 키워드 검색 — 과거 선형 스캔 vs GuidelineSearchIndex.
+
+Usage:
+    python backend/scripts/bench_guideline_search.py [--repeat N]
+
+실제 backend/data/immigration_guidelines_db_v2.json 을 읽어
+  1) 인덱스 구축 시간
+  2) 질의별 선형 스캔(routers/guidelines.py 의 과거 구현) / 인덱스 cold(캐시 미스) / warm(캐시 히트) 시간
+을 출력하고, 두 구현의 결과 row_id 집합이 같은지 검증한다(다르면 exit 1).
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from backend.services.guideline_search_index import GuidelineSearchIndex  # noqa: E402
+
+DB_PATH = ROOT / "backend" / "data" / "immigration_guidelines_db_v2.json"
+
+QUERIES = [
+    "F-4", "f", "E-9", "D-2", "시간제취업", "사업자등록증", "여권", "연장",
+    "통합신청서", "재입국", "결핵", "가족관계", "H-2", "체류자격외", "없는검색어xyz",
+]
+
+
+def linear_search(rows: list, q: str) -> set:
+    """routers/guidelines.py 의 과거 search_guidelines 와 동일한 선형 스캔."""
+    search_index: dict = {}
+    for row in rows:
+        for sk in row.get("search_keys", []) or []:
+            kv = str(sk.get("key_value", "")).lower()
+            if kv:
+                search_index.setdefault(kv, []).append(row["row_id"])
+    q_lower = q.lower().strip()
+    matched = set()
+    for kv, ids in search_index.items():
+        if q_lower in kv:
+            matched.update(ids)
+    for row in rows:
+        if (
+            q_lower in str(row.get("detailed_code", "")).lower()
+            or q_lower in str(row.get("business_name", "")).lower()
+            or q_lower in str(row.get("overview_short", "")).lower()
+            or q_lower in str(row.get("form_docs", "")).lower()
+            or q_lower in str(row.get("supporting_docs", "")).lower()
+        ):
+            matched.add(row["row_id"])
+    return matched
+
+
+def _ms(t0: float, n: int = 1) -> float:
+    return (time.perf_counter() - t0) * 1000 / n
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=200)
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    with open(DB_PATH, encoding="utf-8") as f:
+        rows = json.load(f).get("master_rows", [])
+    load_ms = _ms(t0)
+
+    t0 = time.perf_counter()
+    idx = GuidelineSearchIndex(rows)
+    build_ms = _ms(t0)
+    print(f"rows={len(rows)} json_load={load_ms:.1f}ms index_build={build_ms:.1f}ms {idx.stats()}")
+    print(f"{'query':<16}{'hits':>6}{'linear(ms)':>12}{'cold(ms)':>10}{'warm(ms)':>10}{'speedup':>9}")
+
+    ok = True
+    tot_lin = tot_cold = 0.0
+    for q in QUERIES:
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            expected = linear_search(rows, q)
+        lin = _ms(t0, args.repeat)
+
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            idx._cache.clear()
+            got = idx.search_ids(q)
+        cold = _ms(t0, args.repeat)
+
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            idx.search_ids(q)
+        warm = _ms(t0, args.repeat)
+
+        if set(got) != expected:
+            ok = False
+            print(f"MISMATCH q={q!r}: linear={len(expected)} index={len(got)}")
+        tot_lin += lin
+        tot_cold += cold
+        print(f"{q:<16}{len(got):>6}{lin:>12.3f}{cold:>10.3f}{warm:>10.4f}{lin / max(cold, 1e-9):>8.1f}x")
+
+    print(f"total linear={tot_lin:.2f}ms cold={tot_cold:.2f}ms "
+          f"speedup={tot_lin / max(tot_cold, 1e-9):.1f}x  result-sets={'OK' if ok else 'MISMATCH'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""
+Micro-benchmark: 매뉴얼 페이지 diff — 과거 인덱스 1:1 비교 vs 정렬 기반 diff_pages.
+
+Usage:
+    python backend/scripts/bench_manual_diff.py [--repeat N] [--synthetic PAGES]
+
+baseline(backend/data/manuals/baseline/260414) 의 rhwp_jsonl(없으면 rhwp_text/ 사본)을 읽어
+(둘 다 없으면 --synthetic 페이지 수만큼 합성) 시나리오별로
+  1) non-same 행 수, 2) 검토 PDF 렌더 대상 페이지 수(collect_affected_pages, ±1),
+  3) 실행 시간
+을 두 구현에 대해 출력한다. 변경 없는 입력에서 정렬 diff 가 non-same 을 내면 exit 1.
+"""
+import argparse
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from backend.scripts.manual_update_local import (  # noqa: E402
+    BASELINE_DIR_PARENT, _resolve_baseline_path, collect_affected_pages, diff_pages,
+    load_jsonl, normalize,
+)
+
+
+def index_diff_pages(baseline: list, new: list, *, snippet_len: int = 140) -> list:
+    """manual_update_local.diff_pages 의 과거 구현(인덱스 1:1 + difflib 유사도)."""
+    import difflib
+
+    def _sim(a: str, b: str, cap: int = 4000) -> float:
+        na, nb = normalize(a)[:cap], normalize(b)[:cap]
+        if not na and not nb:
+            return 1.0
+        return round(difflib.SequenceMatcher(None, na, nb).ratio(), 3)
+
+    base_hash_to_pages: dict = {}
+    for b in baseline:
+        if b.get("normalized_text_hash"):
+            base_hash_to_pages.setdefault(b["normalized_text_hash"], []).append(b["rhwp_page_index"])
+    out = []
+    common = min(len(baseline), len(new))
+    for i in range(common):
+        b, n = baseline[i], new[i]
+        if b.get("normalized_text_hash") == n.get("normalized_text_hash"):
+            out.append({"manual_label": n.get("manual_label"), "change_type": "same",
+                        "baseline_page": b["rhwp_page_index"], "new_page": n["rhwp_page_index"]})
+            continue
+        other = [p for p in base_hash_to_pages.get(n.get("normalized_text_hash") or "", [])
+                 if p != b["rhwp_page_index"]]
+        out.append({"manual_label": n.get("manual_label"), "change_type": "moved" if other else "modified",
+                    "baseline_page": b["rhwp_page_index"], "new_page": n["rhwp_page_index"],
+                    "similarity": _sim(b.get("text", ""), n.get("text", ""))})
+    for n in new[common:]:
+        out.append({"manual_label": n.get("manual_label"), "change_type": "added",
+                    "baseline_page": None, "new_page": n["rhwp_page_index"]})
+    for b in baseline[common:]:
+        out.append({"manual_label": b.get("manual_label"), "change_type": "deleted",
+                    "baseline_page": b["rhwp_page_index"], "new_page": None})
+    return out
+
+
+def _load_baselines(synthetic: int) -> dict:
+    base_dir = BASELINE_DIR_PARENT / "260414"
+    manifest = base_dir / "manifest.json"
+    out = {}
+    if manifest.exists():
+        for label, m in json.loads(manifest.read_text(encoding="utf-8")).get("manuals", {}).items():
+            rel = ((m or {}).get("rhwp_jsonl") or {}).get("path")
+            p = _resolve_baseline_path(rel) if rel else None
+            if not (p and p.exists()):
+                p = base_dir / "rhwp_text" / f"{label}_pages.jsonl"   # baseline 에 시드된 사본
+            if p.exists():
+                out[label] = load_jsonl(p)
+    if not out:
+        print(f"[bench] baseline JSONL 없음 — {synthetic}쪽 합성 매뉴얼 사용")
+        texts = [f"제{i}쪽 체류자격별 안내 본문 {i} 신청요건 제출서류 수수료 " * 60 for i in range(synthetic)]
+        out["synthetic"] = _renumber([{"manual_label": "synthetic", "text": t} for t in texts])
+    return out
+
+
+def _renumber(pages: list) -> list:
+    return [dict(p, rhwp_page_index=i + 1,
+                 normalized_text_hash=hashlib.sha256(normalize(p.get("text", "")).encode()).hexdigest())
+            for i, p in enumerate(pages)]
+
+
+def _scenarios(pages: list) -> dict:
+    n = len(pages)
+    edit = dict(pages[n // 2], text=pages[n // 2].get("text", "") + " 개정")
+    return {
+        "unchanged": pages,
+        "insert@3": _renumber(pages[:2] + [{"manual_label": pages[0].get("manual_label"), "text": "신설 안내"}] + pages[2:]),
+        "delete@3": _renumber(pages[:2] + pages[3:]),
+        "edit@mid": _renumber(pages[: n // 2] + [edit] + pages[n // 2 + 1:]),
+        "move-block": _renumber(pages[:5] + pages[15:25] + pages[5:15] + pages[25:]),
+    }
+
+
+def _ms(t0: float, n: int = 1) -> float:
+    return (time.perf_counter() - t0) * 1000 / n
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--synthetic", type=int, default=600)
+    args = ap.parse_args()
+
+    baselines = _load_baselines(args.synthetic)
+    ok = True
+    print(f"{'manual':<18}{'scenario':<12}{'old non-same':>13}{'new non-same':>13}"
+          f"{'old render':>11}{'new render':>11}{'old(ms)':>10}{'new(ms)':>10}")
+    for label, base in baselines.items():
+        base = _renumber(base)
+        for name, new in _scenarios(base).items():
+            counts = {label: len(new)}
+            res = {}
+            for impl, fn in (("old", index_diff_pages), ("new", diff_pages)):
+                t0 = time.perf_counter()
+                for _ in range(args.repeat):
+                    rows = fn(base, new)
+                ms = _ms(t0, args.repeat)
+                non_same = [r for r in rows if r["change_type"] != "same"]
+                render = sum(len(v) for v in collect_affected_pages(non_same, 1, counts).values())
+                res[impl] = (len(non_same), render, ms)
+            if name == "unchanged" and res["new"][0]:
+                ok = False
+            print(f"{label:<18}{name:<12}{res['old'][0]:>13}{res['new'][0]:>13}"
+                  f"{res['old'][1]:>11}{res['new'][1]:>11}{res['old'][2]:>10.1f}{res['new'][2]:>10.1f}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
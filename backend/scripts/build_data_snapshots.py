@@ -0,0 +1,89 @@
+"""
+Build compact load-time snapshots of the static JSON data (services/data_snapshot.py).
+
+Usage:
+    python backend/scripts/build_data_snapshots.py [--check]
+
+  backend/data/addr_index.json                  → addr_index.snap (mmap 문자열 멀티맵)
+  backend/data/immigration_guidelines_db_v2.json → immigration_guidelines_db_v2.pkl.snap
+
+각 스냅샷 헤더에는 원본 JSON 의 sha256 이 들어가며, 런타임 로더는 해시가 다르면
+스냅샷을 무시하고 JSON 으로 폴백한다(따라서 빌드 누락은 느려질 뿐 틀리지 않는다).
+Docker 이미지 빌드(COPY . . 직후)에서 실행한다.
+
+--check: 스냅샷을 쓰지 않고, 현재 스냅샷이 원본과 일치하는지 + JSON 대비 로드 시간만 출력.
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from backend.services import data_snapshot as ds  # noqa: E402
+
+DATA_DIR = ROOT / "backend" / "data"
+ADDR_INDEX = DATA_DIR / "addr_index.json"
+GUIDELINES_DB = DATA_DIR / "immigration_guidelines_db_v2.json"
+
+
+def build_addr_index(src: Path) -> Path:
+    dst = ds.snapshot_path(src)
+    with open(src, encoding="utf-8") as f:
+        data = json.load(f)
+    ds._atomic_write(dst, ds.encode_multimaps(ds.source_digest(src), data))
+    return dst
+
+
+def build_object(src: Path) -> Path:
+    dst = ds.snapshot_path(src, "object")
+    with open(src, encoding="utf-8") as f:
+        data = json.load(f)
+    ds._atomic_write(dst, ds.encode_object(ds.source_digest(src), data))
+    return dst
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, (time.perf_counter() - t0) * 1000
+
+
+def check() -> int:
+    bad = 0
+    maps, ms_snap = _timed(lambda: ds.open_multimaps(ds.snapshot_path(ADDR_INDEX),
+                                                     ds.source_digest(ADDR_INDEX)))
+    _, ms_json = _timed(lambda: json.load(open(ADDR_INDEX, encoding="utf-8")))
+    print(f"addr_index: snapshot {'OK' if maps else 'STALE/MISSING'} "
+          f"({ms_snap:.1f}ms vs json {ms_json:.1f}ms)")
+    bad += maps is None
+
+    snap = ds.snapshot_path(GUIDELINES_DB, "object")
+    _, ms_snap = _timed(lambda: ds.load_json_object(GUIDELINES_DB, snap))
+    _, ms_json = _timed(lambda: json.load(open(GUIDELINES_DB, encoding="utf-8")))
+    ok = snap.exists() and snap.read_bytes()[8:40] == ds.source_digest(GUIDELINES_DB)
+    print(f"guidelines: snapshot {'OK' if ok else 'STALE/MISSING'} "
+          f"({ms_snap:.1f}ms vs json {ms_json:.1f}ms)")
+    bad += not ok
+    return 1 if bad else 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--check", action="store_true")
+    args = ap.parse_args()
+    if args.check:
+        return check()
+    for src, build in ((ADDR_INDEX, build_addr_index), (GUIDELINES_DB, build_object)):
+        if not src.exists():
+            print(f"skip (missing): {src}")
+            continue
+        dst = build(src)
+        print(f"{src.name} → {dst.name} ({dst.stat().st_size // 1024}KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
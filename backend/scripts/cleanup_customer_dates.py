@@ -19,6 +19,9 @@
   빈값                 → skip
   판독 불가/이상 포맷   → 변환하지 않고 보고만 (unparseable)
 
+--apply 는 만기일 DATE 그림자 컬럼(card_expiry_on/passport_expiry_on)도 TEXT 기준으로 다시 맞춘다
+(쓰기 경로를 거치지 않고 DB 를 직접 고친 뒤의 재동기화 용도).
+
 원칙: 멱등 · dry-run 기본 · --apply 시에만 UPDATE · 운영 DB 실행 금지 ·
 민감정보(reg_back/passport_no/주소) 미출력(고객ID·필드·날짜문자열만).
 
@@ -69,6 +72,8 @@ def to_date_only(v):
 def run(apply: bool):
     from backend.db.models.customer import Customer
     from backend.db.session import get_sessionmaker
+    from backend.services.customer_pg_service import EXPIRY_SHADOW_COLUMNS
+    from backend.services.date_normalize import parse_date_only
     from sqlalchemy import select
 
     SessionLocal = get_sessionmaker()
@@ -97,6 +102,10 @@ def run(apply: bool):
                     unparseable.append((row.customer_id, col, str(cur)))
             if row_changed:
                 changed_rows += 1
+            if apply:
+                # 만기일 DATE 그림자(migration 0039)를 정리된 TEXT 기준으로 다시 맞춘다.
+                for text_col, date_col in EXPIRY_SHADOW_COLUMNS.items():
+                    setattr(row, date_col, parse_date_only(getattr(row, text_col, None)))
         if apply:
             session.commit()
 
@@ -211,6 +211,9 @@ def _customer_row_to_pg(d: dict) -> dict:
     for _date_col in ("card_issue_date", "card_expiry_date", "passport_issue_date", "passport_expiry_date"):
         if _date_col in out and out[_date_col] is not None:
             out[_date_col] = normalize_date_only(out[_date_col])
+    # 만기 알림용 DATE 그림자(migration 0039)도 함께 채운다.
+    from backend.services.customer_pg_service import apply_expiry_shadows
+    apply_expiry_shadows(out)
     # 비고 / 기타 are not in mapping above — concat into memo if absent
     extra_bits: list[str] = []
     for k in ("비고", "기타"):
@@ -246,6 +249,8 @@ _RESET_TABLES = [
     "completed_tasks",
     "active_tasks",
     "planned_tasks",
+    "daily_rollups",
+    "daily_rollup_states",
     "daily_entries",
     "daily_balances",
     "memos",
@@ -660,6 +665,8 @@ def imp_completed(session, wb, tenant_id: str, role: str) -> None:
 
 def imp_daily(session, wb, tenant_id: str, role: str) -> None:
     from backend.db.models.daily import DailyEntry, DailyBalance
+    from backend.services import daily_rollup_service
+    from backend.services.daily_pg_service import memo_slots
     from sqlalchemy import select
 
     header, rows = _read_tab(wb, "일일결산")
@@ -700,6 +707,8 @@ def imp_daily(session, wb, tenant_id: str, role: str) -> None:
             "memo": d.get("memo") or None,
             "customer_id": d.get("customer_id") or None,
         }
+        # 결제 슬롯 컬럼(migration 0036)도 memo 에서 함께 채운다 — 롤업/결제수단 집계는 컬럼만 읽는다.
+        fields.update(memo_slots(fields["memo"]))
         if existing is None:
             session.add(DailyEntry(tenant_id=tenant_id, entry_id=eid, **fields))
             _bump(f"daily[{tenant_id}]", "inserted")
@@ -707,6 +716,8 @@ def imp_daily(session, wb, tenant_id: str, role: str) -> None:
             for k, v in fields.items():
                 setattr(existing, k, v)
             _bump(f"daily[{tenant_id}]", "updated")
+    # 롤업을 우회한 일괄 쓰기 → 상태 행 삭제, 다음 분석 조회에서 전체 재집계.
+    daily_rollup_service.invalidate(session, tenant_id)
 
     # 잔액 → daily_balances
     header2, rows2 = _read_tab(wb, "잔액")
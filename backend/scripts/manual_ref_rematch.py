@@ -25,6 +25,8 @@ from pathlib import Path
 from typing import Optional
 
 ROOT     = Path(__file__).parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
 DB_PATH  = ROOT / "backend" / "data" / "immigration_guidelines_db_v2.json"  # 운영 DB — 이동 금지
 # 매뉴얼/검토 산출물 디렉토리 — MANUALS_DATA_DIR(기본=backend/data/manuals)로 분리.
 # unlocked_*.pdf(검증용) 와 manual_update_review.json 이 이 경로를 따른다.
@@ -107,10 +109,9 @@ def _get_pdf_pages(manual: str) -> Optional[list[str]]:
     if not pdf_path or not pdf_path.exists():
         return None
     try:
-        import fitz  # PyMuPDF
-        doc = fitz.open(str(pdf_path))
-        pages = [normalize_pdf_text(doc.load_page(i).get_text()) for i in range(doc.page_count)]
-        doc.close()
+        from backend.services import page_text_store  # 같은 PDF 는 한 번만 파싱(공유 저장소)
+        texts = page_text_store.page_texts(pdf_path).load_all()
+        pages = [normalize_pdf_text(texts[p]) for p in sorted(texts)]
         _pdf_cache[manual] = pages
         return pages
     except Exception as e:
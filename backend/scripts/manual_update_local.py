@@ -46,7 +46,7 @@ CLI
     --force                      (같은 버전 재실행 시 재추출 강제)
 """
 from __future__ import annotations
-import argparse, datetime, hashlib, json, os, pathlib, re, shutil, subprocess, sys
+import argparse, datetime, hashlib, json, os, pathlib, re, shutil, subprocess, sys, tempfile, time
 
 sys.stdout.reconfigure(encoding='utf-8')  # type: ignore[union-attr]
 
@@ -99,7 +99,7 @@ def sha256(p: pathlib.Path) -> str:
 
 
 def run_node(args: list[str], log_path: pathlib.Path, *,
-             max_old_space_mb: int = 4096) -> dict:
+             max_old_space_mb: int = 4096, usage: dict | None = None) -> dict:
     """Run a Node script under tools/rhwp_manual_pipeline.
 
     Captures stdout JSON lines. Last 'done' line is returned as the meta dict.
@@ -107,18 +107,36 @@ def run_node(args: list[str], log_path: pathlib.Path, *,
     ``max_old_space_mb`` caps V8's old-space heap. The 4096 default suits the
     host/local pipeline; the adaptive PDF batcher lowers it on small (≤512MB)
     containers so V8 GCs aggressively instead of growing past the cgroup limit.
+
+    ``usage`` (optional dict) is filled with ``wall_ms`` and ``peak_rss_mb`` —
+    the peak resident set of node and its reaped children (chromium), read from
+    ``os.wait4`` so concurrent runs each get their own figure (None where
+    ``wait4`` is unavailable, e.g. Windows).
     """
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    proc = subprocess.run(
-        ['node', f'--max-old-space-size={int(max_old_space_mb)}'] + args,
-        capture_output=True, text=True, encoding='utf-8',
-    )
-    log_path.write_text(proc.stdout + ('\n[stderr]\n' + proc.stderr if proc.stderr else ''),
+    t0 = time.perf_counter()
+    peak_kb = None
+    with tempfile.TemporaryFile() as fo, tempfile.TemporaryFile() as fe:
+        proc = subprocess.Popen(['node', f'--max-old-space-size={int(max_old_space_mb)}'] + args,
+                                stdout=fo, stderr=fe)
+        if hasattr(os, 'wait4'):
+            _pid, status, ru = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            peak_kb = ru.ru_maxrss
+        else:
+            proc.wait()
+        fo.seek(0); fe.seek(0)
+        stdout = fo.read().decode('utf-8', errors='replace')
+        stderr = fe.read().decode('utf-8', errors='replace')
+    if usage is not None:
+        usage['wall_ms'] = int((time.perf_counter() - t0) * 1000)
+        usage['peak_rss_mb'] = round(peak_kb / 1024, 1) if peak_kb is not None else None
+    log_path.write_text(stdout + ('\n[stderr]\n' + stderr if stderr else ''),
                         encoding='utf-8')
     if proc.returncode != 0:
         raise RuntimeError(f'node failed (rc={proc.returncode}): see {log_path}')
     last_done: dict = {}
-    for line in proc.stdout.splitlines():
+    for line in stdout.splitlines():
         line = line.strip()
         if not line.startswith('{'): continue
         try:
@@ -161,85 +179,184 @@ def normalize(s: str) -> str:
     return re.sub(r'[-‐‑‒–—―]', '-', s)
 
 
+_SHINGLE = 4          # 문자 shingle 길이(normalize 후)
+_MIN_PAIR_SIM = 0.3   # 크기가 다른 replace 블록에서 modified 로 짝지을 최소 유사도
+_PAIR_DP_CAP = 4096   # replace 블록 짝짓기 DP 상한(baseline×new 칸 수) — 넘으면 위치 순 짝짓기
+
+
+def _shingles(s: str, *, cap: int = 4000) -> frozenset:
+    ns = normalize(s)[:cap]
+    if len(ns) <= _SHINGLE:
+        return frozenset([ns]) if ns else frozenset()
+    return frozenset(ns[i:i + _SHINGLE] for i in range(len(ns) - _SHINGLE + 1))
+
+
+def _shingle_similarity(sa: frozenset, sb: frozenset) -> float:
+    """shingle 집합 Dice 계수(0..1) — SequenceMatcher.ratio 와 같은 2M/T 형태, 선형 시간."""
+    if not sa and not sb:
+        return 1.0
+    return round(2 * len(sa & sb) / (len(sa) + len(sb)), 3)
+
+
 def _similarity(a: str, b: str, *, cap: int = 4000) -> float:
     """Cheap normalized-text similarity (0..1) for the changed-page table.
 
-    Capped length keeps it fast on long pages."""
-    import difflib
-    na, nb = normalize(a)[:cap], normalize(b)[:cap]
-    if not na and not nb:
-        return 1.0
-    return round(difflib.SequenceMatcher(None, na, nb).ratio(), 3)
+    Character 4-gram shingle overlap instead of difflib — linear in page length."""
+    return _shingle_similarity(_shingles(a, cap=cap), _shingles(b, cap=cap))
+
+
+def _pair_block(bs: list[int], ns: list[int], sim) -> list[tuple[int | None, int | None]]:
+    """replace 블록의 baseline/new 페이지를 순서를 지키며 짝짓는다 → [(bi|None, ni|None)].
+
+    크기가 같으면 위치 순 1:1(전부 modified). 다르면 유사도 합이 최대인 단조 정렬(DP)로
+    _MIN_PAIR_SIM 이상인 쌍만 짝짓고 나머지는 deleted/added. 블록이 너무 크면 위치 순."""
+    if len(bs) == len(ns) or len(bs) * len(ns) > _PAIR_DP_CAP:
+        k = min(len(bs), len(ns))
+        return ([(bs[i], ns[i]) for i in range(k)]
+                + [(b, None) for b in bs[k:]] + [(None, n) for n in ns[k:]])
+    m, n = len(bs), len(ns)
+    score = [[0.0] * (n + 1) for _ in range(m + 1)]
+    for i in range(m - 1, -1, -1):
+        for j in range(n - 1, -1, -1):
+            s = sim(bs[i], ns[j])
+            best = max(score[i + 1][j], score[i][j + 1])
+            if s >= _MIN_PAIR_SIM:
+                best = max(best, s + score[i + 1][j + 1])
+            score[i][j] = best
+    out: list[tuple[int | None, int | None]] = []
+    i = j = 0
+    while i < m and j < n:
+        s = sim(bs[i], ns[j])
+        if s >= _MIN_PAIR_SIM and score[i][j] == s + score[i + 1][j + 1]:
+            out.append((bs[i], ns[j])); i += 1; j += 1
+        elif score[i][j] == score[i + 1][j]:
+            out.append((bs[i], None)); i += 1
+        else:
+            out.append((None, ns[j])); j += 1
+    out.extend((bs[k], None) for k in range(i, m))
+    out.extend((None, ns[k]) for k in range(j, n))
+    return out
 
 
 def diff_pages(baseline: list[dict], new: list[dict], *, snippet_len: int = 140) -> list[dict]:
-    """Compare two page lists by normalized_text_hash + rhwp_page_index alignment.
+    """Align two page lists by normalized_text_hash sequence, then classify.
 
-    Returns one row per page in max(baseline, new). change_type:
+    Returns one row per aligned pair / unpaired page, in document order. change_type:
       same / modified / added / deleted / moved
 
-    ``moved`` is detected when a 'modified' page's new content hash matches a
-    *different* baseline page (content relocated). ``similarity`` is filled for
-    modified/moved rows so the review UI can sort by magnitude of change.
+    Alignment is a longest-matching-block diff over the hash sequence
+    (``difflib.SequenceMatcher`` on hashes, ``autojunk`` off), so a page inserted
+    or removed near the front no longer turns every later page into ``modified``
+    — shifted pages stay ``same`` with differing baseline_page/new_page.
+    Unmatched new pages whose hash equals an unmatched baseline page are
+    ``moved`` (baseline_page = source, ``moved_from`` set). Remaining pages in a
+    replaced block are paired into ``modified`` rows (see :func:`_pair_block`).
+    ``similarity`` is shingle overlap, filled for modified/moved rows.
     """
-    bn = len(baseline); nn = len(new)
-    # baseline hash → list of baseline page indices (for moved detection)
-    base_hash_to_pages: dict[str, list[int]] = {}
-    for b in baseline:
-        h = b.get('normalized_text_hash')
-        if h:
-            base_hash_to_pages.setdefault(h, []).append(b['rhwp_page_index'])
+    import difflib
+    bh = [b.get('normalized_text_hash') or '' for b in baseline]
+    nh = [n.get('normalized_text_hash') or '' for n in new]
+    ops = difflib.SequenceMatcher(None, bh, nh, autojunk=False).get_opcodes()
+
+    # moved: 정렬 밖으로 밀려난 new 페이지 중 내용이 같은 (역시 밀려난) baseline 페이지가 있는 것
+    free_base: dict[str, list[int]] = {}
+    for tag, i1, i2, _j1, _j2 in ops:
+        if tag in ('delete', 'replace'):
+            for i in range(i1, i2):
+                if bh[i]:
+                    free_base.setdefault(bh[i], []).append(i)
+    moved_to: dict[int, int] = {}            # new idx → baseline idx
+    for tag, _i1, _i2, j1, j2 in ops:
+        if tag in ('insert', 'replace'):
+            for j in range(j1, j2):
+                if free_base.get(nh[j]):
+                    moved_to[j] = free_base[nh[j]].pop(0)
+    moved_base = set(moved_to.values())
+
+    shingle_cache: dict[tuple[str, int], frozenset] = {}
+
+    def _sh(side: str, idx: int) -> frozenset:
+        key = (side, idx)
+        if key not in shingle_cache:
+            page = baseline[idx] if side == 'b' else new[idx]
+            shingle_cache[key] = _shingles(page.get('text', ''))
+        return shingle_cache[key]
+
+    def _sim(i: int, j: int) -> float:
+        return _shingle_similarity(_sh('b', i), _sh('n', j))
+
+    def _snip(page: dict) -> str:
+        return page.get('text', '')[:snippet_len].replace('\n', ' ')
+
+    def _kw(*pages: dict) -> list:
+        return sorted(set(k for p in pages for k in (p.get('keywords') or [])))
 
     out: list[dict] = []
-    common = min(bn, nn)
-    for i in range(common):
-        b = baseline[i]; n = new[i]
-        bh = b.get('normalized_text_hash'); nh = n.get('normalized_text_hash')
-        if bh == nh:
+
+    def _emit(i: int | None, j: int | None, ch: str | None = None) -> None:
+        b = baseline[i] if i is not None else None
+        n = new[j] if j is not None else None
+        if b is not None and n is not None:
+            if ch == 'same':
+                out.append({
+                    'manual_label': n.get('manual_label') or b.get('manual_label'),
+                    'baseline_page': b['rhwp_page_index'], 'new_page': n['rhwp_page_index'],
+                    'change_type': 'same', 'similarity': 1.0,
+                    'baseline_snippet': '', 'new_snippet': '',
+                    'keywords': _kw(b, n),
+                })
+                return
             out.append({
                 'manual_label': n.get('manual_label') or b.get('manual_label'),
-                'baseline_page': b['rhwp_page_index'], 'new_page': n['rhwp_page_index'],
-                'change_type': 'same', 'similarity': 1.0,
-                'baseline_snippet': '', 'new_snippet': '',
-                'keywords': sorted(set((b.get('keywords') or []) + (n.get('keywords') or []))),
+                'baseline_page': b['rhwp_page_index'],
+                'new_page': n['rhwp_page_index'],
+                'change_type': ch,
+                'moved_from': b['rhwp_page_index'] if ch == 'moved' else None,
+                'similarity': _sim(i, j),
+                'baseline_snippet': _snip(b),
+                'new_snippet': _snip(n),
+                'keywords': _kw(b, n),
             })
+        elif n is not None:
+            out.append({
+                'manual_label': n.get('manual_label'),
+                'baseline_page': None, 'new_page': n['rhwp_page_index'],
+                'change_type': 'added', 'similarity': None,
+                'baseline_snippet': '', 'new_snippet': _snip(n),
+                'keywords': n.get('keywords') or [],
+            })
+        else:
+            out.append({
+                'manual_label': b.get('manual_label'),
+                'baseline_page': b['rhwp_page_index'], 'new_page': None,
+                'change_type': 'deleted', 'similarity': None,
+                'baseline_snippet': _snip(b), 'new_snippet': '',
+                'keywords': b.get('keywords') or [],
+            })
+
+    for tag, i1, i2, j1, j2 in ops:
+        if tag == 'equal':
+            for k in range(i2 - i1):
+                _emit(i1 + k, j1 + k, 'same')
             continue
-        # not same on this index — modified, or moved if new content lives
-        # at a different baseline page
-        ch = 'modified'; moved_from = None
-        same_pages = base_hash_to_pages.get(nh or '', [])
-        other = [p for p in same_pages if p != b['rhwp_page_index']]
-        if other:
-            ch = 'moved'; moved_from = other[0]
-        out.append({
-            'manual_label': n.get('manual_label') or b.get('manual_label'),
-            'baseline_page': b['rhwp_page_index'],
-            'new_page': n['rhwp_page_index'],
-            'change_type': ch,
-            'moved_from': moved_from,
-            'similarity': _similarity(b.get('text', ''), n.get('text', '')),
-            'baseline_snippet': b.get('text', '')[:snippet_len].replace('\n', ' '),
-            'new_snippet':      n.get('text', '')[:snippet_len].replace('\n', ' '),
-            'keywords': sorted(set((b.get('keywords') or []) + (n.get('keywords') or []))),
-        })
-    for i in range(common, nn):
-        n = new[i]
-        out.append({
-            'manual_label': n.get('manual_label'),
-            'baseline_page': None, 'new_page': n['rhwp_page_index'],
-            'change_type': 'added', 'similarity': None,
-            'baseline_snippet': '', 'new_snippet': n.get('text', '')[:snippet_len].replace('\n', ' '),
-            'keywords': n.get('keywords') or [],
-        })
-    for i in range(common, bn):
-        b = baseline[i]
-        out.append({
-            'manual_label': b.get('manual_label'),
-            'baseline_page': b['rhwp_page_index'], 'new_page': None,
-            'change_type': 'deleted', 'similarity': None,
-            'baseline_snippet': b.get('text', '')[:snippet_len].replace('\n', ' '), 'new_snippet': '',
-            'keywords': b.get('keywords') or [],
-        })
+        bs = [i for i in range(i1, i2) if i not in moved_base]
+        ns = [j for j in range(j1, j2) if j not in moved_to]
+        pairs = iter(_pair_block(bs, ns, _sim))
+        # new 순서대로 내보내되 moved 는 new 위치에, 짝 없는 baseline 은 블록 내 순서대로
+        pending = next(pairs, None)
+        for j in range(j1, j2):
+            if j in moved_to:
+                _emit(moved_to[j], j, 'moved')
+                continue
+            while pending is not None and pending[1] is None:
+                _emit(pending[0], None)
+                pending = next(pairs, None)
+            if pending is not None:
+                _emit(pending[0], pending[1], 'modified')
+                pending = next(pairs, None)
+        while pending is not None:
+            _emit(pending[0], pending[1], 'modified' if pending[1] is not None else None)
+            pending = next(pairs, None)
     return out
 
 
@@ -350,11 +467,40 @@ def reconcile_decision_store(decisions: dict, candidates: list[dict]) -> dict:
     return decisions
 
 
+def aligned_page_map(changed: list[dict]) -> dict[str, dict[int, int]]:
+    """manual_label → {baseline_page: new_page} for aligned (same/modified) diff rows.
+
+    diff_pages keeps pages shifted by an insert/delete as ``same`` with differing
+    page numbers; this map lets candidate generation remap refs pointing at them.
+    ``moved`` rows are left out — a moved page does not shift its neighbours."""
+    out: dict[str, dict[int, int]] = {}
+    for c in changed:
+        if c.get('change_type') not in ('same', 'modified'):
+            continue
+        if c.get('baseline_page') and c.get('new_page') and c.get('manual_label'):
+            out.setdefault(c['manual_label'], {})[c['baseline_page']] = c['new_page']
+    return out
+
+
+def remap_page_range(pf: int, pt: int, page_map: dict[int, int]) -> tuple[int, int]:
+    """Shift a baseline page range through :func:`aligned_page_map`. An unaligned end
+    (added/deleted around it) keeps the offset of the other end; neither aligned → unchanged."""
+    nf, nt = page_map.get(pf), page_map.get(pt)
+    if nf is None and nt is None:
+        return pf, pt
+    if nf is None:
+        nf = pf + (nt - pt)
+    if nt is None:
+        nt = pt + (nf - pf)
+    return nf, max(nf, nt)
+
+
 def make_ref_candidates(changed: list[dict], new_pages_by_label: dict[str, list[dict]]) -> list[dict]:
     """Generate manual_ref update candidates ONLY for refs whose page range
-    overlaps a changed page or whose match_text appears on a changed page.
-    Unaffected refs are NOT included. (immigration_guidelines_db_v2.json is read
-    only — never modified here.)"""
+    overlaps a changed page, whose match_text appears on a changed page, or whose
+    pages were shifted by an insert/delete elsewhere (``same`` rows with a new page
+    number → ``shifted`` remap candidate). Unaffected refs are NOT included.
+    (immigration_guidelines_db_v2.json is read only — never modified here.)"""
     db = json.loads(DB_PATH.read_text(encoding='utf-8'))
     master = db.get('master_rows', [])
 
@@ -364,6 +510,10 @@ def make_ref_candidates(changed: list[dict], new_pages_by_label: dict[str, list[
     for label, rows in new_pages_by_label.items():
         new_page_lookup[label] = {r['rhwp_page_index']: r for r in rows}
     label_to_kr = {LABEL_KR[k]: k for k in LABEL_KR}
+    page_maps = {LABEL_KR.get(lb, lb): m for lb, m in aligned_page_map(changed).items()}
+    for kr, m in page_maps.items():
+        if any(b != n for b, n in m.items()):
+            affected.setdefault(kr, set())
 
     for c in changed:
         if c['change_type'] == 'same': continue
@@ -385,8 +535,11 @@ def make_ref_candidates(changed: list[dict], new_pages_by_label: dict[str, list[
             label = label_to_kr.get(manual_kr)
             if not label: continue
             overlap = any(p for p in range(pf, pt + 1) if p in affected[manual_kr])
+            page_map = page_maps.get(manual_kr, {})
+            cand_pf, cand_pt = remap_page_range(pf, pt, page_map)
+            shifted = (cand_pf, cand_pt) != (pf, pt)
             text_hit_pages: list[int] = []
-            if not overlap:
+            if not overlap and not shifted:
                 # text-hit fallback: only specific enough mt qualifies (>= 8
                 # normalized chars filters generic Korean substrings).
                 norm_mt = normalize(mt) if mt else ''
@@ -399,8 +552,7 @@ def make_ref_candidates(changed: list[dict], new_pages_by_label: dict[str, list[
                     continue
             # affected → build candidate
             new_snip = ''
-            cand_pf = pf; cand_pt = pt
-            new_page = new_page_lookup.get(label, {}).get(pf or 1)
+            new_page = new_page_lookup.get(label, {}).get(cand_pf or 1)
             if new_page:
                 new_snip = new_page.get('text', '')[:140].replace('\n', ' ')
             change_types = sorted({c['change_type'] for c in changed
@@ -409,7 +561,14 @@ def make_ref_candidates(changed: list[dict], new_pages_by_label: dict[str, list[
                                         or c.get('new_page') in range(pf, pt+1))})
             confidence = 'high' if change_types == ['modified'] else 'review'
             action = 'review' if confidence == 'review' else 'remap_candidate'
-            if text_hit_pages and not overlap:
+            reason = (f'baseline pages {pf}-{pt} overlap changed pages '
+                      f'{sorted(affected[manual_kr] & set(range(pf,pt+1))) or text_hit_pages}')
+            if not overlap and shifted:
+                # 내용은 그대로, 앞쪽 삽입/삭제로 번호만 이동 → 페이지 재매핑
+                change_types = ['shifted']
+                confidence, action = 'high', 'remap_candidate'
+                reason = f'baseline pages {pf}-{pt} shifted to {cand_pf}-{cand_pt}'
+            elif text_hit_pages and not overlap:
                 action = 'review'  # text matched elsewhere — needs human
                 cand_pf = cand_pt = text_hit_pages[0]
                 confidence = 'medium'
@@ -419,8 +578,7 @@ def make_ref_candidates(changed: list[dict], new_pages_by_label: dict[str, list[
                 'manual_label': label,
                 'old_page_from': pf, 'old_page_to': pt,
                 'candidate_page_from': cand_pf, 'candidate_page_to': cand_pt,
-                'reason': f'baseline pages {pf}-{pt} overlap changed pages '
-                          f'{sorted(affected[manual_kr] & set(range(pf,pt+1))) or text_hit_pages}',
+                'reason': reason,
                 'change_type': '+'.join(change_types) or 'unknown',
                 'confidence': confidence,
                 'action': action,
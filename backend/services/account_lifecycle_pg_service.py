@@ -16,6 +16,8 @@ from typing import Optional
 
 from sqlalchemy import select, func
 
+from backend.services.auth_state_cache import invalidate_login_on_commit, invalidate_tenant_on_commit
+
 
 class LifecycleError(Exception):
     def __init__(self, code: str, message: str):
@@ -170,6 +172,7 @@ def suspend_user(login_id: str, actor: str) -> dict:
             raise LifecycleError(block[0], block[1])
         u.is_active = False
         u.account_status = "suspended"
+        invalidate_login_on_commit(session, login_id)
         # 미사용 초대 토큰 폐기 — 같은 트랜잭션(정지 우회 방지), tenant 잠금 이후에만.
         _revoke_unused_tokens(session, login_id)
         session.commit()
@@ -204,6 +207,7 @@ def restore_user(login_id: str, actor: str) -> dict:
         assert_seat_within_limit(session, tenant_id, activating_login_id=login_id)
         u.is_active = True
         u.account_status = "active"
+        invalidate_login_on_commit(session, login_id)
         session.commit()
     _audit("user_restored", actor, login_id, tenant_id)
     return {"login_id": login_id, "account_status": "active"}
@@ -228,6 +232,7 @@ def suspend_tenant(tenant_id: str, actor: str) -> dict:
             raise LifecycleError(block[0], block[1])
         t.service_status = "suspended"
         t.is_active = False
+        invalidate_tenant_on_commit(session, tenant_id)
         logins = list(session.scalars(
             select(AccountUser.login_id).where(AccountUser.tenant_id == tenant_id)).all())
         # 소속 사용자 전원의 미사용 초대 토큰 폐기 — 같은 트랜잭션(정지 우회 방지).
@@ -262,6 +267,7 @@ def restore_tenant(tenant_id: str, actor: str) -> dict:
             raise LifecycleError(block[0], block[1])
         t.service_status = "active"
         t.is_active = True
+        invalidate_tenant_on_commit(session, tenant_id)
         session.commit()
     _audit("tenant_restored", actor, None, tenant_id)
     return {"tenant_id": tenant_id, "service_status": "active"}
@@ -321,6 +327,7 @@ def replace_user(old_login_id: str, new_name: str, new_email: str, actor: str,
         # 기존 사용자 replaced 처리(삭제 아님, 이름/이메일 보존).
         old.is_active = False
         old.account_status = "replaced"
+        invalidate_login_on_commit(session, old_login_id)
         # 기존 계정의 미사용 초대 토큰 폐기 — 신규 계정 토큰만 유효(교체 우회 방지). tenant 잠금 이후.
         _revoke_unused_tokens(session, old_login_id)
 
@@ -447,6 +454,7 @@ def office_suspend_sub(tenant_id: str, actor_login: str, target_login: str) -> d
             raise LifecycleError(block[0], block[1])
         u.is_active = False
         u.account_status = "suspended"
+        invalidate_login_on_commit(session, target_login)
         # 미사용 초대 토큰 폐기 — 같은 트랜잭션(정지 우회 방지), tenant 잠금 이후에만.
         _revoke_unused_tokens(session, target_login)
         session.commit()
@@ -474,6 +482,7 @@ def office_restore_sub(tenant_id: str, actor_login: str, target_login: str) -> d
         assert_seat_within_limit(session, tenant_id, activating_login_id=target_login)
         u.is_active = True
         u.account_status = "active"
+        invalidate_login_on_commit(session, target_login)
         session.commit()
     _audit("user_restored", actor_login, target_login, tenant_id)
     return {"login_id": target_login, "account_status": "active"}
@@ -544,6 +553,7 @@ def office_replace_sub(tenant_id: str, actor_login: str, old_login: str,
         now = _now()
         old.is_active = False
         old.account_status = "replaced"
+        invalidate_login_on_commit(session, old_login)
         # 기존 계정의 미사용 초대 토큰 폐기 — 신규 계정 토큰만 유효(교체 우회 방지). tenant 잠금 이후.
         _revoke_unused_tokens(session, old_login)
 
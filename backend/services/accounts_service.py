@@ -331,6 +331,9 @@ def append_account(account_dict: dict) -> None:
             u.is_admin = is_admin
             u.is_active = is_active
         session.commit()
+    from backend.services.auth_state_cache import invalidate_login, invalidate_tenant
+    invalidate_login(login_id)
+    invalidate_tenant(tenant_id)
 
 
 # 과거 이관 전용 외부 저장소 helper(dict_to_row / _get_ws / _get_ws_readonly /
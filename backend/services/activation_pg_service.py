@@ -237,6 +237,9 @@ def complete_activation(raw: str, new_password: str) -> dict:
         login_id = u.login_id
         tenant_id = u.tenant_id
         session.commit()
+    from backend.services.auth_state_cache import invalidate_login, invalidate_tenant
+    invalidate_login(login_id)
+    invalidate_tenant(tenant_id)
 
     try:
         from backend.services import audit_service
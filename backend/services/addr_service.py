@@ -3,20 +3,26 @@ Address correction service using the 주소정보 도로명 master index.
 
 Loads backend/data/addr_index.json (3MB, built from 도로명코드 master file)
 and uses prefix-based matching to correct OCR-extracted ARC address strings.
+The index is read lazily on first use from the mmap-able snapshot
+``addr_index.snap`` (see services/data_snapshot.py) when its recorded sha256
+matches the JSON; otherwise the JSON is parsed and the snapshot rebuilt.
 
 The index covers 16 시도 × 256 regions × 172K unique road names.
 """
 from __future__ import annotations
 
-import json
 import re
 import threading
 from pathlib import Path
+from typing import Mapping
+
+from backend.services.data_snapshot import load_json_multimaps, snapshot_path
 
 # ── index path ────────────────────────────────────────────────────────────────
 _INDEX_PATH = Path(__file__).parent.parent / "data" / "addr_index.json"
+_SNAPSHOT_PATH = snapshot_path(_INDEX_PATH)
 
-_index: dict | None = None
+_index: Mapping | None = None
 _index_lock = threading.Lock()
 
 # All valid 시도 names (stable, hard-coded for fast prefix matching)
@@ -42,20 +48,18 @@ _JIBUN_SUFFIX_RE = re.compile(r"[동리읍면]$")
 
 # ── index loading ─────────────────────────────────────────────────────────────
 
-def _load_index() -> dict:
+def _load_index() -> Mapping:
     global _index
     if _index is not None:
         return _index
     with _index_lock:
         if _index is not None:
             return _index
-        if not _INDEX_PATH.exists():
-            _index = {"roads": {}, "dongs": {}}
-            return _index
         try:
-            with open(_INDEX_PATH, encoding="utf-8") as f:
-                _index = json.load(f)
+            _index = load_json_multimaps(_INDEX_PATH, _SNAPSHOT_PATH, refresh=True)
         except Exception:
+            _index = None
+        if _index is None:
             _index = {"roads": {}, "dongs": {}}
     return _index
 
@@ -72,7 +76,7 @@ def _extract_sido(addr: str) -> tuple[str, str]:
 
 
 def _extract_sigungu(
-    sido: str, remainder: str, roads: dict, dongs: dict
+    sido: str, remainder: str, roads: Mapping, dongs: Mapping
 ) -> tuple[str, str, str]:
     """Return (key, sigungu_text, remainder_after_sigungu) or ('','',remainder)."""
     tokens = remainder.split()
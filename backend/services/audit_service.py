@@ -10,10 +10,36 @@ caller, and is a no-op whenever:
 Audit failures must not break the surrounding request. If you need a hard
 guarantee that an event is recorded (e.g. compliance), use a separate code
 path — this service is observability, not durability.
+
+Writes are asynchronous: ``log_event`` only appends the row to a bounded
+in-process queue. A background writer thread drains it and bulk-inserts
+batches (one multi-row ``INSERT`` per batch) once ``AUDIT_BATCH_SIZE`` rows are
+pending or ``AUDIT_FLUSH_INTERVAL`` seconds have passed, so requests carry no
+audit round trip and the DB sees a few large inserts instead of many tiny
+transactions. ``created_at`` is stamped at enqueue time, not insert time.
+
+Backpressure: when the queue holds ``AUDIT_QUEUE_MAX`` rows, ``log_event``
+waits up to ``AUDIT_ENQUEUE_WAIT_MS`` for room, then drops the event (counted
+in ``audit_stats()["dropped"]``). If a batch insert fails, its rows are retried
+one by one so a single bad row does not lose the rest.
+
+The writer starts on first use; main.lifespan calls ``flush_and_stop`` on
+shutdown (also registered with ``atexit`` for scripts). ``AUDIT_ASYNC=0``
+restores the old synchronous one-row-per-call write.
+
+Env: ``AUDIT_ASYNC`` (default on), ``AUDIT_QUEUE_MAX`` (default 10000),
+``AUDIT_BATCH_SIZE`` (default 500), ``AUDIT_FLUSH_INTERVAL`` (seconds, default 0.5),
+``AUDIT_ENQUEUE_WAIT_MS`` (default 20).
 """
 from __future__ import annotations
 
+import atexit
 import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
 from typing import Any, Optional
 
 from backend.db.feature_flags import pg_audit_enabled
@@ -21,6 +47,174 @@ from backend.db.session import is_configured
 
 _log = logging.getLogger("audit")
 
+AUDIT_ASYNC = (os.environ.get("AUDIT_ASYNC", "1") or "1").strip().lower() not in (
+    "0", "false", "no", "off")
+AUDIT_QUEUE_MAX = max(1, int(os.environ.get("AUDIT_QUEUE_MAX", "10000") or "10000"))
+AUDIT_BATCH_SIZE = max(1, int(os.environ.get("AUDIT_BATCH_SIZE", "500") or "500"))
+AUDIT_FLUSH_INTERVAL = float(os.environ.get("AUDIT_FLUSH_INTERVAL", "0.5") or "0.5")
+AUDIT_ENQUEUE_WAIT_MS = float(os.environ.get("AUDIT_ENQUEUE_WAIT_MS", "20") or "20")
+
+_COUNTERS = ("enqueued", "written", "dropped", "failed", "batches", "row_retries")
+
+
+def _insert_rows(rows: list[dict]) -> None:
+    """Insert ``rows`` in one transaction (executemany → multi-row VALUES)."""
+    # Local imports keep this module importable even when SQLAlchemy isn't.
+    from sqlalchemy import insert
+
+    from backend.db.models.audit import AuditLog
+    from backend.db.session import get_sessionmaker
+
+    SessionLocal = get_sessionmaker()
+    with SessionLocal() as session:
+        session.execute(insert(AuditLog), rows)
+        session.commit()
+
+
+class _Writer:
+    """Bounded queue + background batch writer. Thread-safe."""
+
+    def __init__(self, *, max_queue: int = AUDIT_QUEUE_MAX, batch_size: int = AUDIT_BATCH_SIZE,
+                 interval: float = AUDIT_FLUSH_INTERVAL):
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.interval = interval
+        self._q: deque = deque()
+        self._cv = threading.Condition()
+        self._inflight = 0
+        self._urgent = False        # flush requested / producers blocked → skip the interval wait
+        self._stop = False
+        self._thread: Optional[threading.Thread] = None
+        self.counters = dict.fromkeys(_COUNTERS, 0)
+        self.max_batch = 0
+        self.max_depth = 0
+
+    def submit(self, row: dict, wait: float) -> bool:
+        """Queue one row. Waits up to ``wait`` seconds when full; False = dropped."""
+        with self._cv:
+            if len(self._q) >= self.max_queue and not self._stop:
+                deadline = time.monotonic() + wait
+                self._urgent = True             # wake the writer early — we are full
+                self._cv.notify_all()
+                while len(self._q) >= self.max_queue and not self._stop:
+                    left = deadline - time.monotonic()
+                    if left <= 0:
+                        break
+                    self._cv.wait(left)
+            if self._stop or len(self._q) >= self.max_queue:
+                self.counters["dropped"] += 1
+                return False
+            self._q.append(row)
+            self.counters["enqueued"] += 1
+            self.max_depth = max(self.max_depth, len(self._q))
+            if len(self._q) == 1 or len(self._q) >= self.batch_size:
+                self._cv.notify_all()           # first row starts the interval; full batch goes now
+            self._ensure_started()
+        return True
+
+    def _ensure_started(self) -> None:
+        # Called under self._cv.
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+
+    def _take(self) -> list:
+        with self._cv:
+            while not self._q and not (self._stop or self._urgent):
+                self._cv.wait(1.0)
+            deadline = time.monotonic() + self.interval
+            while len(self._q) < self.batch_size and not (self._stop or self._urgent):
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                self._cv.wait(left)
+            self._urgent = False
+            n = min(len(self._q), self.batch_size)
+            batch = [self._q.popleft() for _ in range(n)]
+            self._inflight = n
+            if n:
+                self._cv.notify_all()           # room for producers waiting on backpressure
+            return batch
+
+    def _write(self, batch: list) -> None:
+        try:
+            _insert_rows(batch)
+            written, failed = len(batch), 0
+        except Exception as e:  # noqa: BLE001 — by-design swallow
+            _log.warning("audit batch write failed (%d rows), retrying row by row: %s: %s",
+                         len(batch), type(e).__name__, e)
+            written = failed = 0
+            for row in batch:
+                try:
+                    _insert_rows([row])
+                    written += 1
+                except Exception as e1:  # noqa: BLE001
+                    failed += 1
+                    _log.warning("audit write failed (swallowed): %s: %s", type(e1).__name__, e1)
+            with self._cv:
+                self.counters["row_retries"] += len(batch)
+        with self._cv:
+            self.counters["written"] += written
+            self.counters["failed"] += failed
+            self.counters["batches"] += 1
+            self.max_batch = max(self.max_batch, len(batch))
+            self._inflight = 0
+            self._cv.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take()
+            if batch:
+                self._write(batch)
+            with self._cv:
+                if self._stop and not self._q:
+                    return
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every queued row has been written. True if drained in time."""
+        deadline = time.monotonic() + timeout
+        with self._cv:
+            while self._q or self._inflight:
+                self._ensure_started()
+                self._urgent = True
+                self._cv.notify_all()
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    return False
+                self._cv.wait(min(left, 0.05))
+        return True
+
+    def stop(self, timeout: float = 5.0) -> bool:
+        """Drain the queue, then stop the writer thread. A later submit starts a new one."""
+        drained = self.flush(timeout)
+        with self._cv:
+            self._stop = True
+            self._cv.notify_all()
+            t = self._thread
+        if t is not None:
+            t.join(timeout=max(0.1, timeout))
+        with self._cv:
+            self._stop = False
+            self._thread = None
+        return drained
+
+    def stats(self) -> dict:
+        with self._cv:
+            return {
+                **self.counters,
+                "queued": len(self._q) + self._inflight,
+                "max_queue": self.max_queue,
+                "max_depth": self.max_depth,
+                "batch_size": self.batch_size,
+                "max_batch": self.max_batch,
+                "flush_interval": self.interval,
+                "running": bool(self._thread and self._thread.is_alive()),
+                "async": AUDIT_ASYNC,
+            }
+
+
+_writer = _Writer()
+
 
 def log_event(
     *,
@@ -39,24 +233,39 @@ def log_event(
         _log.warning("audit: FEATURE_PG_AUDIT on but DATABASE_URL missing — skipping")
         return
 
+    row = {
+        "action": action,
+        "actor_login_id": actor_login_id,
+        "tenant_id": tenant_id,
+        "target_type": target_type,
+        "target_id": target_id,
+        "payload": payload,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+        "created_at": datetime.now(timezone.utc),
+    }
+    if AUDIT_ASYNC:
+        if not _writer.submit(row, AUDIT_ENQUEUE_WAIT_MS / 1000.0):
+            _log.warning("audit queue full — dropped %s", action)
+        return
     try:
-        # Local imports keep this module importable even when SQLAlchemy isn't.
-        from backend.db.models.audit import AuditLog
-        from backend.db.session import get_sessionmaker
-
-        SessionLocal = get_sessionmaker()
-        with SessionLocal() as session:
-            entry = AuditLog(
-                action=action,
-                actor_login_id=actor_login_id,
-                tenant_id=tenant_id,
-                target_type=target_type,
-                target_id=target_id,
-                payload=payload,
-                ip_address=ip_address,
-                user_agent=user_agent,
-            )
-            session.add(entry)
-            session.commit()
+        _insert_rows([row])
     except Exception as e:  # noqa: BLE001 — by-design swallow
         _log.warning("audit write failed (swallowed): %s: %s", type(e).__name__, e)
+
+
+def flush(timeout: float = 5.0) -> bool:
+    """Block until queued events are written (tests, batch scripts)."""
+    return _writer.flush(timeout)
+
+
+def flush_and_stop(timeout: float = 5.0) -> bool:
+    """Shutdown hook: write what is queued, then stop the writer thread."""
+    return _writer.stop(timeout)
+
+
+def audit_stats() -> dict:
+    return _writer.stats()
+
+
+atexit.register(flush_and_stop, 2.0)
@@ -86,6 +86,76 @@ def account_auth_status(login_id: str) -> dict:
         }
 
 
+def auth_context(login_id: str, tenant_id: str = "", session_id: str = "") -> dict:
+    """매 요청 인증용 — 계정 상태/권한 + tenant service_status + 세션 상태를 **1회 왕복**으로 조회.
+
+    반환: ``{"account": <account_auth_status 형태>, "tenant_status": <tenant_service_status 값>,
+    "session": <session_status 값>}``. tenant_id/session_id 가 비면 해당 항목은 ``None``.
+    세 조회를 ``LEFT JOIN ... ON TRUE`` 로 묶어 행이 없는 쪽은 NULL 로 돌아오게 한다.
+    role(0024)/service_status(0031) 컬럼이 없는 DB 등 조회 실패는 예외를 전파한다 — 호출측
+    (auth_state_cache)이 기존 개별 조회(account_auth_status 등)로 폴백해 각자의 정책을 유지한다.
+    """
+    from sqlalchemy import literal, true
+
+    from backend.db.models.tenant import Tenant
+    from backend.db.models.user import AccountUser
+    from backend.db.models.user_session import UserSession
+    from backend.db.session import get_sessionmaker
+
+    tid = (tenant_id or "").strip()
+    sid = str(session_id or "").strip()
+    u = (
+        select(literal(1).label("u_hit"), AccountUser.is_active, AccountUser.is_admin,
+               AccountUser.tenant_id, AccountUser.role)
+        .where(AccountUser.login_id == login_id).limit(1).subquery("u")
+    )
+    cols = [u.c.u_hit, u.c.is_active, u.c.is_admin, u.c.tenant_id, u.c.role]
+    frm = select(literal(1).label("one")).subquery("b").outerjoin(u, true())
+    if tid:
+        t = (
+            select(literal(1).label("t_hit"), Tenant.service_status)
+            .where(Tenant.tenant_id == tid).limit(1).subquery("t")
+        )
+        cols += [t.c.t_hit, t.c.service_status]
+        frm = frm.outerjoin(t, true())
+    if sid:
+        s = (
+            select(literal(1).label("s_hit"), UserSession.is_kiosk, UserSession.revoked_at)
+            .where(UserSession.session_id == sid).limit(1).subquery("s")
+        )
+        cols += [s.c.s_hit, s.c.is_kiosk, s.c.revoked_at]
+        frm = frm.outerjoin(s, true())
+
+    SessionLocal = get_sessionmaker()
+    with SessionLocal() as session:
+        row = list(session.execute(select(*cols).select_from(frm)).one())
+
+    if row[0] is None:
+        account = {"status": "missing", "is_admin": False, "role": "user", "tenant_id": None}
+    else:
+        is_admin = bool(row[2])
+        account = {
+            "status": "active" if bool(row[1]) else "disabled",
+            "is_admin": is_admin,
+            "role": str(row[4] or ("admin" if is_admin else "user")),
+            "tenant_id": row[3],
+        }
+    rest = row[5:]
+    tenant_status = None
+    if tid:
+        hit, st = rest[0], rest[1]
+        rest = rest[2:]
+        tenant_status = "missing" if hit is None else (str(st) if st is not None else "null_status")
+    session_st = None
+    if sid:
+        hit, is_kiosk, revoked_at = rest
+        if hit is None or is_kiosk:
+            session_st = "missing"
+        else:
+            session_st = "revoked" if revoked_at is not None else "active"
+    return {"account": account, "tenant_status": tenant_status, "session": session_st}
+
+
 def tenant_service_status(tenant_id: str) -> str:
     """tenant 의 service_status 정밀 상태.
 
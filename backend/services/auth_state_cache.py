@@ -0,0 +1,129 @@
+"""인증 상태 캐시 — get_current_user 의 매 요청 PG 재확인(계정/테넌트/세션)을 짧게 보관.
+
+get_current_user 는 인증된 모든 요청마다 계정 is_active/role/소속, (승인형 SaaS) tenant
+service_status, (단일 세션) 세션 revoke 여부를 다시 확인한다. 캐시가 없으면 요청 하나에 최대
+3번 세션을 열고 왕복한다(대시보드 API 15건 → 인증 조회 최대 45회).
+
+- 미스 시 ``auth_pg_service.auth_context`` 한 번(1왕복)으로 세 가지를 함께 읽는다.
+- 결과는 cache_service 의 공용 LRU+TTL 캐시에 ``AUTH_CACHE_TTL`` 초 동안 둔다.
+  계정·세션 항목: 로그인별 네임스페이스 ``"@auth:<login_id>"`` 의 ``"<tenant_id>|<sid>"`` 키.
+  tenant 상태: 해당 tenant 네임스페이스의 ``"auth:tenant_status"`` 키.
+- 비활성화/강등/소속 변경/세션 revoke/tenant 정지 등 쓰기 경로는 커밋 후 ``invalidate_login``
+  / ``invalidate_tenant`` 를 호출한다(트랜잭션을 호출측이 소유하면 ``*_on_commit``). 무효화는
+  cache_service 버스(PG NOTIFY)로 모든 워커에 전파되므로 revoke 는 사실상 즉시 반영된다.
+  버스가 없거나 알림이 누락돼도 최대 TTL 뒤엔 다시 조회한다.
+- 조회 도중 무효화되면(generation) 그 결과는 캐시하지 않는다 — revoke 와 경합한 조회가
+  이전 'active' 상태를 다시 심지 못한다.
+- 조회 오류는 캐시하지 않는다. 결합 조회가 실패하면(구 스키마 등) 기존 개별 조회로 폴백해
+  각 검사의 가용성 우선/fail-closed 정책을 그대로 유지한다.
+
+Env: ``AUTH_CACHE_TTL`` (초, 기본 15 — 0 이면 캐시하지 않음).
+"""
+from __future__ import annotations
+
+import logging
+import os
+from typing import Optional
+
+log = logging.getLogger("auth_state_cache")
+
+AUTH_CACHE_TTL = float(os.environ.get("AUTH_CACHE_TTL", "15") or "15")
+
+TENANT_KEY = "auth:tenant_status"
+
+
+def _login_ns(login_id: str) -> str:
+    return f"@auth:{login_id}"
+
+
+class AuthState:
+    """한 요청의 인증 상태. 처음 필요할 때 캐시 → (미스) 결합 조회 순으로 채운다."""
+
+    def __init__(self, login_id: str, tenant_id: str = "", session_id: str = ""):
+        self.login_id = login_id
+        self.tenant_id = (tenant_id or "").strip()
+        self.session_id = str(session_id or "").strip()
+        self._ctx: Optional[dict] = None
+
+    def _load(self) -> dict:
+        if self._ctx is not None:
+            return self._ctx
+        from backend.services import cache_service as cs
+
+        ns, key = _login_ns(self.login_id), f"{self.tenant_id}|{self.session_id}"
+        if AUTH_CACHE_TTL > 0:
+            hit = cs.cache_get(ns, key)
+            tst = cs.cache_get(self.tenant_id, TENANT_KEY) if self.tenant_id else None
+            if hit is not None and (tst is not None or not self.tenant_id):
+                self._ctx = {**hit, "tenant_status": tst}
+                return self._ctx
+        gen_login = cs.cache_generation(ns)
+        gen_tenant = cs.cache_generation(self.tenant_id) if self.tenant_id else None
+        try:
+            from backend.services.auth_pg_service import auth_context
+            ctx = auth_context(self.login_id, self.tenant_id, self.session_id)
+        except Exception as e:
+            # 개별 조회로 폴백(각 검사의 기존 예외 정책 유지) — 캐시하지 않는다.
+            log.debug("[auth_state] combined lookup failed, falling back: %s", e)
+            self._ctx = {}
+            return self._ctx
+        if AUTH_CACHE_TTL > 0:
+            cs.cache_set(ns, key, {"account": ctx["account"], "session": ctx["session"]},
+                         AUTH_CACHE_TTL, if_generation=gen_login)
+            if self.tenant_id:
+                cs.cache_set(self.tenant_id, TENANT_KEY, ctx["tenant_status"], AUTH_CACHE_TTL,
+                             if_generation=gen_tenant)
+        self._ctx = ctx
+        return ctx
+
+    def account(self) -> dict:
+        """account_auth_status 형태. 조회 실패는 예외 전파(호출측 가용성 우선)."""
+        info = self._load().get("account")
+        if info is not None:
+            return info
+        from backend.services.auth_pg_service import account_auth_status
+        return account_auth_status(self.login_id)
+
+    def tenant_status(self) -> str:
+        """tenant_service_status 값. 오류도 문자열('error'/'no_column')로 반환."""
+        st = self._load().get("tenant_status")
+        if st is not None:
+            return st
+        from backend.services.auth_pg_service import tenant_service_status
+        return tenant_service_status(self.tenant_id)
+
+    def session_status(self) -> str:
+        """session_status 값. 조회 실패는 예외 전파(호출측 가용성 우선)."""
+        st = self._load().get("session")
+        if st is not None:
+            return st
+        from backend.services.session_pg_service import session_status
+        return session_status(self.session_id)
+
+
+def invalidate_login(login_id: Optional[str]) -> None:
+    """login_id 의 캐시된 계정·세션 상태를 모든 워커에서 제거."""
+    if login_id:
+        from backend.services.cache_service import cache_invalidate_tenant
+        cache_invalidate_tenant(_login_ns(login_id))
+
+
+def invalidate_tenant(tenant_id: Optional[str]) -> None:
+    """tenant 의 캐시된 service_status 를 모든 워커에서 제거."""
+    if tenant_id:
+        from backend.services.cache_service import cache_invalidate
+        cache_invalidate(tenant_id, TENANT_KEY)
+
+
+def invalidate_login_on_commit(session, login_id: Optional[str]) -> None:
+    """열린 트랜잭션이 **커밋된 뒤** invalidate_login — 커밋 전에는 무효화하지 않는다."""
+    if login_id:
+        from sqlalchemy import event
+        event.listen(session, "after_commit", lambda _s: invalidate_login(login_id), once=True)
+
+
+def invalidate_tenant_on_commit(session, tenant_id: Optional[str]) -> None:
+    """열린 트랜잭션이 **커밋된 뒤** invalidate_tenant."""
+    if tenant_id:
+        from sqlalchemy import event
+        event.listen(session, "after_commit", lambda _s: invalidate_tenant(tenant_id), once=True)
@@ -1,10 +1,26 @@
 """
 backend/services/cache_service.py
 ----------------------------------
-Lightweight in-memory TTL cache for API response caching.
+In-memory LRU + TTL cache for API response caching, coherent across workers.
 
-Tenant-safe: all cache keys include tenant_id — no cross-tenant leakage.
-Thread-safe: single threading.Lock around all _store mutations.
+Tenant-safe: every entry lives in a per-tenant namespace — no cross-tenant leakage,
+and a tenant's keys can be dropped together (``cache_invalidate_tenant``).
+Bounded: at most ``CACHE_MAX_ENTRIES`` entries (LRU eviction). Expired entries are
+swept from a stripe whenever it takes a new key, so unread keys do not pile up.
+Lock striping: tenants hash onto ``CACHE_STRIPES`` independent stripes (own lock,
+own OrderedDict), so hot tenants do not serialize on one global lock.
+Coherent: with several uvicorn workers each process has its own cache. When the
+app starts the bus (``start_bus``, from main.lifespan), every invalidation is also
+broadcast with PostgreSQL ``NOTIFY`` on ``CACHE_NOTIFY_CHANNEL``; each worker
+``LISTEN``s and drops the same keys. Publishing is done by a background thread that
+coalesces bursts (bulk imports), so writers never wait on the extra round trip.
+If the listener connection drops, notifications may have been missed, so the whole
+local cache is cleared on reconnect. Any other listener failure (a bug or driver
+incompatibility, not a lost connection) stops the listener and turns caching off in
+that worker — serving without the cache beats serving entries nobody can invalidate.
+
+Stats: ``cache_stats()`` (hits, misses, sets, evictions, expirations,
+invalidations, remote_invalidations, entries, hit_rate, bus_broken).
 
 Usage:
     from backend.services.cache_service import cache_get, cache_set, cache_invalidate
@@ -14,44 +30,357 @@ Usage:
         val = expensive_read()
         cache_set(tenant_id, "tasks:active", val, ttl=30.0)
 
-    # On mutation:
+    # On mutation (normally inside the PG service that committed the write):
     cache_invalidate(tenant_id, "tasks:active")
+    cache_invalidate_prefix(tenant_id, "tasks:")
+
+Cached values are shared between requests — treat them as read-only.
+
+Env: ``CACHE_MAX_ENTRIES`` (default 4096), ``CACHE_STRIPES`` (default 16),
+``CACHE_NOTIFY`` (default on; 0 disables the cross-worker bus),
+``CACHE_NOTIFY_CHANNEL`` (default kid_cache_invalidate).
 """
+import json
+import logging
+import os
 import threading
 import time
-from typing import Any, Optional
+import uuid
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+log = logging.getLogger("cache_service")
+
+CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", "4096") or "4096")
+CACHE_STRIPES = max(1, int(os.environ.get("CACHE_STRIPES", "16") or "16"))
+CACHE_NOTIFY = (os.environ.get("CACHE_NOTIFY", "1") or "1").strip().lower() not in (
+    "0", "false", "no", "off")
+CACHE_NOTIFY_CHANNEL = os.environ.get("CACHE_NOTIFY_CHANNEL", "kid_cache_invalidate").strip()
+
+# Short TTLs for list endpoints whose writes all go through the PG services
+# (which invalidate on commit). Seconds.
+TTL_TASKS = float(os.environ.get("CACHE_TTL_TASKS", "10") or "10")
+TTL_EVENTS = float(os.environ.get("CACHE_TTL_EVENTS", "10") or "10")
+TTL_CUSTOMERS = float(os.environ.get("CACHE_TTL_CUSTOMERS", "15") or "15")
+
+_COUNTERS = ("hits", "misses", "sets", "evictions", "expirations",
+             "invalidations", "remote_invalidations")
+
+
+class _Stripe:
+    __slots__ = ("lock", "data", "max_entries", "counters", "gens", "epoch")
+
+    def __init__(self, max_entries: int):
+        self.lock = threading.Lock()
+        # (tenant_id, name) → (value, expire_monotonic); order = LRU → MRU
+        self.data: "OrderedDict[tuple[str, str], tuple[Any, float]]" = OrderedDict()
+        self.max_entries = max_entries
+        self.counters = dict.fromkeys(_COUNTERS, 0)
+        # tenant → invalidation generation (guards loads that raced an invalidation)
+        self.gens: dict[str, int] = {}
+        self.epoch = 0                  # bumped by clear()
+
+    def sweep(self, now: float) -> None:
+        """Drop expired entries (caller holds the lock)."""
+        dead = [k for k, (_v, exp) in self.data.items() if exp <= now]
+        for k in dead:
+            del self.data[k]
+        self.counters["expirations"] += len(dead)
+
+
+class ResponseCache:
+    """Tenant-namespaced, lock-striped LRU + TTL cache. Thread-safe."""
+
+    def __init__(self, *, max_entries: int = CACHE_MAX_ENTRIES, stripes: int = CACHE_STRIPES):
+        self.max_entries = max(1, max_entries)
+        per = -(-self.max_entries // stripes)
+        self._stripes = [_Stripe(per) for _ in range(stripes)]
+
+    def _stripe(self, tenant_id: str) -> _Stripe:
+        # Stable across processes (unlike hash()) — a tenant always maps to one stripe.
+        return self._stripes[zlib.crc32(str(tenant_id).encode("utf-8")) % len(self._stripes)]
+
+    def get(self, tenant_id: str, name: str) -> Optional[Any]:
+        st = self._stripe(tenant_id)
+        k = (str(tenant_id), name)
+        with st.lock:
+            entry = st.data.get(k)
+            if entry is None:
+                st.counters["misses"] += 1
+                return None
+            val, expires = entry
+            if time.monotonic() >= expires:
+                del st.data[k]
+                st.counters["expirations"] += 1
+                st.counters["misses"] += 1
+                return None
+            st.data.move_to_end(k)
+            st.counters["hits"] += 1
+            return val
+
+    def generation(self, tenant_id: str) -> tuple[int, int]:
+        st = self._stripe(tenant_id)
+        with st.lock:
+            return st.epoch, st.gens.get(str(tenant_id), 0)
+
+    def set(self, tenant_id: str, name: str, value: Any, ttl: float, *,
+            if_generation: Optional[tuple[int, int]] = None) -> bool:
+        """Store value. With ``if_generation``, skip (False) if the tenant was invalidated since."""
+        st = self._stripe(tenant_id)
+        k = (str(tenant_id), name)
+        now = time.monotonic()
+        with st.lock:
+            if if_generation is not None and (st.epoch, st.gens.get(k[0], 0)) != if_generation:
+                return False
+            st.data.pop(k, None)
+            if len(st.data) >= st.max_entries:
+                st.sweep(now)
+            while len(st.data) >= st.max_entries:
+                st.data.popitem(last=False)
+                st.counters["evictions"] += 1
+            st.data[k] = (value, now + ttl)
+            st.counters["sets"] += 1
+        return True
+
+    def invalidate(self, tenant_id: str, name: str = "", *, prefix: bool = False,
+                   remote: bool = False) -> int:
+        """Drop one key, or every key starting with ``name`` when ``prefix``. Returns count."""
+        st = self._stripe(tenant_id)
+        tid = str(tenant_id)
+        with st.lock:
+            if prefix:
+                keys = [k for k in st.data if k[0] == tid and k[1].startswith(name)]
+            else:
+                keys = [(tid, name)] if (tid, name) in st.data else []
+            for k in keys:
+                del st.data[k]
+            st.gens[tid] = st.gens.get(tid, 0) + 1
+            st.counters["remote_invalidations" if remote else "invalidations"] += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        for st in self._stripes:
+            with st.lock:
+                st.data.clear()
+                st.epoch += 1
+
+    def sweep(self) -> None:
+        now = time.monotonic()
+        for st in self._stripes:
+            with st.lock:
+                st.sweep(now)
+
+    def stats(self) -> dict:
+        totals = dict.fromkeys(_COUNTERS, 0)
+        entries = 0
+        for st in self._stripes:
+            with st.lock:
+                entries += len(st.data)
+                for c in _COUNTERS:
+                    totals[c] += st.counters[c]
+        reads = totals["hits"] + totals["misses"]
+        return {
+            **totals,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "stripes": len(self._stripes),
+            "hit_rate": round(totals["hits"] / reads, 4) if reads else 0.0,
+            "bus": _bus.running,
+        }
+
+
+_cache = ResponseCache()
+
+
+# ── cross-worker invalidation bus (PostgreSQL LISTEN/NOTIFY) ─────────────────
 
-_lock = threading.Lock()
-_store: dict[str, tuple[Any, float]] = {}   # key → (value, expire_monotonic)
+class _Bus:
+    """Background publisher + listener. Idle (publish no-op) until ``start``."""
 
+    def __init__(self):
+        self.origin = f"{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.running = False
+        self.broken = False         # listener failed for a non-connection reason
+        self._cv = threading.Condition()
+        self._outbox: dict = {}     # (tenant, name, prefix) → None, insertion-ordered
+        self._stop = threading.Event()
+        self._threads: list = []
 
-def _key(tenant_id: str, name: str) -> str:
-    return f"{tenant_id}::{name}"
+    def publish(self, tenant_id: str, name: str, prefix: bool) -> None:
+        if not self.running:
+            return
+        with self._cv:
+            self._outbox[(str(tenant_id), name, bool(prefix))] = None
+            self._cv.notify()
 
+    def _drain(self) -> list:
+        with self._cv:
+            while not self._outbox and not self._stop.is_set():
+                self._cv.wait(1.0)
+            items = list(self._outbox)
+            self._outbox.clear()
+        return items
+
+    def _publisher(self) -> None:
+        from sqlalchemy import text
+        from backend.db.session import get_engine
+        while not self._stop.is_set():
+            items = self._drain()
+            if not items:
+                continue
+            try:
+                with get_engine().connect() as conn:
+                    for t, n, p in items:
+                        payload = json.dumps({"o": self.origin, "t": t, "n": n, "p": int(p)},
+                                             ensure_ascii=False)
+                        conn.execute(text("SELECT pg_notify(:ch, :payload)"),
+                                     {"ch": CACHE_NOTIFY_CHANNEL, "payload": payload})
+                    conn.commit()
+            except Exception as e:
+                log.warning("[cache] invalidation publish failed (%d keys): %s", len(items), e)
+
+    def handle(self, payload: str) -> None:
+        try:
+            msg = json.loads(payload)
+        except ValueError:
+            return
+        if msg.get("o") == self.origin:
+            return
+        _cache.invalidate(msg.get("t", ""), msg.get("n", ""), prefix=bool(msg.get("p")),
+                          remote=True)
+
+    def _listener(self, dsn: str) -> None:
+        import psycopg
+        # Only connection-level failures are worth reconnecting for.
+        retryable = (psycopg.OperationalError, psycopg.InterfaceError, OSError)
+        backoff = 1.0
+        connected_once = False
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(dsn, autocommit=True) as conn:
+                    conn.execute(f'LISTEN "{CACHE_NOTIFY_CHANNEL}"')
+                    if connected_once:
+                        _cache.clear()      # notifications may have been missed while down
+                    connected_once, backoff = True, 1.0
+                    while not self._stop.is_set():
+                        for n in conn.notifies(timeout=1.0):   # psycopg >= 3.2
+                            self.handle(n.payload)
+            except retryable as e:
+                if self._stop.is_set():
+                    break
+                log.warning("[cache] LISTEN connection lost: %s (retry in %.0fs)", e, backoff)
+                _cache.clear()
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+            except Exception as e:
+                if self._stop.is_set():
+                    break
+                log.error("[cache] LISTEN loop failed (%s: %s) — caching disabled in this worker",
+                          type(e).__name__, e)
+                self.broken = True
+                _cache.clear()
+                return
+
+    def start(self, dsn: str) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self.running = True
+        self._threads = [
+            threading.Thread(target=self._publisher, name="cache-notify-pub", daemon=True),
+            threading.Thread(target=self._listener, args=(dsn,), name="cache-notify-listen",
+                             daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self.running = False
+        self._stop.set()
+        with self._cv:
+            self._cv.notify_all()
+        for t in self._threads:
+            t.join(timeout=3.0)
+        self._threads = []
+
+
+_bus = _Bus()
+
+
+def start_bus() -> bool:
+    """Start cross-worker invalidation (LISTEN + publisher threads). True if started.
+
+    No-op unless PostgreSQL is configured and ``CACHE_NOTIFY`` is on."""
+    if not CACHE_NOTIFY:
+        return False
+    from backend.db.session import get_engine, is_configured
+    if not is_configured():
+        return False
+    url = get_engine().url
+    if url.get_backend_name() != "postgresql":
+        return False
+    _bus.start(url.set(drivername="postgresql").render_as_string(hide_password=False))
+    return True
+
+
+def stop_bus() -> None:
+    _bus.stop()
+
+
+# ── public API ───────────────────────────────────────────────────────────────
 
 def cache_get(tenant_id: str, name: str) -> Optional[Any]:
     """Return cached value or None if missing/expired."""
-    k = _key(tenant_id, name)
-    with _lock:
-        entry = _store.get(k)
-        if entry is None:
-            return None
-        val, expires = entry
-        if time.monotonic() > expires:
-            del _store[k]
-            return None
-        return val
+    return _cache.get(tenant_id, name)
+
+
+def cache_set(tenant_id: str, name: str, value: Any, ttl: float, *,
+              if_generation: Optional[tuple[int, int]] = None) -> None:
+    """Store value with TTL (seconds).
+
+    Pass ``if_generation=cache_generation(tenant_id)`` taken before a slow read so the
+    result is dropped if the tenant was invalidated meanwhile."""
+    if _bus.broken:
+        return
+    _cache.set(tenant_id, name, value, ttl, if_generation=if_generation)
 
 
-def cache_set(tenant_id: str, name: str, value: Any, ttl: float) -> None:
-    """Store value with TTL (seconds)."""
-    k = _key(tenant_id, name)
-    with _lock:
-        _store[k] = (value, time.monotonic() + ttl)
+def cache_generation(tenant_id: str) -> tuple[int, int]:
+    """Opaque token that changes whenever the tenant's entries are invalidated."""
+    return _cache.generation(tenant_id)
+
+
+def cache_get_or_load(tenant_id: str, name: str, ttl: float, loader: Callable[[], Any]) -> Any:
+    """Return the cached value, or call ``loader()``, cache and return its result."""
+    val = _cache.get(tenant_id, name)
+    if val is None:
+        gen = _cache.generation(tenant_id)
+        val = loader()
+        # A write that committed while we were loading must not be masked for ``ttl``.
+        if not _bus.broken:
+            _cache.set(tenant_id, name, val, ttl, if_generation=gen)
+    return val
 
 
 def cache_invalidate(tenant_id: str, name: str) -> None:
-    """Remove a specific cache entry immediately."""
-    k = _key(tenant_id, name)
-    with _lock:
-        _store.pop(k, None)
+    """Remove a specific cache entry immediately (this worker + broadcast)."""
+    _cache.invalidate(tenant_id, name)
+    _bus.publish(tenant_id, name, False)
+
+
+def cache_invalidate_prefix(tenant_id: str, prefix: str) -> None:
+    """Remove every entry of the tenant whose name starts with ``prefix`` (+ broadcast)."""
+    _cache.invalidate(tenant_id, prefix, prefix=True)
+    _bus.publish(tenant_id, prefix, True)
+
+
+def cache_invalidate_tenant(tenant_id: str) -> None:
+    """Remove every entry of the tenant (+ broadcast)."""
+    cache_invalidate_prefix(tenant_id, "")
+
+
+def cache_stats() -> dict:
+    return {**_cache.stats(), "bus_broken": _bus.broken}
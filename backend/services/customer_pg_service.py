@@ -6,9 +6,13 @@ names for SQL ergonomics, so this module is the translation layer.
 """
 from __future__ import annotations
 
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, or_, select
+
+from backend.services import pii_crypto as _pii
+from backend.services.customer_identifier_normalize import canonical_reg_front_for_legacy_read
+from backend.services.date_normalize import normalize_date_only, parse_date_only
 
 # Sheet-key ↔ PG-column mapping. Order matches _DEFAULT_CUSTOMER_HEADERS so
 # the response shape is stable across callers.
@@ -56,6 +60,24 @@ _DATE_PG_COLUMNS = (
 # 응답(한글 키) 측 동일 필드.
 _DATE_SHEET_KEYS = ("발급일", "만기일", "발급", "만기")
 
+# 만기일 TEXT → DATE 그림자 컬럼(migration 0039). 만기 알림 범위 조회가 부분 인덱스를 타도록
+# 쓰기 경로가 TEXT 와 함께 갱신한다 — ORM 으로 직접 쓰는 스크립트도 apply_expiry_shadows 를 거친다.
+EXPIRY_SHADOW_COLUMNS = {
+    "card_expiry_date": "card_expiry_on",
+    "passport_expiry_date": "passport_expiry_on",
+}
+
+
+def apply_expiry_shadows(payload: dict) -> dict:
+    """payload(ORM 컬럼)에 만기일 TEXT 가 있으면 DATE 그림자를 채운다(in-place, 판독 불가 → None).
+
+    TEXT 키가 없으면(부분 업데이트) 그림자도 건드리지 않는다.
+    """
+    for text_col, date_col in EXPIRY_SHADOW_COLUMNS.items():
+        if text_col in payload:
+            payload[date_col] = parse_date_only(payload[text_col])
+    return payload
+
 # ── 외국인등록번호 뒷자리(reg_back) 암호화 정책 ────────────────────────────────
 # 1차(전환기): 기존 평문 reg_back 컬럼을 fallback/rollback 용으로 **유지**하고, 읽기
 # 경로에서 항상 마스킹/복호화로 분기한다. 2차에서 reg_back 을 마스크('1******')로
@@ -92,7 +114,6 @@ def _encode_reg_back_into_payload(payload: dict, tenant_id: str) -> None:
     raw = payload.pop("reg_back")
     if raw is None:
         return
-    from backend.services import pii_crypto as _pii
 
     s = str(raw)
     if "*" in s:
@@ -152,35 +173,43 @@ def _legacy_canonicalize_reg_front_in_payload(payload: dict) -> None:
     payload["reg_front"] = canonical_reg_front_for_legacy_read(payload.get("reg_front"))
 
 
-def _row_to_dict(row, *, reveal: bool = False) -> dict:
-    """Customer ORM row → 표준(한글 키) dict.
+def _invalidate(tenant_id: str) -> None:
+    """Drop cached customer list/expiry-alert responses for this tenant on every worker."""
+    from backend.services.cache_service import cache_invalidate_prefix
+    cache_invalidate_prefix(tenant_id, "customers:")
+
+
+def _row_to_dict(row, *, reveal: bool = False, keys: Optional[frozenset] = None) -> dict:
+    """Customer ORM row(또는 컬럼 projection Row) → 표준(한글 키) dict.
 
     reg_back(번호) 특수 처리:
     - reveal=False(목록/기본): 복호화하지 않고 ``1******`` 마스킹(첫 자리 보존 →
       만기 세기판별 호환). ``번호_last4`` 보조키 추가.
     - reveal=True(상세/문서): 암호문 복호화(없으면 평문 fallback). 실패 시 blank.
+
+    ``keys`` 를 주면 그 한글 키만 만든다(projection — 나머지 정규화/복호화 생략).
     """
     out: dict = {}
     for pg_col, sheet_key in PG_TO_SHEET.items():
+        if keys is not None and sheet_key not in keys:
+            continue
         val = getattr(row, pg_col, "")
         out[sheet_key] = "" if val is None else str(val)
 
     # 날짜 필드는 응답 직전 'YYYY-MM-DD' 로 정규화한다. 이렇게 하면 DB 에 과거
     # 'YYYY-MM-DD 00:00:00' 형태가 남아 있어도 API/화면 재발을 막는다(읽기 방어선).
-    from backend.services.date_normalize import normalize_date_only
-
     for sheet_key in _DATE_SHEET_KEYS:
-        out[sheet_key] = normalize_date_only(out.get(sheet_key, "")) or ""
+        if sheet_key in out:
+            out[sheet_key] = normalize_date_only(out[sheet_key]) or ""
 
     # 등록증(reg_front, YYMMDD) 읽기 방어 — 레거시 선행 0 손실('1010')을 canonical('001010')로
     # 복구해 모든 읽기 경로(목록/상세/검색/문서/추출/복사팝업)가 동일 6자리 값을 받게 한다.
     # DB 원문은 수정하지 않는다(유효 복구 불가 값은 원문 유지). 프론트 개별 padStart 불필요.
-    from backend.services.customer_identifier_normalize import (
-        canonical_reg_front_for_legacy_read,
-    )
-    out["등록증"] = canonical_reg_front_for_legacy_read(out.get("등록증", ""))
+    if "등록증" in out:
+        out["등록증"] = canonical_reg_front_for_legacy_read(out["등록증"])
 
-    from backend.services import pii_crypto as _pii
+    if keys is not None and "번호" not in keys:
+        return out
 
     enc = getattr(row, "reg_back_encrypted", "") or ""
     plain_fallback = str(getattr(row, "reg_back", "") or "")
@@ -203,7 +232,7 @@ def _row_to_dict(row, *, reveal: bool = False) -> dict:
 
     # 외부 사이트 계정(하이코리아/소시넷) — **상세(reveal=True)에서만** 평문 그대로 반환한다.
     # 목록/검색(reveal=False)에는 포함하지 않는다(아이디·비밀번호 미노출).
-    if reveal:
+    if reveal and keys is None:
         for col in _EXTERNAL_ACCOUNT_COLS:
             out[col] = str(getattr(row, col, "") or "")
     return out
@@ -249,6 +278,302 @@ def find_customer(tenant_id: str, customer_id: str, *, reveal: bool = False) ->
     return _row_to_dict(row, reveal=reveal) if row else None
 
 
+# ── 조회 API: 필터 push-down + keyset 페이지 + 컬럼 projection ─────────────────
+# 정렬 키 = (length(customer_id) DESC, customer_id DESC). 고객ID 는 4자리 0-패딩 숫자라
+# 길이 우선 비교가 숫자 내림차순과 같다('10000' > '9999'). 커서는 마지막 행의 고객ID 문자열.
+# 날짜 범위 필터는 정규화된 'YYYY-MM-DD' TEXT 값의 문자열 비교다(쓰기 경로가 항상 정규화;
+# 과거 비정규 값은 scripts/cleanup_customer_dates.py 로 정리).
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# reveal=False 번호(마스킹/last4) 계산에 필요한 보조 컬럼.
+_REG_BACK_AUX_COLS = ("reg_back", "reg_back_encrypted", "reg_back_last4")
+
+
+def _escape_like(q: str) -> str:
+    return q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _customer_filters(
+    Customer,
+    tenant_id: str,
+    *,
+    name_prefix: Optional[str] = None,
+    korean_name: Optional[str] = None,
+    visa_status: Optional[str] = None,
+    passport_no: Optional[str] = None,
+    customer_ids: Optional[Iterable[str]] = None,
+    card_expiry_from: Optional[str] = None,
+    card_expiry_to: Optional[str] = None,
+    passport_expiry_from: Optional[str] = None,
+    passport_expiry_to: Optional[str] = None,
+) -> list:
+    conds = [Customer.tenant_id == tenant_id, Customer.deleted_at.is_(None)]
+    if name_prefix:
+        # 한글 이름 또는 영문 성/이름 접두 일치(대소문자 무시).
+        pat = f"{_escape_like(name_prefix.strip())}%"
+        conds.append(or_(
+            Customer.korean_name.ilike(pat, escape="\\"),
+            Customer.surname_en.ilike(pat, escape="\\"),
+            Customer.given_en.ilike(pat, escape="\\"),
+        ))
+    if korean_name is not None:
+        conds.append(func.trim(Customer.korean_name) == korean_name.strip())
+    if visa_status:
+        conds.append(Customer.visa_status == visa_status.strip())
+    if passport_no:
+        conds.append(func.trim(Customer.passport_no) == passport_no.strip())
+    if customer_ids is not None:
+        conds.append(Customer.customer_id.in_([str(x) for x in customer_ids]))
+    for col, lo, hi in (
+        (Customer.card_expiry_date, card_expiry_from, card_expiry_to),
+        (Customer.passport_expiry_date, passport_expiry_from, passport_expiry_to),
+    ):
+        if lo:
+            conds.append(col >= normalize_date_only(lo))
+        if hi:
+            conds.append(col <= normalize_date_only(hi))
+        if lo or hi:
+            conds.append(col != "")
+    return conds
+
+
+def _projection(Customer, columns: Optional[Iterable[str]]):
+    """요청 한글 키 → (select 대상 컬럼 리스트, keys frozenset|None). None = 전체 ORM 행."""
+    if columns is None:
+        return [Customer], None
+    keys = frozenset(columns) | {"고객ID"}
+    pg_cols = {SHEET_TO_PG[k] for k in keys if k in SHEET_TO_PG}
+    if "번호" in keys:
+        pg_cols.update(_REG_BACK_AUX_COLS)
+    pg_cols.add("customer_id")
+    return [getattr(Customer, c) for c in sorted(pg_cols)], keys
+
+
+def query_customers(
+    tenant_id: str,
+    *,
+    after: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+    columns: Optional[Iterable[str]] = None,
+    reveal: bool = False,
+    **filters,
+) -> tuple[list[dict], Optional[str]]:
+    """한 페이지 조회 → ``(items, next_cursor)``. 필터/정렬/LIMIT 은 모두 SQL 에서 처리한다.
+
+    - ``after``: 이전 페이지의 ``next_cursor``(keyset). ``offset`` 은 화면 페이지 번호 호환용.
+    - ``columns``: 반환할 한글 키 목록(``고객ID`` 는 항상 포함). None 이면 전체(list_customers 와 동일).
+    - 필터: ``name_prefix``, ``korean_name``(정확), ``visa_status``, ``passport_no``,
+      ``customer_ids``, ``card_expiry_from/to``, ``passport_expiry_from/to`` ('YYYY-MM-DD').
+    - ``next_cursor`` 는 다음 페이지가 있을 때만 값이 있다.
+    """
+    from backend.db.models.customer import Customer
+    from backend.db.session import get_sessionmaker
+
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    targets, keys = _projection(Customer, columns)
+    conds = _customer_filters(Customer, tenant_id, **filters)
+    id_len = func.length(Customer.customer_id)
+    if after:
+        conds.append(or_(
+            id_len < len(after),
+            and_(id_len == len(after), Customer.customer_id < after),
+        ))
+    stmt = (
+        select(*targets)
+        .where(*conds)
+        .order_by(id_len.desc(), Customer.customer_id.desc())
+        .offset(max(0, offset))
+        .limit(limit + 1)
+    )
+    SessionLocal = get_sessionmaker()
+    with SessionLocal() as session:
+        if keys is None:
+            rows = session.scalars(stmt).all()
+        else:
+            rows = session.execute(stmt).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    items = [_row_to_dict(r, reveal=reveal, keys=keys) for r in rows]
+    next_cursor = str(rows[-1].customer_id) if (has_more and rows) else None
+    return items, next_cursor
+
+
+def count_customers(tenant_id: str, **filters) -> int:
+    """:func:`query_customers` 와 같은 필터의 건수(SQL COUNT)."""
+    from backend.db.models.customer import Customer
+    from backend.db.session import get_sessionmaker
+
+    SessionLocal = get_sessionmaker()
+    with SessionLocal() as session:
+        return int(session.scalar(
+            select(func.count()).select_from(Customer)
+            .where(*_customer_filters(Customer, tenant_id, **filters))
+        ) or 0)
+
+
+def iter_customers(
+    tenant_id: str,
+    *,
+    batch_size: int = 500,
+    columns: Optional[Iterable[str]] = None,
+    reveal: bool = False,
+    **filters,
+) -> Iterator[dict]:
+    """조건에 맞는 고객을 keyset 배치로 스트리밍한다 — 메모리는 ``batch_size`` 에 비례.
+
+    배치 사이에 세션을 유지하지 않으므로 오래 걸리는 소비자(엑셀 작성 등)도 커넥션을 잡지 않는다.
+    """
+    cols = list(columns) if columns is not None else None
+    cursor: Optional[str] = None
+    while True:
+        items, cursor = query_customers(
+            tenant_id, after=cursor, limit=batch_size, columns=cols, reveal=reveal, **filters,
+        )
+        yield from items
+        if cursor is None:
+            return
+
+
+# ── 만기 알림: DATE 그림자 컬럼 범위 조회 ────────────────────────────────────────
+# (tenant_id, *_expiry_on, customer_id) 부분 인덱스 순서 그대로 읽는다 — 테넌트 고객 전체를
+# 읽지 않는다. 커서는 마지막 행의 'YYYY-MM-DD|고객ID'. 알림 행은 필요한 컬럼만 projection 한다
+# (번호는 세기 판별용 첫 자리만).
+
+EXPIRY_ALERT_MONTHS = {"card": 4, "passport": 6}
+_EXPIRY_KINDS = {
+    "card": ("card_expiry_on", "등록증만기일"),
+    "passport": ("passport_expiry_on", "여권만기일"),
+}
+
+
+def _add_months(d, months: int):
+    import calendar
+
+    y, m = divmod(d.month - 1 + months, 12)
+    y += d.year
+    return d.replace(year=y, month=m + 1, day=min(d.day, calendar.monthrange(y, m + 1)[1]))
+
+
+def expiry_window(kind: str, today=None) -> tuple:
+    """만기 알림 기간 ``(today, today + N개월)`` — 등록증 4개월, 여권 6개월.
+
+    달의 일수가 모자라면 그 달 말일로 맞춘다(1/31 + 1개월 → 2/28).
+    """
+    import datetime as _dt
+
+    if kind not in EXPIRY_ALERT_MONTHS:
+        raise ValueError(f"unknown expiry kind: {kind!r}")
+    today = today or _dt.date.today()
+    return today, _add_months(today, EXPIRY_ALERT_MONTHS[kind])
+
+
+def _alert_birth(reg_front, reg_back_head, today) -> str:
+    """등록증(YYMMDD) + 번호 첫 자리(세기 코드) → 'YYYY-MM-DD'. 판독 불가 → ''."""
+    import datetime as _dt
+
+    s = canonical_reg_front_for_legacy_read(reg_front).split(".")[0]
+    if len(s) < 6 or not s[:6].isdigit():
+        return ""
+    yy, mm, dd = int(s[:2]), int(s[2:4]), int(s[4:6])
+    rb = str(reg_back_head or "").strip()
+    century = (
+        1900 if (rb and rb[0] in "1256") else
+        2000 if (rb and rb[0] in "3478") else
+        (1900 if yy > today.year % 100 else 2000)
+    )
+    try:
+        return _dt.date(century + yy, mm, dd).isoformat()
+    except ValueError:
+        return ""
+
+
+def _alert_phone(row) -> str:
+    parts = [str(v or "").strip().split(".")[0] for v in (row.phone1, row.phone2, row.phone3)]
+    return " ".join(p for p in parts if p and p != "nan")
+
+
+def _parse_expiry_cursor(after: str) -> tuple:
+    d, sep, cid = str(after).partition("|")
+    on = parse_date_only(d) if sep and cid else None
+    if on is None or normalize_date_only(d) != d:
+        raise ValueError(f"invalid expiry cursor: {after!r}")
+    return on, cid
+
+
+def query_expiring(
+    tenant_id: str,
+    kind: str,
+    start,
+    end,
+    *,
+    after: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> tuple[list[dict], Optional[str]]:
+    """만기일이 ``start``~``end``(양끝 포함, ``date``)인 비삭제 고객의 알림 행 → ``(items, next_cursor)``.
+
+    - ``kind``: ``"card"``(등록증 만기일) / ``"passport"``(여권 만기일).
+    - 정렬: 만기일 오름차순, 같은 날은 고객ID 순. ``after`` 는 이전 페이지의 ``next_cursor``.
+    - ``limit`` 이 None 이면 기간 전체(알림 개수만큼만 읽는다).
+    - 행: 고객ID, 한글이름, 영문이름, 여권번호, 생년월일, 전화번호, 등록증만기일|여권만기일.
+    """
+    import datetime as _dt
+
+    from backend.db.models.customer import Customer
+    from backend.db.session import get_sessionmaker
+
+    if kind not in _EXPIRY_KINDS:
+        raise ValueError(f"unknown expiry kind: {kind!r}")
+    date_attr, date_label = _EXPIRY_KINDS[kind]
+    col = getattr(Customer, date_attr)
+    conds = [
+        Customer.tenant_id == tenant_id,
+        Customer.deleted_at.is_(None),
+        col.is_not(None),
+        col >= start,
+        col <= end,
+    ]
+    if after:
+        on, cid = _parse_expiry_cursor(after)
+        conds.append(or_(col > on, and_(col == on, Customer.customer_id > cid)))
+    stmt = (
+        select(
+            Customer.customer_id, Customer.korean_name, Customer.surname_en, Customer.given_en,
+            Customer.passport_no, Customer.reg_front,
+            func.substr(Customer.reg_back, 1, 1).label("reg_back_head"),
+            Customer.phone1, Customer.phone2, Customer.phone3,
+            col.label("expiry_on"),
+        )
+        .where(*conds)
+        .order_by(col, Customer.customer_id)
+    )
+    if limit is not None:
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        stmt = stmt.limit(limit + 1)
+    SessionLocal = get_sessionmaker()
+    with SessionLocal() as session:
+        rows = session.execute(stmt).all()
+    has_more = limit is not None and len(rows) > limit
+    if has_more:
+        rows = rows[:limit]
+
+    today = _dt.date.today()
+    items = [{
+        # 고객카드를 고유키로 열기 위함 — 이름 매칭 금지(동명이인 방지).
+        "고객ID": str(r.customer_id),
+        "한글이름": r.korean_name or "",
+        "영문이름": f"{(r.surname_en or '').strip()} {(r.given_en or '').strip()}".strip(),
+        "여권번호": r.passport_no or "",
+        "생년월일": _alert_birth(r.reg_front, r.reg_back_head, today),
+        "전화번호": _alert_phone(r),
+        date_label: r.expiry_on.isoformat(),
+    } for r in rows]
+    next_cursor = f"{rows[-1].expiry_on.isoformat()}|{rows[-1].customer_id}" if has_more else None
+    return items, next_cursor
+
+
 def ids_by_reg_back_hash(tenant_id: str, target_hash: str) -> set:
     """주어진 HMAC 해시와 일치하는 (비삭제) 고객ID 집합. 검색용. 빈 해시 → 빈 집합."""
     if not target_hash:
@@ -348,6 +673,7 @@ def create_customer(tenant_id: str, data: dict, *, max_retries: int = 5) -> dict
     base_payload = {SHEET_TO_PG[k]: v for k, v in data.items() if k in SHEET_TO_PG}
     from backend.services.date_normalize import normalize_date_fields
     normalize_date_fields(base_payload, _DATE_PG_COLUMNS)
+    apply_expiry_shadows(base_payload)
     _validate_reg_front_in_payload(base_payload)  # 신규 등록 = 엄격(복구 금지)
     _encode_reg_back_into_payload(base_payload, tenant_id)
     _apply_external_accounts_into_payload(base_payload, data)
@@ -360,6 +686,7 @@ def create_customer(tenant_id: str, data: dict, *, max_retries: int = 5) -> dict
                 row = Customer(**payload)
                 session.add(row)
                 session.commit()
+                _invalidate(tenant_id)
                 session.refresh(row)
                 return _row_to_dict(row)
         except IntegrityError as e:
@@ -411,6 +738,7 @@ def upsert_customer(tenant_id: str, data: dict) -> dict:
         raise ValueError("고객ID is required")
     from backend.services.date_normalize import normalize_date_fields
     normalize_date_fields(payload, _DATE_PG_COLUMNS)
+    apply_expiry_shadows(payload)
     _legacy_canonicalize_reg_front_in_payload(payload)  # 수정/복원 = grandfather(비파괴)
     _encode_reg_back_into_payload(payload, tenant_id)
     _apply_external_accounts_into_payload(payload, data)
@@ -432,6 +760,7 @@ def upsert_customer(tenant_id: str, data: dict) -> dict:
             for col, val in payload.items():
                 setattr(row, col, val)
         session.commit()
+        _invalidate(tenant_id)
         session.refresh(row)
         return _row_to_dict(row)
 
@@ -462,6 +791,7 @@ def append_delegation(tenant_id: str, customer_id: str, entry: str) -> Optional[
         existing = (row.delegation_history or "").strip()
         row.delegation_history = (existing + "\n" + entry).strip() if existing else entry
         session.commit()
+        _invalidate(tenant_id)
         session.refresh(row)
         return _row_to_dict(row)
 
@@ -486,4 +816,5 @@ def delete_customer(tenant_id: str, customer_id: str) -> bool:
             return False
         row.deleted_at = datetime.now(timezone.utc)
         session.commit()
+        _invalidate(tenant_id)
         return True
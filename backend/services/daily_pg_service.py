@@ -1,9 +1,10 @@
 """PG repository for daily entries + balance."""
 from __future__ import annotations
 
+import re
 from typing import Optional
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, select, update
 
 DAILY_FIELDS = (
     "id",
@@ -29,6 +30,58 @@ def _safe_int(v) -> int:
         return 0
 
 
+_KID_RE = re.compile(r"\[KID\](.*?)\[/KID\]")
+
+# memo [KID] 결제 슬롯 → daily_entries 컬럼(쓰기 시 1회 파싱, 분석/재집계는 컬럼만 읽는다).
+SLOT_FIELDS = ("inc_method", "exp1_method", "exp1_amount", "exp2_method", "exp2_amount", "tax_invoice")
+
+
+def kid_parts(memo) -> dict:
+    """memo 의 [KID] 메타(inc/e1/e1a/e2/e2a/tax ...) 를 dict 로 파싱. 없으면 {}."""
+    m = _KID_RE.search(str(memo or ""))
+    if not m:
+        return {}
+    try:
+        return dict(p.split("=", 1) for p in m.group(1).split(";") if "=" in p)
+    except Exception:
+        return {}
+
+
+def memo_slots(memo) -> dict:
+    """memo → SLOT_FIELDS dict. 레거시(블록 없음)는 결제수단 None, 금액 0, tax_invoice False."""
+    parts = kid_parts(memo)
+    return {
+        "inc_method": parts.get("inc") or None,
+        "exp1_method": parts.get("e1") or None,
+        "exp1_amount": _safe_int(parts.get("e1a", "0")),
+        "exp2_method": parts.get("e2") or None,
+        "exp2_amount": _safe_int(parts.get("e2a", "0")),
+        "tax_invoice": str(parts.get("tax", "")).strip() in ("1", "true", "True"),
+    }
+
+
+# 롤업 델타에 쓰이는 엔트리 컬럼(upsert payload 와 같은 집합).
+_FACT_COLUMNS = (
+    "date", "time", "category", "name", "task",
+    "income_cash", "income_etc", "exp_cash", "exp_etc", "cash_out", "memo", "customer_id",
+    "inc_method", "exp1_method", "exp1_amount", "exp2_method", "exp2_amount", "tax_invoice",
+)
+
+
+def _entry_facts(row) -> dict:
+    """_entry_to_dict + 결제 슬롯 컬럼 — 롤업 집계 입력(API 응답에는 슬롯을 노출하지 않는다)."""
+    d = _entry_to_dict(row)
+    d.update({
+        "inc_method": row.inc_method or None,
+        "exp1_method": row.exp1_method or None,
+        "exp1_amount": int(row.exp1_amount or 0),
+        "exp2_method": row.exp2_method or None,
+        "exp2_amount": int(row.exp2_amount or 0),
+        "tax_invoice": bool(row.tax_invoice),
+    })
+    return d
+
+
 def _entry_to_dict(row) -> dict:
     """Convert a DailyEntry ORM row to a 표준(한글 키) dict."""
     return {
@@ -61,59 +114,132 @@ def list_entries(tenant_id: str, date: Optional[str] = None) -> list[dict]:
     return [_entry_to_dict(r) for r in rows]
 
 
+def list_entries_range(tenant_id: str, date_from: str, date_to: str) -> list[dict]:
+    """date_from <= date < date_to (문자열 비교, idx_daily_tenant_date 범위 스캔).
+
+    월 단위는 ("YYYY-MM", 다음달 "YYYY-MM") 로 부르면 해당 월 prefix 로 시작하는 행을 모두 포함한다."""
+    from backend.db.models.daily import DailyEntry
+    from backend.db.session import get_sessionmaker
+
+    SessionLocal = get_sessionmaker()
+    with SessionLocal() as session:
+        q = select(DailyEntry).where(
+            DailyEntry.tenant_id == tenant_id,
+            DailyEntry.date >= date_from,
+            DailyEntry.date < date_to,
+        )
+        rows = session.scalars(q.order_by(DailyEntry.date.desc(), DailyEntry.time.desc())).all()
+    return [_entry_to_dict(r) for r in rows]
+
+
+_WRITE_RETRIES = 3
+
+
+def _unchanged(DailyEntry, row, cols) -> list:
+    """UPDATE/DELETE 조건 — 읽은 값이 그대로일 때만(compare-and-swap).
+
+    PostgreSQL 은 FOR UPDATE 잠금으로 항상 참이다. 행 잠금이 없는 백엔드(SQLite)에서도
+    읽은 뒤 다른 쓰기가 끼어들면 rowcount 0 → 다시 읽어 롤업 델타가 어긋나지 않게 한다.
+    """
+    return [getattr(DailyEntry, c) == getattr(row, c) for c in cols]
+
+
 def upsert_entry(tenant_id: str, rec: dict) -> dict:
+    """엔트리 저장(신규/수정) + 롤업 증분 반영을 한 트랜잭션에서.
+
+    기존 행은 ``SELECT … FOR UPDATE`` 로 잠근 뒤 읽어 동시 수정이 같은 ``-old`` 델타를 두 번
+    적용하지 않게 한다. 롤업 델타는 UPDATE/INSERT 가 실제로 반영됐을 때만 적용한다.
+    """
+    from sqlalchemy.exc import IntegrityError
+
     from backend.db.models.daily import DailyEntry
     from backend.db.session import get_sessionmaker
+    from backend.services import daily_rollup_service as _rollup
 
     entry_id = str(rec.get("id", "")).strip()
     if not entry_id:
         raise ValueError("id is required")
 
+    payload = {
+        "date": str(rec.get("date", "")).strip(),
+        "time": str(rec.get("time", "")).strip(),
+        "category": str(rec.get("category", "")).strip(),
+        "name": str(rec.get("name", "")).strip(),
+        "task": str(rec.get("task", "")).strip(),
+        "income_cash": _safe_int(rec.get("income_cash", 0)),
+        "income_etc": _safe_int(rec.get("income_etc", 0)),
+        "exp_cash": _safe_int(rec.get("exp_cash", 0)),
+        "exp_etc": _safe_int(rec.get("exp_etc", 0)),
+        "cash_out": _safe_int(rec.get("cash_out", 0)),
+        "memo": str(rec.get("memo", "")),
+        "customer_id": str(rec.get("customer_id", "")).strip(),
+    }
+    payload.update(memo_slots(payload["memo"]))
+
     SessionLocal = get_sessionmaker()
-    with SessionLocal() as session:
-        row = session.scalar(
-            select(DailyEntry).where(
-                DailyEntry.tenant_id == tenant_id, DailyEntry.entry_id == entry_id
+    for _ in range(_WRITE_RETRIES):
+        with SessionLocal() as session:
+            row = session.scalar(
+                select(DailyEntry).where(
+                    DailyEntry.tenant_id == tenant_id, DailyEntry.entry_id == entry_id
+                ).with_for_update()
             )
-        )
-        payload = {
-            "date": str(rec.get("date", "")).strip(),
-            "time": str(rec.get("time", "")).strip(),
-            "category": str(rec.get("category", "")).strip(),
-            "name": str(rec.get("name", "")).strip(),
-            "task": str(rec.get("task", "")).strip(),
-            "income_cash": _safe_int(rec.get("income_cash", 0)),
-            "income_etc": _safe_int(rec.get("income_etc", 0)),
-            "exp_cash": _safe_int(rec.get("exp_cash", 0)),
-            "exp_etc": _safe_int(rec.get("exp_etc", 0)),
-            "cash_out": _safe_int(rec.get("cash_out", 0)),
-            "memo": str(rec.get("memo", "")),
-            "customer_id": str(rec.get("customer_id", "")).strip(),
-        }
-        if row is None:
-            row = DailyEntry(tenant_id=tenant_id, entry_id=entry_id, **payload)
-            session.add(row)
-        else:
-            for k, v in payload.items():
-                setattr(row, k, v)
-        session.commit()
-        session.refresh(row)
-        return _entry_to_dict(row)
+            if row is None:
+                row = DailyEntry(tenant_id=tenant_id, entry_id=entry_id, **payload)
+                session.add(row)
+                try:
+                    session.flush()
+                except IntegrityError:
+                    session.rollback()      # 동시 신규 저장 — 다시 읽어 수정으로 처리
+                    continue
+                _rollup.apply_entry_change(session, tenant_id, None, _entry_facts(row))
+            else:
+                old = _entry_facts(row)
+                res = session.execute(
+                    update(DailyEntry)
+                    .where(DailyEntry.id == row.id, *_unchanged(DailyEntry, row, payload))
+                    .values(**payload)
+                    .execution_options(synchronize_session=False)
+                )
+                if not res.rowcount:
+                    session.rollback()      # 읽은 뒤 바뀜/삭제됨 — 다시 읽는다
+                    continue
+                session.refresh(row)
+                _rollup.apply_entry_change(session, tenant_id, old, _entry_facts(row))
+            session.commit()
+            return _entry_to_dict(row)
+    raise RuntimeError(f"daily entry {entry_id!r} 저장 충돌 — 잠시 후 다시 시도해 주세요.")
 
 
 def delete_entry(tenant_id: str, entry_id: str) -> bool:
+    """엔트리 삭제 + 롤업 차감. 실제로 지운 행이 있을 때만 차감한다(중복 삭제 안전)."""
     from backend.db.models.daily import DailyEntry
     from backend.db.session import get_sessionmaker
+    from backend.services import daily_rollup_service as _rollup
 
     SessionLocal = get_sessionmaker()
-    with SessionLocal() as session:
-        result = session.execute(
-            delete(DailyEntry).where(
-                DailyEntry.tenant_id == tenant_id, DailyEntry.entry_id == entry_id
+    for _ in range(_WRITE_RETRIES):
+        with SessionLocal() as session:
+            row = session.scalar(
+                select(DailyEntry).where(
+                    DailyEntry.tenant_id == tenant_id, DailyEntry.entry_id == entry_id
+                ).with_for_update()
             )
-        )
-        session.commit()
-        return (result.rowcount or 0) > 0
+            if row is None:
+                return False
+            old = _entry_facts(row)
+            res = session.execute(
+                delete(DailyEntry)
+                .where(DailyEntry.id == row.id, *_unchanged(DailyEntry, row, _FACT_COLUMNS))
+                .execution_options(synchronize_session=False)
+            )
+            if not res.rowcount:
+                session.rollback()          # 다른 요청이 먼저 수정/삭제 — 다시 읽는다
+                continue
+            _rollup.apply_entry_change(session, tenant_id, old, None)
+            session.commit()
+            return True
+    raise RuntimeError(f"daily entry {entry_id!r} 삭제 충돌 — 잠시 후 다시 시도해 주세요.")
 
 
 # ── balance ────────────────────────────────────────────────────────────────
@@ -0,0 +1,338 @@
+"""일일결산 일/월 롤업(daily_rollups) — 분석 엔드포인트용 증분 집계.
+
+routers/daily.py 의 월간결산/연간추이/카드·수입 요약/세무 요약은 과거 매 요청마다
+``list_entries(tenant_id)`` 로 테넌트 전체 이력을 읽고 파이썬에서 월 prefix 필터 +
+memo ``[KID]`` 파싱을 반복했다. 여기서는 행 1건의 기여분(:func:`entry_contribution`)을
+일(day)·월(month) 롤업 행에 더하고 빼는 방식으로, 엔트리 upsert/delete 와 **같은 트랜잭션**
+안에서 롤업을 갱신한다(:func:`apply_entry_change`). 엔드포인트는 필요한 월/일 롤업 행만 읽는다.
+
+롤업 항목:
+- 전체 행: 건수, income_cash/income_etc/exp_cash/exp_etc/cash_out, 카드지출, 카드수입(+건수),
+  세무 신고매출(카드수입 또는 세금계산서 체크 — 행당 1회).
+- 현금출금 제외(업무 실적): 건수, 매출, 지출, 카드지출.
+- breakdown: ``cat``(분류별 순이익), ``ops_cat``(현금출금 제외 분류별 매출),
+  ``hour``(시별 순이익), ``dow``(요일별 순이익). 값은 ``[합계, 건수]`` — 건수가 0 이 되면 키 삭제.
+
+테넌트별 롤업 버전(``daily_rollup_states``)이 없거나 :data:`ROLLUP_VERSION` 과 다르면
+다음 조회에서 전체 재집계(:func:`ensure_current`)한다 — 별도 backfill 배치 없이 배포 후
+첫 조회가 초기 집계를 만든다. 집계 정의를 바꾸면 버전을 올린다.
+
+동시성(PG): 쓰기는 테넌트 advisory lock(공유), 재집계는 같은 lock(배타)을 트랜잭션 단위로 잡는다.
+롤업 행 갱신은 ``SELECT ... FOR UPDATE``. 롤업 갱신이 실패해도 엔트리 저장은 막지 않고
+상태 행을 지워 다음 조회에서 재집계되게 한다.
+"""
+from __future__ import annotations
+
+import logging
+from datetime import date as _date
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, select, text
+
+log = logging.getLogger("daily_rollup")
+
+ROLLUP_VERSION = 1
+
+# 테넌트 롤업 advisory lock 네임스페이스(2-키 형식: (ns, hashtext(tenant_id))).
+_LOCK_NS = 815101
+
+CASH_OUT_CATEGORY = "현금출금"
+
+SCALARS = (
+    "entry_count", "income_cash", "income_etc", "exp_cash", "exp_etc", "cash_out",
+    "card_expense", "card_income", "card_income_count", "reported_sales",
+    "ops_count", "ops_sales", "ops_expense", "ops_card_expense",
+)
+SECTIONS = ("cat", "ops_cat", "hour", "dow")
+
+
+# ── 행 1건 계산 ───────────────────────────────────────────────────────────────
+# 결제 슬롯은 daily_entries 컬럼(inc_method/exp1_*/exp2_*/tax_invoice, 쓰기 시 파싱)을 읽는다.
+
+def _safe_int(v) -> int:
+    try:
+        return int(float(str(v).replace(",", "").strip() or "0"))
+    except Exception:
+        return 0
+
+
+def is_card_income_method(v) -> bool:
+    """수입 결제수단이 '카드' 류인지(카드/신용카드/체크카드/영문 card)."""
+    s = str(v or "").strip().lower()
+    if not s:
+        return False
+    return ("카드" in s) or (s in ("card", "creditcard", "credit card", "debitcard"))
+
+
+def card_expense_of(slots: dict) -> int:
+    """지출 슬롯(exp1/exp2) 중 결제수단 '카드' 금액 합계. 레거시(블록 없음)=0."""
+    total = 0
+    for m_key, a_key in (("exp1_method", "exp1_amount"), ("exp2_method", "exp2_amount")):
+        if slots.get(m_key) == "카드":
+            total += int(slots.get(a_key) or 0)
+    return total
+
+
+def _slots(rec: dict) -> dict:
+    """엔트리 dict 의 결제 슬롯. 슬롯 키가 없는 dict(예: 외부 호출)만 memo 를 파싱한다."""
+    if "inc_method" in rec:
+        return rec
+    from backend.services.daily_pg_service import memo_slots
+    return memo_slots(rec.get("memo"))
+
+
+def entry_contribution(rec: dict) -> Optional[tuple[Optional[str], str, dict, dict]]:
+    """엔트리 1건 → (day_period|None, month_period, scalars, breakdown). 날짜 불량이면 None."""
+    ds = str(rec.get("date", "") or "")
+    if len(ds) < 7:
+        return None
+    month = ds[:7]
+    day = ds if len(ds) == 10 else None
+
+    ic, ie = _safe_int(rec.get("income_cash")), _safe_int(rec.get("income_etc"))
+    ec, ee = _safe_int(rec.get("exp_cash")), _safe_int(rec.get("exp_etc"))
+    sales, expense = ic + ie, ec + ee
+    net = sales - expense
+    slots = _slots(rec)
+    card_exp = card_expense_of(slots)
+    card_inc = sales if is_card_income_method(slots.get("inc_method")) else 0
+    reported = sales if (slots.get("inc_method") == "카드" or slots.get("tax_invoice")) else 0
+
+    cat = str(rec.get("category", "") or "").strip() or "기타"
+    ops = cat != CASH_OUT_CATEGORY
+    sc = {
+        "entry_count": 1, "income_cash": ic, "income_etc": ie, "exp_cash": ec, "exp_etc": ee,
+        "cash_out": _safe_int(rec.get("cash_out")),
+        "card_expense": card_exp, "card_income": card_inc,
+        "card_income_count": 1 if card_inc > 0 else 0, "reported_sales": reported,
+        "ops_count": 1 if ops else 0, "ops_sales": sales if ops else 0,
+        "ops_expense": expense if ops else 0, "ops_card_expense": card_exp if ops else 0,
+    }
+    bd: dict = {"cat": {cat: net}}
+    if ops:
+        bd["ops_cat"] = {cat: sales}
+    try:
+        bd["hour"] = {str(int(str(rec.get("time", "") or "").split(":")[0])): net}
+    except Exception:
+        pass
+    try:
+        bd["dow"] = {str(_date.fromisoformat(ds).weekday()): net}
+    except Exception:
+        pass
+    return day, month, sc, bd
+
+
+# ── 누적 연산 ─────────────────────────────────────────────────────────────────
+
+def _empty() -> dict:
+    return {"scalars": dict.fromkeys(SCALARS, 0), "breakdown": {}}
+
+
+def _accumulate(acc: dict, sc: dict, bd: dict, sign: int) -> None:
+    for k, v in sc.items():
+        acc["scalars"][k] = acc["scalars"].get(k, 0) + sign * v
+    for section, items in bd.items():
+        dst = acc["breakdown"].setdefault(section, {})
+        for key, v in items.items():
+            cell = dst.get(key) or [0, 0]
+            dst[key] = [cell[0] + sign * v, cell[1] + sign]
+
+
+def _deltas(old: Optional[dict], new: Optional[dict]) -> dict:
+    """(grain, period) → 누적 delta. 같은 기간의 old/new 는 한 번에 합친다."""
+    out: dict = {}
+    for rec, sign in ((old, -1), (new, 1)):
+        if not rec:
+            continue
+        contrib = entry_contribution(rec)
+        if contrib is None:
+            continue
+        day, month, sc, bd = contrib
+        for key in (("month", month), ("day", day)):
+            if key[1] is None:
+                continue
+            _accumulate(out.setdefault(key, _empty()), sc, bd, sign)
+    return out
+
+
+def _merge_breakdown(base: Optional[dict], delta: dict) -> dict:
+    """저장된 breakdown 에 delta 를 더한 새 dict. 건수가 0 이 된 키/빈 섹션은 제거."""
+    out = {s: dict(v) for s, v in (base or {}).items()}
+    for section, items in delta.items():
+        dst = out.setdefault(section, {})
+        for key, (v, n) in items.items():
+            cell = dst.get(key) or [0, 0]
+            cell = [cell[0] + v, cell[1] + n]
+            if cell[1] <= 0:
+                dst.pop(key, None)
+            else:
+                dst[key] = cell
+        if not dst:
+            out.pop(section, None)
+    return out
+
+
+# ── 락/상태 ───────────────────────────────────────────────────────────────────
+
+def _is_pg(session) -> bool:
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def _lock_tenant(session, tenant_id: str, *, exclusive: bool) -> None:
+    if not _is_pg(session):
+        return
+    fn = "pg_advisory_xact_lock" if exclusive else "pg_advisory_xact_lock_shared"
+    session.execute(text(f"SELECT {fn}(:ns, hashtext(:t))"), {"ns": _LOCK_NS, "t": tenant_id})
+
+
+def _state_current(session, tenant_id: str) -> bool:
+    from backend.db.models.daily import DailyRollupState
+    v = session.scalar(select(DailyRollupState.version).where(DailyRollupState.tenant_id == tenant_id))
+    return v == ROLLUP_VERSION
+
+
+# ── 쓰기 경로 ─────────────────────────────────────────────────────────────────
+
+def _upsert_row(session, tenant_id: str, grain: str, period: str, delta: dict) -> None:
+    from backend.db.models.daily import DailyRollup
+    q = (select(DailyRollup)
+         .where(DailyRollup.tenant_id == tenant_id, DailyRollup.grain == grain,
+                DailyRollup.period == period)
+         .with_for_update())
+    row = session.scalar(q)
+    if row is None:
+        from sqlalchemy.exc import IntegrityError
+        try:
+            with session.begin_nested():
+                row = DailyRollup(tenant_id=tenant_id, grain=grain, period=period,
+                                  breakdown={}, **dict.fromkeys(SCALARS, 0))
+                session.add(row)
+                session.flush()
+        except IntegrityError:          # 동시 최초 생성 — 상대가 만든 행을 잠그고 갱신
+            row = session.scalar(q)
+    for k, v in delta["scalars"].items():
+        if v:
+            setattr(row, k, int(getattr(row, k) or 0) + v)
+    if delta["breakdown"]:
+        row.breakdown = _merge_breakdown(row.breakdown, delta["breakdown"])
+
+
+def apply_entry_change(session, tenant_id: str, old: Optional[dict], new: Optional[dict]) -> bool:
+    """엔트리 변경(old→new, 삭제면 new=None, 신규면 old=None)을 롤업에 반영. 커밋은 호출측.
+
+    롤업이 아직 집계되지 않은(또는 버전이 다른) 테넌트는 건너뛴다(다음 조회에서 재집계).
+    실패해도 예외를 올리지 않고 상태를 무효화한다 — 엔트리 저장이 우선."""
+    try:
+        with session.begin_nested():
+            _lock_tenant(session, tenant_id, exclusive=False)
+            if not _state_current(session, tenant_id):
+                return False
+            for (grain, period), delta in _deltas(old, new).items():
+                _upsert_row(session, tenant_id, grain, period, delta)
+        return True
+    except Exception as e:
+        log.warning("daily rollup 갱신 실패(tenant=%s) — 다음 조회에서 재집계: %s", tenant_id, e)
+        invalidate(session, tenant_id)
+        return False
+
+
+def invalidate(session, tenant_id: str) -> None:
+    """테넌트 롤업 상태 삭제 → 다음 조회에서 전체 재집계."""
+    from backend.db.models.daily import DailyRollupState
+    try:
+        with session.begin_nested():
+            session.execute(delete(DailyRollupState).where(DailyRollupState.tenant_id == tenant_id))
+    except Exception:
+        pass
+
+
+def rebuild_tenant(session, tenant_id: str) -> int:
+    """테넌트 롤업 전체 재집계(daily_entries 기준). 커밋은 호출측. 반환: 반영 엔트리 수."""
+    from backend.db.models.daily import DailyEntry, DailyRollup, DailyRollupState
+    from backend.services.daily_pg_service import _entry_facts
+
+    _lock_tenant(session, tenant_id, exclusive=True)
+    acc: dict = {}
+    n = 0
+    rows = session.execute(select(DailyEntry).where(DailyEntry.tenant_id == tenant_id)).scalars()
+    for row in rows:
+        contrib = entry_contribution(_entry_facts(row))
+        n += 1
+        if contrib is None:
+            continue
+        day, month, sc, bd = contrib
+        for key in (("month", month), ("day", day)):
+            if key[1] is not None:
+                _accumulate(acc.setdefault(key, _empty()), sc, bd, 1)
+    session.execute(delete(DailyRollup).where(DailyRollup.tenant_id == tenant_id))
+    session.add_all(
+        DailyRollup(tenant_id=tenant_id, grain=grain, period=period,
+                    breakdown=a["breakdown"], **a["scalars"])
+        for (grain, period), a in acc.items()
+    )
+    state = session.get(DailyRollupState, tenant_id)
+    if state is None:
+        session.add(DailyRollupState(tenant_id=tenant_id, version=ROLLUP_VERSION))
+    else:
+        state.version = ROLLUP_VERSION
+        state.rebuilt_at = _now()
+    session.flush()
+    return n
+
+
+def _now():
+    from datetime import datetime, timezone
+    return datetime.now(timezone.utc)
+
+
+def ensure_current(tenant_id: str) -> None:
+    """테넌트 롤업이 현재 버전이 아니면 재집계 후 커밋."""
+    from backend.db.session import get_sessionmaker
+    SessionLocal = get_sessionmaker()
+    with SessionLocal() as session:
+        if _state_current(session, tenant_id):
+            return
+        _lock_tenant(session, tenant_id, exclusive=True)
+        if _state_current(session, tenant_id):   # 다른 워커가 먼저 재집계
+            return
+        n = rebuild_tenant(session, tenant_id)
+        session.commit()
+        log.info("daily rollup 재집계 완료 tenant=%s entries=%d", tenant_id, n)
+
+
+# ── 읽기 경로 ─────────────────────────────────────────────────────────────────
+
+def _row_to_dict(row) -> dict:
+    d = {k: int(getattr(row, k) or 0) for k in SCALARS}
+    d["period"] = row.period
+    bd = row.breakdown or {}
+    for section in SECTIONS:
+        d[section] = {k: tuple(v) for k, v in (bd.get(section) or {}).items()}
+    return d
+
+
+def _read(tenant_id: str, grain: str, periods: Optional[Iterable[str]]) -> dict:
+    from backend.db.models.daily import DailyRollup
+    from backend.db.session import get_sessionmaker
+    ensure_current(tenant_id)
+    q = select(DailyRollup).where(DailyRollup.tenant_id == tenant_id, DailyRollup.grain == grain,
+                                  DailyRollup.entry_count > 0)
+    if periods is not None:
+        periods = sorted(set(periods))
+        if not periods:
+            return {}
+        q = q.where(DailyRollup.period.in_(periods))
+    SessionLocal = get_sessionmaker()
+    with SessionLocal() as session:
+        rows = session.scalars(q.order_by(DailyRollup.period)).all()
+    return {r.period: _row_to_dict(r) for r in rows}
+
+
+def month_rollups(tenant_id: str, months: Optional[Iterable[str]] = None) -> dict:
+    """{'YYYY-MM': 롤업 dict}. months=None 이면 테넌트의 모든 월(건수 0 인 월 제외)."""
+    return _read(tenant_id, "month", months)
+
+
+def day_rollup(tenant_id: str, day: str) -> Optional[dict]:
+    """'YYYY-MM-DD' 하루 롤업 dict(없으면 None)."""
+    return _read(tenant_id, "day", [day]).get(day)
@@ -0,0 +1,251 @@
+"""정적 JSON 데이터(addr_index / 실무지침 DB)의 컴팩트 스냅샷 — 워커 기동 시간·메모리 절감.
+
+워커마다 import 시점에 큰 JSON 을 ``json.load`` 하면(addr_index 3MB ≈ 210ms / 17MB,
+실무지침 1.3MB ≈ 90ms) 워커 수만큼 파싱 시간과 힙이 반복된다. 여기서는 빌드 단계
+(``scripts/build_data_snapshots.py``, Dockerfile 에서 실행)에서 스냅샷을 미리 만들어 두고
+런타임에는
+
+* **문자열 멀티맵 스냅샷** (``.snap``, addr_index 용): ``key -> [str, ...]`` 사전들을
+  정렬된 키 표 + uint32 오프셋 배열 + UTF-8 blob 으로 직렬화한다. ``mmap`` 으로 열어
+  키 표만 읽고, 값 목록은 조회 시점에 해당 구간만 디코드한다(최근 키 몇 개만 캐시).
+  페이지는 OS 페이지 캐시라 워커 간 공유된다. :class:`StringMultimap` 은 ``get`` / ``in`` /
+  ``[]`` / 키 순회 / ``len`` 을 지원해 기존 dict 사용처를 바꾸지 않아도 된다.
+* **객체 스냅샷** (``.pkl.snap``, 실무지침 DB 용): 파싱된 JSON 객체의 pickle. 런타임에
+  수정(관리자 PATCH)되는 데이터라 mmap 읽기 전용 표현 대신 빠른 역직렬화만 취한다.
+
+두 형식 모두 헤더에 **원본 JSON 의 sha256** 을 기록하고, 로드 시 원본 해시와 다르면
+(원본이 갱신됨/빌드 누락) 스냅샷을 버리고 원본 JSON 으로 폴백한다 — 스냅샷은 항상
+캐시일 뿐 진실 원천은 JSON 이다. ``refresh=True`` 면 폴백 후 스냅샷을 원자적으로 다시 쓴다
+(쓰기 실패는 무시).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import pickle
+import struct
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+_MULTIMAP_MAGIC = b"HWSMAP1\n"
+_OBJECT_MAGIC = b"HWSOBJ1\n"
+# magic(8) | 원본 sha256(32) | 바이트순서(1: little) | 예약(3) | 섹션 수(uint32)
+_HEADER = struct.Struct("<8s32sB3xI")
+# 섹션: 이름 길이 | 키 수 | 값 수 | 키 blob 길이 | 값 blob 길이
+_SECTION = struct.Struct("<IIIII")
+_U32 = 4
+_LITTLE = 1 if sys.byteorder == "little" else 0
+
+DEFAULT_DECODE_CACHE = 32
+
+
+def source_digest(path: os.PathLike | str) -> bytes:
+    """원본 파일 sha256(raw 32바이트)."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+def _atomic_write(dst: Path, payload: bytes) -> None:
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, dst)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def _u32_array(values) -> bytes:
+    import array
+    arr = array.array("I", values)
+    if arr.itemsize != _U32:  # pragma: no cover - 비표준 플랫폼
+        raise RuntimeError("uint32 array 미지원 플랫폼")
+    return arr.tobytes()
+
+
+# ── 문자열 멀티맵(.snap) ──────────────────────────────────────────────────────
+
+def encode_multimaps(digest: bytes, sections: Mapping[str, Mapping[str, list]]) -> bytes:
+    """``{섹션명: {key: [str, ...]}}`` → 스냅샷 바이트. 키는 정렬, 값 순서는 보존."""
+    parts = [_HEADER.pack(_MULTIMAP_MAGIC, digest, _LITTLE, len(sections))]
+    for name, mapping in sections.items():
+        keys = sorted(mapping)
+        key_blob = bytearray()
+        key_offs = [0]
+        val_blob = bytearray()
+        val_offs = [0]
+        val_range = [0]
+        for k in keys:
+            key_blob += k.encode("utf-8")
+            key_offs.append(len(key_blob))
+            for v in mapping[k]:
+                val_blob += str(v).encode("utf-8")
+                val_offs.append(len(val_blob))
+            val_range.append(len(val_offs) - 1)
+        name_b = name.encode("utf-8")
+        parts += [
+            _SECTION.pack(len(name_b), len(keys), len(val_offs) - 1, len(key_blob), len(val_blob)),
+            name_b,
+            _u32_array(key_offs), _u32_array(val_range), _u32_array(val_offs),
+            bytes(key_blob), bytes(val_blob),
+        ]
+    return b"".join(parts)
+
+
+class StringMultimap(Mapping):
+    """mmap 위의 읽기 전용 ``key -> list[str]`` 뷰. 값 목록은 조회 시 디코드(소형 LRU)."""
+
+    def __init__(self, buf: memoryview, offset: int, *, cache_size: int = DEFAULT_DECODE_CACHE):
+        n_name, n_keys, n_vals, key_len, val_len = _SECTION.unpack_from(buf, offset)
+        pos = offset + _SECTION.size
+        self.name = bytes(buf[pos:pos + n_name]).decode("utf-8")
+        pos += n_name
+        key_offs = buf[pos:pos + (n_keys + 1) * _U32].cast("I")
+        pos += (n_keys + 1) * _U32
+        self._val_range = buf[pos:pos + (n_keys + 1) * _U32].cast("I")
+        pos += (n_keys + 1) * _U32
+        self._val_offs = buf[pos:pos + (n_vals + 1) * _U32].cast("I")
+        pos += (n_vals + 1) * _U32
+        key_blob = buf[pos:pos + key_len]
+        pos += key_len
+        self._val_blob = buf[pos:pos + val_len]
+        self.end = pos + val_len
+        # 키 표(수백 개)만 즉시 디코드 — 값 blob 은 손대지 않는다.
+        self._keys: dict[str, int] = {
+            bytes(key_blob[key_offs[i]:key_offs[i + 1]]).decode("utf-8"): i
+            for i in range(n_keys)
+        }
+        self._cache: "OrderedDict[int, list[str]]" = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    def _values(self, i: int) -> list[str]:
+        with self._lock:
+            hit = self._cache.get(i)
+            if hit is not None:
+                self._cache.move_to_end(i)
+                return hit
+        offs, blob = self._val_offs, self._val_blob
+        lo, hi = self._val_range[i], self._val_range[i + 1]
+        out = [bytes(blob[offs[j]:offs[j + 1]]).decode("utf-8") for j in range(lo, hi)]
+        with self._lock:
+            self._cache[i] = out
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return out
+
+    def __getitem__(self, key: str) -> list[str]:
+        i = self._keys.get(key)
+        if i is None:
+            raise KeyError(key)
+        return self._values(i)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def open_multimaps(snap_path: os.PathLike | str, digest: bytes) -> Optional[dict[str, StringMultimap]]:
+    """스냅샷을 mmap 으로 연다. 없거나/형식 불일치/원본 해시 불일치면 None."""
+    try:
+        with open(snap_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        buf = memoryview(mm)
+        magic, snap_digest, order, n_sections = _HEADER.unpack_from(buf, 0)
+        if magic != _MULTIMAP_MAGIC or snap_digest != digest or order != _LITTLE:
+            return None
+        out: dict[str, StringMultimap] = {}
+        pos = _HEADER.size
+        for _ in range(n_sections):
+            m = StringMultimap(buf, pos)
+            out[m.name] = m
+            pos = m.end
+        return out
+    except (struct.error, ValueError, TypeError, UnicodeDecodeError):
+        logger.warning("[data_snapshot] 손상된 스냅샷 무시: %s", snap_path)
+        return None
+
+
+def load_json_multimaps(src_path: os.PathLike | str, snap_path: os.PathLike | str,
+                        *, refresh: bool = False) -> Optional[Mapping[str, Mapping]]:
+    """``{섹션: {key: [str]}}`` 모양 JSON 을 스냅샷(유효 시) 또는 원본에서 읽는다.
+
+    원본이 없으면 None. 스냅샷이 무효면 원본 JSON dict 를 돌려주고, ``refresh`` 면
+    스냅샷을 다시 만든다.
+    """
+    src = Path(src_path)
+    if not src.exists():
+        return None
+    digest = source_digest(src)
+    maps = open_multimaps(snap_path, digest)
+    if maps is not None:
+        return maps
+    with open(src, encoding="utf-8") as f:
+        data = json.load(f)
+    if refresh:
+        try:
+            _atomic_write(Path(snap_path), encode_multimaps(digest, data))
+        except OSError as e:
+            logger.info("[data_snapshot] 스냅샷 갱신 생략(%s): %s", snap_path, e)
+    return data
+
+
+# ── 객체 스냅샷(.pkl.snap) ────────────────────────────────────────────────────
+
+def encode_object(digest: bytes, obj: Any) -> bytes:
+    return (_HEADER.pack(_OBJECT_MAGIC, digest, _LITTLE, 0)
+            + pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def load_json_object(src_path: os.PathLike | str, snap_path: os.PathLike | str,
+                     *, refresh: bool = False) -> Any:
+    """JSON 파일을 스냅샷(원본 해시 일치 시) 또는 ``json.load`` 로 읽는다.
+
+    반환 객체는 호출자 소유(수정 가능). 원본이 없으면 ``FileNotFoundError``.
+    """
+    src = Path(src_path)
+    with open(src, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).digest()
+    try:
+        with open(snap_path, "rb") as f:
+            head = f.read(_HEADER.size)
+            magic, snap_digest, _order, _n = _HEADER.unpack(head)
+            if magic == _OBJECT_MAGIC and snap_digest == digest:
+                return pickle.load(f)
+    except (OSError, struct.error, pickle.UnpicklingError, EOFError):
+        pass
+    obj = json.loads(raw.decode("utf-8"))
+    if refresh:
+        try:
+            _atomic_write(Path(snap_path), encode_object(digest, obj))
+        except OSError as e:
+            logger.info("[data_snapshot] 스냅샷 갱신 생략(%s): %s", snap_path, e)
+    return obj
+
+
+def snapshot_path(src_path: os.PathLike | str, kind: str = "snap") -> Path:
+    """원본 옆 스냅샷 경로: ``addr_index.json`` → ``addr_index.snap`` / ``*.pkl.snap``."""
+    src = Path(src_path)
+    suffix = ".snap" if kind == "snap" else ".pkl.snap"
+    return src.with_name(src.stem + suffix)
@@ -77,6 +77,20 @@ def normalize_date_only(value):
     return s  # 판독 불가 → 원문 그대로
 
 
+def parse_date_only(value):
+    """날짜형 값을 ``datetime.date`` 로 — 판독 불가/빈값/None 이면 ``None``.
+
+    :func:`normalize_date_only` 와 같은 입력 규칙을 쓴다(DATE 그림자 컬럼 등 비교·인덱스용).
+    """
+    s = normalize_date_only(value)
+    if not s or len(s) != 10 or s[4] != "-" or s[7] != "-":
+        return None
+    try:
+        return _dt.date(int(s[:4]), int(s[5:7]), int(s[8:10]))
+    except ValueError:
+        return None
+
+
 def normalize_date_fields(data: dict, keys) -> dict:
     """``data`` 의 주어진 ``keys`` 만 in-place 로 날짜 정규화하고 ``data`` 반환.
 
@@ -1,9 +1,77 @@
-"""PG repository for calendar events (per-date)."""
+"""PG repository for calendar events (per-date).
+
+Every save/delete bumps the tenant's change counter (``event_sync_states``)
+and stamps the date in ``event_date_changes`` in the same transaction, so
+readers can ask for a date range at a known version and later for only the
+dates changed since then (``get_events_range`` / ``get_events_changes``).
+"""
 from __future__ import annotations
 
+from typing import Optional
+
 from sqlalchemy import delete, select
 
 
+def _invalidate(tenant_id: str) -> None:
+    """Drop cached calendar event responses for this tenant on every worker."""
+    from backend.services.cache_service import cache_invalidate_prefix
+    cache_invalidate_prefix(tenant_id, "events:")
+
+
+def _bump_version(session, tenant_id: str, date_str: str) -> int:
+    """Advance the tenant's change counter and record it for ``date_str``.
+
+    The counter row stays locked until commit, so concurrent writers of one
+    tenant commit in version order — a reader that saw version N can never
+    miss a later commit that got a smaller number.
+    """
+    from sqlalchemy.exc import IntegrityError
+
+    from backend.db.models.event import EventDateChange, EventSyncState
+
+    q = select(EventSyncState).where(EventSyncState.tenant_id == tenant_id).with_for_update()
+    state = session.scalar(q)
+    if state is None:
+        try:
+            with session.begin_nested():
+                state = EventSyncState(tenant_id=tenant_id, version=0)
+                session.add(state)
+                session.flush()
+        except IntegrityError:          # concurrent first write — lock the winner's row
+            state = session.scalar(q)
+    state.version = int(state.version or 0) + 1
+
+    change = session.get(EventDateChange, (tenant_id, date_str))
+    if change is None:
+        session.add(EventDateChange(tenant_id=tenant_id, date_str=date_str, version=state.version))
+    else:
+        change.version = state.version
+    return state.version
+
+
+def _read_version(session, tenant_id: str) -> int:
+    from backend.db.models.event import EventSyncState
+    v = session.scalar(select(EventSyncState.version).where(EventSyncState.tenant_id == tenant_id))
+    return int(v or 0)
+
+
+def _range_filter(stmt, col, date_from: Optional[str], date_to: Optional[str]):
+    # date_str is zero-padded YYYY-MM-DD, so string order is date order.
+    if date_from:
+        stmt = stmt.where(col >= date_from)
+    if date_to:
+        stmt = stmt.where(col <= date_to)
+    return stmt
+
+
+def events_version(tenant_id: str) -> int:
+    """Current change counter for the tenant (0 = never written since sync tracking began)."""
+    from backend.db.session import get_sessionmaker
+
+    with get_sessionmaker()() as session:
+        return _read_version(session, tenant_id)
+
+
 def get_events_map(tenant_id: str) -> dict[str, list[str]]:
     """Return {date_str: [event_text, ...]} for this tenant.
 
@@ -25,6 +93,62 @@ def get_events_map(tenant_id: str) -> dict[str, list[str]]:
     return result
 
 
+def _rows_map(session, tenant_id: str, stmt_filter) -> dict[str, list[str]]:
+    from backend.db.models.event import Event
+
+    rows = session.execute(
+        stmt_filter(select(Event.date_str, Event.event_text).where(Event.tenant_id == tenant_id))
+        .order_by(Event.date_str, Event.sort_order, Event.id)
+    ).all()
+    result: dict[str, list[str]] = {}
+    for date_str, text in rows:
+        result.setdefault(date_str, []).append(text)
+    return result
+
+
+def get_events_range(tenant_id: str, date_from: Optional[str] = None,
+                     date_to: Optional[str] = None) -> tuple[dict[str, list[str]], int]:
+    """``({date_str: [event_text, ...]}, version)`` for dates in ``[date_from, date_to]``.
+
+    Reads only the range via ``idx_events_tenant_date``. The version is read
+    *before* the rows: a write committing in between is at worst reported
+    again by the next ``get_events_changes`` call, never lost.
+    """
+    from backend.db.models.event import Event
+    from backend.db.session import get_sessionmaker
+
+    with get_sessionmaker()() as session:
+        version = _read_version(session, tenant_id)
+        result = _rows_map(session, tenant_id,
+                           lambda st: _range_filter(st, Event.date_str, date_from, date_to))
+    return result, version
+
+
+def get_events_changes(tenant_id: str, since: int, date_from: Optional[str] = None,
+                       date_to: Optional[str] = None) -> tuple[dict[str, list[str]], int]:
+    """Dates (within the optional range) written after version ``since``.
+
+    Returns ``({date_str: [event_text, ...]}, version)`` where a date whose
+    events were all deleted maps to ``[]`` — the client drops it.
+    """
+    from backend.db.models.event import Event, EventDateChange
+    from backend.db.session import get_sessionmaker
+
+    with get_sessionmaker()() as session:
+        version = _read_version(session, tenant_id)
+        if version <= since:
+            return {}, version
+        dates = session.scalars(_range_filter(
+            select(EventDateChange.date_str).where(
+                EventDateChange.tenant_id == tenant_id, EventDateChange.version > since),
+            EventDateChange.date_str, date_from, date_to,
+        )).all()
+        result: dict[str, list[str]] = {d: [] for d in dates}
+        if dates:
+            result.update(_rows_map(session, tenant_id, lambda st: st.where(Event.date_str.in_(dates))))
+    return result, version
+
+
 def save_events_for_date(tenant_id: str, date_str: str, lines: list[str]) -> int:
     """Reconcile rows for ``date_str`` against the new ``lines`` using
     row-level INSERT / UPDATE / DELETE — never a wipe-and-reinsert.
@@ -57,12 +181,14 @@ def save_events_for_date(tenant_id: str, date_str: str, lines: list[str]) -> int
         ).all()
 
         n_keep = min(len(existing), len(cleaned))
+        changed = len(existing) != len(cleaned)
         # Update overlap in place.
         for i in range(n_keep):
             row = existing[i]
             if row.event_text != cleaned[i] or row.sort_order != i:
                 row.event_text = cleaned[i]
                 row.sort_order = i
+                changed = True
         # Insert any new tail rows.
         for i in range(n_keep, len(cleaned)):
             session.add(Event(
@@ -73,7 +199,10 @@ def save_events_for_date(tenant_id: str, date_str: str, lines: list[str]) -> int
         for i in range(n_keep, len(existing)):
             session.delete(existing[i])
 
+        if changed:
+            _bump_version(session, tenant_id, date_str)
         session.commit()
+        _invalidate(tenant_id)
     return len(cleaned)
 
 
@@ -87,5 +216,8 @@ def delete_events_for_date(tenant_id: str, date_str: str) -> int:
         result = session.execute(
             delete(Event).where(Event.tenant_id == tenant_id, Event.date_str == date_str)
         )
+        if result.rowcount:
+            _bump_version(session, tenant_id, date_str)
         session.commit()
+        _invalidate(tenant_id)
         return result.rowcount or 0
@@ -1,18 +1,36 @@
-"""[로컬 PoC — A안 보강] OCR/DOC 전역 동시수 제한.
+"""[로컬 PoC — A안 보강] OCR/DOC 전역 동시수 제한 — 공정(FIFO) 대기열 + 즉시 인계.
 
 combined + uvicorn workers>=2 에서는 process-local asyncio.Semaphore 가 프로세스
 경계를 넘지 못해 전역 제한이 되지 않는다(=workers 수만큼 동시 허용). 그래서 여기서는
-PostgreSQL **advisory lock** 으로 프로세스 경계를 넘는 전역 1 제한을 건다.
-
-advisory lock 채택 이유(限limiter table 대비):
+PostgreSQL **advisory lock** 으로 프로세스 경계를 넘는 전역 N 제한을 건다.
+슬롯은 ``slots`` 개(slots=1 은 단일 키 (key), N 은 2-키 (key, slot)).
+
+대기 방식(과거: 0.5s/0.25s 간격 pg_try_advisory_lock polling — 대기자마다 연결·왕복 소모,
+최대 poll 간격만큼 빈 지연, 순서 보장 없음):
+
+1. 프로세스 내 FIFO(:class:`_FifoGate`) — 같은 워커의 대기자는 도착 순서대로 줄 선다.
+   async 대기자는 future, 동기 대기자는 Event 로 기다린다(스레드/연결을 잡지 않음).
+   PG 구성 시 이 줄의 맨 앞 1명만 PG 단계로 간다 → 대기 중 연결은 워커·키당 최대 1개.
+2. PG 단계 — 워커 간 순서는 "게이트" advisory lock (key, ``_GATE``) 을 **blocking**
+   ``pg_advisory_lock`` 으로 잡아 정한다(PG 락 대기열 = 요청 순서, 남은 대기시간을
+   ``lock_timeout`` 으로). 게이트를 잡은 1명만 슬롯을 시도하고, 비어 있지 않으면
+   ``LISTEN`` 채널에서 반납 ``NOTIFY`` 를 기다린다 → 반납 즉시 인계.
+   보유자가 죽어 NOTIFY 없이 락이 풀린 경우를 위해 ``SLOT_RECHECK_SECONDS`` 마다 재확인.
+   슬롯을 얻으면 게이트를 놓아 다음 워커가 이어서 줄 맨 앞이 된다.
+
+advisory lock 채택 이유(limiter table 대비):
 - migration 불필요(스키마 변경 0) — 새 테이블/컬럼 없음.
 - 크래시/연결 종료 시 락이 **자동 해제** — limiter table 의 "프로세스가 죽으면 카운터가
   멈춤" 위험(stale counter / reaper 필요)이 없다.
 
-PG 미구성(DATABASE_URL 없음) 환경에서는 process-local Semaphore(1) 로 graceful
-degrade 한다(전역 보장은 안 되며 경고 로그를 남긴다).
+PG 미구성(DATABASE_URL 없음) 환경에서는 process-local FIFO(N) 로 graceful degrade 한다
+(전역 보장은 안 되며 경고 로그를 남긴다).
+
+대기열 위치(:attr:`SlotLease.position`, 도착 시 앞에 있던 요청 수 — 0 = 바로 획득)와
+대기/점유 시간은 lease 로 돌려주고(응답 헤더 :meth:`SlotLease.headers`), 키별 대기·점유
+시간 분포는 :func:`stats`, 현재 점유/대기 수는 :func:`queue_status` 로 본다.
 
-비블로킹(non_blocking=True)이면 이미 점유 중일 때 즉시 ConcurrencyBusy 를 던진다
+wait_timeout=0 이면 이미 점유 중일 때 즉시 ConcurrencyBusy 를 던진다
 (기존 backend/routers/scan.py 의 sem.locked() -> busy 응답과 동일한 의미).
 """
 from __future__ import annotations
@@ -22,6 +40,7 @@ import logging
 import os
 import threading
 import time
+from collections import deque
 from contextlib import contextmanager
 
 from sqlalchemy import text
@@ -33,6 +52,7 @@ log = logging.getLogger("global_concurrency")
 # advisory lock 키 — 임의 고정 정수(다른 advisory lock 사용처와 충돌 방지용 네임스페이스).
 OCR_LOCK_KEY = 815001
 DOC_LOCK_KEY = 815002
+KEY_NAMES = {OCR_LOCK_KEY: "ocr", DOC_LOCK_KEY: "doc"}
 
 # 대기 정책(초). 스캔/문서생성이 겹치면 즉시 거절하지 않고 이 시간만큼 순서를 기다린다.
 # 동시 스캔은 드물고 대부분 한 명이 한 번씩 처리하므로, '기다렸다 이어서 처리'가 자연스럽다.
@@ -42,109 +62,413 @@ DOC_LOCK_KEY = 815002
 OCR_WAIT_SECONDS = float(os.environ.get("OCR_WAIT_SECONDS", "30") or "30")
 DOC_WAIT_SECONDS = float(os.environ.get("DOC_WAIT_SECONDS", "60") or "60")
 
-_LOCAL_SEMS: dict[int, asyncio.Semaphore] = {}
-_LOCAL_SYNC_SEMS: dict[int, threading.Semaphore] = {}
-_local_sync_lock = threading.Lock()
+# 슬롯 수. 둘 다 기본 1(기존 전역 직렬화) — 메모리 여유가 있는 배포만 env 로 올린다.
+# DOC 는 준비(고객 조회·도장·필드값) 단계는 게이트 밖에서 병렬로 돌고 PDF 병합/HWPX 조립
+# 단계만 이 N 슬롯 게이트를 거친다.
+OCR_SLOTS = max(1, int(os.environ.get("OCR_SLOTS", "1") or "1"))
+DOC_SLOTS = max(1, int(os.environ.get("DOC_SLOTS", "1") or "1"))
+
+# NOTIFY 없이 풀린 슬롯(보유 워커 크래시)을 놓치지 않기 위한 재확인 간격(초).
+SLOT_RECHECK_SECONDS = float(os.environ.get("SLOT_RECHECK_SECONDS", "2") or "2")
+
+# 게이트 2-키 두 번째 값 — 슬롯 번호(0..N-1)와 겹치지 않는 int4 최댓값.
+_GATE = 2147483647
+_METRIC_SAMPLES = 512
+
+_GATES: dict[tuple, "_FifoGate"] = {}
+_gates_lock = threading.Lock()
 _warned_local = False
-_warned_local_sync = False
 
 
 class ConcurrencyBusy(Exception):
-    """전역 슬롯이 이미 점유 중이라 즉시 거절(503 busy)."""
+    """wait_timeout 안에 전역 슬롯을 얻지 못해 거절(503 busy)."""
 
 
-def _local_sem(key: int) -> asyncio.Semaphore:
-    sem = _LOCAL_SEMS.get(key)
-    if sem is None:
-        sem = asyncio.Semaphore(1)
-        _LOCAL_SEMS[key] = sem
-    return sem
+class SlotLease:
+    """게이트가 yield 하는 점유 정보 — 대기열 위치·대기(wait_s)·작업(hold_s) 시간 보고용."""
 
+    __slots__ = ("key", "slot", "position", "wait_s", "acquired_at", "released_at")
 
-def _pg_try_lock(key: int):
-    """동기. 성공 시 (conn, True), 점유 중이면 (None, False). 예외는 호출측에서 처리."""
-    engine = _db.get_engine()
-    conn = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
-    try:
+    def __init__(self, key: int):
+        self.key = key
+        self.slot: int | None = None
+        self.position = 0
+        self.wait_s = 0.0
+        self.acquired_at: float | None = None
+        self.released_at: float | None = None
+
+    @property
+    def hold_s(self) -> float:
+        if self.acquired_at is None:
+            return 0.0
+        return (self.released_at or time.monotonic()) - self.acquired_at
+
+    def headers(self) -> dict:
+        """클라이언트 보고용 응답 헤더(대기열 위치, 대기 ms)."""
+        return {"X-Queue-Position": str(self.position),
+                "X-Queue-Wait-Ms": f"{self.wait_s * 1000:.0f}"}
+
+
+# ── 지표 ─────────────────────────────────────────────────────────────────────
+
+class _KeyMetrics:
+    __slots__ = ("acquired", "busy", "holding", "waits", "holds", "max_wait_s", "max_hold_s")
+
+    def __init__(self):
+        self.acquired = self.busy = self.holding = 0
+        self.waits: deque = deque(maxlen=_METRIC_SAMPLES)
+        self.holds: deque = deque(maxlen=_METRIC_SAMPLES)
+        self.max_wait_s = self.max_hold_s = 0.0
+
+
+_METRICS: dict[int, _KeyMetrics] = {}
+_metrics_lock = threading.Lock()
+
+
+def _metric(key: int, event: str, seconds: float = 0.0) -> None:
+    with _metrics_lock:
+        m = _METRICS.setdefault(key, _KeyMetrics())
+        if event == "acquired":
+            m.acquired += 1
+            m.holding += 1
+            m.waits.append(seconds)
+            m.max_wait_s = max(m.max_wait_s, seconds)
+        elif event == "released":
+            m.holding -= 1
+            m.holds.append(seconds)
+            m.max_hold_s = max(m.max_hold_s, seconds)
+        elif event == "busy":
+            m.busy += 1
+
+
+def _dist(samples) -> dict:
+    if not samples:
+        return {"n": 0, "avg_ms": 0, "p50_ms": 0, "p95_ms": 0}
+    s = sorted(samples)
+    pick = lambda q: round(s[min(len(s) - 1, int(q * len(s)))] * 1000)  # noqa: E731
+    return {"n": len(s), "avg_ms": round(sum(s) / len(s) * 1000), "p50_ms": pick(0.5),
+            "p95_ms": pick(0.95)}
+
+
+def stats() -> dict:
+    """키별 지표(프로세스 단위): 획득/거절 수, 현재 점유, 최근 대기·점유 시간 분포."""
+    with _metrics_lock:
+        return {
+            KEY_NAMES.get(k, str(k)): {
+                "acquired": m.acquired, "busy": m.busy, "holding": m.holding,
+                "wait": {**_dist(m.waits), "max_ms": round(m.max_wait_s * 1000)},
+                "hold": {**_dist(m.holds), "max_ms": round(m.max_hold_s * 1000)},
+            }
+            for k, m in _METRICS.items()
+        }
+
+
+# ── 프로세스 내 FIFO ─────────────────────────────────────────────────────────
+
+class _Waiter:
+    __slots__ = ("event", "loop", "fut", "granted")
+
+    def __init__(self, *, loop=None):
+        self.granted = False
+        self.loop = loop
+        self.fut = loop.create_future() if loop is not None else None
+        self.event = threading.Event() if loop is None else None
+
+    def wake(self) -> None:
+        if self.event is not None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(lambda f=self.fut: f.done() or f.set_result(None))
+
+
+class _FifoGate:
+    """용량 N 의 FIFO 세마포어 — 반납 시 줄 맨 앞 대기자에게 바로 넘긴다(스레드/async 공용)."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.free = capacity
+        self._lock = threading.Lock()
+        self._q: deque[_Waiter] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._q)
+
+    def _enter(self, w: _Waiter) -> tuple[bool, int]:
+        """(즉시 통과 여부, 앞선 대기자 수)."""
+        with self._lock:
+            if self.free > 0 and not self._q:
+                self.free -= 1
+                return True, 0
+            self._q.append(w)
+            return False, len(self._q) - 1
+
+    def _cancel(self, w: _Waiter) -> bool:
+        """대기 포기. 이미 넘겨받았으면 False(호출측이 통과 처리 또는 release)."""
+        with self._lock:
+            if w.granted:
+                return False
+            self._q.remove(w)
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            while self._q:
+                w = self._q.popleft()
+                w.granted = True
+                try:
+                    w.wake()
+                    return
+                except RuntimeError:        # 대기자의 이벤트루프가 이미 닫힘 → 다음 사람
+                    continue
+            self.free += 1
+
+    def acquire_sync(self, timeout: float) -> int:
+        w = _Waiter()
+        ok, ahead = self._enter(w)
+        if ok:
+            return 0
+        if not w.event.wait(max(0.0, timeout)) and self._cancel(w):
+            raise ConcurrencyBusy()
+        return ahead + 1
+
+    async def acquire_async(self, timeout: float) -> int:
+        w = _Waiter(loop=asyncio.get_running_loop())
+        ok, ahead = self._enter(w)
+        if ok:
+            return 0
+        try:
+            await asyncio.wait_for(asyncio.shield(w.fut), timeout=max(0.0, timeout))
+        except asyncio.TimeoutError:
+            if self._cancel(w):
+                raise ConcurrencyBusy()
+        except asyncio.CancelledError:
+            if not self._cancel(w):
+                self.release()
+            raise
+        return ahead + 1
+
+
+def _gate(key: int, capacity: int) -> _FifoGate:
+    with _gates_lock:
+        g = _GATES.get((key, capacity))
+        if g is None:
+            g = _GATES[(key, capacity)] = _FifoGate(capacity)
+        return g
+
+
+def _warn_local() -> None:
+    global _warned_local
+    if not _warned_local:
+        log.warning(
+            "PG 미구성 — 전역 동시수 제한이 process-local FIFO 로 degrade됩니다 "
+            "(workers>=2 에서 전역 보장 안 됨)."
+        )
+        _warned_local = True
+
+
+# ── PG 단계 ──────────────────────────────────────────────────────────────────
+
+def _channel(key: int) -> str:
+    return f"kid_slot_{key}"
+
+
+def _pg_try_slot(conn, key: int, slots: int):
+    """슬롯 0..slots-1 중 비어 있는 첫 슬롯을 잡아 번호 반환(없으면 None).
+
+    slots=1 은 기존 단일 키 advisory lock(pg_try_advisory_lock(key)) 그대로,
+    slots>1 은 2-키 형식 (key, slot) — 단일 키 공간과 겹치지 않는다."""
+    if slots <= 1:
         got = conn.execute(text("SELECT pg_try_advisory_lock(:k)"), {"k": key}).scalar()
+        return 0 if got else None
+    for slot in range(slots):
+        got = conn.execute(text("SELECT pg_try_advisory_lock(:k, :s)"), {"k": key, "s": slot}).scalar()
         if got:
-            return conn, True
-        conn.close()
-        return None, False
-    except Exception:
-        conn.close()
+            return slot
+    return None
+
+
+def _pg_unlock_slot(conn, key: int, slots: int, slot: int) -> None:
+    if slots <= 1:
+        conn.execute(text("SELECT pg_advisory_unlock(:k)"), {"k": key})
+    else:
+        conn.execute(text("SELECT pg_advisory_unlock(:k, :s)"), {"k": key, "s": slot})
+
+
+def _pg_gate_queue(conn, key: int) -> int:
+    """게이트에 줄 선 워커 수(게이트 보유 1 + blocking 대기)."""
+    return int(conn.execute(text(
+        "SELECT count(*) FROM pg_locks WHERE locktype = 'advisory' AND objsubid = 2 "
+        "AND classid::bigint = :k AND objid::bigint = :g"), {"k": key, "g": _GATE}).scalar() or 0)
+
+
+def _wait_notify(conn, timeout: float) -> None:
+    """LISTEN 중인 연결에서 NOTIFY 1건(또는 timeout)까지 대기.
+
+    ``notifies(timeout=, stop_after=)`` 는 psycopg 3.2+ (requirements.txt 하한)."""
+    raw = conn.connection.driver_connection
+    for _n in raw.notifies(timeout=max(0.01, timeout), stop_after=1):
+        pass
+
+
+def _is_lock_timeout(e: Exception) -> bool:
+    return getattr(getattr(e, "orig", None), "sqlstate", None) == "55P03"
+
+
+def _pg_acquire(key: int, slots: int, deadline: float) -> tuple:
+    """동기. 게이트(FIFO) → 슬롯. 반환 (conn, slot, 앞선 워커 수). 시간 초과 시 ConcurrencyBusy.
+
+    반환된 conn 은 슬롯을 쥔 채 열려 있다 — :func:`_pg_release` 로 반납한다."""
+    conn = _db.get_engine().connect().execution_options(isolation_level="AUTOCOMMIT")
+    gate = listening = False
+    ahead = 0
+    try:
+        gate = bool(conn.execute(text("SELECT pg_try_advisory_lock(:k, :g)"),
+                                 {"k": key, "g": _GATE}).scalar())
+        if not gate:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ConcurrencyBusy()
+            ahead = _pg_gate_queue(conn, key)
+            conn.execute(text("SELECT set_config('lock_timeout', :t, false)"),
+                         {"t": f"{max(1, int(remaining * 1000))}ms"})
+            try:
+                conn.execute(text("SELECT pg_advisory_lock(:k, :g)"), {"k": key, "g": _GATE})
+            except Exception as e:
+                if _is_lock_timeout(e):
+                    raise ConcurrencyBusy() from None
+                raise
+            finally:
+                conn.execute(text("RESET lock_timeout"))
+            gate = True
+        while True:
+            slot = _pg_try_slot(conn, key, slots)
+            if slot is not None:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ConcurrencyBusy()
+            if not listening:
+                conn.execute(text(f'LISTEN "{_channel(key)}"'))
+                listening = True
+                continue        # LISTEN 직전에 반납됐을 수 있다 → 바로 재시도
+            _wait_notify(conn, min(remaining, SLOT_RECHECK_SECONDS))
+        _pg_leave_gate(conn, key, listening)
+        return conn, slot, ahead
+    except BaseException:
+        try:
+            if gate:
+                _pg_leave_gate(conn, key, listening)
+        finally:
+            conn.close()
         raise
 
 
-def _pg_unlock(conn, key: int) -> None:
-    """동기. unlock 후 연결 반환. 어떤 경우에도 connection 을 닫는다."""
+def _pg_leave_gate(conn, key: int, listening: bool) -> None:
+    if listening:
+        conn.execute(text(f'UNLISTEN "{_channel(key)}"'))
+    conn.execute(text("SELECT pg_advisory_unlock(:k, :g)"), {"k": key, "g": _GATE})
+
+
+def _pg_release(conn, key: int, slots: int, slot: int) -> None:
+    """동기. 슬롯 반납 + 게이트 대기자에게 NOTIFY. 어떤 경우에도 connection 을 닫는다."""
     try:
-        conn.execute(text("SELECT pg_advisory_unlock(:k)"), {"k": key})
+        _pg_unlock_slot(conn, key, slots, slot)
+        conn.execute(text("SELECT pg_notify(:ch, '')"), {"ch": _channel(key)})
     finally:
         conn.close()
 
 
+def queue_status(key: int, slots: int = 1) -> dict:
+    """현재 점유/대기 수. PG 구성 시 전역(pg_locks), 아니면 이 프로세스 기준."""
+    if _db.is_configured():
+        if slots <= 1:
+            hold_sql = "classid::bigint = 0 AND objid::bigint = :k AND objsubid = 1"
+        else:
+            hold_sql = "classid::bigint = :k AND objid::bigint < :n AND objsubid = 2"
+        with _db.get_engine().connect() as conn:
+            holding = conn.execute(text(
+                "SELECT count(*) FROM pg_locks WHERE locktype = 'advisory' AND granted AND "
+                + hold_sql), {"k": key, "n": slots}).scalar() or 0
+            queued = _pg_gate_queue(conn, key)
+        local_waiting = _gate(key, 1).waiting
+        return {"slots": slots, "holding": int(holding), "waiting": queued + local_waiting,
+                "scope": "global"}
+    g = _gate(key, slots)
+    return {"slots": slots, "holding": g.capacity - g.free, "waiting": g.waiting, "scope": "local"}
+
+
+# ── 공개 게이트 ──────────────────────────────────────────────────────────────
+
 class global_limit:
-    """async context manager — 전역 동시수 1 게이트(대기 가능).
+    """async context manager — 전역 동시수 N 게이트(FIFO 대기). ``as`` 값은 :class:`SlotLease`.
 
     사용:
-        async with global_limit(OCR_LOCK_KEY, wait_timeout=OCR_WAIT_SECONDS):
+        async with global_limit(OCR_LOCK_KEY, wait_timeout=OCR_WAIT_SECONDS) as lease:
             result = await asyncio.to_thread(...)
 
     동작:
-    - 슬롯이 비어 있으면 즉시 획득.
-    - 점유 중이면 wait_timeout 초까지 0.5초 간격으로 풀리길 기다렸다가 획득(이벤트루프 비블로킹).
+    - 슬롯이 비어 있고 줄이 없으면 즉시 획득.
+    - 점유 중이면 도착 순서대로 줄 서서 wait_timeout 초까지 기다린다(이벤트루프 비블로킹,
+      대기 중 스레드/연결을 잡지 않음 — PG 단계는 워커당 맨 앞 1명만 스레드에서 blocking).
     - wait_timeout 까지도 못 잡으면 ConcurrencyBusy(호출측이 친절한 안내 반환).
     - wait_timeout=0 이면 즉시 거절(기존 동작).
-
-    PG 구성 시 advisory lock(프로세스 경계 넘는 전역 1), 미구성 시 process-local Semaphore.
     """
 
-    def __init__(self, key: int, *, wait_timeout: float = 0.0, poll: float = 0.5):
+    def __init__(self, key: int, *, wait_timeout: float = 0.0, slots: int = 1):
         self.key = key
         self.wait_timeout = max(0.0, float(wait_timeout))
-        self.poll = poll
+        self.slots = max(1, int(slots))
+        self.lease = SlotLease(key)
         self._conn = None
-        self._local: asyncio.Semaphore | None = None
-
-    async def __aenter__(self):
-        if _db.is_configured():
-            waited = 0.0
-            while True:
-                conn, got = await asyncio.to_thread(_pg_try_lock, self.key)
-                if got:
-                    self._conn = conn
-                    return self
-                if waited >= self.wait_timeout:
-                    raise ConcurrencyBusy()
-                await asyncio.sleep(self.poll)
-                waited += self.poll
-
-        # ── PG 미구성: process-local fallback (전역 보장 X) ──
-        global _warned_local
-        if not _warned_local:
-            log.warning(
-                "PG 미구성 — 전역 동시수 제한이 process-local Semaphore 로 degrade됩니다 "
-                "(workers>=2 에서 전역 1 보장 안 됨)."
-            )
-            _warned_local = True
-        sem = _local_sem(self.key)
-        if self.wait_timeout <= 0:
-            if sem.locked():
-                raise ConcurrencyBusy()
-            await sem.acquire()
-        else:
-            try:
-                await asyncio.wait_for(sem.acquire(), timeout=self.wait_timeout)
-            except asyncio.TimeoutError:
-                raise ConcurrencyBusy()
-        self._local = sem
-        return self
+        self._local: _FifoGate | None = None
+
+    async def __aenter__(self) -> SlotLease:
+        lease, t0 = self.lease, time.monotonic()
+        deadline = t0 + self.wait_timeout
+        pg = _db.is_configured()
+        if not pg:
+            _warn_local()
+        gate = _gate(self.key, 1 if pg else self.slots)
+        try:
+            lease.position = await gate.acquire_async(self.wait_timeout)
+            if pg:
+                try:
+                    loop = asyncio.get_running_loop()
+                    fut = loop.run_in_executor(None, _pg_acquire, self.key, self.slots, deadline)
+                    try:
+                        self._conn, lease.slot, ahead = await asyncio.shield(fut)
+                    except asyncio.CancelledError:
+                        fut.add_done_callback(self._release_orphan)
+                        raise
+                    lease.position += ahead
+                finally:
+                    gate.release()
+            else:
+                self._local, lease.slot = gate, 0
+        except ConcurrencyBusy:
+            _metric(self.key, "busy")
+            raise
+        lease.acquired_at = time.monotonic()
+        lease.wait_s = lease.acquired_at - t0
+        _metric(self.key, "acquired", lease.wait_s)
+        return lease
+
+    def _release_orphan(self, fut) -> None:
+        """요청이 취소된 뒤 PG 단계가 슬롯을 얻었으면 바로 반납한다."""
+        if fut.cancelled() or fut.exception() is not None:
+            return
+        conn, slot, _ahead = fut.result()
+        threading.Thread(target=_pg_release, args=(conn, self.key, self.slots, slot),
+                         daemon=True).start()
 
     async def __aexit__(self, *exc):
+        self.lease.released_at = time.monotonic()
+        _metric(self.key, "released", self.lease.hold_s)
         if self._conn is not None:
             try:
-                await asyncio.to_thread(_pg_unlock, self._conn, self.key)
+                await asyncio.to_thread(_pg_release, self._conn, self.key, self.slots,
+                                        self.lease.slot)
             finally:
                 self._conn = None
         if self._local is not None:
@@ -153,64 +477,46 @@ class global_limit:
         return False
 
 
-def _local_sync_sem(key: int) -> threading.Semaphore:
-    with _local_sync_lock:
-        sem = _LOCAL_SYNC_SEMS.get(key)
-        if sem is None:
-            sem = threading.Semaphore(1)
-            _LOCAL_SYNC_SEMS[key] = sem
-        return sem
-
-
 @contextmanager
-def global_limit_sync(key: int, *, wait_timeout: float = DOC_WAIT_SECONDS, poll: float = 0.25):
-    """동기 핸들러용 전역 동시수 1 게이트(DOC 문서생성 등).
+def global_limit_sync(key: int, *, wait_timeout: float = DOC_WAIT_SECONDS, slots: int = 1):
+    """동기 핸들러용 전역 동시수 N 게이트(DOC 문서생성 등). yield 값은 :class:`SlotLease`.
 
     FastAPI 의 동기(`def`) 핸들러는 anyio 외부 스레드풀에서 실행되므로 여기서 blocking
     대기를 해도 이벤트루프를 막지 않는다. DOC 는 사용자가 의도한 산출물 생성이므로
-    '거절'보다 '직렬화(짧게 대기)'가 자연스럽다 → pg_try_advisory_lock 을 poll 하며
-    최대 wait_timeout 초 대기 후에도 못 잡으면 ConcurrencyBusy(503).
-
-    PG 미구성 시 process-local threading.Semaphore(1) blocking 대기(전역 보장 X).
+    '거절'보다 '직렬화(짧게 대기)'가 자연스럽다 → FIFO 로 최대 wait_timeout 초 대기 후에도
+    못 잡으면 ConcurrencyBusy(503).
     """
-    if _db.is_configured():
-        engine = _db.get_engine()
-        conn = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
-        acquired = False
-        try:
-            waited = 0.0
-            while True:
-                got = conn.execute(text("SELECT pg_try_advisory_lock(:k)"), {"k": key}).scalar()
-                if got:
-                    acquired = True
-                    break
-                if waited >= wait_timeout:
-                    raise ConcurrencyBusy()
-                time.sleep(poll)
-                waited += poll
-            yield
-        finally:
-            if acquired:
-                try:
-                    conn.execute(text("SELECT pg_advisory_unlock(:k)"), {"k": key})
-                finally:
-                    conn.close()
-            else:
-                conn.close()
-        return
-
-    # ── PG 미구성: process-local fallback (전역 보장 X) ──
-    global _warned_local_sync
-    if not _warned_local_sync:
-        log.warning(
-            "PG 미구성 — DOC 전역 동시수 제한이 process-local Semaphore 로 degrade됩니다 "
-            "(workers>=2 에서 전역 1 보장 안 됨)."
-        )
-        _warned_local_sync = True
-    sem = _local_sync_sem(key)
-    if not sem.acquire(timeout=wait_timeout):
-        raise ConcurrencyBusy()
+    slots = max(1, int(slots))
+    lease = SlotLease(key)
+    t0 = time.monotonic()
+    deadline = t0 + wait_timeout
+    pg = _db.is_configured()
+    if not pg:
+        _warn_local()
+    gate = _gate(key, 1 if pg else slots)
+    conn = None
+    try:
+        lease.position = gate.acquire_sync(wait_timeout)
+        if pg:
+            try:
+                conn, lease.slot, ahead = _pg_acquire(key, slots, deadline)
+                lease.position += ahead
+            finally:
+                gate.release()
+        else:
+            lease.slot = 0
+    except ConcurrencyBusy:
+        _metric(key, "busy")
+        raise
+    lease.acquired_at = time.monotonic()
+    lease.wait_s = lease.acquired_at - t0
+    _metric(key, "acquired", lease.wait_s)
     try:
-        yield
+        yield lease
     finally:
-        sem.release()
+        lease.released_at = time.monotonic()
+        _metric(key, "released", lease.hold_s)
+        if conn is not None:
+            _pg_release(conn, key, slots, lease.slot)
+        else:
+            gate.release()
@@ -0,0 +1,189 @@
+"""실무지침(immigration_guidelines_db_v2) 검색 인덱스 — 시작 시 1회 구축하는 n-gram 역색인.
+
+``routers/guidelines.py`` 의 ``/search/query`` 는 과거 요청마다 search_keys 전체를 돌고,
+MASTER_ROWS 전체에 다섯 필드 ``str(...).lower()`` 부분일치를 반복했다. 여기서는
+
+1. 행마다 검색 필드(detailed_code / business_name / overview_short / form_docs /
+   supporting_docs / search_keys 값)를 **미리 소문자화**해 구분자(``\\x00``)로 이어 둔다.
+2. 그 문자열의 문자 bigram → 행 위치 역색인(1글자 질의는 unigram 역색인)을 만든다.
+3. 질의 = 질의 bigram posting 교집합(후보) → 후보만 원문 부분일치로 확정(오탐 없음).
+   따라서 결과 집합은 과거 선형 검색과 **동일**하다.
+4. 관련도 점수로 정렬(코드 정확 > 코드 접두 > 업무명/검색키 > 개요 > 서류, 동점은 코드순).
+5. (q, action_type, domain) 별 정렬 결과(row_id 목록)를 LRU 로 보관 → 2페이지 이후는 재검색 없음.
+
+필드 값이 바뀌면(관리자 PATCH) :meth:`GuidelineSearchIndex.refresh_row` 로 해당 행 posting 만
+갱신하고 결과 캐시를 비운다.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+# (필드, 관련도 가중치). search_keys 는 리스트라 별도 처리.
+SEARCH_FIELDS = (
+    ("detailed_code", 0),      # 코드는 아래 _score 에서 정확/접두 가산을 따로 준다
+    ("business_name", 30),
+    ("overview_short", 10),
+    ("form_docs", 5),
+    ("supporting_docs", 5),
+)
+SEARCH_KEYS_WEIGHT = 30
+CODE_EXACT_WEIGHT = 100
+CODE_PREFIX_WEIGHT = 60
+CODE_CONTAINS_WEIGHT = 40
+
+_SEP = "\x00"
+DEFAULT_CACHE_SIZE = 256
+
+
+def _search_key_values(row: dict) -> list[str]:
+    keys = row.get("search_keys") or []
+    if not isinstance(keys, list):
+        return []
+    out = []
+    for sk in keys:
+        if isinstance(sk, dict):
+            kv = str(sk.get("key_value", "")).lower()
+            if kv:
+                out.append(kv)
+    return out
+
+
+def _bigrams(s: str) -> set[str]:
+    return {s[i:i + 2] for i in range(len(s) - 1)}
+
+
+class _RowDoc:
+    """한 행의 소문자화된 검색 필드(필드별 + 구분자로 이은 전체 문자열)."""
+
+    __slots__ = ("row_id", "fields", "keys", "blob")
+
+    def __init__(self, row: dict):
+        self.row_id = row.get("row_id")
+        self.fields = {f: str(row.get(f, "") or "").lower() for f, _w in SEARCH_FIELDS}
+        self.keys = _search_key_values(row)
+        self.blob = _SEP.join([*self.fields.values(), *self.keys])
+
+
+class GuidelineSearchIndex:
+    """MASTER_ROWS 검색 역색인 + (q, action_type, domain) 결과 캐시. 스레드 안전."""
+
+    def __init__(self, rows: Iterable[dict], *, cache_size: int = DEFAULT_CACHE_SIZE):
+        self._lock = threading.RLock()
+        self._cache: "OrderedDict[tuple, list[str]]" = OrderedDict()
+        self._cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self.rebuild(rows)
+
+    # ── 구축/갱신 ───────────────────────────────────────────────────────────
+    def rebuild(self, rows: Iterable[dict]) -> None:
+        with self._lock:
+            self._rows: list[dict] = list(rows)
+            self._docs: list[_RowDoc] = [_RowDoc(r) for r in self._rows]
+            self._pos: dict = {d.row_id: i for i, d in enumerate(self._docs)}
+            self._grams: dict[str, set[int]] = {}
+            self._chars: dict[str, set[int]] = {}
+            for i, doc in enumerate(self._docs):
+                self._add_postings(i, doc)
+            self._cache.clear()
+
+    def _add_postings(self, i: int, doc: _RowDoc) -> None:
+        for g in _bigrams(doc.blob):
+            self._grams.setdefault(g, set()).add(i)
+        for c in set(doc.blob):
+            self._chars.setdefault(c, set()).add(i)
+
+    def _remove_postings(self, i: int, doc: _RowDoc) -> None:
+        for g in _bigrams(doc.blob):
+            self._grams.get(g, set()).discard(i)
+        for c in set(doc.blob):
+            self._chars.get(c, set()).discard(i)
+
+    def refresh_row(self, row: dict) -> None:
+        """행 필드가 바뀐 뒤 호출 — 해당 행 posting 만 다시 만들고 결과 캐시를 비운다."""
+        with self._lock:
+            i = self._pos.get(row.get("row_id"))
+            if i is None:
+                return
+            self._remove_postings(i, self._docs[i])
+            self._docs[i] = _RowDoc(row)
+            self._add_postings(i, self._docs[i])
+            self._cache.clear()
+
+    # ── 질의 ────────────────────────────────────────────────────────────────
+    def _candidates(self, q: str) -> set[int]:
+        if len(q) == 1:
+            return set(self._chars.get(q, ()))
+        postings = []
+        for g in _bigrams(q):
+            p = self._grams.get(g)
+            if not p:
+                return set()
+            postings.append(p)
+        postings.sort(key=len)
+        out = set(postings[0])
+        for p in postings[1:]:
+            out &= p
+            if not out:
+                break
+        return out
+
+    @staticmethod
+    def _score(doc: _RowDoc, q: str) -> int:
+        """관련도 점수. 0 이면 불일치(어느 필드에도 부분일치 없음)."""
+        score = 0
+        code = doc.fields["detailed_code"]
+        if code == q:
+            score += CODE_EXACT_WEIGHT
+        elif code.startswith(q):
+            score += CODE_PREFIX_WEIGHT
+        elif q in code:
+            score += CODE_CONTAINS_WEIGHT
+        for f, w in SEARCH_FIELDS[1:]:
+            if q in doc.fields[f]:
+                score += w
+        if any(q in kv for kv in doc.keys):
+            score += SEARCH_KEYS_WEIGHT
+        return score
+
+    def search_ids(self, q: str, action_type: Optional[str] = None,
+                   domain: Optional[str] = None) -> list[str]:
+        """관련도 내림차순(동점은 detailed_code 오름차순) row_id 목록. 결과는 캐시된다."""
+        ql = q.lower().strip()
+        key = (ql, action_type or None, domain or None)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+            scored = []
+            if ql:
+                for i in self._candidates(ql):
+                    row = self._rows[i]
+                    if action_type and row.get("action_type") != action_type:
+                        continue
+                    if domain and row.get("domain") != domain:
+                        continue
+                    s = self._score(self._docs[i], ql)
+                    if s:
+                        scored.append((-s, str(row.get("detailed_code", "") or ""), i))
+            scored.sort()
+            ids = [self._rows[i]["row_id"] for _s, _c, i in scored]
+            self._cache[key] = ids
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+            return ids
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "rows": len(self._rows),
+                "bigrams": len(self._grams),
+                "cached_queries": len(self._cache),
+                "cache_hits": self.hits,
+                "cache_misses": self.misses,
+            }
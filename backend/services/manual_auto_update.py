@@ -808,7 +808,7 @@ def _existing_artifact_rowids(svc, version: str) -> set:
     return rowids
 
 
-# ── adaptive PDF batching (512MB-safe 순차 처리) ──────────────────────────────
+# ── adaptive PDF batching (512MB-safe, 워커별 순차) ─────────────────────────────
 # Render Cron Starter(512MB)에서 21개 후보를 한 번에 렌더하면 chromium/node 가 OOM(rc=137,
 # SIGKILL) 난다. 컨테이너 메모리를 읽어 안전한 batch size 를 산정하고, batch 하나씩
 # generate_pdf.mjs 를 따로 실행(프로세스 종료 → 메모리 회수)한다. node/OOM 실패 시 batch 를
@@ -825,7 +825,8 @@ _OOM_RC = ("rc=137", "rc=-9")
 
 
 def _detect_memory_limit_mb() -> int:
-    """컨테이너 메모리 상한(MB). cgroup v2→v1 순으로 읽고, 없거나 비정상이면 512 로 간주.
+    """컨테이너 메모리 상한(MB). cgroup v2→v1 순으로 읽고, 상한이 없으면("max"/파일 없음)
+    물리 메모리(SC_PHYS_PAGES × SC_PAGE_SIZE), 그것도 못 읽으면 512 로 간주.
     테스트/오버라이드용 env ``MANUAL_PDF_MEMORY_LIMIT_MB`` 가 우선한다."""
     env = os.environ.get("MANUAL_PDF_MEMORY_LIMIT_MB")
     if env:
@@ -853,6 +854,13 @@ def _detect_memory_limit_mb() -> int:
         if mb <= 0 or mb > 1024 * 1024:  # 0 또는 >1TB 는 비정상
             continue
         return mb
+    # cgroup 상한 없음(호스트/무제한 컨테이너) → 물리 메모리. 512 로 두면 큰 호스트도 워커 1개.
+    try:
+        mb = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        mb = 0
+    if mb > 0:
+        return mb
     return _DEFAULT_MEMORY_LIMIT_MB
 
 
@@ -936,46 +944,75 @@ def _is_oom_failure(exc: Exception, log_path) -> bool:
     return False
 
 
+def _canonical_page_bytes(path) -> bytes:
+    """렌더된 1쪽 PDF 를 메타데이터/문서ID 없이 다시 직렬화 — 같은 페이지면 같은 bytes(=같은 hash)."""
+    import fitz
+    with fitz.open(path) as d:
+        d.set_metadata({})
+        return d.tobytes(garbage=3, deflate=True, no_new_id=True)
+
+
 def _render_batch(*, label: str, manual: str, hwp, batch: list[dict], neighbor: int,
-                  version: str, svc, tmpdir, out: dict, max_old_space_mb: int) -> None:
+                  version: str, svc, tmpdir, out: dict, max_old_space_mb: int,
+                  tag: str = "", usage: dict | None = None) -> None:
     """batch 후보들의 합집합 페이지를 generate_pdf.mjs 1회 실행으로 렌더한 뒤 후보별 번들 저장.
 
+    렌더된 페이지는 조각 저장소(manual_pdf_blobs)에 내용 hash 로 1회만 저장하고, 후보 번들은
+    그 hash 목록(page_manifest)으로만 기록한다 — 후보끼리 겹치는 페이지·이전 버전과 같은
+    페이지는 다시 저장하지 않는다. PDF 는 조회 시 조립(pdf_artifact_cache).
+
     node(run_node) 실패는 예외로 전파한다(호출부가 OOM 판정 → batch 축소/재시도). 번들
-    단계 실패는 후보 단위라 예외를 던지지 않고 out['failed'] 에만 기록한다."""
-    import fitz
+    단계 실패는 후보 단위라 예외를 던지지 않고 out['failed'] 에만 기록한다.
+    ``tag`` 는 동시 실행 batch 끼리 페이지 폴더/로그가 겹치지 않게 하는 접미사,
+    ``usage`` 는 run_node 의 wall_ms/peak_rss_mb 를 받는다."""
+    import shutil
     from backend.scripts.manual_update_local import NODE_TOOLS, run_node
     needed = sorted({p for c in batch for p in _candidate_pages(c, neighbor)})
-    pages_dir = tmpdir / f"pages_{label}"
-    genpdf_log = tmpdir / f"genpdf_{label}.log"
+    pages_dir = tmpdir / f"pages_{label}{tag}"
+    genpdf_log = tmpdir / f"genpdf_{label}{tag}.log"
     run_node([str(NODE_TOOLS / "generate_pdf.mjs"), "--src", str(hwp),
               "--label", label, "--pages", ",".join(map(str, needed)),
               "--flat", "--out-dir", str(pages_dir)],
-             genpdf_log, max_old_space_mb=max_old_space_mb)
+             genpdf_log, max_old_space_mb=max_old_space_mb, usage=usage)
+    try:
+        _bundle_batch(label=label, manual=manual, batch=batch, neighbor=neighbor,
+                      version=version, svc=svc, pages_dir=pages_dir, out=out)
+    finally:
+        shutil.rmtree(pages_dir, ignore_errors=True)   # 조각 저장 후 페이지 파일은 불필요
+
+
+def _bundle_batch(*, label: str, manual: str, batch: list[dict], neighbor: int,
+                  version: str, svc, pages_dir, out: dict) -> None:
+    """렌더된 페이지 파일 → 조각 저장소 + 후보별 번들 manifest 저장(_render_batch 의 2단계)."""
+    page_hash: dict[int, str | None] = {}
+
+    def _page(p: int) -> str | None:
+        if p not in page_hash:
+            pf = pages_dir / label / f"p{p:04d}.pdf"
+            if not pf.is_file():
+                pf = pages_dir / f"p{p:04d}.pdf"
+            page_hash[p] = (svc.put_pdf_blob(_canonical_page_bytes(pf), page_count=1)
+                            if pf.is_file() else None)
+        return page_hash[p]
+
     for c in batch:
         pages = _candidate_pages(c, neighbor)
         try:
-            bundle = fitz.open()
-            used = []
+            used, manifest = [], []
             for p in pages:
-                pf = pages_dir / label / f"p{p:04d}.pdf"
-                if not pf.is_file():
-                    pf = pages_dir / f"p{p:04d}.pdf"
-                if pf.is_file():
-                    with fitz.open(pf) as srcpdf:
-                        bundle.insert_pdf(srcpdf)
+                h = _page(p)
+                if h:
                     used.append(p)
+                    manifest.append({"hash": h})
             if not used:
-                bundle.close()
                 out["failed"] += 1
                 out["failed_row_ids"].append(c.get("row_id"))
                 out["errors"].append(f"{c.get('row_id')}: no page PDFs")
                 continue
-            blob = bundle.tobytes()
-            bundle.close()
             rec = svc.save_pdf_artifact(
                 manual=manual, artifact_type="changed_page_bundle", version=version,
                 source="staging", page_from=min(used), page_to=max(used),
-                page_numbers=used, pdf_blob=blob, page_count=len(used),
+                page_numbers=used, page_manifest=manifest, page_count=len(used),
                 status="generated", note=f"candidate {c['row_id']}",
             )
             out["generated"] += 1
@@ -986,56 +1023,187 @@ def _render_batch(*, label: str, manual: str, hwp, batch: list[dict], neighbor:
             out["errors"].append(f"{c.get('row_id')}: bundle failed: {type(e).__name__}: {e}")
 
 
-def _process_label_adaptive(*, label: str, manual: str, hwp, cands: list[dict],
-                            batch_size: int, page_budget: int, neighbor: int,
-                            version: str, svc, tmpdir, out: dict, memory_limit_mb: int,
-                            batch_counter: dict, batch_count: int) -> None:
-    """한 매뉴얼(label)의 후보들을 batch 단위로 순차 렌더. node/OOM 실패 시 batch 를 절반으로
-    줄여 재시도하고, batch_size 1 에서도 실패하면 해당 후보만 failed 로 기록하고 진행한다."""
-    genpdf_log = tmpdir / f"genpdf_{label}.log"
-    work = [(b, batch_size) for b in _plan_batches(cands, batch_size, page_budget, neighbor)]
-    while work:
-        batch, bs = work.pop(0)
-        batch_counter["i"] += 1
-        bi = batch_counter["i"]
+# ── 병렬 렌더 스케줄러 ─────────────────────────────────────────────────────────
+# 워커 호스트(멀티코어·대용량 메모리)에서 label/batch 를 한 번에 하나씩만 렌더하면 대부분의
+# 코어가 논다. 컨테이너 메모리 상한을 워커 수로 나눈 몫(share)을 각 워커의 '가상 컨테이너'
+# 로 보고 batch size/page budget/node heap 을 그 몫 기준으로 산정한다 → 동시 렌더 합계가
+# 상한을 넘지 않는다. 512MB 급에서는 워커 1개 = 기존 순차 동작과 동일.
+_RENDER_SLOT_MB = 1024   # 렌더 1개(node + chromium)에 잡는 메모리 몫 기본값
+
+
+def _render_workers(memory_limit_mb: int) -> int:
+    """동시 렌더 워커 수 = min(CPU 수, 메모리 상한 // 슬롯 MB), 최소 1.
+    env ``MANUAL_PDF_RENDER_WORKERS`` 가 우선, ``MANUAL_PDF_RENDER_SLOT_MB`` 로 슬롯 크기 조정."""
+    env = os.environ.get("MANUAL_PDF_RENDER_WORKERS")
+    if env:
+        try:
+            v = int(str(env).strip())
+            if v > 0:
+                return v
+        except ValueError:
+            pass
+    try:
+        slot = int(os.environ.get("MANUAL_PDF_RENDER_SLOT_MB") or _RENDER_SLOT_MB)
+    except ValueError:
+        slot = _RENDER_SLOT_MB
+    return max(1, min(os.cpu_count() or 1, memory_limit_mb // max(1, slot)))
+
+
+def _new_batch_out() -> dict:
+    return {"generated": 0, "failed": 0, "artifact_ids": [], "errors": [], "failed_row_ids": []}
+
+
+def _merge_batch_out(out: dict, b: dict) -> None:
+    out["generated"] += b["generated"]
+    out["failed"] += b["failed"]
+    for k in ("artifact_ids", "errors", "failed_row_ids"):
+        out[k].extend(b[k])
+
+
+def _run_render_queue(*, jobs: dict, workers: int, batch_size: int, page_budget: int,
+                      neighbor: int, version: str, svc, tmpdir, out: dict,
+                      memory_limit_mb: int, share_mb: int, batch_count: int,
+                      checkpoint=None) -> None:
+    """label 별 batch 큐를 ``workers`` 개 스레드로 병렬 렌더(node 는 별도 프로세스).
+
+    jobs: {label: {"manual", "hwp", "cands"}}. 워커마다 홈 label 큐의 앞에서 꺼내고, 비면
+    가장 긴 다른 label 큐의 뒤에서 훔쳐온다(work-stealing). node/OOM 실패 시 batch 를 절반으로
+    나눠 같은 label 큐 앞에 되돌리고(다른 워커가 즉시 가져갈 수 있음), batch_size 1 에서도
+    실패하면 그 후보만 failed. ``checkpoint()`` 가 주어지면 batch 시작 전에 이미 artifact 가
+    생긴 row_id(중단 후 재개·동시 실행)를 빼고 skipped_existing 으로 센다.
+    batch 별 wall_ms/peak_rss_mb 는 pdf_batch_done 로그와 out["batches"] 에 남긴다."""
+    import shutil
+    import threading
+    from collections import deque
+    queues = {label: deque((b, batch_size) for b in _plan_batches(j["cands"], batch_size,
+                                                                  page_budget, neighbor))
+              for label, j in jobs.items()}
+    labels = sorted(queues)
+    if not labels:
+        return
+    cond = threading.Condition()
+    state = {"inflight": 0, "i": 0}
+    max_old = _node_heap_mb(share_mb)
+
+    def _take(home: str):
+        with cond:
+            while True:
+                if queues[home]:
+                    item = (home,) + queues[home].popleft()
+                else:
+                    victim = max(labels, key=lambda lb: len(queues[lb]))
+                    item = (victim,) + queues[victim].pop() if queues[victim] else None
+                if item is not None:
+                    state["inflight"] += 1
+                    state["i"] += 1
+                    return item + (state["i"],)
+                if not state["inflight"]:
+                    return None
+                cond.wait()
+
+    def _finish(label: str, retry: list | None = None) -> None:
+        with cond:
+            if retry:
+                queues[label].extendleft(reversed(retry))
+            state["inflight"] -= 1
+            cond.notify_all()
+
+    def _run_one(wi: int, label: str, batch: list[dict], bs: int, bi: int) -> list | None:
+        manual, hwp = jobs[label]["manual"], jobs[label]["hwp"]
+        if checkpoint is not None:
+            done = checkpoint()
+            kept = [c for c in batch if c.get("row_id") not in done]
+            if len(kept) < len(batch):
+                with cond:
+                    out["skipped_existing"] += len(batch) - len(kept)
+                batch = kept
+            if not batch:
+                return None
         rids = [c.get("row_id") for c in batch]
-        max_old = _node_heap_mb(memory_limit_mb)
-        _log("pdf_batch_start", version=version, manual=manual,
-             memory_limit_mb=memory_limit_mb, batch_size=bs, batch_index=bi,
-             batch_count=batch_count, candidate_row_ids=rids, node_heap_mb=max_old)
+        tag = f"_b{bi}"
+        genpdf_log = tmpdir / f"genpdf_{label}{tag}.log"
+        _log("pdf_batch_start", version=version, manual=manual, worker=wi,
+             memory_limit_mb=memory_limit_mb, share_mb=share_mb, batch_size=bs,
+             batch_index=bi, batch_count=batch_count, candidate_row_ids=rids,
+             node_heap_mb=max_old)
+        bout = _new_batch_out()
+        usage: dict = {}
         try:
             _render_batch(label=label, manual=manual, hwp=hwp, batch=batch,
                           neighbor=neighbor, version=version, svc=svc, tmpdir=tmpdir,
-                          out=out, max_old_space_mb=max_old)
-            _log("pdf_batch_done", version=version, manual=manual, batch_size=bs,
-                 batch_index=bi, batch_count=batch_count, candidate_row_ids=rids,
-                 generated=out["generated"], failed=out["failed"],
-                 skipped_existing=out["skipped_existing"])
+                          out=bout, max_old_space_mb=max_old, tag=tag, usage=usage)
         except Exception as e:
+            shutil.rmtree(tmpdir / f"pages_{label}{tag}", ignore_errors=True)
             oom = _is_oom_failure(e, genpdf_log)
-            _log("pdf_batch_failed", version=version, manual=manual, batch_size=bs,
-                 batch_index=bi, batch_count=batch_count, candidate_row_ids=rids,
-                 oom=oom, error=f"{type(e).__name__}: {e}")
+            _log("pdf_batch_failed", version=version, manual=manual, worker=wi, batch_size=bs,
+                 batch_index=bi, batch_count=batch_count, candidate_row_ids=rids, oom=oom,
+                 wall_ms=usage.get("wall_ms"), peak_rss_mb=usage.get("peak_rss_mb"),
+                 error=f"{type(e).__name__}: {e}")
+            with cond:
+                out["batches"].append({"label": label, "batch_index": bi, "batch_size": bs,
+                                       "row_ids": rids, "status": "failed", "oom": oom,
+                                       "wall_ms": usage.get("wall_ms"),
+                                       "peak_rss_mb": usage.get("peak_rss_mb")})
             if bs > 1:
                 new_bs = max(1, bs // 2)
-                out["retry_count"] += 1
+                with cond:
+                    out["retry_count"] += 1
                 _log("pdf_batch_retry_smaller", version=version, manual=manual,
                      batch_size=bs, new_batch_size=new_bs, batch_index=bi,
                      batch_count=batch_count, candidate_row_ids=rids, oom=oom)
-                sub = _plan_batches(batch, new_bs, page_budget, neighbor)
-                work = [(s, new_bs) for s in sub] + work  # 즉시 재시도(앞에 삽입)
-            else:
-                for c in batch:
-                    out["failed"] += 1
-                    out["failed_row_ids"].append(c.get("row_id"))
-                    out["errors"].append(
-                        f"{c.get('row_id')}: generate_pdf failed at batch_size=1: "
-                        f"{type(e).__name__}: {e}")
-                _log("pdf_batch_candidate_failed", version=version, manual=manual,
-                     batch_index=bi, batch_count=batch_count, candidate_row_ids=rids,
-                     oom=oom, error=f"{type(e).__name__}: {e}")
-                _emit_genpdf_log_tail(manual=manual, version=version, exc=e,
-                                      log_path=genpdf_log)
+                return [(sub, new_bs) for sub in _plan_batches(batch, new_bs, page_budget, neighbor)]
+            for c in batch:
+                bout["failed"] += 1
+                bout["failed_row_ids"].append(c.get("row_id"))
+                bout["errors"].append(
+                    f"{c.get('row_id')}: generate_pdf failed at batch_size=1: "
+                    f"{type(e).__name__}: {e}")
+            with cond:
+                _merge_batch_out(out, bout)
+            _log("pdf_batch_candidate_failed", version=version, manual=manual,
+                 batch_index=bi, batch_count=batch_count, candidate_row_ids=rids,
+                 oom=oom, error=f"{type(e).__name__}: {e}")
+            _emit_genpdf_log_tail(manual=manual, version=version, exc=e, log_path=genpdf_log)
+            return None
+        with cond:
+            _merge_batch_out(out, bout)
+            out["batches"].append({"label": label, "batch_index": bi, "batch_size": bs,
+                                   "row_ids": rids, "status": "done",
+                                   "generated": bout["generated"], "failed": bout["failed"],
+                                   "wall_ms": usage.get("wall_ms"),
+                                   "peak_rss_mb": usage.get("peak_rss_mb")})
+            totals = (out["generated"], out["failed"], out["skipped_existing"])
+        _log("pdf_batch_done", version=version, manual=manual, worker=wi, batch_size=bs,
+             batch_index=bi, batch_count=batch_count, candidate_row_ids=rids,
+             wall_ms=usage.get("wall_ms"), peak_rss_mb=usage.get("peak_rss_mb"),
+             generated=totals[0], failed=totals[1], skipped_existing=totals[2])
+        return None
+
+    def _worker(wi: int) -> None:
+        home = labels[wi % len(labels)]
+        while True:
+            item = _take(home)
+            if item is None:
+                return
+            label, batch, bs, bi = item
+            retry = None
+            try:
+                retry = _run_one(wi, label, batch, bs, bi)
+            except Exception as e:   # 방어 — 워커가 죽어 큐가 멈추지 않게
+                _log("pdf_batch_worker_error", version=version, worker=wi, batch_index=bi,
+                     error=f"{type(e).__name__}: {e}")
+            finally:
+                _finish(label, retry)
+
+    if workers <= 1:
+        _worker(0)
+        return
+    threads = [threading.Thread(target=_worker, args=(wi,), name=f"pdf-render-{wi}", daemon=True)
+               for wi in range(workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
 
 
 def _server_pdf_disabled() -> tuple[bool, str]:
@@ -1058,9 +1226,11 @@ def generate_pdf_artifacts_for_version(version: str | None = None, *, neighbor:
     """변경 페이지 PDF artifact 생성(node/chromium 필요 — host/worker 전용).
 
     흐름: 후보 조회 → (skip_existing) 이미 artifact 있는 후보 제외 → 남은 후보가 있으면
-    현재 첨부 /tmp 다운로드 → **컨테이너 메모리 기준 adaptive batch 산정** → 후보를 batch
-    단위로 나눠 batch 하나씩 generate_pdf.mjs 실행(프로세스 종료 → 메모리 회수) → 후보별
-    per-page PDF 를 PyMuPDF 로 묶어 manual_pdf_artifacts.pdf_blob 저장 → /tmp 삭제.
+    현재 첨부 /tmp 다운로드 → **컨테이너 메모리 기준 워커 수·adaptive batch 산정** → 후보를
+    batch 단위로 나눠 워커들이 label 을 가로질러 병렬로 generate_pdf.mjs 실행(batch 마다
+    프로세스 종료 → 메모리 회수) → 페이지를 조각 저장소에, 후보별 번들 manifest 를
+    manual_pdf_artifacts 에 저장 → /tmp 삭제. 워커 수는 _render_workers, 각 워커의
+    batch/heap 은 메모리 상한 ÷ 워커 수 기준(_run_render_queue).
 
     512MB(Render Cron Starter)에서 21개 후보를 한 번에 렌더하면 OOM 나므로, batch 하나가
     실패(OOM/node)하면 batch 를 절반으로 줄여 재시도하고, batch_size 1 에서도 실패하면 그
@@ -1074,7 +1244,8 @@ def generate_pdf_artifacts_for_version(version: str | None = None, *, neighbor:
     (skip_existing=True). 남은 후보가 없으면 다운로드조차 하지 않고 skip 한다.
     PDF 생성 실패는 텍스트/후보 데이터에 영향 없다(이 함수는 artifact 만 다룬다).
     반환: {version, generated, failed, skipped_existing, remaining, batch_size,
-           memory_limit_mb, retry_count, artifact_ids, errors, status}."""
+           memory_limit_mb, workers, retry_count, artifact_ids, errors, batches, status}.
+    batches 는 batch 별 {label, batch_index, batch_size, row_ids, status, wall_ms, peak_rss_mb}."""
     import shutil
     import tempfile
     from collections import defaultdict
@@ -1091,8 +1262,9 @@ def generate_pdf_artifacts_for_version(version: str | None = None, *, neighbor:
         return {"status": "skipped", "reason": "no staging version"}
 
     out = {"version": version, "generated": 0, "failed": 0, "skipped_existing": 0,
-           "remaining": 0, "batch_size": None, "memory_limit_mb": None,
-           "retry_count": 0, "artifact_ids": [], "errors": [], "failed_row_ids": []}
+           "remaining": 0, "batch_size": None, "memory_limit_mb": None, "workers": None,
+           "retry_count": 0, "artifact_ids": [], "errors": [], "failed_row_ids": [],
+           "batches": []}
 
     # 생성 대상(target) 을 다운로드 전에 확정해 불필요한 하이코리아 접속/추출을 피한다.
     cands_all = svc.get_candidates_enriched(version)
@@ -1114,9 +1286,12 @@ def generate_pdf_artifacts_for_version(version: str | None = None, *, neighbor:
 
     # ── adaptive batch 산정 ──────────────────────────────────────────────────
     memory_limit_mb = _detect_memory_limit_mb()
-    init_bs = _compute_batch_size(memory_limit_mb)
-    budget = _page_budget(memory_limit_mb)
+    workers = _render_workers(memory_limit_mb)
+    share_mb = max(1, memory_limit_mb // workers)
+    init_bs = _compute_batch_size(share_mb)
+    budget = _page_budget(share_mb)
     out["memory_limit_mb"] = memory_limit_mb
+    out["workers"] = workers
     out["batch_size"] = init_bs
 
     tmpdir = Path(tempfile.gettempdir()) / "manual_pdf_artifacts" / version
@@ -1138,11 +1313,12 @@ def generate_pdf_artifacts_for_version(version: str | None = None, *, neighbor:
         batch_count = sum(len(_plan_batches(cs, init_bs, budget, neighbor))
                           for cs in by_label.values())
         _log("pdf_batch_plan", version=version, memory_limit_mb=memory_limit_mb,
+             workers=workers, share_mb=share_mb,
              batch_size=init_bs, page_budget=budget, batch_count=batch_count,
              total_candidates=len(target),
              labels={k: len(v) for k, v in by_label.items()})
 
-        batch_counter = {"i": 0}
+        jobs: dict[str, dict] = {}
         for hwp in sorted(tmpdir.iterdir()):
             if not hwp.is_file() or hwp.suffix.lower() not in (".hwp", ".hwpx"):
                 continue
@@ -1154,16 +1330,20 @@ def generate_pdf_artifacts_for_version(version: str | None = None, *, neighbor:
             cands = by_label.get(label) or []
             if not cands:
                 continue
-            _process_label_adaptive(
-                label=label, manual=manual, hwp=hwp, cands=cands, batch_size=init_bs,
-                page_budget=budget, neighbor=neighbor, version=version, svc=svc,
-                tmpdir=tmpdir, out=out, memory_limit_mb=memory_limit_mb,
-                batch_counter=batch_counter, batch_count=batch_count)
+            jobs[label] = {"manual": manual, "hwp": hwp, "cands": cands}
+        _run_render_queue(
+            jobs=jobs, workers=workers, batch_size=init_bs, page_budget=budget,
+            neighbor=neighbor, version=version, svc=svc, tmpdir=tmpdir, out=out,
+            memory_limit_mb=memory_limit_mb, share_mb=share_mb, batch_count=batch_count,
+            checkpoint=(lambda: _existing_artifact_rowids(svc, version)) if skip_existing else None)
 
         out["remaining"] = max(0, len(target) - out["generated"] - out["failed"])
         out["status"] = "ok"
         _log("pdf_batch_all_done", version=version, memory_limit_mb=memory_limit_mb,
-             batch_size=init_bs, batch_count=batch_count, generated=out["generated"],
+             workers=workers, batch_size=init_bs, batch_count=batch_count,
+             wall_ms_total=sum(b.get("wall_ms") or 0 for b in out["batches"]),
+             peak_rss_mb_max=max((b.get("peak_rss_mb") or 0 for b in out["batches"]), default=0),
+             generated=out["generated"],
              failed=out["failed"], skipped_existing=out["skipped_existing"],
              remaining=out["remaining"], retry_count=out["retry_count"])
         return out
@@ -9,9 +9,17 @@ v6 핵심:
   2. sub-category 영역 = 자기 시작 ~ 다음 〔??〕 시작 직전
   3. sub-category는 자동으로 모든 action_type에 매핑 (부모 자격이 어떤 action 섹션인지 추론)
   4. 일반 자격(F-4, H-2 등)은 기존 점수 시스템 + 본문 연속 등장 보호 유지
+
+증분 재색인:
+  페이지마다 한 번만 fitz 로 읽어 '페이지 사실'(〔〕/() 코드, 상단 () 개수, action 키워드)을
+  뽑고(extract_page_facts), 인덱스는 사실 목록만으로 다시 계산한다(derive_index — fitz 없음).
+  사실은 페이지 내용 hash 로 manual_index_v6_pages.json 에 보관. 매뉴얼 업데이트 후에는
+  get_changed_pages 의 변경 페이지만 다시 읽고 나머지는 캐시를 번호 이동만 반영해 재사용
+  (update_incremental). 재사용 전 페이지 텍스트 hash 를 대조해 어긋난 페이지는 다시 추출한다. 전체 재구축(build_all)은 검증 모드(--verify)로 남는다.
 """
 from __future__ import annotations
-import json, re, sys
+import hashlib, json, re, sys
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -23,6 +31,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 ROOT     = Path(__file__).parent.parent.parent
 MANUALS  = ROOT / "backend" / "data" / "manuals"
 INDEX_V6 = MANUALS / "manual_index_v6.json"
+PAGES_V6 = MANUALS / "manual_index_v6_pages.json"   # 페이지 사실 캐시(내용 hash 주소)
+
+TARGETS = {
+    "체류민원": MANUALS / "unlocked_체류민원.pdf",
+    "사증민원": MANUALS / "unlocked_사증민원.pdf",
+}
+# get_changed_pages 의 manual_label(rhwp 라벨) → 인덱스 라벨
+_CHANGE_LABEL = {"residence": "체류민원", "visa": "사증민원"}
 
 _CODE_BODY = r"[A-Z]-\d+(?:-(?:\d+|[A-Z][\w]*))?"
 _BRACKET_FORMAL = re.compile(rf"〔({_CODE_BODY})〕")
@@ -56,15 +72,7 @@ def find_subcategory_starts(doc: fitz.Document) -> list[tuple[int, str]]:
     같은 코드의 여러 페이지 등장 시 첫 페이지만 시작점으로.
     Returns: [(page_no, code), ...] 페이지 오름차순
     """
-    code_first_page: dict[str, int] = {}
-    for p in doc:
-        text = p.get_text()  # 페이지 전체
-        for m in _BRACKET_FORMAL.finditer(text):
-            code = m.group(1)
-            if code not in code_first_page:
-                code_first_page[code] = p.number + 1
-    starts = sorted([(p, c) for c, p in code_first_page.items()])
-    return starts
+    return _starts_from_facts([extract_page_facts(p) for p in doc])
 
 
 def build_subcategory_sections(starts: list[tuple[int, str]], total_pages: int,
@@ -100,38 +108,7 @@ def page_score_general(page: fitz.Page, code: str) -> int:
 
 def collect_general_main_pages(doc: fitz.Document, exclude_codes: set[str]) -> dict[str, dict[int, int]]:
     """sub-category 외의 일반 자격 코드용 메인 페이지 수집."""
-    all_codes_per_page: dict[int, set[str]] = {}
-    for p in doc:
-        text = p.get_text()
-        codes = set(_BRACKET_PAREN.findall(text)) - exclude_codes
-        if codes:
-            all_codes_per_page[p.number + 1] = codes
-
-    code_pages: dict[str, dict[int, int]] = defaultdict(dict)
-    for p_no, codes in all_codes_per_page.items():
-        page = doc[p_no - 1]
-        for code in codes:
-            sc = page_score_general(page, code)
-            if sc >= _PAGE_THRESHOLD:
-                code_pages[code][p_no] = sc
-
-    # 본문 연속 3+ 페이지 보너스
-    for code in {c for codes in all_codes_per_page.values() for c in codes}:
-        body_pages = sorted(p for p, codes in all_codes_per_page.items() if code in codes)
-        if not body_pages: continue
-        groups, cur = [], [body_pages[0]]
-        for p in body_pages[1:]:
-            if p - cur[-1] <= 3:
-                cur.append(p)
-            else:
-                groups.append(cur); cur = [p]
-        groups.append(cur)
-        for g in groups:
-            if len(g) >= 3:
-                for p in g:
-                    if p not in code_pages[code]:
-                        code_pages[code][p] = 3
-    return dict(code_pages)
+    return _general_from_facts([extract_page_facts(p) for p in doc], exclude_codes)
 
 
 def cluster_pages(page_scores: dict[int, int], gap: int = _GAP) -> list[dict]:
@@ -166,14 +143,102 @@ def find_action_in_range(doc, pf, pt, kws):
     return (first, last, kw) if first else None
 
 
-def build_index_for_pdf(pdf_path: Path, manual_label: str) -> dict:
-    doc = fitz.open(pdf_path)
-    total = len(doc)
+# ── 페이지 사실(fitz 1회) → 인덱스(순수 계산) ─────────────────────────────
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def extract_page_facts(page: fitz.Page) -> dict:
+    """인덱스 계산에 필요한 페이지 정보만 추출. hash = 페이지 전체 텍스트 sha256.
+
+    formal: 〔〕 코드(등장 순, 중복 제거), paren/paren_head: () 코드 개수(전체/상단 30%),
+    actions: {action_type: 처음 일치한 키워드(ACTION_KEYWORDS 순)}."""
+    text = page.get_text()
+    paren = Counter(_BRACKET_PAREN.findall(text))
+    head: dict[str, int] = {}
+    if paren:
+        rect = page.rect
+        top = fitz.Rect(0, 0, rect.width, rect.height * _HEADER_HEIGHT_RATIO)
+        head = {c: n for c, n in Counter(_BRACKET_PAREN.findall(page.get_text(clip=top))).items()
+                if c in paren}
+    actions = {}
+    for action_type, kws in ACTION_KEYWORDS.items():
+        for k in kws:
+            if k in text:
+                actions[action_type] = k
+                break
+    return {
+        "hash": _text_hash(text),
+        "formal": list(dict.fromkeys(_BRACKET_FORMAL.findall(text))),
+        "paren": dict(paren), "paren_head": head, "actions": actions,
+    }
+
+
+def _starts_from_facts(facts: list[dict]) -> list[tuple[int, str]]:
+    """find_subcategory_starts 의 사실 목록 버전."""
+    code_first_page: dict[str, int] = {}
+    for i, f in enumerate(facts):
+        for code in f["formal"]:
+            code_first_page.setdefault(code, i + 1)
+    return sorted([(p, c) for c, p in code_first_page.items()])
+
+
+def _general_from_facts(facts: list[dict], exclude_codes: set[str]) -> dict[str, dict[int, int]]:
+    """collect_general_main_pages 의 사실 목록 버전(점수 규칙 동일)."""
+    all_codes_per_page: dict[int, set[str]] = {}
+    for i, f in enumerate(facts):
+        codes = set(f["paren"]) - exclude_codes
+        if codes:
+            all_codes_per_page[i + 1] = codes
+
+    code_pages: dict[str, dict[int, int]] = defaultdict(dict)
+    for p_no, codes in all_codes_per_page.items():
+        f = facts[p_no - 1]
+        for code in codes:
+            head_p = f["paren_head"].get(code, 0)
+            sc = head_p * _W_HEAD_PAREN + max(0, f["paren"][code] - head_p) * _W_BODY_PAREN
+            if sc >= _PAGE_THRESHOLD:
+                code_pages[code][p_no] = sc
+
+    for code in {c for codes in all_codes_per_page.values() for c in codes}:
+        body_pages = sorted(p for p, codes in all_codes_per_page.items() if code in codes)
+        if not body_pages: continue
+        groups, cur = [], [body_pages[0]]
+        for p in body_pages[1:]:
+            if p - cur[-1] <= 3:
+                cur.append(p)
+            else:
+                groups.append(cur); cur = [p]
+        groups.append(cur)
+        for g in groups:
+            if len(g) >= 3:
+                for p in g:
+                    if p not in code_pages[code]:
+                        code_pages[code][p] = 3
+    return dict(code_pages)
+
+
+def _action_in_facts(facts: list[dict], pf: int, pt: int, action_type: str):
+    """find_action_in_range 의 사실 목록 버전."""
+    first = last = kw = None
+    for p_no in range(pf, pt + 1):
+        if p_no - 1 >= len(facts): break
+        k = facts[p_no - 1]["actions"].get(action_type)
+        if k:
+            if first is None:
+                first, kw = p_no, k
+            last = p_no
+    return (first, last, kw) if first else None
+
+
+def derive_index(facts: list[dict], manual_label: str, *, verbose: bool = True) -> dict:
+    """페이지 사실 목록 → 매뉴얼 1개 인덱스(build_index_for_pdf 와 같은 결과, fitz 미사용)."""
+    total = len(facts)
 
     # === 1. sub-category 정식 섹션 ===
-    starts = find_subcategory_starts(doc)
-    sub_sections = build_subcategory_sections(starts, total)
-    print(f"  [{manual_label}] sub-category 정식 섹션: {len(sub_sections)} 코드 (총 {sum(len(v) for v in sub_sections.values())} 인스턴스)")
+    sub_sections = build_subcategory_sections(_starts_from_facts(facts), total)
+    if verbose:
+        print(f"  [{manual_label}] sub-category 정식 섹션: {len(sub_sections)} 코드 (총 {sum(len(v) for v in sub_sections.values())} 인스턴스)")
 
     code_index = {}
     action_index = defaultdict(list)
@@ -195,9 +260,9 @@ def build_index_for_pdf(pdf_path: Path, manual_label: str) -> dict:
             "score": 100, "match_kind": "subcategory_change_default",
         })
         # 추가 action 키워드도 보조로 등록 (CHANGE 제외 — 이미 위에서 등록)
-        for action_type, kws in ACTION_KEYWORDS.items():
+        for action_type in ACTION_KEYWORDS:
             if action_type == "CHANGE": continue
-            hit = find_action_in_range(doc, pf, pt, kws)
+            hit = _action_in_facts(facts, pf, pt, action_type)
             if hit is None: continue
             first, last, kw = hit
             action_index[f"{code}|{action_type}"].append({
@@ -207,8 +272,9 @@ def build_index_for_pdf(pdf_path: Path, manual_label: str) -> dict:
             })
 
     # === 2. 일반 자격 (sub-category 아닌 코드) ===
-    general_codes = collect_general_main_pages(doc, exclude_codes=set(sub_sections))
-    print(f"  [{manual_label}] 일반 자격 코드: {len(general_codes)} 코드")
+    general_codes = _general_from_facts(facts, exclude_codes=set(sub_sections))
+    if verbose:
+        print(f"  [{manual_label}] 일반 자격 코드: {len(general_codes)} 코드")
     for code, page_scores in general_codes.items():
         clusters = cluster_pages(page_scores)
         if not clusters: continue
@@ -220,8 +286,8 @@ def build_index_for_pdf(pdf_path: Path, manual_label: str) -> dict:
             "manual": manual_label, "page_from": top["page_from"], "page_to": top["page_to"],
             "score": top["score"], "page_count": top["page_count"], "kind": "general",
         })
-        for action_type, kws in ACTION_KEYWORDS.items():
-            hit = find_action_in_range(doc, top["page_from"], top["page_to"], kws)
+        for action_type in ACTION_KEYWORDS:
+            hit = _action_in_facts(facts, top["page_from"], top["page_to"], action_type)
             if hit is None: continue
             first, last, kw = hit
             action_index[f"{code}|{action_type}"].append({
@@ -230,25 +296,63 @@ def build_index_for_pdf(pdf_path: Path, manual_label: str) -> dict:
                 "score": top["score"], "match_kind": "general_with_action",
             })
 
-    doc.close()
     return {"label": manual_label, "total_pages": total,
             "code_index": code_index, "action_index": dict(action_index)}
 
 
-def build_all() -> dict:
-    targets = {
-        "체류민원": MANUALS / "unlocked_체류민원.pdf",
-        "사증민원": MANUALS / "unlocked_사증민원.pdf",
-    }
-    manuals_info, code_index_all, action_index_all = {}, defaultdict(list), defaultdict(list)
-    for label, path in targets.items():
-        if not path.exists(): print(f"[skip] {label}"); continue
-        info = build_index_for_pdf(path, label)
-        manuals_info[label] = {
-            "file": str(path.relative_to(ROOT) if path.is_relative_to(ROOT) else path),
-            "total_pages": info["total_pages"],
-            "code_count": len(info["code_index"]),
-        }
+def build_index_for_pdf(pdf_path: Path, manual_label: str) -> dict:
+    with fitz.open(pdf_path) as doc:
+        facts = [extract_page_facts(p) for p in doc]
+    return derive_index(facts, manual_label)
+
+
+# ── 페이지 사실 캐시 + 증분 갱신 ──────────────────────────────────────
+def _load_page_cache() -> dict:
+    try:
+        data = json.loads(PAGES_V6.read_text(encoding="utf-8"))
+        if isinstance(data.get("pages"), dict) and isinstance(data.get("manuals"), dict):
+            return data
+    except Exception:
+        pass
+    return {"manuals": {}, "pages": {}}
+
+
+def _save_page_cache(facts_by_label: dict[str, list[dict]]) -> None:
+    """라벨별 페이지 hash 순서 + hash → 사실(사용 중인 것만) 저장."""
+    pages: dict[str, dict] = {}
+    manuals = {}
+    for label, facts in facts_by_label.items():
+        manuals[label] = {"page_hashes": [f["hash"] for f in facts]}
+        for f in facts:
+            pages.setdefault(f["hash"], {k: v for k, v in f.items() if k != "hash"})
+    PAGES_V6.write_text(json.dumps({"manuals": manuals, "pages": pages}, ensure_ascii=False),
+                        encoding="utf-8")
+
+
+def carry_over_pages(prev_hashes: list[str], changed: list[dict], total: int) -> list[Optional[str]] | None:
+    """이전 빌드의 페이지 hash 를 새 페이지 번호로 옮긴다. None = 다시 읽을 페이지.
+
+    변경(non-same) 행의 new_page 는 다시 읽고 baseline_page 는 소비된 것으로 본다. 나머지
+    페이지는 순서대로 1:1 대응(삽입/삭제로 번호만 이동). 개수가 맞지 않으면(변경 목록과 PDF 가
+    어긋남) None 반환 → 호출측이 전체 재추출. 개수가 맞아도 대응이 틀릴 수 있으므로 호출측
+    (_build)은 재사용 전에 새 페이지 텍스트 hash 와 대조한다."""
+    extract = {c["new_page"] for c in changed if c.get("new_page") and c.get("change_type") != "same"}
+    consumed = {c["baseline_page"] for c in changed
+                if c.get("baseline_page") and c.get("change_type") != "same"}
+    keep_new = [p for p in range(1, total + 1) if p not in extract]
+    keep_old = [p for p in range(1, len(prev_hashes) + 1) if p not in consumed]
+    if len(keep_new) != len(keep_old):
+        return None
+    slots: list[Optional[str]] = [None] * total
+    for np_, op in zip(keep_new, keep_old):
+        slots[np_ - 1] = prev_hashes[op - 1]
+    return slots
+
+
+def _assemble(infos: dict[str, dict], manuals_info: dict) -> dict:
+    """매뉴얼별 인덱스 → 전체 인덱스(사증민원 VISA_CONFIRM 보강 + 중복 제거)."""
+    code_index_all, action_index_all = defaultdict(list), defaultdict(list)
+    for info in infos.values():
         for c, e in info["code_index"].items(): code_index_all[c].extend(e)
         for k, e in info["action_index"].items(): action_index_all[k].extend(e)
 
@@ -271,16 +375,107 @@ def build_all() -> dict:
             seen.add(key); uniq.append(e)
         action_index_all[k] = uniq
 
-    result = {
+    return {
         "manuals": manuals_info,
         "code_index": dict(code_index_all),
         "action_index": dict(action_index_all),
         "built_at": datetime.now(timezone.utc).isoformat(),
     }
+
+
+def _manual_info(label: str, path: Path, info: dict) -> dict:
+    return {
+        "file": str(path.relative_to(ROOT) if path.is_relative_to(ROOT) else path),
+        "total_pages": info["total_pages"],
+        "code_count": len(info["code_index"]),
+    }
+
+
+def _build(changed_by_label: dict[str, list[dict]] | None) -> tuple[dict, dict]:
+    """changed_by_label 이 None 이면 전체 추출, 아니면 라벨별 변경 페이지만 추출.
+    반환: (index, stats{label: {"extracted", "reused", "mode"}}). 인덱스/캐시 파일은 쓰지 않는다."""
+    cache = _load_page_cache() if changed_by_label is not None else {"manuals": {}, "pages": {}}
+    infos, manuals_info, facts_by_label, stats = {}, {}, {}, {}
+    for label, path in TARGETS.items():
+        if not path.exists(): print(f"[skip] {label}"); continue
+        with fitz.open(path) as doc:
+            slots = None
+            prev = (cache["manuals"].get(label) or {}).get("page_hashes")
+            if changed_by_label is not None and prev:
+                slots = carry_over_pages(prev, changed_by_label.get(label, []), len(doc))
+            if slots is None:
+                slots = [None] * len(doc)
+            facts, extracted, mismatched = [], 0, 0
+            for i, h in enumerate(slots):
+                cached = cache["pages"].get(h) if h else None
+                if cached is not None and _text_hash(doc[i].get_text()) != h:
+                    cached, mismatched = None, mismatched + 1   # 옮긴 사실이 이 페이지 것이 아님 → 재추출
+                if cached is None:
+                    facts.append(extract_page_facts(doc[i])); extracted += 1
+                else:
+                    facts.append({"hash": h, **cached})
+        info = derive_index(facts, label, verbose=changed_by_label is None)
+        infos[label], facts_by_label[label] = info, facts
+        manuals_info[label] = _manual_info(label, path, info)
+        stats[label] = {"extracted": extracted, "reused": len(facts) - extracted,
+                        "hash_mismatch": mismatched,
+                        "mode": "full" if extracted == len(facts) else "incremental"}
+    return _assemble(infos, manuals_info), {"stats": stats, "facts": facts_by_label}
+
+
+def build_all() -> dict:
+    result, extra = _build(None)
+    _save_page_cache(extra["facts"])
     INDEX_V6.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
     return result
 
 
+def diff_index(old: dict, new: dict) -> dict:
+    """두 인덱스의 code_index/action_index 키 단위 차이 {sec: {added, removed, changed}}."""
+    out = {}
+    for sec in ("code_index", "action_index"):
+        o, n = (old or {}).get(sec) or {}, (new or {}).get(sec) or {}
+        out[sec] = {
+            "added": sorted(set(n) - set(o)),
+            "removed": sorted(set(o) - set(n)),
+            "changed": sorted(k for k in set(o) & set(n) if o[k] != n[k]),
+        }
+    return out
+
+
+def _strip_built_at(index: dict) -> dict:
+    return {k: v for k, v in index.items() if k != "built_at"}
+
+
+def update_incremental(version: str | None = None, *, changed: list[dict] | None = None,
+                       verify: bool = False) -> dict:
+    """변경 페이지만 다시 읽어 인덱스를 갱신하고 이전 인덱스 대비 차이를 반환.
+
+    changed 를 주지 않으면 manual_update_pg_service.get_changed_pages(version) 사용.
+    캐시가 없거나 변경 목록이 PDF 페이지 수와 맞지 않는 라벨은 전체 추출로 대체한다.
+    verify=True 면 전체 재구축도 수행해 결과가 같은지 확인(다르면 전체 결과를 저장).
+    반환: {"diff", "stats", "verified"(None|bool), "code_index", "action_index"(건수)}."""
+    if changed is None:
+        from backend.services import manual_update_pg_service as svc
+        changed = svc.get_changed_pages(version) if version else []
+    by_label: dict[str, list[dict]] = defaultdict(list)
+    for c in changed:
+        lbl = c.get("manual_label")
+        by_label[_CHANGE_LABEL.get(lbl, lbl)].append(c)
+    old = json.loads(INDEX_V6.read_text(encoding="utf-8")) if INDEX_V6.exists() else {}
+    result, extra = _build(dict(by_label))
+    verified = None
+    if verify:
+        full, full_extra = _build(None)
+        verified = _strip_built_at(full) == _strip_built_at(result)
+        if not verified:
+            result, extra = full, full_extra
+    _save_page_cache(extra["facts"])
+    INDEX_V6.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+    return {"diff": diff_index(old, result), "stats": extra["stats"], "verified": verified,
+            "code_index": len(result["code_index"]), "action_index": len(result["action_index"])}
+
+
 # ── DB 코드 → 매뉴얼 코드 alias 테이블 ─────────────────────────────────
 DB_TO_MANUAL_ALIAS = {
     "F-5-2": "F-5-4",   # DB "영주권자 미성년 자녀" → 매뉴얼 "일반 영주자의 배우자 또는 미성년 자녀"
@@ -362,12 +557,17 @@ if __name__ == "__main__":
     p = argparse.ArgumentParser()
     sub = p.add_subparsers(dest="cmd", required=True)
     sub.add_parser("build")
+    p_up = sub.add_parser("update"); p_up.add_argument("version")
+    p_up.add_argument("--verify", action="store_true", help="전체 재구축과 결과 비교")
     p_lk = sub.add_parser("lookup"); p_lk.add_argument("code"); p_lk.add_argument("action")
     sub.add_parser("stats")
     args = p.parse_args()
     if args.cmd == "build":
         result = build_all()
         print(f"\n[OK] code_index:{len(result['code_index'])}, action_index:{len(result['action_index'])}")
+    elif args.cmd == "update":
+        res = update_incremental(args.version, verify=args.verify)
+        print(json.dumps(res, indent=2, ensure_ascii=False))
     elif args.cmd == "lookup":
         print(json.dumps(lookup(args.code, args.action), indent=2, ensure_ascii=False))
     elif args.cmd == "stats":
@@ -47,29 +47,52 @@ def _norm_hashes(text: str) -> tuple[str, str]:
     return th, nh
 
 
-def extract_pages(pdf_bytes: bytes, manual_label: str) -> list[dict]:
+def _page_row(manual_label: str, page_no: int, text: str) -> dict:
+    th, nh = _norm_hashes(text)
+    first_line = next((ln.strip() for ln in text.splitlines() if ln.strip()), "")
+    return {
+        "manual_label": manual_label,
+        "rhwp_page_index": page_no,        # 1-based
+        "printed_page_no": page_no,
+        "title_guess": first_line[:80],
+        "text": text,
+        "text_hash": th,
+        "normalized_text_hash": nh,
+        "keywords": [],
+    }
+
+
+def _stored_pages(pdf_hash: str, manual_label: str) -> Optional[list[dict]]:
+    """페이지 텍스트 저장소에 이미 있는 PDF 면 blob 없이 페이지 목록 반환(없으면 None)."""
+    from backend.services import page_text_store
+    try:
+        if not pdf_hash or page_text_store.page_count(pdf_hash) is None:
+            return None
+        rows = page_text_store.get_pages(pdf_hash)
+    except Exception:
+        return None
+    return [_page_row(manual_label, p, rows[p]["text"]) for p in sorted(rows)]
+
+
+def extract_pages(pdf_bytes: bytes, manual_label: str, *, pdf_hash: str | None = None) -> list[dict]:
     """업로드 PDF 의 페이지별 텍스트만 추출(렌더링/합성 없음). OCR 미사용(텍스트 PDF 기준).
 
-    반환 dict 는 diff_pages/compute_candidates 가 기대하는 키를 갖춘다."""
+    페이지 텍스트 저장소(page_text_store)를 거쳐 같은 PDF 는 한 번만 파싱한다. 저장소를
+    못 쓰면 직접 추출. 반환 dict 는 diff_pages/compute_candidates 가 기대하는 키를 갖춘다."""
+    from backend.services import page_text_store
+    try:
+        h, _n = page_text_store.ensure_pdf(pdf_bytes, pdf_hash=pdf_hash)
+        stored = _stored_pages(h, manual_label)
+        if stored is not None:
+            return stored
+    except Exception:
+        pass
     import fitz  # PyMuPDF
     pages: list[dict] = []
     doc = fitz.open(stream=pdf_bytes, filetype="pdf")
     try:
         for i in range(doc.page_count):
-            page = doc.load_page(i)
-            text = page.get_text() or ""
-            th, nh = _norm_hashes(text)
-            first_line = next((ln.strip() for ln in text.splitlines() if ln.strip()), "")
-            pages.append({
-                "manual_label": manual_label,
-                "rhwp_page_index": i + 1,          # 1-based
-                "printed_page_no": i + 1,
-                "title_guess": first_line[:80],
-                "text": text,
-                "text_hash": th,
-                "normalized_text_hash": nh,
-                "keywords": [],
-            })
+            pages.append(_page_row(manual_label, i + 1, doc.load_page(i).get_text() or ""))
     finally:
         doc.close()
     return pages
@@ -113,12 +136,15 @@ def _latest_deployed_pages(manual: str) -> Optional[list[dict]]:
     if not arts:
         return None
     arts.sort(key=lambda a: (a.get("created_at") or ""), reverse=True)
+    refs = svc.load_base_refs()
+    label = _ref_label_for(manual, refs)
+    stored = _stored_pages(arts[0].get("content_hash"), label)   # 파싱 이력 있으면 blob 미조회
+    if stored is not None:
+        return stored
     blob = svc.get_pdf_artifact_blob(arts[0]["id"])
     if not blob:
         return None
-    refs = svc.load_base_refs()
-    label = _ref_label_for(manual, refs)
-    return extract_pages(blob, label)
+    return extract_pages(blob, label, pdf_hash=arts[0].get("content_hash"))
 
 
 def _is_review_splice_artifact(a: dict) -> bool:
@@ -208,10 +234,9 @@ def _run_change_detection_once(manual: str, version: str) -> dict:
     if manual_norm is None:
         raise ValueError("manual 은 visa / stay / revision_history 중 하나여야 합니다.")
     version = (version or "").strip()
-    res = get_staging_blob(manual_norm, version)
-    if res is None:
+    meta = get_staging_meta(manual_norm, version)
+    if meta is None:
         raise ValueError("업로드된 검토용 PDF 가 없습니다. 먼저 PDF 를 업로드하세요.")
-    pdf_bytes, _meta = res
 
     if manual_norm == "revision_history":
         return {"status": "no_diff", "manual": manual_norm, "version": version,
@@ -220,7 +245,12 @@ def _run_change_detection_once(manual: str, version: str) -> dict:
 
     refs = svc.load_base_refs()
     label = _ref_label_for(manual_norm, refs)
-    new_pages = extract_pages(pdf_bytes, label)
+    new_pages = _stored_pages(meta.get("content_hash"), label)
+    if new_pages is None:
+        res = get_staging_blob(manual_norm, version)
+        if res is None:
+            raise ValueError("업로드된 검토용 PDF 가 없습니다. 먼저 PDF 를 업로드하세요.")
+        new_pages = extract_pages(res[0], label, pdf_hash=meta.get("content_hash"))
     extracted = len(new_pages)
     baseline_pages = _latest_deployed_pages(manual_norm)
     if not baseline_pages:
@@ -241,8 +271,8 @@ def _run_change_detection_once(manual: str, version: str) -> dict:
             "extracted_pages": extracted, "changed": len(non_same), "candidates": len(candidates)}
 
 
-def get_staging_blob(manual: str, version: str = "") -> Optional[tuple[bytes, dict]]:
-    """검토용 staging 업로드 PDF blob + 메타. version 미지정 시 최신."""
+def get_staging_meta(manual: str, version: str = "") -> Optional[dict]:
+    """검토용 staging 업로드 PDF artifact 메타(blob 제외). version 미지정 시 최신."""
     manual_norm = normalize_manual(manual)
     if manual_norm is None:
         return None
@@ -252,7 +282,15 @@ def get_staging_blob(manual: str, version: str = "") -> Optional[tuple[bytes, di
     if not arts:
         return None
     arts.sort(key=lambda a: (a.get("created_at") or ""), reverse=True)
-    meta = arts[0]
+    return arts[0]
+
+
+def get_staging_blob(manual: str, version: str = "") -> Optional[tuple[bytes, dict]]:
+    """검토용 staging 업로드 PDF blob + 메타. version 미지정 시 최신."""
+    meta = get_staging_meta(manual, version)
+    if meta is None:
+        return None
+    from backend.services import manual_update_pg_service as svc
     blob = svc.get_pdf_artifact_blob(meta["id"])
     if not blob:
         return None
@@ -282,7 +320,9 @@ def _resolve_upload_artifact(manual_norm: str, version: str = "") -> Optional[di
 
 
 def resolve_review_pdf_meta(manual: str, version: str = "") -> Optional[dict]:
-    """업로드 PDF 메타(blob 제외) — source/page_count/review_only/artifact_id. 없으면 None."""
+    """업로드 PDF 메타(blob 제외) — source/page_count/review_only/artifact_id/content_hash. 없으면 None.
+
+    pg_pdf 는 artifact_id/content_hash 로 디스크 캐시 파일을 서빙한다(pdf_artifact_cache)."""
     manual_norm = normalize_manual(manual)
     if manual_norm is None:
         return None
@@ -291,23 +331,7 @@ def resolve_review_pdf_meta(manual: str, version: str = "") -> Optional[dict]:
         return None
     return {"source": m["_source"], "review_only": m["_review_only"],
             "page_count": m.get("page_count"), "artifact_id": m.get("id"),
-            "version": m.get("version")}
-
-
-def resolve_review_pdf(manual: str, version: str = "") -> Optional[dict]:
-    """업로드 PDF blob + 메타 — pg_pdf 스트리밍용. 없으면 None(기존 resolver 로 폴백)."""
-    manual_norm = normalize_manual(manual)
-    if manual_norm is None:
-        return None
-    m = _resolve_upload_artifact(manual_norm, version)
-    if m is None:
-        return None
-    from backend.services import manual_update_pg_service as svc
-    blob = svc.get_pdf_artifact_blob(m["id"])
-    if not blob:
-        return None
-    return {"blob": blob, "source": m["_source"], "review_only": m["_review_only"],
-            "page_count": m.get("page_count")}
+            "version": m.get("version"), "content_hash": m.get("content_hash")}
 
 
 def list_uploads(manual: str = "") -> list[dict]:
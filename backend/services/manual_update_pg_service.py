@@ -637,14 +637,28 @@ def clear_reviewer_override(row_id: str) -> dict:
 
 
 def _baseline_text_for(label: str, pf: int, pt: int) -> str:
-    pages = {p["rhwp_page_index"]: p for p in load_baseline_pages(label)} if label else {}
+    pages = {p["rhwp_page_index"]: p for p in load_baseline_pages(label, pf, pt or pf)} if label else {}
     return "\n".join((pages.get(p, {}).get("text") or "") for p in range(pf, (pt or pf) + 1)).strip()
 
 
 def _candidate_text_for(version: str, label: str, pf: int, pt: int) -> tuple[str, bool]:
-    """후보(신규) 페이지 텍스트 — PG에는 변경 페이지 스니펫(240자)만 있다.
-    new_page 가 범위에 드는 변경 페이지의 new_snippet 을 모은다. (전체 본문 미보유)
+    """후보(신규) 페이지 텍스트.
+
+    해당 version 의 업로드 staging PDF 가 페이지 텍스트 저장소에 있으면(변경 감지 때 파싱됨)
+    그 페이지 전체 본문을 쓴다 — PDF 재파싱/ blob 조회 없음. 없으면 PG 의 변경 페이지
+    스니펫(240자)만 모은다.
     반환: (text, partial) — partial=True 면 스니펫 기반(전체 아님)."""
+    try:
+        from backend.services import manual_pdf_upload_service as up
+        from backend.services import page_text_store
+        meta = up.get_staging_meta(label, version)
+        h = (meta or {}).get("content_hash")
+        if h and page_text_store.page_count(h) is not None:
+            rows = page_text_store.get_pages(h, range(pf, (pt or pf) + 1))
+            return ("\n".join(rows.get(p, {}).get("text") or "" for p in range(pf, (pt or pf) + 1)).strip(),
+                    False)
+    except Exception:
+        pass
     snips = []
     for cp in get_changed_pages(version):
         if cp.get("manual_label") != label:
@@ -674,8 +688,8 @@ def _diff_segments(a: str, b: str) -> list[dict]:
 
 def recompare(version: str, label: str, baseline_from: int, baseline_to: int,
               candidate_from: int, candidate_to: int) -> dict:
-    """수동 지정 페이지 기준으로 기존/후보 텍스트를 재추출하고 diff 를 다시 계산.
-    후보(신규) 텍스트는 변경 페이지 스니펫 기반(전체 본문 미보유 → partial)."""
+    """수동 지정 페이지 기준으로 기존/후보 텍스트를 다시 모아 diff 를 다시 계산.
+    후보(신규) 텍스트는 페이지 텍스트 저장소에 있으면 전체 본문, 없으면 스니펫(partial)."""
     existing = _baseline_text_for(label, baseline_from, baseline_to)
     cand, partial = _candidate_text_for(version, label, candidate_from, candidate_to)
     return {
@@ -691,9 +705,15 @@ def recompare(version: str, label: str, baseline_from: int, baseline_to: int,
 def compute_candidates(changed: list[dict], new_pages_by_label: dict[str, list[dict]],
                        refs: list[dict]) -> list[dict]:
     """변경 페이지에 연결된 manual_ref 만 후보로 산출. 파일 기반 make_ref_candidates 와
-    동일한 로직(overlap 또는 충분히 구체적인 match_text 의 text-hit)이되 refs 는 PG 에서."""
-    from backend.scripts.manual_update_local import normalize  # 순수 함수 재사용
-    affected: dict[str, set[int]] = {}
+    동일한 로직(overlap, 충분히 구체적인 match_text 의 text-hit, 삽입/삭제로 번호만 밀린
+    페이지의 shifted 재매핑)이되 refs 는 PG 에서."""
+    from backend.scripts.manual_update_local import (  # 순수 함수 재사용
+        aligned_page_map, normalize, remap_page_range,
+    )
+    page_maps = aligned_page_map(changed)
+    affected: dict[str, set[int]] = {
+        lbl: set() for lbl, m in page_maps.items() if any(b != n for b, n in m.items())
+    }
     for c in changed:
         if c.get("change_type") == "same":
             continue
@@ -719,8 +739,10 @@ def compute_candidates(changed: list[dict], new_pages_by_label: dict[str, list[d
         pt = int(ref.get("page_to") or 0)
         mt = (ref.get("match_text") or "").strip()
         overlap = any(p in affected[lbl] for p in range(pf, pt + 1))
+        cand_pf, cand_pt = remap_page_range(pf, pt, page_maps.get(lbl, {}))
+        shifted = (cand_pf, cand_pt) != (pf, pt)
         text_hit: list[int] = []
-        if not overlap:
+        if not overlap and not shifted:
             norm = normalize(mt) if mt else ""
             if len(norm) >= 8:
                 for pn in affected[lbl]:
@@ -729,9 +751,8 @@ def compute_candidates(changed: list[dict], new_pages_by_label: dict[str, list[d
                         text_hit.append(pn)
             if not text_hit:
                 continue
-        cand_pf, cand_pt = pf, pt
         new_snip = ""
-        np = new_lookup.get(lbl, {}).get(pf or 1)
+        np = new_lookup.get(lbl, {}).get(cand_pf or 1)
         if np:
             new_snip = np.get("text", "")[:140].replace("\n", " ")
         ctypes = sorted({
@@ -742,7 +763,13 @@ def compute_candidates(changed: list[dict], new_pages_by_label: dict[str, list[d
         })
         conf = "high" if ctypes == ["modified"] else "review"
         action = "review" if conf == "review" else "remap_candidate"
-        if text_hit and not overlap:
+        reason = (f"baseline pages {pf}-{pt} overlap changed "
+                  f"{sorted(affected[lbl] & set(range(pf, pt + 1))) or text_hit}")
+        if not overlap and shifted:
+            ctypes = ["shifted"]
+            conf, action = "high", "remap_candidate"
+            reason = f"baseline pages {pf}-{pt} shifted to {cand_pf}-{cand_pt}"
+        elif text_hit and not overlap:
             action = "review"
             cand_pf = cand_pt = text_hit[0]
             conf = "medium"
@@ -752,8 +779,7 @@ def compute_candidates(changed: list[dict], new_pages_by_label: dict[str, list[d
             "manual_label": lbl,
             "old_page_from": pf, "old_page_to": pt,
             "candidate_page_from": cand_pf, "candidate_page_to": cand_pt,
-            "reason": f"baseline pages {pf}-{pt} overlap changed "
-                      f"{sorted(affected[lbl] & set(range(pf, pt + 1))) or text_hit}",
+            "reason": reason,
             "change_type": "+".join(ctypes) or "unknown",
             "confidence": conf,
             "action": action,
@@ -850,8 +876,9 @@ def replace_base_refs(refs: list[dict], snapshot_tag: str = "") -> int:
         return n
 
 
-def load_baseline_pages(label: str) -> list[dict]:
-    """활성 baseline 의 페이지를 diff_pages 입력 형태로 반환."""
+def load_baseline_pages(label: str, page_from: int | None = None,
+                        page_to: int | None = None) -> list[dict]:
+    """활성 baseline 의 페이지를 diff_pages 입력 형태로 반환. page_from/to 로 범위만 조회 가능."""
     if not pg_enabled():
         return []
     from sqlalchemy import select
@@ -867,11 +894,12 @@ def load_baseline_pages(label: str) -> list[dict]:
         ).first()
         if not bv:
             return []
-        rows = session.scalars(
-            select(ManualBasePage)
-            .where(ManualBasePage.base_version_id == bv.id)
-            .order_by(ManualBasePage.page_index)
-        ).all()
+        q = select(ManualBasePage).where(ManualBasePage.base_version_id == bv.id)
+        if page_from is not None:
+            q = q.where(ManualBasePage.page_index >= page_from)
+        if page_to is not None:
+            q = q.where(ManualBasePage.page_index <= page_to)
+        rows = session.scalars(q.order_by(ManualBasePage.page_index)).all()
         return [{
             "manual_label": r.manual_label,
             "rhwp_page_index": r.page_index,
@@ -1151,7 +1179,9 @@ def _artifact_to_dict(a, *, with_blob: bool = False) -> dict:
         "content_hash": a.content_hash, "status": a.status, "note": a.note,
         # ⚠ pdf_blob 컬럼을 절대 만지지 않는다(메타 조회 시 거대한 bytea 적재 → SSL EOF/OOM).
         #   blob 존재 여부는 file_size 프록시로 판정(save 시 blob 있으면 file_size 설정됨).
-        "has_blob": bool(a.file_size),
+        #   manifest artifact 는 blob 대신 조각 목록(작은 JSON)으로 조회 시 조립된다.
+        "has_blob": bool(a.file_size) or bool(a.page_manifest),
+        "page_manifest": a.page_manifest,
         "created_at": a.created_at.isoformat() if a.created_at else None,
         "updated_at": a.updated_at.isoformat() if a.updated_at else None,
     }
@@ -1165,8 +1195,12 @@ def save_pdf_artifact(*, manual: str, artifact_type: str, version: str | None =
                       page_from: int | None = None, page_to: int | None = None,
                       page_numbers: list | None = None, pdf_blob: bytes | None = None,
                       pdf_path: str | None = None, page_count: int | None = None,
-                      status: str = "generated", note: str = "") -> dict:
-    """PDF artifact 1건 기록. content_hash/file_size 는 blob 으로부터 자동 산출."""
+                      status: str = "generated", note: str = "",
+                      page_manifest: list | None = None) -> dict:
+    """PDF artifact 1건 기록. content_hash/file_size 는 blob 으로부터 자동 산출.
+
+    page_manifest(manual_pdf_blobs 조각 목록)를 주면 blob 없이 기록하고 content_hash 는
+    :func:`manifest_hash` — 같은 조각 구성이면 같은 hash(디스크 캐시 키)."""
     if not pg_enabled():
         return {"ok": False, "reason": "pg_disabled"}
     import hashlib
@@ -1174,11 +1208,13 @@ def save_pdf_artifact(*, manual: str, artifact_type: str, version: str | None =
     from backend.db.session import get_sessionmaker
     fsize = len(pdf_blob) if pdf_blob is not None else None
     chash = hashlib.sha256(pdf_blob).hexdigest() if pdf_blob is not None else None
+    if page_manifest is not None and pdf_blob is None:
+        chash = manifest_hash(page_manifest)
     with get_sessionmaker()() as session:
         a = ManualPdfArtifact(
             manual=manual, artifact_type=artifact_type, version=version, run_id=run_id,
             source=source, page_from=page_from, page_to=page_to, page_numbers=page_numbers,
-            pdf_blob=pdf_blob, pdf_path=pdf_path, page_count=page_count,
+            pdf_blob=pdf_blob, page_manifest=page_manifest, pdf_path=pdf_path, page_count=page_count,
             file_size=fsize, content_hash=chash, status=status, note=note or None,
         )
         session.add(a)
@@ -1233,15 +1269,115 @@ def get_pdf_artifact(artifact_id: int, *, with_blob: bool = False) -> dict | Non
 
 
 def get_pdf_artifact_blob(artifact_id: int) -> bytes | None:
-    """선택된 id 1건의 pdf_blob 만 단일 컬럼으로 조회(목록/메타 조회와 절대 섞지 않음)."""
+    """선택된 id 1건의 pdf_blob 만 단일 컬럼으로 조회(목록/메타 조회와 절대 섞지 않음).
+
+    manifest artifact 는 조각을 조립한 PDF bytes(디스크 캐시 경유)를 돌려준다."""
     if not pg_enabled():
         return None
     from sqlalchemy import select
     from backend.db.models.manual_update import ManualPdfArtifact
     from backend.db.session import get_sessionmaker
     with get_sessionmaker()() as session:
-        return session.scalar(
+        blob = session.scalar(
             select(ManualPdfArtifact.pdf_blob).where(ManualPdfArtifact.id == artifact_id))
+        if blob is not None:
+            return blob
+        row = session.execute(
+            select(ManualPdfArtifact.content_hash, ManualPdfArtifact.page_manifest)
+            .where(ManualPdfArtifact.id == artifact_id)).first()
+    if not row or not row.page_manifest:
+        return None
+    from backend.services import pdf_artifact_cache as _pc
+    path = _pc.materialize(artifact_id, row.content_hash, manifest=row.page_manifest)
+    if not path:
+        return None
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _iter_bytea(col, where, chunk_size: int):
+    """bytea 컬럼 1건을 substring(offset, len) 으로 잘라 순서대로 yield(전체를 한 번에 SELECT 안 함)."""
+    from sqlalchemy import func as safunc, select
+    from backend.db.session import get_sessionmaker
+    with get_sessionmaker()() as session:
+        total = session.scalar(select(safunc.length(col)).where(where))
+        offset = 0
+        while total and offset < total:
+            chunk = session.scalar(select(safunc.substring(col, offset + 1, chunk_size)).where(where))
+            if not chunk:
+                break
+            yield bytes(chunk)
+            offset += len(chunk)
+
+
+def iter_pdf_artifact_blob(artifact_id: int, chunk_size: int = 4 * 1024 * 1024):
+    """선택된 id 1건의 pdf_blob 을 chunk_size 단위 bytes 로 순서대로 yield(blob 없으면 아무것도 안 냄).
+
+    bytea 전체를 한 번에 SELECT 하지 않고 substring(offset, len) 으로 잘라 읽는다 —
+    수백 페이지 전체 매뉴얼도 프로세스 메모리에는 chunk 1개만 올라온다(SSL EOF/OOM 방지).
+    manifest artifact(pdf_blob 없음)는 아무것도 내지 않는다 — pdf_artifact_cache 가 조립."""
+    if not pg_enabled():
+        return
+    from backend.db.models.manual_update import ManualPdfArtifact
+    yield from _iter_bytea(ManualPdfArtifact.pdf_blob, ManualPdfArtifact.id == artifact_id, chunk_size)
+
+
+# ── 내용 주소 PDF 조각 저장소(manual_pdf_blobs) ───────────────────────────────
+def manifest_hash(manifest: list) -> str:
+    """page_manifest 의 정규화 JSON sha256 — 조각 구성이 같으면 같은 값."""
+    import hashlib
+    import json
+    norm = [{k: seg[k] for k in ("hash", "from", "to") if seg.get(k) is not None} for seg in manifest]
+    return hashlib.sha256(json.dumps(norm, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+def put_pdf_blob(data: bytes, *, page_count: int | None = None) -> str:
+    """PDF 조각을 내용 hash 로 1회만 저장하고 hash 반환(이미 있으면 쓰기 없음)."""
+    import hashlib
+    from sqlalchemy import select
+    from sqlalchemy.exc import IntegrityError
+    from backend.db.models.manual_update import ManualPdfBlob
+    from backend.db.session import get_sessionmaker
+    h = hashlib.sha256(data).hexdigest()
+    with get_sessionmaker()() as session:
+        if session.scalar(select(ManualPdfBlob.content_hash).where(ManualPdfBlob.content_hash == h)):
+            return h
+        if page_count is None:
+            try:
+                import fitz
+                with fitz.open(stream=data, filetype="pdf") as d:
+                    page_count = d.page_count
+            except Exception:
+                page_count = None
+        session.add(ManualPdfBlob(content_hash=h, pdf_blob=data, page_count=page_count,
+                                  byte_size=len(data)))
+        try:
+            session.commit()
+        except IntegrityError:       # 동시 저장 — 같은 내용이므로 무시
+            session.rollback()
+    return h
+
+
+def get_pdf_blob_meta(content_hashes) -> dict:
+    """{hash: {"page_count", "byte_size"}} — 존재하는 조각만(blob 미적재)."""
+    from sqlalchemy import select
+    from backend.db.models.manual_update import ManualPdfBlob
+    from backend.db.session import get_sessionmaker
+    hs = sorted(set(content_hashes))
+    if not hs:
+        return {}
+    with get_sessionmaker()() as session:
+        rows = session.execute(
+            select(ManualPdfBlob.content_hash, ManualPdfBlob.page_count, ManualPdfBlob.byte_size)
+            .where(ManualPdfBlob.content_hash.in_(hs))).all()
+    return {h: {"page_count": pc, "byte_size": bs} for h, pc, bs in rows}
+
+
+def iter_pdf_blob(content_hash: str, chunk_size: int = 4 * 1024 * 1024):
+    """manual_pdf_blobs 1건을 chunk 단위로 yield(없으면 아무것도 안 냄)."""
+    from backend.db.models.manual_update import ManualPdfBlob
+    yield from _iter_bytea(ManualPdfBlob.pdf_blob, ManualPdfBlob.content_hash == content_hash,
+                           chunk_size)
 
 
 def get_latest_pdf_artifact(manual: str, page_no: int | None = None) -> dict | None:
@@ -1311,12 +1447,14 @@ def pdf_artifact_summary(manual: str | None = None) -> dict:
     return out
 
 
-# ── full PDF 합성(PyMuPDF 스플라이스, 검토용) ────────────────────────────────
+# ── full PDF 합성(조각 manifest 스플라이스, 검토용) ─────────────────────────
 # 검토용 "완전한 PDF": 배포본 전체 매뉴얼 PDF 에 이미 렌더된 변경 페이지 artifact 를
-# 해당 위치에 끼워넣어 '변경 반영된 완전한 PDF(검토용·운영 미반영)' 를 만든다.
-# node/playwright 불필요(변경 페이지는 worker 가 이미 렌더). 결과는 full_pdf artifact
-# 로 캐시하되, worker/node 가 재렌더한 '진짜' full_pdf 및 staging full PDF 와 반드시
-# 구분한다. 구분 마커(note):  "purpose=review_splice;generator=pymupdf_splice;source_hash=…"
+# 해당 위치에 끼워넣은 '변경 반영된 완전한 PDF(검토용·운영 미반영)'. 배포본은 조각 저장소
+# (manual_pdf_blobs)에 hash 로 1회만 저장하고, 합성 결과는 "배포본 p1-9 + 변경쪽 hash +
+# 배포본 p11-…" 같은 page_manifest 로만 기록한다 → 버전당 저장량·합성 시간은 변경 페이지 수에
+# 비례한다. 실제 PDF 는 조회 시 pdf_artifact_cache 가 조립(manifest hash 로 디스크 캐시).
+# worker/node 가 재렌더한 '진짜' full_pdf 및 staging full PDF 와 반드시 구분한다.
+# 구분 마커(note):  "purpose=review_splice;generator=pymupdf_splice;source_hash=…"
 # cleanup 은 이 마커가 있는 review_splice artifact 만 삭제 → worker full_pdf 는 절대 보존.
 _SPLICE_PURPOSE = "review_splice"
 _SPLICE_GENERATOR = "pymupdf_splice"
@@ -1345,8 +1483,18 @@ def get_worker_full_pdf(manual: str, version: str | None = None) -> dict | None:
     return rows[0] if rows else None
 
 
+def _artifact_segments(a: dict) -> list[dict] | None:
+    """artifact → manifest 조각 목록. 레거시(pdf_blob) artifact 는 조각 저장소로 옮겨 1조각."""
+    if a.get("page_manifest"):
+        return list(a["page_manifest"])
+    blob = get_pdf_artifact_blob(a["id"])
+    if not blob:
+        return None
+    return [{"hash": put_pdf_blob(blob, page_count=a.get("page_count"))}]
+
+
 def _changed_components(manual: str, version: str) -> list[dict]:
-    """(manual, version) 의 변경 페이지 artifact(blob 포함)를 page_from 순으로 반환."""
+    """(manual, version) 의 변경 페이지 artifact 를 page_from 순 {page_from, page_to, segments} 로 반환."""
     out: list[dict] = []
     for a in get_pdf_artifacts(manual, version):
         if a.get("artifact_type") not in ("changed_page", "changed_page_bundle"):
@@ -1359,77 +1507,77 @@ def _changed_components(manual: str, version: str) -> list[dict]:
             pf, pt = min(nums), max(nums)
         else:
             pt = a.get("page_to") or pf
-        blob = get_pdf_artifact_blob(a["id"])
-        if not blob:
+        segs = _artifact_segments(a)
+        if not segs:
             continue
-        out.append({"page_from": int(pf), "page_to": int(pt),
-                    "content_hash": a.get("content_hash") or str(a["id"]), "blob": blob})
+        out.append({"page_from": int(pf), "page_to": int(pt), "segments": segs})
     out.sort(key=lambda c: c["page_from"])
     return out
 
 
-def splice_changed_pages_into_full(base_pdf_bytes: bytes, components: list[dict]) -> bytes:
-    """배포본 전체 PDF(base)의 변경 구간을 components(렌더된 변경 페이지 PDF)로 교체.
+def splice_manifest(base_hash: str, base_page_count: int, components: list[dict]) -> list[dict]:
+    """배포본(base_hash, 1..base_page_count)의 변경 구간을 components 조각으로 교체한 manifest.
 
-    page_from 내림차순으로 처리해 앞 페이지 인덱스가 흔들리지 않게 한다.
-    modified(동일 페이지 수)는 1:1 정확 교체, 페이지 증감 케이스는 근사
-    (시작 인덱스에 변경 페이지를 삽입). 1-based 페이지 번호 기준."""
-    import fitz
-    base = fitz.open(stream=base_pdf_bytes, filetype="pdf")
-    try:
-        for c in sorted(components, key=lambda x: x["page_from"], reverse=True):
-            pf = int(c["page_from"]); pt = int(c["page_to"] or pf)
-            i0 = max(0, pf - 1)
-            if i0 >= base.page_count:
-                continue
-            i1 = min(base.page_count - 1, pt - 1)
-            repl = fitz.open(stream=c["blob"], filetype="pdf")
-            try:
-                if i0 <= i1:
-                    base.delete_pages(from_page=i0, to_page=i1)
-                base.insert_pdf(repl, start_at=i0)
-            finally:
-                repl.close()
-        return base.tobytes(deflate=True, garbage=3)
-    finally:
-        base.close()
+    modified(동일 페이지 수)는 1:1 정확 교체, 페이지 증감 케이스는 근사(구간 시작 위치에
+    변경 페이지 삽입). 배포본 범위를 벗어난 구간은 무시. 1-based 페이지 번호 기준."""
+    out: list[dict] = []
+    cursor = 1
+    for c in sorted(components, key=lambda x: x["page_from"]):
+        pf = int(c["page_from"]); pt = int(c["page_to"] or pf)
+        if pf > base_page_count:
+            continue
+        if pf > cursor:
+            out.append({"hash": base_hash, "from": cursor, "to": pf - 1})
+        out.extend(c["segments"])
+        cursor = max(cursor, min(pt, base_page_count) + 1)
+    if cursor <= base_page_count:
+        out.append({"hash": base_hash, "from": cursor, "to": base_page_count})
+    return out
 
 
-def compose_full_pdf_blob(manual: str, version: str, base_pdf_bytes: bytes,
-                          base_hash: str) -> dict | None:
-    """변경 페이지 artifact 가 있으면 base 에 스플라이스해 '검토용' full_pdf blob 을 만들고
-    review_splice full_pdf artifact 로 캐시한다(입력 동일하면 재사용). 없으면 None.
+def manifest_page_count(manifest: list[dict]) -> int | None:
+    """manifest 총 페이지 수(범위 없는 조각은 저장소 page_count). 알 수 없으면 None."""
+    whole = [seg["hash"] for seg in manifest if not seg.get("from")]
+    meta = get_pdf_blob_meta(whole)
+    total = 0
+    for seg in manifest:
+        if seg.get("from"):
+            total += int(seg.get("to") or seg["from"]) - int(seg["from"]) + 1
+        else:
+            pc = (meta.get(seg["hash"]) or {}).get("page_count")
+            if pc is None:
+                return None
+            total += int(pc)
+    return total
 
+
+def compose_full_pdf_manifest(manual: str, version: str, base_pdf_bytes: bytes,
+                              base_hash: str) -> dict | None:
+    """변경 페이지 artifact 가 있으면 배포본에 스플라이스한 '검토용' full_pdf 를 manifest 로
+    기록한다(입력 동일하면 재사용). 없으면 None. PDF bytes 는 만들지 않는다(조회 시 조립).
+
+    배포본은 조각 저장소에 hash 로 1회만 저장(base_hash 가 이미 있으면 재저장·재해시 없음).
     캐시/정리 모두 review_splice 마커가 있는 artifact 만 대상으로 한다 → worker/node 가
     만든 진짜 full_pdf 와 staging full PDF 는 절대 건드리지 않는다.
-    반환: {"blob", "artifact_id", "cached", "page_count", "components", "review_only": True}."""
+    반환: {"artifact_id", "content_hash", "cached", "page_count", "components", "review_only": True}."""
     if not pg_enabled():
         return None
     components = _changed_components(manual, version)
     if not components:
         return None
-    import hashlib
-    src = base_hash + "|" + "|".join(
-        f"{c['page_from']}-{c['page_to']}:{c['content_hash']}" for c in components)
-    src_hash = hashlib.sha256(src.encode("utf-8")).hexdigest()
-    note_tag = _splice_note(src_hash)
+    base_meta = get_pdf_blob_meta([base_hash]).get(base_hash) if base_hash else None
+    if base_meta is None:
+        base_hash = put_pdf_blob(base_pdf_bytes)
+        base_meta = get_pdf_blob_meta([base_hash]).get(base_hash) or {}
+    manifest = splice_manifest(base_hash, int(base_meta.get("page_count") or 0), components)
+    note_tag = _splice_note(manifest_hash(manifest))
     # 동일 입력 캐시 재사용 (review_splice + 동일 source_hash)
     for a in get_pdf_artifacts(manual, version):
         if (a.get("artifact_type") == "full_pdf" and is_review_splice_note(a.get("note"))
                 and (a.get("note") or "") == note_tag):
-            blob = get_pdf_artifact_blob(a["id"])
-            if blob:
-                return {"blob": blob, "artifact_id": a["id"], "cached": True,
-                        "page_count": a.get("page_count"), "components": len(components),
-                        "review_only": True}
-    composed = splice_changed_pages_into_full(base_pdf_bytes, components)
-    pc = None
-    try:
-        import fitz
-        with fitz.open(stream=composed, filetype="pdf") as _d:
-            pc = _d.page_count
-    except Exception:
-        pass
+            return {"artifact_id": a["id"], "content_hash": a.get("content_hash"), "cached": True,
+                    "page_count": a.get("page_count"), "components": len(components),
+                    "review_only": True}
     # 옛 review_splice 캐시만 정리(같은 manual/version). worker full_pdf/staging 은 보존.
     for a in get_pdf_artifacts(manual, version):
         if a.get("artifact_type") == "full_pdf" and is_review_splice_note(a.get("note")):
@@ -1437,8 +1585,10 @@ def compose_full_pdf_blob(manual: str, version: str, base_pdf_bytes: bytes,
                 delete_pdf_artifact(a["id"])
             except Exception:
                 pass
+    pc = manifest_page_count(manifest)
     saved = save_pdf_artifact(manual=manual, artifact_type="full_pdf", version=version,
-                              source="review_splice", pdf_blob=composed, page_count=pc,
+                              source="review_splice", page_manifest=manifest, page_count=pc,
                               status="generated", note=note_tag)
-    return {"blob": composed, "artifact_id": saved.get("id"), "cached": False,
-            "page_count": pc, "components": len(components), "review_only": True}
+    return {"artifact_id": saved.get("id"), "content_hash": saved.get("content_hash"),
+            "cached": False, "page_count": pc, "components": len(components),
+            "review_only": True}
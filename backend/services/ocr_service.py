@@ -30,6 +30,9 @@ try:
 except Exception:
     pytesseract = None
 
+# 모든 Tesseract 호출은 tess_engine 경유 — tesserocr 상주 핸들 풀, 없으면 pytesseract.
+from backend.services import tess_engine as _tess
+
 # OmniMRZ singleton — PaddleOCR model is loaded on first access.
 # Cached at module level so each uvicorn worker loads models once.
 import threading as _threading
@@ -104,10 +107,10 @@ _NAME_BAN = {
 # ─────────────────────────────────────────────────────────────────────────────
 
 def _ocr(img, lang="kor", config=""):
-    if pytesseract is None or img is None:
+    if not _tess.available() or img is None:
         return ""
     try:
-        return pytesseract.image_to_string(img, lang=lang, config=config) or ""
+        return _tess.image_to_string(img, lang=lang, config=config)
     except Exception:
         return ""
 
@@ -136,29 +139,44 @@ def ocr_try_all(
     psms=(6, 7),
     pres=("raw", "binarize"),
     max_tries=None,
+    deadline=None,
 ):
+    """(lang × psm × pre) 격자 중 가장 긴 텍스트를 고른다.
+
+    후보는 ocr_variant_executor 워커 풀에서 병렬로 돈다. 동점은 격자 순서가 앞선 후보가
+    이기므로 직렬 실행과 결과가 같다. max_tries 는 격자 순서 앞에서부터 자른다.
+    deadline(monotonic) 을 넘기면 그때까지의 최선을 반환한다.
+    """
     best = {"text": "", "lang": None, "config": "", "pre": None, "score": -1}
-    if pytesseract is None or img is None:
+    if not _tess.available() or img is None:
         return best
 
-    tried = 0
-    for lang in langs:
-        for psm in psms:
-            for pre in pres:
-                proc = img
-                if pre == "binarize":
-                    proc = _binarize(img)
-                cfg = f"--oem 3 --psm {psm}"
-                try:
-                    txt = pytesseract.image_to_string(proc, lang=lang, config=cfg) or ""
-                except Exception:
-                    txt = ""
-                score = len(txt.strip())
-                if score > best["score"]:
-                    best.update(text=txt, lang=lang, config=cfg, pre=pre, score=score)
-                tried += 1
-                if max_tries is not None and tried >= max_tries:
-                    return best
+    from backend.services.ocr_variant_executor import Variant, run_variants
+
+    grid = [(lang, psm, pre) for lang in langs for psm in psms for pre in pres]
+    if max_tries is not None:
+        grid = grid[:max_tries]
+    # 워커들이 공유할 이진화 이미지는 제출 전에 1회만 만든다.
+    bin_img = _binarize(img) if any(pre == "binarize" for _l, _p, pre in grid) else None
+
+    def _variant(lang, psm, pre):
+        cfg = f"--oem 3 --psm {psm}"
+        proc = bin_img if pre == "binarize" else img
+
+        def _fn():
+            try:
+                txt = _tess.image_to_string(proc, lang=lang, config=cfg)
+            except Exception:
+                txt = ""
+            return {"text": txt, "lang": lang, "config": cfg, "pre": pre,
+                    "score": len(txt.strip())}
+        return Variant(f"{lang}/psm{psm}/{pre}", _fn)
+
+    variants = [_variant(*g) for g in grid]
+    run = run_variants("ocr_try_all", variants, evaluate=lambda r: (r["score"], r),
+                       deadline=deadline, reorder=False)
+    if run.best is not None:
+        best.update(run.best)
     return best
 
 
@@ -763,15 +781,10 @@ def _prep_mrz(img: Image.Image, target_w: int = 1200) -> Image.Image:
 
 
 def _tess_string(img: Image.Image, lang: str, config: str, timeout_s: int = 2) -> str:
-    if pytesseract is None:
+    if not _tess.available():
         return ""
     try:
-        return pytesseract.image_to_string(img, lang=lang, config=config, timeout=timeout_s) or ""
-    except TypeError:
-        try:
-            return pytesseract.image_to_string(img, lang=lang, config=config) or ""
-        except Exception:
-            return ""
+        return _tess.image_to_string(img, lang=lang, config=config, timeout=timeout_s)
     except Exception:
         return ""
 
@@ -864,84 +877,125 @@ def _iter_mrz_candidate_bands(im: Image.Image):
 # 5) 여권 파서
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _passport_tess_mrz(img: Image.Image) -> dict | None:
+def _mrz_band_outcome(label: str, prep: Image.Image, langs, timeout_s: int) -> dict:
+    """밴드 1개(전처리 완료)를 langs 순서로 OCR → 최선 MRZ pair 후보.
+
+    반환 {"sc", "parsed", "label", "check_ok"} — parsed 는 여권번호가 확보된 경우만 채운다.
+    """
+    out = {"sc": -1, "parsed": None, "label": label, "check_ok": False}
+    for lang in langs:
+        txt = _tess_string(prep, lang, "--oem 3 --psm 6", timeout_s=timeout_s)
+        if not txt:
+            continue
+        L1, L2, sc = find_best_mrz_pair_from_text(txt)
+        if sc <= out["sc"]:
+            continue
+        out["sc"] = sc
+        parsed = _parse_mrz_pair(L1, L2) if (L1 and L2) else {}
+        if parsed.get("여권"):
+            rep = _mrz_check_report(L1, L2)
+            out.update(parsed=parsed, label=f"{label}/{lang}",
+                       check_ok=bool(rep.get("doc_check_ok") and rep.get("birth_check_ok")
+                                     and rep.get("expiry_check_ok")))
+            if out["check_ok"]:
+                break
+    return out
+
+
+def _mrz_rotation_outcome(img: Image.Image, angle: int, langs, timeout_s: int) -> dict:
+    """회전 1개: 회전 → 후보 밴드들 → 밴드별 OCR. 체크디지트 통과 밴드에서 조기 종료."""
+    try:
+        rotated = img.rotate(angle, expand=True, fillcolor=255)
+    except Exception:
+        try:
+            rotated = img.rotate(angle, expand=True)
+        except Exception:
+            return {"sc": -1, "parsed": None, "label": f"rot{angle}", "check_ok": False}
+    best = {"sc": -1, "parsed": None, "label": f"rot{angle}", "check_ok": False}
+    for band_label, band in _iter_mrz_candidate_bands(rotated):
+        res = _mrz_band_outcome(f"rot{angle}/{band_label}", _prep_mrz(band), langs, timeout_s)
+        if res["parsed"] and (best["parsed"] is None or res["sc"] > best["sc"]):
+            best = res
+        elif best["parsed"] is None and res["sc"] > best["sc"]:
+            best["sc"] = res["sc"]
+        if best["parsed"] and (best["check_ok"] or best["sc"] >= 6):
+            break
+    return best
+
+
+def _mrz_outcome_key(o: dict):
+    """여권번호 확보 후보 우선, 그다음 MRZ 점수."""
+    return (o["parsed"] is not None, o["sc"])
+
+
+def _passport_tess_mrz(img: Image.Image, deadline: float | None = None) -> dict | None:
     """
     Tesseract + ocrb 기반 여권 MRZ 파서 (빠른 경로, ~1-3s).
 
     _iter_mrz_candidate_bands / _prep_mrz / _tess_string / find_best_mrz_pair_from_text /
-    _parse_mrz_pair 를 활용하는 기존 MRZ 파이프라인.
+    _parse_mrz_pair 를 활용하는 기존 MRZ 파이프라인. 후보(밴드 × 언어, 회전)는
+    ocr_variant_executor 로 병렬 실행하고, 세 check digit(_mrz_check_report)을 모두 통과한
+    결과가 나오면 나머지 후보를 취소한다. deadline(monotonic, 기본 스캔 예산)을 넘기면
+    그때까지의 최선을 쓴다.
 
-    반환: 파싱 성공(여권번호 확보) 시 표준 필드 dict, 실패 시 None.
+    반환: 파싱 성공(여권번호 확보) 시 표준 필드 dict(+ ``_ocr_report``: 승자 후보/시도 수),
+    실패 시 None.
     """
-    if pytesseract is None:
+    if not _tess.available():
         return None
 
-    best_parsed: dict | None = None
-    best_sc = -1
-
-    for _, band in _iter_mrz_candidate_bands(img):
-        prep = _prep_mrz(band)
-        for lang in ("ocrb", "eng"):
-            txt = _tess_string(prep, lang, "--oem 3 --psm 6", timeout_s=5)
-            if not txt:
-                continue
-            L1, L2, sc = find_best_mrz_pair_from_text(txt)
-            if sc > best_sc:
-                parsed = _parse_mrz_pair(L1, L2) if (L1 and L2) else {}
-                if parsed.get("여권"):
-                    # 여권번호까지 확보된 경우만 최적 후보로 채택
-                    best_sc = sc
-                    best_parsed = parsed
-                elif sc > best_sc:
-                    # 여권번호 없어도 score 갱신은 유지 (다른 밴드 탐색 우선순위용)
-                    best_sc = sc
-            if best_parsed and best_sc >= 8:
-                break  # 충분히 높은 score + 여권번호 확보 → 조기 종료
-        if best_parsed and best_sc >= 8:
-            break
+    from backend.services.ocr_variant_executor import Variant, run_variants, scan_deadline
+
+    if deadline is None:
+        deadline = scan_deadline()
+
+    # ── 1단계: 원래 방향 — 밴드 × 언어 ────────────────────────────────────────
+    # 여권번호 + (check digit 3종 통과 또는 score ≥ 8) 이면 충분히 확실 → 조기 종료.
+    bands = [(label, _prep_mrz(band)) for label, band in _iter_mrz_candidate_bands(img)]
+    variants = [
+        Variant(f"{label}/{lang}",
+                (lambda prep=prep, label=label, lang=lang:
+                 _mrz_band_outcome(label, prep, (lang,), 5)))
+        for label, prep in bands for lang in ("ocrb", "eng")
+    ]
+    run = run_variants(
+        "passport_mrz", variants,
+        evaluate=lambda o: (_mrz_outcome_key(o), o),
+        accept=lambda o: bool(o["parsed"]) and (o["check_ok"] or o["sc"] >= 8),
+        deadline=deadline,
+    )
+    best = run.best or {"sc": -1, "parsed": None}
+    reports = [run.report()]
 
     # ── Orientation + deskew fallback ────────────────────────────────────────
     # Triggers when main pass (original orientation) produced no confident result.
     #
-    # Priority order:
+    # Priority order (기본; 실제 제출 순서는 과거 승리 횟수가 많은 회전이 먼저):
     #   90°, 270° — passport placed 90° sideways on scanner (most common failure)
     #   180°       — upside-down placement
     #   ±5°, ±10°, ±3° — genuine slight tilt on otherwise correct orientation
     #
     # For major rotations (90/270/180): try both "ocrb" and "eng".
     # For fine tilts: ocrb only (lean path).
-    if not best_parsed or best_sc < 6:
+    if (not best["parsed"] or best["sc"] < 6) and not run.timed_out:
         _ROT_LANGS = {90: ("ocrb", "eng"), 270: ("ocrb", "eng"), 180: ("ocrb", "eng")}
-        for angle in (90, 270, 180, -5, 5, -10, 10, -3, 3):
-            if best_parsed and best_sc >= 6:
-                break
-            try:
-                rotated = img.rotate(angle, expand=True, fillcolor=255)
-            except Exception:
-                try:
-                    rotated = img.rotate(angle, expand=True)
-                except Exception:
-                    continue
-            langs = _ROT_LANGS.get(angle, ("ocrb",))
-            for _, band in _iter_mrz_candidate_bands(rotated):
-                prep = _prep_mrz(band)
-                for lang in langs:
-                    txt = _tess_string(prep, lang, "--oem 3 --psm 6", timeout_s=4)
-                    if not txt:
-                        continue
-                    L1, L2, sc = find_best_mrz_pair_from_text(txt)
-                    if sc > best_sc:
-                        parsed = _parse_mrz_pair(L1, L2) if (L1 and L2) else {}
-                        if parsed.get("여권"):
-                            best_sc = sc
-                            best_parsed = parsed
-                        elif sc > best_sc:
-                            best_sc = sc
-                    if best_parsed and best_sc >= 6:
-                        break
-                if best_parsed and best_sc >= 6:
-                    break
+        rot_variants = [
+            Variant(f"rot{angle}",
+                    (lambda angle=angle:
+                     _mrz_rotation_outcome(img, angle, _ROT_LANGS.get(angle, ("ocrb",)), 4)))
+            for angle in (90, 270, 180, -5, 5, -10, 10, -3, 3)
+        ]
+        rot = run_variants(
+            "passport_mrz_rotation", rot_variants,
+            evaluate=lambda o: (_mrz_outcome_key(o), o),
+            accept=lambda o: bool(o["parsed"]) and (o["check_ok"] or o["sc"] >= 6),
+            deadline=deadline,
+        )
+        reports.append(rot.report())
+        if rot.best is not None and _mrz_outcome_key(rot.best) > _mrz_outcome_key(best):
+            best = rot.best
 
+    best_parsed = best["parsed"]
     if not best_parsed:
         return None
 
@@ -958,6 +1012,8 @@ def _passport_tess_mrz(img: Image.Image) -> dict | None:
         "생년월일": best_parsed.get("생년월일", ""),
         "_raw_L1":  None,
         "_raw_L2":  None,
+        "_ocr_report": {"winner": best.get("label"), "check_ok": best.get("check_ok", False),
+                        "stages": reports},
     }
 
 
@@ -1630,7 +1686,9 @@ def parse_arc(img, fast: bool = False, passport_dob: str = ""):
     try:
         # fast=True: 1회(kor+eng, psm=6)만 시도 — 호출 수 2→1로 감소
         max_tries = 1 if fast else None
-        t_top = ocr_try_all(top, langs=("kor+eng",) if fast else ("kor", "kor+eng"), max_tries=max_tries)["text"]
+        from backend.services.ocr_variant_executor import scan_deadline
+        t_top = ocr_try_all(top, langs=("kor+eng",) if fast else ("kor", "kor+eng"),
+                            max_tries=max_tries, deadline=scan_deadline())["text"]
     except Exception:
         t_top = ""
     tn_top = t_top
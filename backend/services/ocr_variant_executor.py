@@ -0,0 +1,170 @@
+"""OCR 후보(variant) 병렬 실행기 — 조기 종료 + 스캔별 시간예산 + 승자 보고.
+
+``ocr_try_all`` 의 (언어 × psm × 전처리) 격자와 ``_passport_tess_mrz`` 의 (밴드 × 언어,
+회전 × 밴드 × 언어) 탐색은 과거 모두 직렬이었다. 각 후보는 결국 tesseract 서브프로세스
+1회라, 여기서는 후보들을 **제한된 워커 풀**에 올려 tesseract 프로세스를 동시에 최대
+``OCR_VARIANT_WORKERS`` 개까지 돌린다.
+
+* 워커는 스레드다 — 실제 CPU 작업은 pytesseract 가 띄우는 tesseract 프로세스에서 일어나고
+  스레드는 그 종료를 기다리는 동안 GIL 을 놓는다. 파이썬 프로세스 풀(워커마다 PIL/numpy
+  재적재, 이미지 pickle)을 두지 않는 이유는 512MB 플랜 메모리 때문이다.
+* 후보는 **과거 승리 횟수** 내림차순(동률은 호출측 순서)으로 제출한다 — 자주 이기는
+  회전/밴드가 먼저 돈다.
+* ``accept(outcome)`` 가 참인 결과가 나오면 아직 시작 안 한 후보는 취소하고 바로 반환한다
+  (이미 돌고 있는 tesseract 는 각자 timeout 으로 끝난다).
+* ``deadline`` (time.monotonic 기준)을 넘기면 남은 후보를 취소하고 그때까지의 최선을 반환.
+* :class:`VariantRun` 에 승자 라벨, 시도/취소 수, 경과 시간이 남는다.
+
+``OCR_VARIANT_WORKERS=1`` 이면 과거처럼 한 번에 하나씩(제출 순서대로) 실행된다.
+tesseract 자체 OpenMP 스레드가 병렬 실행과 겹쳐 과부하되지 않도록 병렬일 때는
+``OMP_THREAD_LIMIT=1`` 을 기본값으로 둔다(이미 설정돼 있으면 존중).
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Sequence
+
+OCR_VARIANT_WORKERS = max(1, int(os.environ.get("OCR_VARIANT_WORKERS", "")
+                                 or min(4, os.cpu_count() or 1)))
+# 스캔 1건 전체(모든 단계 합산) 시간예산(초). 라우터 25초 예산보다 짧게 잡아 응답 여유를 둔다.
+OCR_SCAN_BUDGET_SECONDS = float(os.environ.get("OCR_SCAN_BUDGET_SECONDS", "20") or "20")
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+# (그룹, 라벨) → 승리 횟수. 프로세스 로컬 학습값(재시작 시 초기화).
+_wins: dict[tuple[str, str], int] = {}
+_wins_lock = threading.Lock()
+
+
+@dataclass
+class Variant:
+    """실행 후보 1개. ``fn()`` 의 반환값이 ``evaluate`` 로 넘어간다."""
+    label: str
+    fn: Callable[[], Any]
+
+
+@dataclass
+class VariantRun:
+    """병렬 실행 결과 + 보고."""
+    best: Any = None
+    best_label: Optional[str] = None
+    accepted: bool = False
+    timed_out: bool = False
+    tried: int = 0
+    cancelled: int = 0
+    elapsed_ms: float = 0.0
+    labels: list[str] = field(default_factory=list)
+
+    def report(self) -> dict:
+        return {
+            "winner": self.best_label,
+            "accepted": self.accepted,
+            "timed_out": self.timed_out,
+            "tried": self.tried,
+            "cancelled": self.cancelled,
+            "elapsed_ms": round(self.elapsed_ms, 1),
+        }
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                if OCR_VARIANT_WORKERS > 1:
+                    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+                _pool = ThreadPoolExecutor(max_workers=OCR_VARIANT_WORKERS,
+                                           thread_name_prefix="ocr-variant")
+    return _pool
+
+
+def scan_deadline(budget_s: Optional[float] = None) -> float:
+    """지금부터 스캔 시간예산 후의 monotonic 시각."""
+    return time.monotonic() + (OCR_SCAN_BUDGET_SECONDS if budget_s is None else budget_s)
+
+
+def order_by_wins(group: str, variants: Sequence[Variant]) -> list[Variant]:
+    """과거 승리 횟수 내림차순(안정 정렬 — 동률은 입력 순서)."""
+    with _wins_lock:
+        wins = {v.label: _wins.get((group, v.label), 0) for v in variants}
+    return sorted(variants, key=lambda v: -wins[v.label])
+
+
+def record_win(group: str, label: str) -> None:
+    with _wins_lock:
+        _wins[(group, label)] = _wins.get((group, label), 0) + 1
+
+
+def win_stats() -> dict[str, dict[str, int]]:
+    with _wins_lock:
+        out: dict[str, dict[str, int]] = {}
+        for (group, label), n in _wins.items():
+            out.setdefault(group, {})[label] = n
+        return out
+
+
+def run_variants(
+    group: str,
+    variants: Sequence[Variant],
+    *,
+    evaluate: Callable[[Any], tuple[Any, Any]],
+    accept: Callable[[Any], bool] = lambda _o: False,
+    deadline: Optional[float] = None,
+    reorder: bool = True,
+) -> VariantRun:
+    """후보들을 병렬 실행해 최선 결과를 고른다.
+
+    evaluate(result) -> (정렬키, outcome): 정렬키가 큰 outcome 이 최선. 동점이면 제출
+    순서가 앞선 후보가 이긴다(직렬 실행과 같은 결정론적 결과).
+    accept(outcome) 이 참이면 조기 종료. 승자는 ``record_win`` 으로 다음 순서에 반영된다.
+    """
+    t0 = time.monotonic()
+    run = VariantRun()
+    ordered = order_by_wins(group, variants) if reorder else list(variants)
+    run.labels = [v.label for v in ordered]
+    if not ordered:
+        return run
+
+    pool = _executor()
+    futures: dict[Future, int] = {pool.submit(v.fn): i for i, v in enumerate(ordered)}
+    pending = set(futures)
+    best_key: Any = None
+    best_idx = -1
+    try:
+        while pending:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                run.timed_out = True
+                break
+            for fut in sorted(done, key=futures.__getitem__):
+                idx = futures[fut]
+                run.tried += 1
+                try:
+                    key, outcome = evaluate(fut.result())
+                except Exception:
+                    continue
+                if key is None:
+                    continue
+                if best_idx < 0 or key > best_key or (key == best_key and idx < best_idx):
+                    best_key, best_idx, run.best = key, idx, outcome
+                if accept(outcome):
+                    run.accepted = True
+                    best_key, best_idx, run.best = key, idx, outcome
+                    break
+            if run.accepted:
+                break
+    finally:
+        for fut in pending:
+            if fut.cancel():
+                run.cancelled += 1
+    if best_idx >= 0:
+        run.best_label = ordered[best_idx].label
+        record_win(group, run.best_label)
+    run.elapsed_ms = (time.monotonic() - t0) * 1000
+    return run
@@ -0,0 +1,226 @@
+"""매뉴얼 PDF 페이지 텍스트 저장소 — (PDF 내용 hash, 추출기 버전, 페이지) 주소, SQLite.
+
+같은 매뉴얼 PDF 를 여러 곳(업로드 변경감지, 이전 운영본 재추출, recompare, manual_ref_rematch,
+audit_manual_mapping*)이 각자 PyMuPDF 로 다시 파싱했다. 여기서는 PDF 1개를 한 번만 파싱해
+페이지별 텍스트·정규화 텍스트(manual_update_local.normalize)·블록 좌표를 저장하고, 이후엔
+필요한 페이지만 읽는다.
+
+* 키: ``pdf_hash``(파일 bytes sha256) + ``EXTRACTOR_VERSION`` + ``page_no``(1-based).
+  추출 방식이 바뀌면 EXTRACTOR_VERSION 을 올린다 → 옛 행은 자연히 무시된다.
+* 값은 zlib 압축(text / norm / blocks JSON). 한 행 = 한 페이지라 부분 조회가 싸다.
+* :func:`page_texts` 는 접근한 페이지만 로드하는 lazy 매핑을 돌려준다.
+* 저장소를 못 쓰면(디스크/잠금 오류) 호출측은 기존처럼 직접 추출한다(:func:`ensure_pdf` 예외).
+
+``PAGE_TEXT_STORE_PATH`` (기본 MANUALS_DATA_DIR/page_text_store.sqlite3).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+log = logging.getLogger("page_text_store")
+
+EXTRACTOR_VERSION = "pymupdf-text-v1"
+
+_lock = threading.Lock()
+_ready: set = set()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pdf_doc (
+    pdf_hash   TEXT NOT NULL,
+    extractor  TEXT NOT NULL,
+    page_count INTEGER NOT NULL,
+    created_at TEXT NOT NULL DEFAULT (datetime('now')),
+    PRIMARY KEY (pdf_hash, extractor)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS page_text (
+    pdf_hash  TEXT NOT NULL,
+    extractor TEXT NOT NULL,
+    page_no   INTEGER NOT NULL,
+    width     REAL,
+    height    REAL,
+    text      BLOB NOT NULL,
+    norm      BLOB NOT NULL,
+    blocks    BLOB NOT NULL,
+    PRIMARY KEY (pdf_hash, extractor, page_no)
+) WITHOUT ROWID;
+"""
+
+PdfSource = Union[bytes, str, Path]
+
+
+def store_path() -> Path:
+    env = os.environ.get("PAGE_TEXT_STORE_PATH")
+    if env:
+        return Path(env)
+    try:
+        from config import MANUALS_DATA_DIR
+        base = Path(MANUALS_DATA_DIR)
+    except Exception:
+        env = os.environ.get("MANUALS_DATA_DIR")
+        base = Path(env) if env else Path(__file__).resolve().parents[1] / "data" / "manuals"
+    return base / "page_text_store.sqlite3"
+
+
+def _connect() -> sqlite3.Connection:
+    path = store_path()
+    conn = sqlite3.connect(str(path), timeout=30)
+    key = str(path)
+    if key not in _ready:
+        with _lock:
+            if key not in _ready:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                conn.commit()
+                _ready.add(key)
+    return conn
+
+
+def _pack(s: str) -> bytes:
+    return zlib.compress(s.encode("utf-8"), 6)
+
+
+def _unpack(b: bytes) -> str:
+    return zlib.decompress(b).decode("utf-8")
+
+
+def pdf_sha256(pdf: PdfSource) -> str:
+    if isinstance(pdf, (bytes, bytearray)):
+        return hashlib.sha256(pdf).hexdigest()
+    h = hashlib.sha256()
+    with open(pdf, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def page_count(pdf_hash: str) -> Optional[int]:
+    """저장된 PDF 의 페이지 수(없으면 None) — blob 을 읽지 않고 캐시 여부 확인용."""
+    conn = _connect()
+    try:
+        row = conn.execute("SELECT page_count FROM pdf_doc WHERE pdf_hash=? AND extractor=?",
+                           (pdf_hash, EXTRACTOR_VERSION)).fetchone()
+    finally:
+        conn.close()
+    return int(row[0]) if row else None
+
+
+def _extract_rows(pdf: PdfSource, pdf_hash: str) -> Iterator[tuple]:
+    import fitz
+    from backend.scripts.manual_update_local import normalize
+    doc = (fitz.open(stream=bytes(pdf), filetype="pdf") if isinstance(pdf, (bytes, bytearray))
+           else fitz.open(str(pdf)))
+    try:
+        for i in range(doc.page_count):
+            page = doc.load_page(i)
+            text = page.get_text() or ""
+            blocks = [[round(b[0], 1), round(b[1], 1), round(b[2], 1), round(b[3], 1), b[4]]
+                      for b in page.get_text("blocks") if b[6] == 0]
+            yield (pdf_hash, EXTRACTOR_VERSION, i + 1, page.rect.width, page.rect.height,
+                   _pack(text), _pack(normalize(text)),
+                   _pack(json.dumps(blocks, ensure_ascii=False, separators=(",", ":"))))
+    finally:
+        doc.close()
+
+
+def ensure_pdf(pdf: PdfSource, *, pdf_hash: Optional[str] = None) -> tuple[str, int]:
+    """PDF 페이지 텍스트가 저장돼 있음을 보장(없으면 1회 파싱·저장). 반환: (pdf_hash, page_count).
+
+    pdf_hash 를 알면(artifact content_hash 등) 넘겨서 재해시를 피한다."""
+    pdf_hash = pdf_hash or pdf_sha256(pdf)
+    n = page_count(pdf_hash)
+    if n is not None:
+        return pdf_hash, n
+    rows = list(_extract_rows(pdf, pdf_hash))
+    conn = _connect()
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO page_text "
+                "(pdf_hash, extractor, page_no, width, height, text, norm, blocks) "
+                "VALUES (?,?,?,?,?,?,?,?)", rows)
+            conn.execute("INSERT OR REPLACE INTO pdf_doc (pdf_hash, extractor, page_count) "
+                         "VALUES (?,?,?)", (pdf_hash, EXTRACTOR_VERSION, len(rows)))
+    finally:
+        conn.close()
+    return pdf_hash, len(rows)
+
+
+def get_pages(pdf_hash: str, pages: Optional[Iterable[int]] = None, *,
+              fields: tuple = ("text",)) -> dict[int, dict]:
+    """{page_no: {field: ...}} — pages 미지정 시 전체. fields ⊂ text/norm/blocks/size.
+    blocks 는 [[x0, y0, x1, y1, text], ...], size 는 (width, height)."""
+    cols = {"text": "text", "norm": "norm", "blocks": "blocks", "size": "width, height"}
+    sel = ", ".join(cols[f] for f in fields)
+    sql = f"SELECT page_no, {sel} FROM page_text WHERE pdf_hash=? AND extractor=?"
+    args: list = [pdf_hash, EXTRACTOR_VERSION]
+    want = sorted(set(pages)) if pages is not None else None
+    if want is not None:
+        if not want:
+            return {}
+        sql += f" AND page_no IN ({','.join('?' * len(want))})"
+        args += want
+    conn = _connect()
+    try:
+        rows = conn.execute(sql + " ORDER BY page_no", args).fetchall()
+    finally:
+        conn.close()
+    out: dict[int, dict] = {}
+    for row in rows:
+        rec, k = {}, 1
+        for f in fields:
+            if f == "size":
+                rec["size"] = (row[k], row[k + 1]); k += 2
+                continue
+            val = _unpack(row[k])
+            rec[f] = json.loads(val) if f == "blocks" else val
+            k += 1
+        out[row[0]] = rec
+    return out
+
+
+class PageTexts(Mapping):
+    """{page_no(1-based): text} lazy 매핑 — 접근한 페이지만 저장소에서 읽고 기억한다."""
+
+    def __init__(self, pdf_hash: str, count: int, *, field: str = "text"):
+        self.pdf_hash, self._count, self._field = pdf_hash, count, field
+        self._loaded: dict[int, str] = {}
+
+    def __getitem__(self, page_no: int) -> str:
+        if not 1 <= page_no <= self._count:
+            raise KeyError(page_no)
+        if page_no not in self._loaded:
+            rec = get_pages(self.pdf_hash, [page_no], fields=(self._field,)).get(page_no)
+            self._loaded[page_no] = rec[self._field] if rec else ""
+        return self._loaded[page_no]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(1, self._count + 1))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def load_all(self) -> dict[int, str]:
+        """남은 페이지를 한 번에 읽어 dict 로 반환(전 페이지 순회용)."""
+        missing = [p for p in self if p not in self._loaded]
+        if missing:
+            for p, rec in get_pages(self.pdf_hash, None if len(missing) == self._count else missing,
+                                    fields=(self._field,)).items():
+                self._loaded[p] = rec[self._field]
+        return {p: self._loaded.get(p, "") for p in self}
+
+
+def page_texts(pdf: PdfSource, *, normalized: bool = False,
+               pdf_hash: Optional[str] = None) -> PageTexts:
+    """PDF(경로/bytes) → lazy {page_no: text}. 처음 보는 PDF 면 1회 파싱해 저장."""
+    h, n = ensure_pdf(pdf, pdf_hash=pdf_hash)
+    return PageTexts(h, n, field="norm" if normalized else "text")
@@ -0,0 +1,196 @@
+"""매뉴얼 PDF artifact 디스크 캐시 — content_hash 주소, chunk 단위 적재.
+
+``/guidelines/manual-update/pdf`` 와 artifact ``/content`` 는 과거 PG bytea 전체를
+``get_pdf_artifact_blob`` 으로 읽어 한 응답에 실었다. 체류민원급 전체 매뉴얼은 수십 MB 라
+요청마다 워커 메모리에 통째로 올라가고(OOM), 긴 bytea 전송 중 SSL EOF 도 났다.
+
+여기서는 artifact 를 ``content_hash``(sha256) 이름의 파일로 1회만 내려받아 두고
+(:func:`materialize`), 라우터는 그 파일을 ``FileResponse`` 로 서빙한다 — Range 요청(뷰어가
+300쪽만 열 때)은 Starlette 가 파일 오프셋으로 처리하므로 전체를 메모리에 올리지 않는다.
+
+* 적재는 :func:`manual_update_pg_service.iter_pdf_artifact_blob` 으로 chunk 단위 → 임시파일
+  → sha256 검증 → 원자적 rename. 같은 hash 동시 적재는 hash 별 lock 으로 1회만.
+* 내용이 같으면 경로가 같으므로 무효화가 필요 없다(ETag = content_hash).
+* 전체 크기가 ``PDF_ARTIFACT_CACHE_MAX_MB`` 를 넘으면 오래 안 쓴(mtime) 파일부터 삭제.
+* 디스크 적재가 실패하면 호출측은 :func:`stream_chunks` 로 DB 에서 바로 흘려보낸다.
+* page_manifest artifact(번들/검토용 전체 PDF)는 조각 저장소(manual_pdf_blobs)의 조각을
+  각자 hash 파일로 받아 :func:`assemble` 로 이어붙인 뒤 manifest hash 이름으로 둔다.
+
+``PDF_ARTIFACT_CACHE_DIR`` (기본 시스템 임시폴더/kid_pdf_artifacts),
+``PDF_ARTIFACT_CACHE_MAX_MB`` (기본 2048), ``PDF_ARTIFACT_CHUNK_KB`` (기본 4096).
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import threading
+from typing import Iterator, Optional
+
+log = logging.getLogger("pdf_artifact_cache")
+
+PDF_ARTIFACT_CACHE_DIR = (os.environ.get("PDF_ARTIFACT_CACHE_DIR")
+                          or os.path.join(tempfile.gettempdir(), "kid_pdf_artifacts"))
+PDF_ARTIFACT_CACHE_MAX_MB = int(os.environ.get("PDF_ARTIFACT_CACHE_MAX_MB", "2048") or "2048")
+CHUNK_BYTES = int(os.environ.get("PDF_ARTIFACT_CHUNK_KB", "4096") or "4096") * 1024
+
+_HASH_RE = re.compile(r"^[0-9a-f]{64}$")
+
+_locks_guard = threading.Lock()
+_locks: dict = {}
+
+
+def _hash_lock(content_hash: str) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(content_hash, threading.Lock())
+
+
+def path_for(content_hash: str) -> Optional[str]:
+    """content_hash → 캐시 파일 경로(hash 형식이 아니면 None)."""
+    h = (content_hash or "").strip().lower()
+    if not _HASH_RE.match(h):
+        return None
+    return os.path.join(PDF_ARTIFACT_CACHE_DIR, h[:2], f"{h}.pdf")
+
+
+def stream_chunks(artifact_id: int) -> Iterator[bytes]:
+    """DB 에서 chunk 단위로 바로 읽는 iterator(디스크 캐시 불가 시 StreamingResponse 용)."""
+    from backend.services import manual_update_pg_service as svc
+    return svc.iter_pdf_artifact_blob(artifact_id, CHUNK_BYTES)
+
+
+def _fill(path: str, chunks, *, verify: bool, label) -> bool:
+    """chunks 를 임시파일에 쓰고 (verify 면 sha256==파일명 확인 후) 원자적 rename. 호출측이 hash lock 보유."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+    except OSError as e:
+        log.warning("pdf cache dir unavailable: %s", e)
+        return False
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+        if not size or (verify and digest.hexdigest() != os.path.basename(path)[:-4]):
+            log.warning("pdf %s: blob 없음 또는 content_hash 불일치", label)
+            os.unlink(tmp)
+            return False
+        os.replace(tmp, path)
+        return True
+    except Exception as e:
+        log.warning("pdf %s cache fill failed: %s", label, e)
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return False
+
+
+def _ensure(path: Optional[str], fill) -> Optional[str]:
+    if path is None:
+        return None
+    if _touch(path):
+        return path
+    with _hash_lock(os.path.basename(path)[:-4]):
+        if not _touch(path) and not fill(path):
+            return None
+    _evict(keep=path)
+    return path
+
+
+def materialize_blob(content_hash: str) -> Optional[str]:
+    """조각 저장소(manual_pdf_blobs) 1건을 캐시 파일로 보장하고 경로 반환."""
+    from backend.services import manual_update_pg_service as svc
+    return _ensure(path_for(content_hash),
+                   lambda p: _fill(p, svc.iter_pdf_blob(content_hash, CHUNK_BYTES),
+                                   verify=True, label=f"blob {content_hash[:12]}"))
+
+
+def assemble(manifest: list, out_path: str) -> None:
+    """manifest 조각들을 순서대로 이어붙여 out_path 에 PDF 저장. 조각은 캐시 파일에서 연다."""
+    import fitz
+    doc = fitz.open()
+    try:
+        for seg in manifest:
+            src_path = materialize_blob(seg["hash"])
+            if src_path is None:
+                raise FileNotFoundError(f"pdf blob {seg['hash'][:12]} 없음")
+            with fitz.open(src_path) as src:
+                lo = int(seg.get("from") or 1) - 1
+                hi = int(seg.get("to") or src.page_count) - 1
+                doc.insert_pdf(src, from_page=lo, to_page=min(hi, src.page_count - 1))
+        doc.save(out_path, garbage=1, deflate=True)
+    finally:
+        doc.close()
+
+
+def materialize(artifact_id: int, content_hash: Optional[str],
+                manifest: Optional[list] = None) -> Optional[str]:
+    """artifact 를 캐시 파일로 보장하고 경로 반환. hash 없음/blob 없음/불일치/디스크 오류면 None.
+
+    manifest artifact 는 조각을 조립해 manifest hash 이름으로 저장한다(조각은 각자 hash 검증)."""
+    path = path_for(content_hash or "")
+    if manifest:
+        def _assemble(p: str) -> bool:
+            tmp = p + ".assemble.part"
+            try:
+                os.makedirs(os.path.dirname(p), exist_ok=True)
+                assemble(manifest, tmp)
+                os.replace(tmp, p)
+                return True
+            except Exception as e:
+                log.warning("pdf artifact %s assemble failed: %s", artifact_id, e)
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                return False
+        return _ensure(path, _assemble)
+    return _ensure(path, lambda p: _fill(p, stream_chunks(artifact_id), verify=True,
+                                         label=f"artifact {artifact_id}"))
+
+
+def _touch(path: str) -> bool:
+    try:
+        os.utime(path)
+        return True
+    except OSError:
+        return False
+
+
+def _evict(keep: str = "") -> int:
+    """총 크기가 상한을 넘으면 mtime 오래된 파일부터 삭제. 반환: 삭제 수."""
+    limit = PDF_ARTIFACT_CACHE_MAX_MB * 1024 * 1024
+    files = []
+    total = 0
+    for root, _dirs, names in os.walk(PDF_ARTIFACT_CACHE_DIR):
+        for n in names:
+            if not n.endswith(".pdf"):
+                continue
+            p = os.path.join(root, n)
+            try:
+                st = os.stat(p)
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, p))
+            total += st.st_size
+    removed = 0
+    for _mtime, size, p in sorted(files):
+        if total <= limit:
+            break
+        if p == keep:
+            continue
+        try:
+            os.unlink(p)     # 서빙 중인 파일은 열린 fd 로 계속 읽힌다(POSIX)
+            total -= size
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
@@ -0,0 +1,151 @@
+"""문서자동작성 PDF 템플릿 레지스트리 — 템플릿을 1회만 읽고 위젯 목록을 미리 계산한다.
+
+``quick_doc.fill_and_append_pdf`` 는 과거 /generate-full 요청마다 선택 서류별로
+``fitz.open(abs_path)`` (디스크 읽기 + 파싱) 후 ``page.widgets()`` 전체를 돌며
+``normalize_field_name`` 을 다시 계산했고, ``_agent_fields_of_template`` 도 같은 파일을 또 열었다.
+
+여기서는 템플릿마다
+
+* 원본 PDF 바이트(메모리 보관)와
+* 위젯 목록(:class:`TemplateWidget` — 페이지, xref, 원래 이름, 정규화 이름, 타입, rect, 플래그)
+
+을 (경로, mtime_ns, 크기) 키로 1회 만들어 둔다. 요청은 :meth:`PreparsedTemplate.open` 으로
+**메모리 바이트에서 새 Document(복제본)** 를 열어 수정하므로 원본 캐시는 절대 변하지 않는다.
+관련 위젯만 ``page.load_widget(xref)`` 로 불러오면(:meth:`PreparsedTemplate.iter_widgets`)
+값을 넣을 필드가 없는 페이지/위젯은 파싱조차 하지 않는다.
+
+템플릿 파일이 바뀌면(mtime/크기 변경) 다음 조회에서 다시 읽는다. 보관 총량은
+``PDF_TEMPLATE_CACHE_MB`` (기본 64MB) 를 넘으면 가장 오래 안 쓴 템플릿부터 버린다.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+PDF_TEMPLATE_CACHE_MB = float(os.environ.get("PDF_TEMPLATE_CACHE_MB", "64") or "64")
+
+
+@dataclass(frozen=True)
+class TemplateWidget:
+    page: int
+    xref: int
+    name: str        # 원래 field_name
+    base: str        # normalize_field_name(name)
+    ftype: str       # field_type_string ("Text", "CheckBox", ...)
+    rect: tuple      # (x0, y0, x1, y1)
+    flags: int       # field_flags
+
+
+class PreparsedTemplate:
+    """메모리에 올린 템플릿 1개(읽기 전용). 수정은 항상 :meth:`open` 복제본에서."""
+
+    def __init__(self, path: str, stamp: tuple, data: bytes, page_count: int,
+                 widgets: Iterable[TemplateWidget]):
+        self.path = path
+        self.stamp = stamp
+        self.data = data
+        self.page_count = page_count
+        self.widgets: tuple[TemplateWidget, ...] = tuple(widgets)
+        by_page: dict[int, list[TemplateWidget]] = {}
+        for w in self.widgets:
+            by_page.setdefault(w.page, []).append(w)
+        self.by_page: dict[int, tuple[TemplateWidget, ...]] = {p: tuple(ws) for p, ws in by_page.items()}
+        self.bases: frozenset[str] = frozenset(w.base for w in self.widgets)
+
+    def open(self):
+        """원본 바이트에서 새 fitz.Document 를 연다(요청별 복제본)."""
+        import fitz
+        return fitz.open("pdf", self.data)
+
+    def iter_widgets(self, doc, wanted: Callable[[TemplateWidget], bool]):
+        """복제본 doc 에서 wanted(info) 가 참인 위젯만 (page, [Widget, ...]) 로 yield.
+
+        위젯 순서는 원래 ``page.widgets()`` 순서 그대로. 해당 위젯이 없는 페이지는 로드하지 않는다."""
+        for pno in sorted(self.by_page):
+            infos = [i for i in self.by_page[pno] if wanted(i)]
+            if not infos:
+                continue
+            page = doc[pno]
+            widgets = [w for w in (page.load_widget(i.xref) for i in infos) if w is not None]
+            if widgets:
+                yield page, widgets
+
+
+def _parse(path: str, stamp: tuple, normalize: Callable[[str], str]) -> PreparsedTemplate:
+    import fitz
+    with open(path, "rb") as f:
+        data = f.read()
+    widgets = []
+    with fitz.open("pdf", data) as doc:
+        page_count = doc.page_count
+        for page in doc:
+            for w in (page.widgets() or []):
+                name = getattr(w, "field_name", "") or ""
+                r = w.rect
+                widgets.append(TemplateWidget(
+                    page=page.number, xref=w.xref, name=name, base=normalize(name),
+                    ftype=w.field_type_string or "", rect=(r.x0, r.y0, r.x1, r.y1),
+                    flags=getattr(w, "field_flags", 0) or 0,
+                ))
+    return PreparsedTemplate(path, stamp, data, page_count, widgets)
+
+
+class TemplateRegistry:
+    """(경로, mtime_ns, 크기) 키의 PreparsedTemplate LRU. 스레드 안전."""
+
+    def __init__(self, *, max_bytes: int = int(PDF_TEMPLATE_CACHE_MB * 1024 * 1024)):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[str, PreparsedTemplate]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: str, normalize: Callable[[str], str]) -> PreparsedTemplate:
+        """템플릿을 반환(없거나 파일이 바뀌었으면 다시 읽음). 읽기/파싱 실패는 예외 그대로."""
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            tpl = self._items.get(path)
+            if tpl is not None and tpl.stamp == stamp:
+                self._items.move_to_end(path)
+                self.hits += 1
+                return tpl
+            self.misses += 1
+        tpl = _parse(path, stamp, normalize)     # 락 밖에서 파싱(다른 템플릿 조회 비차단)
+        with self._lock:
+            old = self._items.pop(path, None)
+            if old is not None:
+                self._bytes -= len(old.data)
+            self._items[path] = tpl
+            self._bytes += len(tpl.data)
+            while self._bytes > self.max_bytes and len(self._items) > 1:
+                _p, evicted = self._items.popitem(last=False)
+                self._bytes -= len(evicted.data)
+        return tpl
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"templates": len(self._items), "bytes": self._bytes,
+                    "hits": self.hits, "misses": self.misses}
+
+
+_registry: Optional[TemplateRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> TemplateRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = TemplateRegistry()
+    return _registry
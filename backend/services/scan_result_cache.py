@@ -0,0 +1,330 @@
+"""여권/등록증 스캔 결과 캐시 — 같은 이미지 재업로드 시 OCR 파이프라인·OCR 슬롯 생략.
+
+직원이 같은 여권/등록증 이미지를 다시 올리는 일이 잦다(필드 수정 후 재시도, 여러 탭,
+같은 PDF 재스캔). ``routers/scan.py`` 는 매번 parse_passport/parse_arc 전체를 돌리며
+OCR 슬롯을 잡는다. 여기서는 디코드된 이미지 기준으로 결과를 캐시한다.
+
+키
+  (tenant_id, 종류(passport/arc), 모드(fast, passport_dob …), 이미지 해시)
+  * exact   : 디코드된 픽셀(mode/size/bytes) sha256 — 재인코딩돼도 픽셀이 같으면 일치.
+  * perceptual: 16×16 dHash(256bit) + 이미지 크기 — JPEG 재압축 등 미세 잡음 흡수.
+    dHash 는 글자 몇 개 차이를 구분하지 못하므로 후보 선별에만 쓰고, 메모리에만 두는
+    64×64 흑백 축소본을 픽셀 단위로 비교(최대 차 ≤ 32, 평균 차 ≤ 4)해 통과해야 적중이다.
+    다른 사람의 여권이 같은 양식이라는 이유로 섞이지 않게 하기 위함이다.
+
+정책
+  * 테넌트 스코프 — 다른 테넌트 결과는 절대 조회되지 않는다.
+  * 크기 상한 LRU(``SCAN_CACHE_MAX_ENTRIES``) + TTL(``SCAN_CACHE_TTL_SECONDS``).
+  * 선택적 디스크 spill(``SCAN_CACHE_SPILL_DIR``): 메모리에서 밀려난 항목을 디스크로 내린다.
+    결과에는 PII(여권번호·등록번호·주소)가 있으므로 **pii_crypto 로 암호화 가능할 때만** 쓰고,
+    키가 없으면 spill 하지 않는다. 파일명은 키 해시라 평문 정보가 없다. 프로세스 시작 시
+    이전 spill 파일은 모두 지운다(색인이 없으므로 재사용 불가).
+  * PII-safe 제거: 만료/축출/무효화 시 메모리 항목 결과 dict 를 비우고 spill 파일을 지운다.
+    조회는 항상 깊은 복사본을 돌려줘 호출측 변경이 캐시에 남지 않는다.
+  * 실패 결과(빈 결과, MRZ 없음)는 호출측에서 저장하지 않는다.
+
+지표: :meth:`ScanResultCache.stats` (exact/perceptual/disk 적중, 미스, 축출, 만료, spill).
+"""
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+log = logging.getLogger("scan_result_cache")
+
+SCAN_CACHE_ENABLED = (os.environ.get("SCAN_CACHE_ENABLED", "1") or "1").strip().lower() not in (
+    "0", "false", "no", "off")
+SCAN_CACHE_MAX_ENTRIES = int(os.environ.get("SCAN_CACHE_MAX_ENTRIES", "128") or "128")
+SCAN_CACHE_TTL_SECONDS = float(os.environ.get("SCAN_CACHE_TTL_SECONDS", "900") or "900")
+SCAN_CACHE_SPILL_DIR = os.environ.get("SCAN_CACHE_SPILL_DIR", "").strip() or None
+SCAN_CACHE_MAX_SPILL_ENTRIES = int(os.environ.get("SCAN_CACHE_MAX_SPILL_ENTRIES", "1024") or "1024")
+
+_DHASH_SIDE = 16
+_THUMB_SIDE = 64
+_THUMB_MAX_DIFF = 32
+_THUMB_MEAN_DIFF = 4.0
+
+
+class ImageKey(NamedTuple):
+    """디코드된 이미지 식별자. thumb 는 perceptual 검증용(메모리 전용, 디스크에 쓰지 않음)."""
+    exact: str
+    phash: str
+    thumb: bytes
+
+
+def image_hashes(img) -> ImageKey:
+    """PIL 이미지 → ImageKey(exact sha256 hex, "dhash:WxH", 64×64 흑백 축소본)."""
+    h = hashlib.sha256()
+    h.update(f"{img.mode}|{img.size[0]}x{img.size[1]}|".encode())
+    h.update(img.tobytes())
+    gray = img.convert("L")
+    px = gray.resize((_DHASH_SIDE + 1, _DHASH_SIDE)).tobytes()
+    bits = 0
+    for y in range(_DHASH_SIDE):
+        row = px[y * (_DHASH_SIDE + 1):(y + 1) * (_DHASH_SIDE + 1)]
+        for x in range(_DHASH_SIDE):
+            bits = (bits << 1) | (row[x] > row[x + 1])
+    thumb = gray.resize((_THUMB_SIDE, _THUMB_SIDE)).tobytes()
+    return ImageKey(h.hexdigest(), f"{bits:064x}:{img.size[0]}x{img.size[1]}", thumb)
+
+
+def _thumbs_match(a: bytes, b: bytes) -> bool:
+    if len(a) != len(b) or not a:
+        return False
+    total = 0
+    for x, y in zip(a, b):
+        d = x - y if x > y else y - x
+        if d > _THUMB_MAX_DIFF:
+            return False
+        total += d
+    return total / len(a) <= _THUMB_MEAN_DIFF
+
+
+def mode_key(**params: Any) -> str:
+    """파싱 모드 파라미터 → 정규화 문자열(키 일부). 예: ``fast=True;passport_dob=``."""
+    return ";".join(f"{k}={params[k]}" for k in sorted(params))
+
+
+class _Entry:
+    __slots__ = ("result", "phash", "thumb", "expires")
+
+    def __init__(self, result: dict, phash: str, thumb: bytes, expires: float):
+        self.result = result
+        self.phash = phash
+        self.thumb = thumb
+        self.expires = expires
+
+
+def _scrub(obj: Any) -> None:
+    """캐시가 보유한 결과 객체의 PII 참조를 끊는다(dict/list 재귀 비우기)."""
+    if isinstance(obj, dict):
+        for v in obj.values():
+            _scrub(v)
+        obj.clear()
+    elif isinstance(obj, list):
+        for v in obj:
+            _scrub(v)
+        obj.clear()
+
+
+class ScanResultCache:
+    """테넌트 스코프 LRU + TTL 스캔 결과 캐시(선택적 암호화 디스크 spill). 스레드 안전."""
+
+    def __init__(self, *, max_entries: int = SCAN_CACHE_MAX_ENTRIES,
+                 ttl_s: float = SCAN_CACHE_TTL_SECONDS,
+                 spill_dir: Optional[str] = SCAN_CACHE_SPILL_DIR,
+                 max_spill_entries: int = SCAN_CACHE_MAX_SPILL_ENTRIES):
+        self.max_entries = max(1, max_entries)
+        self.ttl_s = ttl_s
+        self.max_spill_entries = max(0, max_spill_entries)
+        self._lock = threading.Lock()
+        self._mem: "OrderedDict[tuple, _Entry]" = OrderedDict()
+        # 디스크 항목: key → (path, phash, thumb, expires). 결과는 디스크(암호문)에만 있다.
+        self._disk: "OrderedDict[tuple, tuple[Path, str, bytes, float]]" = OrderedDict()
+        # (tenant, kind, mode, phash) → exact. 메모리/디스크 공용.
+        self._by_phash: dict[tuple, str] = {}
+        self._counters = dict.fromkeys(
+            ("hits_exact", "hits_perceptual", "hits_disk", "misses", "stores",
+             "evictions", "expirations", "spills", "invalidations"), 0)
+        self._spill_dir = Path(spill_dir) if spill_dir else None
+        if self._spill_dir is not None:
+            self._reset_spill_dir()
+
+    # ── 내부 ────────────────────────────────────────────────────────────────
+    def _reset_spill_dir(self) -> None:
+        try:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+            for p in self._spill_dir.glob("*.scan"):
+                p.unlink(missing_ok=True)
+        except OSError as e:
+            log.warning("[scan_cache] spill 디렉토리 사용 불가 — spill 비활성: %s", e)
+            self._spill_dir = None
+
+    def _spill_enabled(self) -> bool:
+        if self._spill_dir is None or self.max_spill_entries <= 0:
+            return False
+        from backend.services.pii_crypto import customer_pii_available
+        return customer_pii_available()
+
+    @staticmethod
+    def _spill_name(key: tuple) -> str:
+        return hashlib.sha256("\x00".join(key).encode("utf-8")).hexdigest() + ".scan"
+
+    def _drop_mem(self, key: tuple, entry: _Entry) -> None:
+        self._mem.pop(key, None)
+        if self._by_phash.get(key[:3] + (entry.phash,)) == key[3] and key not in self._disk:
+            self._by_phash.pop(key[:3] + (entry.phash,), None)
+        _scrub(entry.result)
+
+    def _drop_disk(self, key: tuple) -> None:
+        path, phash, _thumb, _exp = self._disk.pop(key)
+        if self._by_phash.get(key[:3] + (phash,)) == key[3] and key not in self._mem:
+            self._by_phash.pop(key[:3] + (phash,), None)
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def _spill(self, key: tuple, entry: _Entry) -> bool:
+        from backend.services.pii_crypto import encrypt_pii
+        path = self._spill_dir / self._spill_name(key)
+        try:
+            path.write_text(encrypt_pii(json.dumps(entry.result, ensure_ascii=False)),
+                            encoding="utf-8")
+        except Exception as e:
+            log.info("[scan_cache] spill 실패(항목 폐기): %s", e.__class__.__name__)
+            return False
+        self._disk[key] = (path, entry.phash, entry.thumb, entry.expires)
+        self._counters["spills"] += 1
+        while len(self._disk) > self.max_spill_entries:
+            self._drop_disk(next(iter(self._disk)))
+            self._counters["evictions"] += 1
+        return True
+
+    def _load_disk(self, key: tuple) -> Optional[dict]:
+        from backend.services.pii_crypto import decrypt_pii
+        path, phash, thumb, expires = self._disk[key]
+        try:
+            result = json.loads(decrypt_pii(path.read_text(encoding="utf-8")))
+        except Exception:
+            self._drop_disk(key)
+            return None
+        self._drop_disk(key)
+        self._insert(key, _Entry(result, phash, thumb, expires))   # 메모리로 승격
+        return result
+
+    def _insert(self, key: tuple, entry: _Entry) -> None:
+        old = self._mem.pop(key, None)
+        if old is not None:
+            _scrub(old.result)
+        self._mem[key] = entry
+        self._by_phash[key[:3] + (entry.phash,)] = key[3]
+        while len(self._mem) > self.max_entries:
+            old_key, old_entry = next(iter(self._mem.items()))
+            self._mem.pop(old_key)
+            spilled = self._spill_enabled() and self._spill(old_key, old_entry)
+            if not spilled:
+                self._drop_mem(old_key, old_entry)
+            else:
+                _scrub(old_entry.result)
+            self._counters["evictions"] += 1
+
+    def _lookup(self, key: tuple, now: float) -> Optional[dict]:
+        entry = self._mem.get(key)
+        if entry is not None:
+            if entry.expires <= now:
+                self._drop_mem(key, entry)
+                self._counters["expirations"] += 1
+                return None
+            self._mem.move_to_end(key)
+            return entry.result
+        disk = self._disk.get(key)
+        if disk is not None:
+            if disk[3] <= now:
+                self._drop_disk(key)
+                self._counters["expirations"] += 1
+                return None
+            result = self._load_disk(key)
+            if result is not None:
+                self._counters["hits_disk"] += 1
+            return result
+        return None
+
+    # ── 공개 API ────────────────────────────────────────────────────────────
+    def _thumb_of(self, key: tuple) -> bytes:
+        entry = self._mem.get(key)
+        if entry is not None:
+            return entry.thumb
+        disk = self._disk.get(key)
+        return disk[2] if disk is not None else b""
+
+    def get(self, tenant_id: str, kind: str, mode: str, hashes: ImageKey) -> Optional[dict]:
+        """캐시된 결과의 깊은 복사본 또는 None."""
+        exact, phash, thumb = hashes
+        base = (str(tenant_id), kind, mode)
+        now = time.monotonic()
+        with self._lock:
+            hit = self._lookup(base + (exact,), now)
+            if hit is not None:
+                self._counters["hits_exact"] += 1
+                return copy.deepcopy(hit)
+            alias = self._by_phash.get(base + (phash,))
+            if (alias is not None and alias != exact
+                    and _thumbs_match(self._thumb_of(base + (alias,)), thumb)):
+                hit = self._lookup(base + (alias,), now)
+                if hit is not None:
+                    self._counters["hits_perceptual"] += 1
+                    return copy.deepcopy(hit)
+            self._counters["misses"] += 1
+            return None
+
+    def put(self, tenant_id: str, kind: str, mode: str, hashes: ImageKey, result: dict) -> None:
+        exact, phash, thumb = hashes
+        key = (str(tenant_id), kind, mode, exact)
+        with self._lock:
+            if key in self._disk:
+                self._drop_disk(key)
+            self._insert(key, _Entry(copy.deepcopy(result), phash, thumb,
+                                     time.monotonic() + self.ttl_s))
+            self._counters["stores"] += 1
+
+    def invalidate_tenant(self, tenant_id: str) -> int:
+        """테넌트의 모든 항목 제거(메모리 scrub + spill 파일 삭제). 제거 수 반환."""
+        tid = str(tenant_id)
+        with self._lock:
+            n = 0
+            for key in [k for k in self._mem if k[0] == tid]:
+                self._drop_mem(key, self._mem[key])
+                n += 1
+            for key in [k for k in self._disk if k[0] == tid]:
+                self._drop_disk(key)
+                n += 1
+            self._counters["invalidations"] += n
+            return n
+
+    def clear(self) -> None:
+        with self._lock:
+            for key, entry in list(self._mem.items()):
+                self._drop_mem(key, entry)
+            for key in list(self._disk):
+                self._drop_disk(key)
+            self._by_phash.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = (self._counters["hits_exact"] + self._counters["hits_perceptual"]
+                    + self._counters["hits_disk"])
+            total = hits + self._counters["misses"]
+            return {
+                **self._counters,
+                "entries": len(self._mem),
+                "spilled_entries": len(self._disk),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_s,
+                "spill": self._spill_dir is not None,
+                "hit_rate": round(hits / total, 4) if total else 0.0,
+            }
+
+
+_cache: Optional[ScanResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> Optional[ScanResultCache]:
+    """프로세스 싱글톤. SCAN_CACHE_ENABLED=0 이면 None."""
+    global _cache
+    if not SCAN_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ScanResultCache()
+    return _cache
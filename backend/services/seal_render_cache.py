@@ -0,0 +1,143 @@
+"""도장 이미지 렌더 캐시 — 같은 이름의 도장은 한 번만 그린다.
+
+``quick_doc.make_seal_bytes`` 는 서류 생성마다 역할(최대 6개)별로 원형 배경 PNG 를 열어
+리사이즈하고, 글자 크기별 TTF 폰트를 다시 읽어 PIL 로 도장을 합성했다. 행정사 본인 도장과
+재방문 고객 도장은 매번 같은 결과이므로
+
+* 폰트 객체는 (경로, 크기, 파일 버전) 별로 1회만 로드(:func:`get_font`),
+* 원형 배경은 (경로, 캔버스 크기, 파일 버전) 별로 1회만 읽고 리사이즈(:func:`get_circle`),
+* 최종 결과는 (정규화 이름, 영문 여부, 자산 버전) 키의 LRU(:class:`SealRenderCache`)
+
+에 보관한다. 자산 버전(:func:`asset_version`)은 폰트/배경 파일의 mtime·크기와 렌더 파라미터라서
+자산을 교체하면 키가 바뀌어 자동으로 다시 그린다.
+
+도장에는 고객 이름이 들어가므로 디스크/DB 2차 캐시는 두지 않는다(프로세스 메모리만).
+``SEAL_CACHE_MAX_ENTRIES`` (기본 512, 0 이면 비활성).
+"""
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+SEAL_CACHE_MAX_ENTRIES = int(os.environ.get("SEAL_CACHE_MAX_ENTRIES", "512") or "512")
+
+
+def _file_version(path: str) -> tuple:
+    try:
+        st = os.stat(path)
+        return (path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return (path, None, None)
+
+
+def asset_version(*paths: str, params: tuple = ()) -> tuple:
+    """폰트/배경 파일 버전 + 렌더 파라미터(캔버스 크기 등) — 캐시 키의 자산 부분."""
+    return tuple(_file_version(p) for p in paths) + tuple(params)
+
+
+_asset_lock = threading.Lock()
+_fonts: dict = {}
+_circles: dict = {}
+
+
+def get_font(path: str, size: int):
+    """TTF 폰트 객체(공유). 로드 실패 시 기존과 같이 PIL 기본 폰트."""
+    key = (_file_version(path), size)
+    font = _fonts.get(key)
+    if font is None:
+        from PIL import ImageFont
+        try:
+            font = ImageFont.truetype(path, size)
+        except Exception:
+            font = ImageFont.load_default()
+        with _asset_lock:
+            font = _fonts.setdefault(key, font)
+    return font
+
+
+def get_circle(path: str, canvas_size: int, scale: float = 1.05):
+    """원형 배경을 canvas_size*scale 로 리사이즈한 RGBA 이미지(공유 — 호출측은 읽기만).
+
+    파일이 없으면 기존과 같이 빨간 원을 직접 그린 뒤 리사이즈한다."""
+    key = (_file_version(path), canvas_size, scale)
+    circle = _circles.get(key)
+    if circle is None:
+        from PIL import Image, ImageDraw
+        try:
+            img = Image.open(path).convert("RGBA")
+        except Exception:
+            img = Image.new("RGBA", (canvas_size, canvas_size), (0, 0, 0, 0))
+            d = ImageDraw.Draw(img)
+            margin = int(canvas_size * 0.08)
+            d.ellipse(
+                (margin, margin, canvas_size - margin, canvas_size - margin),
+                outline=(180, 0, 0, 255),
+                width=int(canvas_size * 0.05),
+            )
+        size = int(canvas_size * scale)
+        circle = img.resize((size, size), Image.LANCZOS)
+        with _asset_lock:
+            circle = _circles.setdefault(key, circle)
+    return circle
+
+
+class SealRenderCache:
+    """렌더 결과 LRU. 값은 불변(bytes) 또는 호출측이 복사해서 쓰는 객체. 스레드 안전."""
+
+    def __init__(self, max_entries: int = SEAL_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[Hashable, object]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_render(self, key: Hashable, render: Callable[[], Optional[object]]):
+        """key 적중 시 보관값, 아니면 render() 결과를 보관 후 반환. None(렌더 실패)은 보관 안 함."""
+        if self.max_entries <= 0:
+            return render()
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+        value = render()
+        if value is None:
+            return None
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._items), "max_entries": self.max_entries,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 4) if total else None,
+                "fonts_loaded": len(_fonts), "circles_loaded": len(_circles),
+            }
+
+
+_cache: Optional[SealRenderCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> SealRenderCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SealRenderCache()
+    return _cache
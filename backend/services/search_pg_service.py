@@ -0,0 +1,207 @@
+"""PG repository for 통합검색 — 검색 조건을 SQL 로 내려(push-down) 필요한 행만 읽는다.
+
+과거 ``routers/search.py`` 는 소스마다 테넌트 전체(고객/업무/게시판/업무참고)를 읽어
+Python 에서 ``str(v).lower()`` 부분일치를 돌렸다 → 키 입력 한 번에 전체 테이블 로드.
+
+여기서는 소스별로 **검색 문서 식**(여러 TEXT 컬럼을 ``coalesce(col, '') || ' ' || ...``
+로 이어 붙인 식)에 ``ILIKE '%q%'`` 를 걸고, 랭킹(정확 일치 > 접두 일치 > 부분 일치)과
+``LIMIT`` 까지 SQL 에서 끝낸다. PostgreSQL 에서는 migration 0033 의 pg_trgm GIN 식
+인덱스가 이 ILIKE 를 받으므로 비용이 테넌트 크기가 아니라 결과 수에 비례한다.
+
+주의: 검색 문서 식은 migration 0033 의 인덱스 식과 **같은 식**(컬럼·순서·구분자)이어야
+planner 가 인덱스를 쓴다. 컬럼 목록을 바꾸면 새 migration 으로 인덱스도 다시 만든다.
+
+반환값은 ``(score, dict)`` 리스트 — score 가 높을수록 상위. dict 는 라우터가
+SearchResult 로 바꾸는 데 필요한 컬럼만 담는다(컬럼 projection, 복호화/정규화 없음).
+"""
+from __future__ import annotations
+
+from sqlalchemy import Text, case, cast, literal_column, select
+
+# 소스별 검색 문서 컬럼 — migration 0033(_SEARCH_DOCS)과 동일 순서/구성.
+CUSTOMER_SEARCH_COLUMNS = (
+    "customer_id", "korean_name", "surname_en", "given_en", "passport_no",
+    "nationality", "reg_front", "phone1", "phone2", "phone3", "address",
+    "visa_status", "visa_type", "memo",
+)
+ACTIVE_TASK_SEARCH_COLUMNS = ("category", "name", "work", "details", "customer_id")
+PLANNED_TASK_SEARCH_COLUMNS = ("period", "content", "note")
+COMPLETED_TASK_SEARCH_COLUMNS = ("category", "name", "work", "details", "customer_id")
+BOARD_SEARCH_COLUMNS = ("category", "title", "content", "office_name")
+
+# 랭킹 점수. 같은 점수 안에서는 소스별 기본 정렬(최신 우선)을 따른다.
+SCORE_EXACT = 3
+SCORE_PREFIX = 2
+SCORE_CONTAINS = 1
+
+
+def search_doc_sql(table: str, columns: tuple[str, ...]) -> str:
+    """검색 문서 SQL 식 — 쿼리 쪽 식은 모두 여기서 만든다(migration 0033 인덱스 식과 동일 구성)."""
+    return " || ' ' || ".join(f"coalesce({table}.{c}, '')" for c in columns)
+
+
+def _escape_like(q: str) -> str:
+    """LIKE 메타문자(%, _)와 escape 문자 자체를 리터럴로 만든다(ESCAPE '\\')."""
+    return q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _contains(expr, q: str):
+    return expr.ilike(f"%{_escape_like(q)}%", escape="\\")
+
+
+def _rank(primary, q: str):
+    """primary 컬럼 기준 랭킹 CASE 식 (정확 3 / 접두 2 / 그 외 부분 일치 1)."""
+    esc = _escape_like(q)
+    return case(
+        (primary.ilike(esc, escape="\\"), SCORE_EXACT),
+        (primary.ilike(f"{esc}%", escape="\\"), SCORE_PREFIX),
+        else_=SCORE_CONTAINS,
+    )
+
+
+def _doc(table: str, columns: tuple[str, ...]):
+    return literal_column(search_doc_sql(table, columns), type_=Text)
+
+
+def search_customers(tenant_id: str, q: str, limit: int) -> list[tuple[int, dict]]:
+    """비삭제 고객 중 q 를 포함하는 상위 ``limit`` 건. 번호(reg_back)·외부계정은 검색/반환 제외."""
+    from backend.db.models.customer import Customer
+    from backend.db.session import get_sessionmaker
+
+    score = case(
+        (Customer.customer_id == q, SCORE_EXACT),
+        else_=_rank(Customer.korean_name, q),
+    ).label("score")
+    stmt = (
+        select(
+            score,
+            Customer.customer_id, Customer.korean_name, Customer.surname_en,
+            Customer.given_en, Customer.nationality, Customer.visa_status,
+            Customer.visa_type,
+        )
+        .where(
+            Customer.tenant_id == tenant_id,
+            Customer.deleted_at.is_(None),
+            _contains(_doc("customers", CUSTOMER_SEARCH_COLUMNS), q),
+        )
+        .order_by(score.desc(), Customer.customer_id.desc())
+        .limit(limit)
+    )
+    SessionLocal = get_sessionmaker()
+    with SessionLocal() as session:
+        rows = session.execute(stmt).all()
+    return [
+        (int(r.score), {
+            "고객ID": r.customer_id or "",
+            "한글": r.korean_name or "",
+            "성": r.surname_en or "",
+            "명": r.given_en or "",
+            "국적": r.nationality or "",
+            "체류자격": r.visa_status or "",
+            "비자종류": r.visa_type or "",
+        })
+        for r in rows
+    ]
+
+
+def search_tasks(tenant_id: str, q: str, limit: int) -> list[tuple[int, dict]]:
+    """예정 → 진행 → 완료 순서로 각 상위 ``limit`` 건. dict 에 ``label``(예정/진행/완료) 포함."""
+    from backend.db.models.task import ActiveTask, CompletedTask, PlannedTask
+    from backend.db.session import get_sessionmaker
+
+    out: list[tuple[int, dict]] = []
+    SessionLocal = get_sessionmaker()
+    with SessionLocal() as session:
+        # 예정업무: 이름 컬럼이 없어 content 기준 랭킹.
+        score = _rank(PlannedTask.content, q).label("score")
+        for r in session.execute(
+            select(score, PlannedTask.task_id, PlannedTask.content)
+            .where(
+                PlannedTask.tenant_id == tenant_id,
+                _contains(_doc("planned_tasks", PLANNED_TASK_SEARCH_COLUMNS), q),
+            )
+            .order_by(score.desc(), PlannedTask.date.desc(), PlannedTask.id.desc())
+            .limit(limit)
+        ).all():
+            out.append((int(r.score), {
+                "label": "예정", "id": r.task_id or "", "name": "",
+                "work": r.content or "",
+            }))
+
+        for label, model, table, columns in (
+            ("진행", ActiveTask, "active_tasks", ACTIVE_TASK_SEARCH_COLUMNS),
+            ("완료", CompletedTask, "completed_tasks", COMPLETED_TASK_SEARCH_COLUMNS),
+        ):
+            score = _rank(model.name, q).label("score")
+            for r in session.execute(
+                select(score, model.task_id, model.name, model.work, model.category)
+                .where(
+                    model.tenant_id == tenant_id,
+                    _contains(_doc(table, columns), q),
+                )
+                .order_by(score.desc(), model.date.desc(), model.id.desc())
+                .limit(limit)
+            ).all():
+                out.append((int(r.score), {
+                    "label": label, "id": r.task_id or "", "name": r.name or "",
+                    "work": r.work or r.category or "",
+                }))
+    return out
+
+
+def search_board(q: str, limit: int) -> list[tuple[int, dict]]:
+    """게시판(전 테넌트 공유 — 기존 공개 게시판 의미 유지) 상위 ``limit`` 건."""
+    from backend.db.models.board import BoardPost
+    from backend.db.session import get_sessionmaker
+
+    score = _rank(BoardPost.title, q).label("score")
+    stmt = (
+        select(score, BoardPost.id, BoardPost.title, BoardPost.content)
+        .where(_contains(_doc("board_posts", BOARD_SEARCH_COLUMNS), q))
+        .order_by(score.desc(), BoardPost.created_at.desc())
+        .limit(limit)
+    )
+    SessionLocal = get_sessionmaker()
+    with SessionLocal() as session:
+        rows = session.execute(stmt).all()
+    return [
+        (int(r.score), {"id": r.id or "", "title": r.title or "", "content": r.content or ""})
+        for r in rows
+    ]
+
+
+def search_reference(tenant_id: str, q: str, limit: int,
+                     sheet_name: str = "업무참고") -> list[tuple[int, dict]]:
+    """업무참고 시트 행(JSONB data 의 텍스트 표현) 상위 ``limit`` 건. dict 는 행 data 그대로.
+
+    JSON 텍스트에는 헤더(키)도 들어 있으므로 SQL 은 후보만 좁히고, 최종 판정은 값만 보는
+    기존 규칙(값 부분일치)으로 한 번 더 거른다 — 후보 수는 ``limit`` 로 제한된다.
+    """
+    from backend.db.models.work_data import WorkReferenceRow
+    from backend.db.session import get_sessionmaker
+
+    ql = q.lower()
+    SessionLocal = get_sessionmaker()
+    out: list[tuple[int, dict]] = []
+    offset = 0
+    with SessionLocal() as session:
+        while len(out) < limit:
+            batch = session.scalars(
+                select(WorkReferenceRow.data)
+                .where(
+                    WorkReferenceRow.tenant_id == tenant_id,
+                    WorkReferenceRow.sheet_name == sheet_name,
+                    _contains(cast(WorkReferenceRow.data, Text), q),
+                )
+                .order_by(WorkReferenceRow.row_index)
+                .offset(offset)
+                .limit(limit)
+            ).all()
+            for data in batch:
+                data = data or {}
+                if any(ql in str(v).lower() for v in data.values() if v):
+                    out.append((SCORE_CONTAINS, data))
+            if len(batch) < limit:
+                break
+            offset += limit
+    return out[:limit]
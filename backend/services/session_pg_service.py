@@ -43,7 +43,11 @@ def revoke_active_sessions(login_id: str, reason: str, only_non_kiosk: bool = Tr
         stmt = stmt.values(revoked_at=datetime.now(timezone.utc), revoked_reason=reason)
         result = session.execute(stmt)
         session.commit()
-        return result.rowcount or 0
+    n = result.rowcount or 0
+    if n:
+        from backend.services.auth_state_cache import invalidate_login
+        invalidate_login(login_id)
+    return n
 
 
 def revoke_active_sessions_in_session(session, login_id: str, reason: str,
@@ -52,8 +56,10 @@ def revoke_active_sessions_in_session(session, login_id: str, reason: str,
 
     relink 등 소속 변경 시 세션 revoke 를 같은 트랜잭션에 포함해, revoke DB 작업이 실패하면
     변경 전체가 롤백되게 한다(commit 후 best-effort 의 원자성 공백 제거). 반환: revoke 건수.
+    인증 상태 캐시는 그 트랜잭션이 커밋된 뒤 무효화된다.
     """
     from backend.db.models.user_session import UserSession
+    from backend.services.auth_state_cache import invalidate_login_on_commit
 
     stmt = (
         update(UserSession)
@@ -62,7 +68,10 @@ def revoke_active_sessions_in_session(session, login_id: str, reason: str,
     if only_non_kiosk:
         stmt = stmt.where(UserSession.is_kiosk.is_(False))
     stmt = stmt.values(revoked_at=datetime.now(timezone.utc), revoked_reason=reason)
-    return int(session.execute(stmt).rowcount or 0)
+    n = int(session.execute(stmt).rowcount or 0)
+    if n:
+        invalidate_login_on_commit(session, login_id)
+    return n
 
 
 def create_session(login_id: str, tenant_id: str, session_id: str,
@@ -106,12 +115,18 @@ def revoke_session(session_id: str, reason: str = "logout") -> bool:
     from backend.db.models.user_session import UserSession
     from backend.db.session import get_sessionmaker
 
+    sid = str(session_id).strip()
     SessionLocal = get_sessionmaker()
     with SessionLocal() as session:
+        login_id = session.scalar(select(UserSession.login_id).where(UserSession.session_id == sid))
         result = session.execute(
             update(UserSession)
-            .where(UserSession.session_id == str(session_id).strip(), UserSession.revoked_at.is_(None))
+            .where(UserSession.session_id == sid, UserSession.revoked_at.is_(None))
             .values(revoked_at=datetime.now(timezone.utc), revoked_reason=reason)
         )
         session.commit()
-        return (result.rowcount or 0) > 0
+    revoked = (result.rowcount or 0) > 0
+    if revoked:
+        from backend.services.auth_state_cache import invalidate_login
+        invalidate_login(login_id)
+    return revoked
@@ -0,0 +1,304 @@
+"""서명 이벤트 푸시 — 서명 제출/임시서명 저장을 SSE 구독자에게 즉시 전달(워커 간 공유).
+
+기존에는 프론트가 ``/signature/poll/{token}`` 과 ``/signature/pad/events`` 를 2~8초마다 폴링했다.
+매 폴링이 인증 + PG 조회를 하고, 제출 상태(``routers/signature._pending``)는 프로세스 로컬이라
+워커가 여럿이면 제출을 보지 못한 워커로 간 폴링은 계속 pending 이었다.
+
+- ``publish(tenant_id, event, data)``: 같은 워커의 구독자에게 바로 전달하고, 버스가 켜져 있으면
+  PostgreSQL ``NOTIFY`` (``SIGNATURE_NOTIFY_CHANNEL``)로 다른 워커에도 보낸다. 발행은 백그라운드
+  스레드가 하므로 요청 경로는 NOTIFY 왕복을 기다리지 않는다.
+- 구독(``subscribe``)은 tenant 단위 — 다른 사무소 이벤트는 전달되지 않는다. ``request_id`` 를
+  주면 그 요청의 이벤트만 받는다. 구독자 큐는 작게 제한하고, 넘치면 오래된 이벤트부터 버린다.
+- ``request_id`` 가 실린 이벤트는 워커마다 최근 목록(``recent``)에 잠시 보관한다 — 다른 워커가
+  받은 제출도 폴링·늦게 연결된 구독이 확인할 수 있다.
+- LISTEN 연결이 끊겼다 다시 붙으면 그 사이 이벤트는 유실될 수 있다 — 폴링이 안전망으로 남는다.
+  연결 오류가 아닌 예외면 재접속하지 않고 LISTEN 만 멈춘다(``stats()["listen_failed"]``).
+
+이벤트: ``signature.submitted`` {request_id, type}, ``temp_slot.saved`` {slot},
+``pad.saved`` {slot}.
+
+Env: ``SIGNATURE_NOTIFY`` (기본 on), ``SIGNATURE_NOTIFY_CHANNEL`` (기본 kid_signature_events).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Optional
+
+log = logging.getLogger("signature_events")
+
+SIGNATURE_NOTIFY = (os.environ.get("SIGNATURE_NOTIFY", "1") or "1").strip().lower() not in (
+    "0", "false", "no", "off")
+SIGNATURE_NOTIFY_CHANNEL = os.environ.get("SIGNATURE_NOTIFY_CHANNEL", "kid_signature_events").strip()
+
+SUBSCRIBER_QUEUE = 32          # 구독자별 미전달 이벤트 상한(넘치면 오래된 것부터 버림)
+RECENT_MAX = 2048              # 워커별 최근 request_id 이벤트 보관 수
+RECENT_TTL = 600.0             # 초 — 서명 토큰 TTL(5분)보다 넉넉히
+OUTBOX_MAX = 1000              # 발행 대기 상한(PG 장애 시 메모리 보호)
+
+
+class Subscription:
+    """SSE 연결 1개. 이벤트는 구독자의 이벤트 루프에서 ``queue`` 로 들어온다."""
+
+    def __init__(self, tenant_id: str, loop: asyncio.AbstractEventLoop,
+                 request_id: Optional[str] = None):
+        self.tenant_id = tenant_id
+        self.loop = loop
+        self.request_id = request_id or None
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE)
+        self.dropped = 0
+
+    def wants(self, data: dict) -> bool:
+        return self.request_id is None or data.get("request_id") == self.request_id
+
+    def _put(self, item: dict) -> None:
+        # 구독자 루프 안에서 실행된다.
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(item)
+
+    def offer(self, item: dict) -> None:
+        try:
+            self.loop.call_soon_threadsafe(self._put, item)
+        except RuntimeError:
+            pass                                    # 루프 종료(연결 정리 중)
+
+
+class _Hub:
+    """tenant → 구독자 집합 + 최근 request_id 이벤트. Thread-safe."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subs: dict[str, set] = {}
+        self._recent: OrderedDict = OrderedDict()   # request_id → (tenant, item, monotonic)
+        self.counters = {"published": 0, "delivered": 0, "remote": 0}
+
+    def subscribe(self, tenant_id: str, loop: asyncio.AbstractEventLoop,
+                  request_id: Optional[str] = None) -> Subscription:
+        sub = Subscription(str(tenant_id), loop, request_id)
+        with self._lock:
+            self._subs.setdefault(sub.tenant_id, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subs.get(sub.tenant_id)
+            if subs is not None:
+                subs.discard(sub)
+                if not subs:
+                    del self._subs[sub.tenant_id]
+
+    def deliver(self, tenant_id: str, item: dict, *, remote: bool = False) -> int:
+        tid = str(tenant_id)
+        rid = (item.get("data") or {}).get("request_id")
+        with self._lock:
+            if rid:
+                self._recent[rid] = (tid, item, time.monotonic())
+                self._recent.move_to_end(rid)
+                while len(self._recent) > RECENT_MAX:
+                    self._recent.popitem(last=False)
+            targets = [s for s in self._subs.get(tid, ()) if s.wants(item.get("data") or {})]
+            self.counters["remote" if remote else "published"] += 1
+            self.counters["delivered"] += len(targets)
+        for s in targets:
+            s.offer(item)
+        return len(targets)
+
+    def recent(self, tenant_id: Optional[str], request_id: str) -> Optional[dict]:
+        """최근 ``RECENT_TTL`` 초 안에 받은 request_id 이벤트. tenant_id=None 이면 tenant 무시."""
+        with self._lock:
+            hit = self._recent.get(request_id)
+            if hit is None:
+                return None
+            tid, item, at = hit
+            if time.monotonic() - at > RECENT_TTL:
+                del self._recent[request_id]
+                return None
+        if tenant_id is not None and tid != str(tenant_id):
+            return None
+        return item
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self.counters,
+                "tenants": len(self._subs),
+                "subscribers": sum(len(s) for s in self._subs.values()),
+                "recent": len(self._recent),
+                "bus": _bus.running,
+                "listen_failed": _bus.listen_failed,
+            }
+
+
+_hub = _Hub()
+
+
+# ── cross-worker bus (PostgreSQL LISTEN/NOTIFY) ──────────────────────────────
+
+class _Bus:
+    """Background publisher + listener. Idle (publish no-op) until ``start``."""
+
+    def __init__(self):
+        self.origin = f"{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.running = False
+        self.listen_failed = False      # 연결 외 오류로 LISTEN 중단(같은 워커 전달·폴링은 유지)
+        self._cv = threading.Condition()
+        self._outbox: deque = deque()
+        self._stop = threading.Event()
+        self._threads: list = []
+
+    def publish(self, tenant_id: str, item: dict) -> None:
+        if not self.running:
+            return
+        with self._cv:
+            if len(self._outbox) >= OUTBOX_MAX:
+                self._outbox.popleft()
+            self._outbox.append((str(tenant_id), item))
+            self._cv.notify()
+
+    def _drain(self) -> list:
+        with self._cv:
+            while not self._outbox and not self._stop.is_set():
+                self._cv.wait(1.0)
+            items = list(self._outbox)
+            self._outbox.clear()
+        return items
+
+    def _publisher(self) -> None:
+        from sqlalchemy import text
+        from backend.db.session import get_engine
+        while not self._stop.is_set():
+            items = self._drain()
+            if not items:
+                continue
+            try:
+                with get_engine().connect() as conn:
+                    for tid, item in items:
+                        payload = json.dumps({"o": self.origin, "t": tid, **item},
+                                             ensure_ascii=False)
+                        conn.execute(text("SELECT pg_notify(:ch, :payload)"),
+                                     {"ch": SIGNATURE_NOTIFY_CHANNEL, "payload": payload})
+                    conn.commit()
+            except Exception as e:
+                log.warning("[signature-events] publish failed (%d events): %s", len(items), e)
+
+    def handle(self, payload: str) -> None:
+        try:
+            msg = json.loads(payload)
+        except ValueError:
+            return
+        if not isinstance(msg, dict) or msg.get("o") == self.origin or not msg.get("e"):
+            return
+        _hub.deliver(msg.get("t", ""), {"e": msg["e"], "data": msg.get("data") or {}}, remote=True)
+
+    def _listener(self, dsn: str) -> None:
+        import psycopg
+        retryable = (psycopg.OperationalError, psycopg.InterfaceError, OSError)
+        backoff = 1.0
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(dsn, autocommit=True) as conn:
+                    conn.execute(f'LISTEN "{SIGNATURE_NOTIFY_CHANNEL}"')
+                    backoff = 1.0
+                    while not self._stop.is_set():
+                        for n in conn.notifies(timeout=1.0):   # psycopg >= 3.2
+                            self.handle(n.payload)
+            except retryable as e:
+                if self._stop.is_set():
+                    break
+                log.warning("[signature-events] LISTEN connection lost: %s (retry in %.0fs)",
+                            e, backoff)
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+            except Exception as e:
+                # 연결 문제가 아니면(드라이버 비호환 등) 재접속해도 같다 — 멈추고 폴링에 맡긴다.
+                if not self._stop.is_set():
+                    log.error("[signature-events] LISTEN loop failed (%s: %s) — 워커 간 전달 중단",
+                              type(e).__name__, e)
+                    self.listen_failed = True
+                return
+
+    def start(self, dsn: str) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self.running = True
+        self._threads = [
+            threading.Thread(target=self._publisher, name="signature-notify-pub", daemon=True),
+            threading.Thread(target=self._listener, args=(dsn,), name="signature-notify-listen",
+                             daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self.running = False
+        self._stop.set()
+        with self._cv:
+            self._cv.notify_all()
+        for t in self._threads:
+            t.join(timeout=3.0)
+        self._threads = []
+
+
+_bus = _Bus()
+
+
+def start_bus() -> bool:
+    """워커 간 전달(LISTEN + 발행 스레드) 시작. 시작했으면 True.
+
+    PostgreSQL 미구성이거나 ``SIGNATURE_NOTIFY`` 가 꺼져 있으면 같은 워커 안에서만 전달한다."""
+    if not SIGNATURE_NOTIFY:
+        return False
+    from backend.db.session import get_engine, is_configured
+    if not is_configured():
+        return False
+    url = get_engine().url
+    if url.get_backend_name() != "postgresql":
+        return False
+    _bus.start(url.set(drivername="postgresql").render_as_string(hide_password=False))
+    return True
+
+
+def stop_bus() -> None:
+    _bus.stop()
+
+
+# ── public API ───────────────────────────────────────────────────────────────
+
+def publish(tenant_id: Optional[str], event: str, data: Optional[dict] = None) -> None:
+    """tenant 구독자에게 이벤트 전달(+ 다른 워커로 NOTIFY). 예외를 내지 않는다."""
+    if not tenant_id:
+        return
+    item = {"e": event, "data": dict(data or {})}
+    try:
+        _hub.deliver(tenant_id, item)
+        _bus.publish(tenant_id, item)
+    except Exception as e:  # 알림 실패가 저장을 깨지 않게
+        log.warning("[signature-events] publish %s failed: %s", event, e)
+
+
+def subscribe(tenant_id: str, loop: asyncio.AbstractEventLoop,
+              request_id: Optional[str] = None) -> Subscription:
+    return _hub.subscribe(tenant_id, loop, request_id)
+
+
+def unsubscribe(sub: Subscription) -> None:
+    _hub.unsubscribe(sub)
+
+
+def recent(tenant_id: Optional[str], request_id: str) -> Optional[dict]:
+    return _hub.recent(tenant_id, request_id)
+
+
+def stats() -> dict:
+    return _hub.stats()
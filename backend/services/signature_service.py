@@ -134,6 +134,8 @@ def get_temp_slots(tenant_id: str) -> list:
 def save_temp_slot(tenant_id: str, slot: int, b64: str, memo: str) -> None:
     from backend.services.signature_pg_service import save_temp_slot as _pg
     _pg(tenant_id, slot, b64, memo)
+    from backend.services.signature_events import publish
+    publish(tenant_id, "temp_slot.saved", {"slot": slot})
 
 
 def save_temp_slot_first_empty(tenant_id: str, b64: str, memo: str = "") -> "int | None":
@@ -20,6 +20,12 @@ ACTIVE_FIELDS = (
 )
 
 
+def _invalidate(tenant_id: str) -> None:
+    """Drop cached task lists (GET /tasks/*) for this tenant on every worker."""
+    from backend.services.cache_service import cache_invalidate_prefix
+    cache_invalidate_prefix(tenant_id, "tasks:")
+
+
 def _active_to_dict(row) -> dict:
     return {
         "id": row.task_id or "",
@@ -134,6 +140,7 @@ def upsert_active(tenant_id: str, rec: dict) -> dict:
             for k, v in payload.items():
                 setattr(row, k, v)
         session.commit()
+        _invalidate(tenant_id)
         session.refresh(row)
         return _active_to_dict(row)
 
@@ -168,6 +175,7 @@ def patch_active(tenant_id: str, task_id: str, changes: dict) -> dict | None:
                 else:
                     setattr(row, field_map[k], "" if v is None else str(v))
         session.commit()
+        _invalidate(tenant_id)
         session.refresh(row)
         return _active_to_dict(row)
 
@@ -186,6 +194,7 @@ def delete_active(tenant_id: str, task_ids: list[str]) -> int:
             )
         )
         session.commit()
+        _invalidate(tenant_id)
         return result.rowcount or 0
 
 
@@ -230,6 +239,7 @@ def upsert_planned(tenant_id: str, rec: dict) -> dict:
             for k, v in payload.items():
                 setattr(row, k, v)
         session.commit()
+        _invalidate(tenant_id)
         session.refresh(row)
         return _planned_to_dict(row)
 
@@ -248,6 +258,7 @@ def delete_planned(tenant_id: str, task_ids: list[str]) -> int:
             )
         )
         session.commit()
+        _invalidate(tenant_id)
         return result.rowcount or 0
 
 
@@ -378,6 +389,7 @@ def upsert_completed(tenant_id: str, rec: dict) -> dict:
             for k, v in payload.items():
                 setattr(row, k, v)
         session.commit()
+        _invalidate(tenant_id)
         session.refresh(row)
         return _completed_to_dict(row)
 
@@ -396,6 +408,7 @@ def delete_completed(tenant_id: str, task_ids: list[str]) -> int:
             )
         )
         session.commit()
+        _invalidate(tenant_id)
         return result.rowcount or 0
 
 
@@ -439,4 +452,5 @@ def complete_active(tenant_id: str, task_ids: list[str]) -> int:
             session.delete(r)
             moved += 1
         session.commit()
+        _invalidate(tenant_id)
     return moved
@@ -507,6 +507,7 @@ def relink_account(login_id: str, target_tenant_id: str, actor_login: str,
     from backend.services import activation_pg_service as _act
     from backend.services.account_lifecycle_pg_service import (
         _revoke_unused_tokens, assert_invitation_capacity, LifecycleError)
+    from backend.services.auth_state_cache import invalidate_login_on_commit
     from backend.services.session_pg_service import revoke_active_sessions_in_session
 
     lid = (login_id or "").strip()
@@ -562,6 +563,7 @@ def relink_account(login_id: str, target_tenant_id: str, actor_login: str,
         u.account_status = "invited"
         u.is_admin = False
         u.role = "user"
+        invalidate_login_on_commit(session, lid)
         # 10) 새 activation 토큰.
         raw = _act.issue_activation_token(session, lid, ttid)
         session.commit()
@@ -37,8 +37,8 @@ CONFIRMATION_PHRASE = "사업장 전체 폐기"
 PURGE_BY_TENANT_ID: list[str] = [
     "customers",
     "active_tasks", "planned_tasks", "completed_tasks",
-    "daily_entries", "daily_balances",
-    "events", "memos",
+    "daily_entries", "daily_balances", "daily_rollups", "daily_rollup_states",
+    "events", "event_date_changes", "event_sync_states", "memos",
     "accommodation_providers", "guarantor_connections",
     "document_metadata",
     "fixed_expenses", "monthly_tax_summaries",
@@ -0,0 +1,308 @@
+"""상주(in-process) Tesseract 엔진 풀 — 호출마다 tesseract 프로세스를 띄우지 않는다.
+
+``pytesseract.image_to_string`` 은 호출마다 임시 이미지 파일을 쓰고 ``tesseract`` 바이너리를
+fork 해 traineddata(kor/ocrb/eng)를 다시 읽는다. ARC 1건 파싱에 수십 번 호출되므로
+프로세스 기동 + 모델 로드 비용이 대부분을 차지한다.
+
+여기서는 tesserocr(libtesseract 바인딩)가 설치돼 있으면 **초기화된 API 핸들을
+(lang, oem, psm, -c 변수) 별로 풀에 보관**해 요청 간 재사용한다.
+
+* 풀 크기: 키마다 최대 ``TESS_POOL_SIZE`` 개(기본 = OCR_VARIANT_WORKERS). 모두 사용 중이면
+  반납될 때까지 기다린다(병렬 OCR 후보 실행기와 같은 상한).
+* 전역 상한: 모든 키를 합쳐 ``TESS_MAX_HANDLES`` 개(기본 max(4, TESS_POOL_SIZE)). 꽉 차면 가장
+  오래 쉰 유휴 핸들(LRU, 다른 키 포함)을 닫고 새 핸들을 만든다. 유휴 핸들이 없으면 반납을 기다린다
+  — 설정 키가 많아도 상주 API 수(=메모리)가 상한을 넘지 않는다.
+* 설정 문자열은 pytesseract 형식(``--oem 3 --psm 6 -c tessedit_char_whitelist=...``) 그대로 받는다.
+  ``-c`` 변수는 핸들 생성 시 고정되므로 키에 포함된다(호출 간 whitelist 누수 없음).
+* 폴백: tesserocr 미설치 / ``TESS_ENGINE=pytesseract`` / 핸들 초기화 실패(해당 언어 traineddata
+  없음 등, 키 단위로 기억) / 호출 예외 → 기존 pytesseract 경로(timeout 지원).
+* timeout: ``Recognize(timeout=ms)`` (Tesseract 자체 취소 모니터)로 건다. 시간이 넘으면 그 핸들은
+  버리고 :class:`TesseractTimeout` 을 던진다(pytesseract 의 timeout RuntimeError 와 같은 취급).
+  ``Recognize(timeout=)`` 를 지원하지 않는 tesserocr 면 timeout 이 있는 호출은 pytesseract 로 보낸다.
+
+:func:`stats` 로 키별 핸들 수·호출 수·폴백 수를 볼 수 있다.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import shlex
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+try:
+    import tesserocr  # type: ignore[import]
+except Exception:
+    tesserocr = None
+
+try:
+    import pytesseract
+except Exception:
+    pytesseract = None
+
+log = logging.getLogger("tess_engine")
+
+TESS_ENGINE = (os.environ.get("TESS_ENGINE", "auto") or "auto").strip().lower()
+
+
+def _default_pool_size() -> int:
+    from backend.services.ocr_variant_executor import OCR_VARIANT_WORKERS
+    return OCR_VARIANT_WORKERS
+
+
+TESS_POOL_SIZE = max(1, int(os.environ.get("TESS_POOL_SIZE", "") or _default_pool_size()))
+TESS_MAX_HANDLES = max(1, int(os.environ.get("TESS_MAX_HANDLES", "") or max(4, TESS_POOL_SIZE)))
+
+
+class TesseractTimeout(RuntimeError):
+    """풀 핸들 인식이 timeout 을 넘겼다(핸들은 폐기됨)."""
+
+
+def parse_config(config: str) -> tuple[int, int, tuple[tuple[str, str], ...]]:
+    """pytesseract config → (oem, psm, ((var, value), ...)). 미지정 oem=3, psm=3."""
+    oem, psm, variables = 3, 3, []
+    toks = shlex.split(config or "")
+    i = 0
+    while i < len(toks):
+        t = toks[i]
+        if t in ("--oem", "--psm") and i + 1 < len(toks):
+            if t == "--oem":
+                oem = int(toks[i + 1])
+            else:
+                psm = int(toks[i + 1])
+            i += 2
+            continue
+        if t == "-c" and i + 1 < len(toks) and "=" in toks[i + 1]:
+            name, value = toks[i + 1].split("=", 1)
+            variables.append((name, value))
+            i += 2
+            continue
+        i += 1
+    return oem, psm, tuple(sorted(variables))
+
+
+# 전역 핸들 회계 — 모든 풀이 같은 Condition 을 쓴다(반납 시 다른 키 대기자도 깨움).
+_cond = threading.Condition()
+_total = 0                                  # 살아 있는 핸들 수(사용 중 + 유휴)
+_idle_lru: OrderedDict = OrderedDict()      # id(api) → (pool, api), 오래 쉰 순
+_evictions = 0
+
+
+def _end(api) -> None:
+    try:
+        api.End()
+    except Exception:
+        pass
+
+
+class _HandlePool:
+    """한 (lang, oem, psm, vars) 키의 API 핸들 풀. 유휴 핸들은 LIFO 로 재사용."""
+
+    def __init__(self, key: tuple, size: int):
+        self.key = key
+        self.size = size
+        self._idle: list = []
+        self._created = 0
+        self.calls = 0
+        self.timeouts = 0
+        self.broken = False
+
+    def _create(self):
+        lang, oem, psm, variables = self.key
+        kwargs = {"lang": lang, "psm": psm, "oem": oem, "variables": dict(variables)}
+        prefix = os.environ.get("TESSDATA_PREFIX")
+        if prefix:
+            kwargs["path"] = prefix
+        return tesserocr.PyTessBaseAPI(**kwargs)
+
+    def acquire(self):
+        global _total, _evictions
+        evicted = None
+        with _cond:
+            while True:
+                if self._idle:
+                    api = self._idle.pop()
+                    _idle_lru.pop(id(api), None)
+                    return api
+                if self._created < self.size:
+                    if _total < TESS_MAX_HANDLES:
+                        break
+                    if _idle_lru:
+                        _, (owner, evicted) = _idle_lru.popitem(last=False)
+                        owner._idle.remove(evicted)
+                        owner._created -= 1
+                        _total -= 1
+                        _evictions += 1
+                        break
+                _cond.wait()
+            self._created += 1
+            _total += 1
+        if evicted is not None:
+            _end(evicted)
+        try:
+            return self._create()
+        except Exception:
+            with _cond:
+                self._created -= 1
+                _total -= 1
+                _cond.notify_all()
+            raise
+
+    def release(self, api, *, discard: bool = False) -> None:
+        global _total
+        with _cond:
+            if discard:
+                self._created -= 1
+                _total -= 1
+            else:
+                self._idle.append(api)
+                _idle_lru[id(api)] = (self, api)
+            _cond.notify_all()
+        if discard:
+            _end(api)
+
+    def close(self) -> None:
+        global _total
+        with _cond:
+            idle, self._idle = self._idle, []
+            for api in idle:
+                _idle_lru.pop(id(api), None)
+            self._created -= len(idle)
+            _total -= len(idle)
+            _cond.notify_all()
+        for api in idle:
+            _end(api)
+
+
+_pools: dict[tuple, _HandlePool] = {}
+_pools_lock = threading.Lock()
+_fallbacks = 0
+
+
+def _pool_for(key: tuple) -> _HandlePool:
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = _pools[key] = _HandlePool(key, TESS_POOL_SIZE)
+    return pool
+
+
+def pooled_enabled() -> bool:
+    return tesserocr is not None and TESS_ENGINE != "pytesseract"
+
+
+def available() -> bool:
+    return pooled_enabled() or pytesseract is not None
+
+
+_recognize_timeout_supported: Optional[bool] = None   # None = 아직 모름
+
+
+def _recognize(api, timeout: Optional[float]) -> bool:
+    """SetImage 후 인식. timeout 이 있으면 Recognize(timeout=ms) — 시간 초과면 False."""
+    global _recognize_timeout_supported
+    if not timeout:
+        return True                     # GetUTF8Text 가 인식까지 수행
+    ok = api.Recognize(timeout=max(1, int(timeout * 1000)))
+    _recognize_timeout_supported = True
+    return bool(ok)
+
+
+def _pooled_string(img, lang: str, config: str, timeout: Optional[float] = None) -> Optional[str]:
+    """풀 핸들로 OCR. 이 키를 쓸 수 없으면 None(호출측이 pytesseract 로 폴백).
+
+    timeout 을 넘기면 핸들을 버리고 :class:`TesseractTimeout`.
+    """
+    global _recognize_timeout_supported
+    oem, psm, variables = parse_config(config)
+    pool = _pool_for((lang, oem, psm, variables))
+    if pool.broken:
+        return None
+    try:
+        api = pool.acquire()
+    except Exception as exc:
+        pool.broken = True
+        log.warning("[tess_engine] 핸들 초기화 실패 lang=%s psm=%s — pytesseract 폴백: %s",
+                    lang, psm, exc)
+        return None
+    ok = False
+    try:
+        api.SetImage(img)
+        try:
+            finished = _recognize(api, timeout)
+        except (AttributeError, TypeError):
+            # Recognize(timeout=) 미지원 tesserocr — 시간 제한 호출은 pytesseract 로.
+            _recognize_timeout_supported = False
+            ok = True                       # 핸들 자체는 멀쩡 — 풀로 반납
+            return None
+        if not finished:
+            pool.timeouts += 1
+            raise TesseractTimeout(f"tesseract timeout ({timeout}s) lang={lang} psm={psm}")
+        txt = api.GetUTF8Text() or ""
+        ok = True
+        pool.calls += 1
+        return txt
+    except TesseractTimeout:
+        raise
+    except Exception:
+        return None
+    finally:
+        if ok:
+            try:
+                api.Clear()
+            except Exception:
+                ok = False
+        pool.release(api, discard=not ok)
+
+
+def image_to_string(img, lang: str = "eng", config: str = "", timeout: Optional[float] = None) -> str:
+    """pytesseract.image_to_string 호환. 풀 핸들 우선, 실패 시 pytesseract. 예외는 던진다.
+
+    ``timeout`` (초)을 넘기면 예외(풀 경로 :class:`TesseractTimeout`, pytesseract RuntimeError).
+    """
+    global _fallbacks
+    if pooled_enabled() and not (timeout and _recognize_timeout_supported is False):
+        txt = _pooled_string(img, lang, config, timeout)
+        if txt is not None:
+            return txt
+        _fallbacks += 1
+    if pytesseract is None:
+        raise RuntimeError("tesseract 엔진 없음(tesserocr/pytesseract 미설치)")
+    if timeout:
+        try:
+            return pytesseract.image_to_string(img, lang=lang, config=config, timeout=timeout) or ""
+        except TypeError:  # timeout 미지원 구버전
+            pass
+    return pytesseract.image_to_string(img, lang=lang, config=config) or ""
+
+
+def stats() -> dict:
+    with _pools_lock:
+        pools = list(_pools.values())
+    with _cond:
+        return {
+            "engine": "tesserocr" if pooled_enabled() else "pytesseract",
+            "pool_size": TESS_POOL_SIZE,
+            "max_handles": TESS_MAX_HANDLES,
+            "handles": _total,
+            "evictions": _evictions,
+            "fallbacks": _fallbacks,
+            "pools": [
+                {"lang": p.key[0], "oem": p.key[1], "psm": p.key[2], "vars": dict(p.key[3]),
+                 "handles": p._created, "idle": len(p._idle), "calls": p.calls,
+                 "timeouts": p.timeouts, "broken": p.broken}
+                for p in pools
+            ],
+        }
+
+
+def shutdown() -> None:
+    """유휴 핸들 정리(테스트/종료용)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for p in pools:
+        p.close()
@@ -0,0 +1,156 @@
+"""감사 로그 비동기 배치 writer(audit_service) 테스트.
+
+SQLite 임시 DB + get_sessionmaker monkeypatch(운영 DB 불필요). writer 는 테스트마다 새 인스턴스.
+
+검증:
+- log_event 는 DB 를 기다리지 않고 큐에만 넣는다.
+- 크기 임계치에 도달하면 여러 행을 한 INSERT 로 기록하고, flush 는 남은 행까지 쓴다.
+- 큐가 가득 차면 잠시 기다린 뒤 드롭하고 드롭 수를 센다.
+- 배치 실패 시 행 단위로 재시도해 정상 행은 남긴다.
+- flush_and_stop 후에도 다음 이벤트가 오면 writer 가 다시 뜬다.
+- /dev/pg/audit-test 는 큐를 flush 한 뒤 세므로 delta 가 1 이다.
+
+실행: pytest backend/tests/test_audit_service.py
+"""
+import threading
+
+import pytest
+from sqlalchemy import BigInteger, create_engine, event, select
+from sqlalchemy.dialects.postgresql import INET, JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.services import audit_service as aud
+
+
+@compiles(BigInteger, "sqlite")
+def _bigint_as_integer(element, compiler, **kw):  # noqa: ANN001
+    return "INTEGER"
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_json(element, compiler, **kw):  # noqa: ANN001
+    return "JSON"
+
+
+@compiles(INET, "sqlite")
+def _inet_as_text(element, compiler, **kw):  # noqa: ANN001
+    return "TEXT"
+
+
+@pytest.fixture
+def db(monkeypatch, tmp_path):
+    from backend.db.base import Base
+    from backend.db.models.audit import AuditLog
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}", future=True)
+    Base.metadata.create_all(engine, tables=[AuditLog.__table__])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=Session)
+    import backend.db.session as dbs
+    monkeypatch.setattr(dbs, "get_sessionmaker", lambda: SessionLocal)
+    monkeypatch.setattr(aud, "is_configured", lambda: True)
+    monkeypatch.setenv("FEATURE_PG_AUDIT", "1")
+    monkeypatch.setattr(aud, "AUDIT_ASYNC", True)
+    inserts = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cur, stmt, *a: stmt.startswith("INSERT") and inserts.append(stmt))
+
+    def rows():
+        with SessionLocal() as s:
+            return s.scalars(select(AuditLog).order_by(AuditLog.id)).all()
+    yield rows, inserts
+    aud._writer.stop(timeout=2.0)
+
+
+def _writer(monkeypatch, **kw):
+    w = aud._Writer(**kw)
+    monkeypatch.setattr(aud, "_writer", w)
+    return w
+
+
+def test_batches_by_size_and_flush(db, monkeypatch):
+    rows, inserts = db
+    w = _writer(monkeypatch, max_queue=100, batch_size=5, interval=30.0)
+    for i in range(12):
+        aud.log_event(action="doc_edit", tenant_id="t1", target_id=str(i), payload={"i": i},
+                      ip_address="10.0.0.1")
+    assert aud.flush(timeout=3.0)
+    got = rows()
+    assert [r.target_id for r in got] == [str(i) for i in range(12)]
+    assert got[0].payload == {"i": 0} and got[0].created_at is not None
+    st = aud.audit_stats()
+    assert (st["enqueued"], st["written"], st["dropped"], st["queued"]) == (12, 12, 0, 0)
+    assert st["batches"] == 3 and st["max_batch"] == 5
+    assert len(inserts) == 3                       # 행마다가 아니라 배치마다 INSERT 1회
+    assert w.stats()["running"]
+
+
+def test_log_event_does_not_wait_for_db_and_drops_when_full(db, monkeypatch):
+    gate, started = threading.Event(), threading.Event()
+    real = aud._insert_rows
+
+    def slow(batch):
+        started.set()
+        gate.wait(5)
+        real(batch)
+    monkeypatch.setattr(aud, "_insert_rows", slow)
+    monkeypatch.setattr(aud, "AUDIT_ENQUEUE_WAIT_MS", 10)
+    _writer(monkeypatch, max_queue=3, batch_size=1, interval=0.0)
+
+    aud.log_event(action="a0")
+    assert started.wait(2)                         # writer 가 a0 를 쓰는 중(DB 멈춤)
+    for i in range(1, 6):
+        aud.log_event(action=f"a{i}")              # 요청 경로는 막히지 않는다
+    st = aud.audit_stats()
+    assert (st["enqueued"], st["dropped"]) == (4, 2)
+    gate.set()
+    assert aud.flush(timeout=3.0)
+    assert [r.action for r in db[0]()] == ["a0", "a1", "a2", "a3"]
+
+
+def test_bad_row_retried_individually(db, monkeypatch):
+    real = aud._insert_rows
+
+    def picky(batch):
+        if any(r["action"] == "bad" for r in batch):
+            raise ValueError("bad row")
+        real(batch)
+    monkeypatch.setattr(aud, "_insert_rows", picky)
+    _writer(monkeypatch, max_queue=10, batch_size=10, interval=30.0)
+    for a in ("ok1", "bad", "ok2"):
+        aud.log_event(action=a)
+    assert aud.flush(timeout=3.0)
+    assert [r.action for r in db[0]()] == ["ok1", "ok2"]
+    st = aud.audit_stats()
+    assert (st["written"], st["failed"], st["row_retries"]) == (2, 1, 3)
+
+
+def test_stop_drains_and_restarts(db, monkeypatch):
+    rows, _ = db
+    w = _writer(monkeypatch, max_queue=10, batch_size=100, interval=30.0)
+    aud.log_event(action="before")
+    assert aud.flush_and_stop(timeout=3.0)
+    assert not w.stats()["running"]
+    aud.log_event(action="after")
+    assert aud.flush(timeout=3.0)
+    assert [r.action for r in rows()] == ["before", "after"]
+
+
+def test_sync_mode_and_flag_off(db, monkeypatch):
+    rows, _ = db
+    monkeypatch.setattr(aud, "AUDIT_ASYNC", False)
+    aud.log_event(action="sync")
+    assert [r.action for r in rows()] == ["sync"]
+    monkeypatch.setenv("FEATURE_PG_AUDIT", "0")
+    aud.log_event(action="off")
+    assert [r.action for r in rows()] == ["sync"]
+
+
+def test_dev_audit_test_counts_after_flush(db, monkeypatch):
+    from backend.routers import dev_pg
+
+    rows, _ = db
+    _writer(monkeypatch, max_queue=100, batch_size=50, interval=30.0)
+    res = dev_pg.audit_test(dev_pg.AuditTestRequest(action="dev_test", tenant_id="t1"))
+    assert res["ok"] and res["delta"] == 1
+    assert [r.action for r in rows()] == ["dev_test"]
@@ -0,0 +1,184 @@
+"""인증 상태 캐시(auth_state_cache) — get_current_user 의 계정/테넌트/세션 재확인 캐시 테스트.
+
+SQLite 임시 DB + get_sessionmaker monkeypatch(운영 DB 불필요). 캐시는 테스트마다 새 인스턴스.
+
+검증:
+- auth_context 는 계정·tenant·세션 상태를 SQL 1문으로 읽고, 기존 개별 조회와 같은 값을 낸다.
+- get_current_user 반복 호출은 첫 요청만 DB 를 읽는다.
+- 세션 revoke / 계정 정지 / tenant 정지는 커밋 후 캐시를 무효화해 바로 401 이 된다.
+- 로딩 중 무효화된 결과는 캐시하지 않고, 결합 조회 실패 시 개별 조회로 폴백한다.
+- 무효화는 워커 간 버스에 실린다.
+
+실행: pytest backend/tests/test_auth_state_cache.py
+"""
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import BigInteger, create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.services import auth_state_cache as asc
+from backend.services import cache_service as cs
+
+
+@compiles(BigInteger, "sqlite")
+def _bigint_as_integer(element, compiler, **kw):  # noqa: ANN001
+    return "INTEGER"
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_json(element, compiler, **kw):  # noqa: ANN001
+    return "JSON"
+
+
+LOGIN, TID, SID = "staff@auth.kr", "T-AUTH", "sid-auth"
+
+
+@pytest.fixture
+def db(monkeypatch, tmp_path):
+    from backend.db.base import Base
+    from backend.db.models.activation_token import ActivationToken
+    from backend.db.models.tenant import Tenant
+    from backend.db.models.user import AccountUser
+    from backend.db.models.user_session import UserSession
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'auth.db'}", future=True)
+    Base.metadata.create_all(engine, tables=[
+        Tenant.__table__, AccountUser.__table__, ActivationToken.__table__, UserSession.__table__,
+    ])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=Session)
+    import backend.db.session as dbs
+    monkeypatch.setattr(dbs, "get_sessionmaker", lambda: SessionLocal)
+    monkeypatch.setattr(dbs, "is_configured", lambda: True)
+    monkeypatch.setattr(cs, "_cache", cs.ResponseCache(max_entries=64, stripes=4))
+    monkeypatch.setenv("FEATURE_SINGLE_SESSION", "1")
+    monkeypatch.setenv("FEATURE_APPROVED_SAAS", "1")
+
+    with SessionLocal() as s:
+        t = Tenant(tenant_id=TID, office_name="인증사무소")
+        t.service_status = "active"
+        t.is_active = True
+        t.seat_limit = 5
+        s.add(t)
+        s.flush()
+        s.add(AccountUser(login_id=LOGIN, tenant_id=TID, password_hash="x", is_admin=False,
+                          is_active=True, account_status="active", role="sub_admin"))
+        s.add(UserSession(login_id=LOGIN, tenant_id=TID, session_id=SID, is_kiosk=False))
+        s.commit()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cur, stmt, *a: statements.append(stmt))
+    return statements
+
+
+def _token():
+    from backend.auth import create_access_token
+    return create_access_token({"sub": LOGIN, "tenant_id": TID, "is_admin": False,
+                                "role": "user", "sid": SID})
+
+
+def _code(tok):
+    from backend.auth import get_current_user
+    with pytest.raises(HTTPException) as ei:
+        get_current_user(tok)
+    return ei.value.detail["code"]
+
+
+def test_auth_context_one_statement_matches_individual_lookups(db):
+    from backend.services.auth_pg_service import account_auth_status, auth_context, tenant_service_status
+    from backend.services.session_pg_service import session_status
+
+    db.clear()
+    ctx = auth_context(LOGIN, TID, SID)
+    assert len(db) == 1
+    assert ctx == {"account": account_auth_status(LOGIN), "tenant_status": tenant_service_status(TID),
+                   "session": session_status(SID)}
+    assert ctx["account"]["role"] == "sub_admin" and ctx["session"] == "active"
+    assert auth_context("nobody", "T-NONE", "sid-none") == {
+        "account": {"status": "missing", "is_admin": False, "role": "user", "tenant_id": None},
+        "tenant_status": "missing", "session": "missing"}
+    assert auth_context(LOGIN)["tenant_status"] is None
+
+
+def test_repeat_requests_hit_cache(db):
+    from backend.auth import get_current_user
+    tok = _token()
+    db.clear()
+    first = get_current_user(tok)
+    assert len(db) == 1
+    for _ in range(5):
+        assert get_current_user(tok) == first
+    assert len(db) == 1
+    assert first["role"] == "sub_admin" and first["is_sub_admin"] is True
+
+
+def test_revocations_apply_immediately(db):
+    from backend.auth import get_current_user
+    from backend.services import account_lifecycle_pg_service as life
+    from backend.services.session_pg_service import create_session, revoke_session
+
+    tok = _token()
+    get_current_user(tok)
+    revoke_session(SID)
+    assert _code(tok) == "SESSION_REVOKED"
+
+    create_session(LOGIN, TID, "sid-2")
+    from backend.auth import create_access_token
+    tok2 = create_access_token({"sub": LOGIN, "tenant_id": TID, "sid": "sid-2"})
+    get_current_user(tok2)
+    life.suspend_tenant(TID, "wkdwhfl")
+    assert _code(tok2) == "TENANT_SUSPENDED"
+    life.restore_tenant(TID, "wkdwhfl")
+
+    create_session(LOGIN, TID, "sid-3")
+    tok3 = create_access_token({"sub": LOGIN, "tenant_id": TID, "sid": "sid-3"})
+    get_current_user(tok3)
+    life.suspend_user(LOGIN, "wkdwhfl")
+    assert _code(tok3) == "ACCOUNT_DISABLED"
+
+
+def test_tenant_suspend_invalidates_status(db, monkeypatch):
+    from backend.auth import get_current_user
+    from backend.services import account_lifecycle_pg_service as life
+
+    monkeypatch.setenv("FEATURE_SINGLE_SESSION", "0")
+    monkeypatch.setattr(life, "_revoke_sessions", lambda *a, **kw: None)   # 세션 revoke 없이도
+    tok = _token()
+    get_current_user(tok)
+    life.suspend_tenant(TID, "wkdwhfl")
+    assert _code(tok) == "TENANT_SUSPENDED"
+
+
+def test_load_racing_invalidation_not_cached(db, monkeypatch):
+    from backend.services import auth_pg_service as aps
+    real = aps.auth_context
+
+    def racing(*a):
+        ctx = real(*a)
+        asc.invalidate_login(LOGIN)          # 조회 중 다른 요청이 revoke
+        return ctx
+    monkeypatch.setattr(aps, "auth_context", racing)
+    asc.AuthState(LOGIN, TID, SID).account()
+    assert cs.cache_get(asc._login_ns(LOGIN), f"{TID}|{SID}") is None
+
+
+def test_combined_failure_falls_back_uncached(db, monkeypatch):
+    from backend.auth import get_current_user
+    from backend.services import auth_pg_service as aps
+
+    def boom(*a):
+        raise RuntimeError("no such column: users.role")
+    monkeypatch.setattr(aps, "auth_context", boom)
+    cu = get_current_user(_token())
+    assert cu["role"] == "sub_admin"
+    assert cs.cache_stats()["entries"] == 0
+
+
+def test_invalidation_is_broadcast(db, monkeypatch):
+    monkeypatch.setattr(cs._bus, "running", True)
+    monkeypatch.setattr(cs._bus, "_outbox", {})
+    asc.invalidate_login(LOGIN)
+    asc.invalidate_tenant(TID)
+    assert cs._bus._drain() == [(f"@auth:{LOGIN}", "", True), (TID, asc.TENANT_KEY, False)]
@@ -0,0 +1,155 @@
+"""응답 캐시(cache_service) — LRU/TTL 상한, 테넌트 네임스페이스, 워커 간 무효화 테스트.
+
+SQLite 임시 DB(진행업무) + 메모리 캐시. PostgreSQL LISTEN/NOTIFY 는 메시지 처리(_Bus.handle)
+와 발행 큐 병합만 검증한다(운영 DB 불필요).
+
+검증:
+- 크기 상한 초과 시 LRU 축출, 읽히지 않은 만료 항목은 새 키 적재 시 정리.
+- prefix/테넌트 무효화는 해당 테넌트만 지운다.
+- 로딩 중 무효화되면 그 결과는 캐시하지 않는다(generation).
+- 다른 워커가 보낸 NOTIFY 는 적용, 자기 자신이 보낸 것은 무시. 발행 큐는 같은 키를 합친다.
+- LISTEN 루프가 연결 오류가 아닌 예외로 죽으면 재접속하지 않고 그 워커의 캐시를 끈다.
+- tasks_pg_service 쓰기 → GET /tasks/active 캐시 무효화.
+
+실행: pytest backend/tests/test_cache_service.py
+"""
+import json
+
+import pytest
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.services import cache_service as cs
+
+
+@compiles(BigInteger, "sqlite")
+def _bigint_as_integer(element, compiler, **kw):  # noqa: ANN001
+    return "INTEGER"
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_json(element, compiler, **kw):  # noqa: ANN001
+    return "JSON"
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    c = cs.ResponseCache(max_entries=3, stripes=1)
+    monkeypatch.setattr(cs, "_cache", c)
+    return c
+
+
+def test_lru_bound_and_expired_sweep(cache, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cs.time, "monotonic", lambda: now[0])
+    cs.cache_set("t1", "a", 1, ttl=10)
+    cs.cache_set("t1", "b", 2, ttl=10)
+    cs.cache_set("t1", "c", 3, ttl=10)
+    assert cs.cache_get("t1", "a") == 1            # a → MRU
+    cs.cache_set("t1", "d", 4, ttl=10)             # b 축출(LRU)
+    assert cs.cache_get("t1", "b") is None and cs.cache_get("t1", "a") == 1
+    cs.cache_set("t2", "short", 0, ttl=1)
+    now[0] += 5                                    # short 만료, 아무도 안 읽음
+    cs.cache_set("t2", "e", 5, ttl=10)             # 만료 항목부터 정리 → LRU 축출 불필요
+    st = cs.cache_stats()
+    assert st["entries"] == 3 and st["expirations"] == 1 and st["evictions"] == 2
+    assert (st["hits"], st["misses"]) == (2, 1)
+
+
+def test_prefix_and_tenant_invalidation(cache):
+    cache.max_entries = 99
+    cache._stripes[0].max_entries = 99
+    for t in ("t1", "t2"):
+        cs.cache_set(t, "tasks:active", [t], ttl=60)
+        cs.cache_set(t, "tasks:planned", [t], ttl=60)
+        cs.cache_set(t, "events:map", {}, ttl=60)
+    cs.cache_invalidate_prefix("t1", "tasks:")
+    assert cs.cache_get("t1", "tasks:active") is None and cs.cache_get("t1", "events:map") == {}
+    assert cs.cache_get("t2", "tasks:active") == ["t2"]
+    cs.cache_invalidate_tenant("t2")
+    assert cs.cache_stats()["entries"] == 1
+
+
+def test_load_racing_invalidation_not_cached(cache):
+    def _load():
+        cs.cache_invalidate("t1", "tasks:active")  # 로딩 중 다른 요청이 쓰기
+        return ["stale"]
+    assert cs.cache_get_or_load("t1", "tasks:active", 60, _load) == ["stale"]
+    assert cs.cache_get("t1", "tasks:active") is None
+    assert cs.cache_get_or_load("t1", "tasks:active", 60, lambda: ["fresh"]) == ["fresh"]
+    assert cs.cache_get("t1", "tasks:active") == ["fresh"]
+
+
+def test_remote_notify_applied_and_own_ignored(cache):
+    cs.cache_set("t1", "tasks:active", 1, ttl=60)
+    own = json.dumps({"o": cs._bus.origin, "t": "t1", "n": "tasks:", "p": 1})
+    cs._bus.handle(own)
+    assert cs.cache_get("t1", "tasks:active") == 1
+    cs._bus.handle(json.dumps({"o": "other", "t": "t1", "n": "tasks:", "p": 1}))
+    cs._bus.handle("not json")
+    assert cs.cache_get("t1", "tasks:active") is None
+    assert cs.cache_stats()["remote_invalidations"] == 1
+
+
+def test_publish_coalesces_until_bus_started(monkeypatch):
+    bus = cs._Bus()
+    bus.publish("t1", "tasks:", True)
+    assert bus._outbox == {}                       # 버스 미기동 → 발행 없음
+    monkeypatch.setattr(bus, "running", True)
+    for _ in range(50):                            # 일괄 등록 등 연속 쓰기
+        bus.publish("t1", "customers:", True)
+    bus.publish("t2", "events:", True)
+    assert bus._drain() == [("t1", "customers:", True), ("t2", "events:", True)]
+
+
+def test_listener_non_connection_error_disables_cache(cache, monkeypatch):
+    import psycopg
+
+    connects = []
+
+    class _Conn:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, sql):
+            pass
+
+        def notifies(self, **kw):
+            raise TypeError("notifies() got an unexpected keyword argument 'timeout'")
+
+    monkeypatch.setattr(psycopg, "connect", lambda *a, **k: connects.append(1) or _Conn())
+    bus = cs._Bus()
+    monkeypatch.setattr(cs, "_bus", bus)
+    cs.cache_set("t1", "tasks:active", 1, ttl=60)
+    bus._listener("postgresql://x")                # 재시도 루프 없이 반환
+    assert connects == [1] and bus.broken
+    assert cs.cache_get("t1", "tasks:active") is None
+    cs.cache_set("t1", "tasks:active", 2, ttl=60)
+    assert cs.cache_get_or_load("t1", "tasks:active", 60, lambda: 3) == 3
+    assert cs.cache_get("t1", "tasks:active") is None and cs.cache_stats()["bus_broken"]
+
+
+def test_task_writes_invalidate_cached_list(cache, monkeypatch, tmp_path):
+    from backend.db.base import Base
+    from backend.db.models.task import ActiveTask
+    from backend.services import tasks_pg_service as tps
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'tasks.db'}", future=True)
+    Base.metadata.create_all(engine, tables=[ActiveTask.__table__])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=Session)
+    import backend.db.session as dbs
+    monkeypatch.setattr(dbs, "get_sessionmaker", lambda: SessionLocal)
+
+    from backend.routers.tasks import get_active_tasks
+    user = {"tenant_id": "t1"}
+    assert get_active_tasks(user) == []
+    tps.upsert_active("t1", {"id": "k1", "name": "홍길동"})
+    assert [t["id"] for t in get_active_tasks(user)] == ["k1"]
+    tps.delete_active("t1", ["k1"])
+    assert get_active_tasks(user) == []
+    assert cs.cache_stats()["hits"] == 0
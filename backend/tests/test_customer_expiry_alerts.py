@@ -0,0 +1,156 @@
+"""만기 알림(DATE 그림자 컬럼 + query_expiring / GET /customers/expiry-alerts) 테스트.
+
+SQLite 임시 DB + get_sessionmaker monkeypatch + FastAPI TestClient(get_current_user override).
+
+검증:
+- 쓰기 경로(upsert/create)가 만기일 TEXT 와 함께 DATE 그림자를 채우고, 부분 업데이트는 건드리지 않으며
+  판독 불가 값은 NULL.
+- query_expiring: 기간(양끝 포함)·삭제/타 테넌트 제외, 만기일→고객ID 순, keyset 페이지가 중복/누락 없음.
+  알림 행 형식(영문이름/생년월일 세기 판별/전화번호)은 기존 pandas 구현과 같다.
+- expiry_window: 등록증 4개월/여권 6개월, 월말은 그 달 말일로 맞춤.
+- HTTP: 기본 응답은 기존 {card_alerts, passport_alerts}, kind 페이지는 {items, next_cursor}, 잘못된 값은 400.
+
+실행: pytest backend/tests/test_customer_expiry_alerts.py
+"""
+import datetime
+from datetime import date, timezone
+
+import pytest
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.services import cache_service as cs
+from backend.services import customer_pg_service as svc
+
+
+@compiles(BigInteger, "sqlite")
+def _bigint_as_integer(element, compiler, **kw):  # noqa: ANN001
+    return "INTEGER"
+
+
+TID = "T-EXP"
+
+
+@pytest.fixture
+def db(monkeypatch, tmp_path):
+    from backend.db.base import Base
+    from backend.db.models.customer import Customer
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'exp.db'}", future=True)
+    Base.metadata.create_all(engine, tables=[Customer.__table__])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=Session)
+    import backend.db.session as dbs
+    monkeypatch.setattr(dbs, "get_sessionmaker", lambda: SessionLocal)
+    monkeypatch.setattr(cs, "_cache", cs.ResponseCache(max_entries=64, stripes=4))
+    return SessionLocal
+
+
+def _add(SessionLocal, **kw):
+    from backend.db.models.customer import Customer
+
+    payload = svc.apply_expiry_shadows(dict(kw))
+    payload.setdefault("tenant_id", TID)
+    with SessionLocal() as s:
+        s.add(Customer(**payload))
+        s.commit()
+
+
+def _shadow(SessionLocal, cid):
+    from backend.db.models.customer import Customer
+
+    with SessionLocal() as s:
+        row = s.query(Customer).filter_by(tenant_id=TID, customer_id=cid).one()
+        return row.card_expiry_on, row.passport_expiry_on
+
+
+def test_write_path_maintains_shadow(db):
+    svc.upsert_customer(TID, {"고객ID": "0001", "한글": "홍길동",
+                              "만기일": "2026.11.30", "만기": "2027-01-05 00:00:00"})
+    assert _shadow(db, "0001") == (date(2026, 11, 30), date(2027, 1, 5))
+
+    svc.upsert_customer(TID, {"고객ID": "0001", "한글": "홍길동2"})       # 부분 업데이트
+    assert _shadow(db, "0001") == (date(2026, 11, 30), date(2027, 1, 5))
+
+    svc.upsert_customer(TID, {"고객ID": "0001", "만기일": "2026-02-30", "만기": ""})
+    assert _shadow(db, "0001") == (None, None)                          # 판독 불가/빈값 → NULL
+
+    created = svc.create_customer(TID, {"한글": "김신규", "만기일": "20261201"})
+    assert _shadow(db, created["고객ID"]) == (date(2026, 12, 1), None)
+
+
+def test_query_expiring_range_order_and_paging(db):
+    _add(db, customer_id="0005", korean_name="홍길동", surname_en="HONG", given_en="GILDONG",
+         passport_no="M1234", reg_front="1010", reg_back="7020304",
+         phone1="010", phone2="1234", phone3="5678", card_expiry_date="2026-11-30")
+    _add(db, customer_id="0002", korean_name="김철수", reg_front="850101", reg_back="1******",
+         card_expiry_date="2026-11-30")
+    _add(db, customer_id="0003", korean_name="이영희", card_expiry_date="2026.10.18")
+    _add(db, customer_id="0004", korean_name="범위밖", card_expiry_date="2027-03-01")
+    _add(db, customer_id="0006", korean_name="판독불가", card_expiry_date="미정")
+    _add(db, customer_id="0007", korean_name="삭제됨", card_expiry_date="2026-11-01",
+         deleted_at=datetime.datetime.now(timezone.utc))
+    _add(db, tenant_id="T-OTHER", customer_id="0008", card_expiry_date="2026-11-01")
+
+    start, end = date(2026, 10, 18), date(2027, 2, 18)
+    items, cur = svc.query_expiring(TID, "card", start, end)
+    assert [(r["고객ID"], r["등록증만기일"]) for r in items] == [
+        ("0003", "2026-10-18"), ("0002", "2026-11-30"), ("0005", "2026-11-30")]
+    assert cur is None
+    assert items[2] == {
+        "고객ID": "0005", "한글이름": "홍길동", "영문이름": "HONG GILDONG", "여권번호": "M1234",
+        "생년월일": "2000-10-10", "전화번호": "010 1234 5678", "등록증만기일": "2026-11-30",
+    }
+    assert items[1]["생년월일"] == "1985-01-01" and items[1]["영문이름"] == ""
+
+    page1, cur = svc.query_expiring(TID, "card", start, end, limit=2)
+    assert [r["고객ID"] for r in page1] == ["0003", "0002"] and cur == "2026-11-30|0002"
+    page2, cur = svc.query_expiring(TID, "card", start, end, after=cur, limit=2)
+    assert [r["고객ID"] for r in page2] == ["0005"] and cur is None
+
+    assert svc.query_expiring(TID, "passport", start, end) == ([], None)
+    with pytest.raises(ValueError):
+        svc.query_expiring(TID, "card", start, end, after="2026-11-30")
+    with pytest.raises(ValueError):
+        svc.query_expiring(TID, "visa", start, end)
+
+
+def test_expiry_window_clamps_month_end():
+    assert svc.expiry_window("card", date(2026, 10, 31)) == (date(2026, 10, 31), date(2027, 2, 28))
+    assert svc.expiry_window("passport", date(2026, 8, 31)) == (date(2026, 8, 31), date(2027, 2, 28))
+    assert svc.expiry_window("card", date(2027, 10, 31))[1] == date(2028, 2, 29)
+
+
+def test_http_legacy_shape_and_paging(db):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from backend.auth import get_current_user
+    from backend.routers import customers as r
+
+    today = date.today()
+    for i, days in enumerate((10, 20, 30, 200)):
+        _add(db, customer_id=f"010{i}", korean_name=f"고객{i}",
+             card_expiry_date=(today + datetime.timedelta(days=days)).isoformat(),
+             passport_expiry_date=(today + datetime.timedelta(days=days)).isoformat())
+    _add(db, customer_id="0199", card_expiry_date=(today - datetime.timedelta(days=1)).isoformat())
+
+    app = FastAPI()
+    app.include_router(r.router, prefix="/api/customers")
+    app.dependency_overrides[get_current_user] = lambda: {"tenant_id": TID}
+    c = TestClient(app)
+
+    body = c.get("/api/customers/expiry-alerts").json()
+    assert [x["고객ID"] for x in body["card_alerts"]] == ["0100", "0101", "0102"]
+    assert [x["고객ID"] for x in body["passport_alerts"]] == ["0100", "0101", "0102"]
+
+    res = c.get("/api/customers/expiry-alerts", params={"kind": "card", "limit": 2}).json()
+    assert [x["고객ID"] for x in res["items"]] == ["0100", "0101"] and res["next_cursor"]
+    res = c.get("/api/customers/expiry-alerts",
+                params={"kind": "card", "limit": 2, "cursor": res["next_cursor"]}).json()
+    assert [x["고객ID"] for x in res["items"]] == ["0102"] and res["next_cursor"] is None
+
+    assert c.get("/api/customers/expiry-alerts", params={"kind": "visa"}).status_code == 400
+    assert c.get("/api/customers/expiry-alerts",
+                 params={"kind": "card", "cursor": "bad"}).status_code == 400
+    assert c.get("/api/customers/expiry-alerts",
+                 params={"kind": "card", "limit": 0}).status_code == 400
@@ -0,0 +1,121 @@
+"""고객 조회 API(query_customers / count_customers / iter_customers) 테스트.
+
+SQLite 임시 DB. 운영 DB 불필요.
+
+검증:
+- keyset 페이지: 고객ID 숫자 내림차순('10000' > '9999'), 중복/누락 없이 끝까지.
+- 필터 push-down: 이름 접두(한글/영문), 정확 한글명, 체류자격, 만기 범위, 삭제/타 테넌트 제외.
+- 컬럼 projection: 요청 키 + 고객ID 만 반환(번호/외부계정 미포함).
+- iter_customers 가 배치 크기와 무관하게 전체를 순서대로 스트리밍.
+- GET /customers 만기일 필터: 판독 가능한 값은 정규화, 판독 불가 값은 400(필터 무시 금지).
+
+실행: pytest backend/tests/test_customer_query_pg.py
+"""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.services import customer_pg_service as svc
+
+
+@compiles(BigInteger, "sqlite")
+def _bigint_as_integer_on_sqlite(element, compiler, **kw):  # noqa: ANN001
+    return "INTEGER"
+
+
+@pytest.fixture
+def db(monkeypatch, tmp_path):
+    from backend.db.base import Base
+    from backend.db.models.customer import Customer
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'cq.db'}", future=True)
+    Base.metadata.create_all(engine, tables=[Customer.__table__])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=Session)
+    import backend.db.session as dbs
+    monkeypatch.setattr(dbs, "get_sessionmaker", lambda: SessionLocal)
+
+    with SessionLocal() as s:
+        s.add_all([
+            Customer(tenant_id="t1", customer_id="0001", korean_name="홍길동", surname_en="HONG",
+                     visa_status="F-4", card_expiry_date="2026-11-30", reg_back="1234567"),
+            Customer(tenant_id="t1", customer_id="0002", korean_name="김철수", surname_en="KIM",
+                     visa_status="E-9", card_expiry_date="2027-05-01"),
+            Customer(tenant_id="t1", customer_id="9999", korean_name="홍길순", given_en="GILSUN",
+                     visa_status="F-4", passport_expiry_date="2026-12-01"),
+            Customer(tenant_id="t1", customer_id="10000", korean_name="홍길동",
+                     visa_status="F-5", card_expiry_date=""),
+            Customer(tenant_id="t1", customer_id="0003", korean_name="홍길동",
+                     deleted_at=datetime.now(timezone.utc)),
+            Customer(tenant_id="t2", customer_id="0004", korean_name="홍길동"),
+        ])
+        s.commit()
+    return SessionLocal
+
+
+def _ids(items):
+    return [c["고객ID"] for c in items]
+
+
+def test_keyset_pages_numeric_desc(db):
+    page1, cur = svc.query_customers("t1", limit=2)
+    assert _ids(page1) == ["10000", "9999"] and cur == "9999"
+    page2, cur = svc.query_customers("t1", after=cur, limit=2)
+    assert _ids(page2) == ["0002", "0001"] and cur is None
+    assert svc.count_customers("t1") == 4
+
+
+def test_offset_page_matches_keyset(db):
+    items, _ = svc.query_customers("t1", limit=2, offset=2)
+    assert _ids(items) == ["0002", "0001"]
+
+
+def test_filters_pushdown(db):
+    assert _ids(svc.query_customers("t1", name_prefix="홍길")[0]) == ["10000", "9999", "0001"]
+    assert _ids(svc.query_customers("t1", name_prefix="gil")[0]) == ["9999"]
+    assert _ids(svc.query_customers("t1", korean_name="홍길동")[0]) == ["10000", "0001"]
+    assert _ids(svc.query_customers("t1", visa_status="F-4")[0]) == ["9999", "0001"]
+    assert _ids(svc.query_customers(
+        "t1", card_expiry_from="2026-10-01", card_expiry_to="2027.01.31")[0]) == ["0001"]
+    assert _ids(svc.query_customers("t1", passport_expiry_to="2027-01-01")[0]) == ["9999"]
+    assert svc.count_customers("t1", korean_name="홍길동") == 2
+    assert _ids(svc.query_customers("t1", customer_ids={"0001", "0004"})[0]) == ["0001"]
+
+
+def test_projection_returns_only_requested_keys(db):
+    items, _ = svc.query_customers("t1", columns=("한글",), korean_name="김철수")
+    assert items == [{"고객ID": "0002", "한글": "김철수"}]
+    items, _ = svc.query_customers("t1", columns=("번호",), customer_ids=["0001"])
+    assert items[0]["번호"] == "1******" and items[0]["번호_last4"] == "4567"
+
+
+def test_full_rows_match_find_customer(db):
+    items, _ = svc.query_customers("t1", customer_ids=["0001"])
+    assert items == [svc.find_customer("t1", "0001")]
+
+
+def test_iter_customers_streams_all(db):
+    assert _ids(svc.iter_customers("t1", batch_size=1)) == ["10000", "9999", "0002", "0001"]
+    assert _ids(svc.iter_customers("t1", batch_size=3, visa_status="F-4")) == ["9999", "0001"]
+
+
+def test_http_expiry_filter_validation(db, monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from backend.auth import get_current_user
+    from backend.routers import customers as r
+    from backend.services import cache_service as cs
+
+    monkeypatch.setattr(cs, "_cache", cs.ResponseCache(max_entries=64, stripes=4))
+    app = FastAPI()
+    app.include_router(r.router, prefix="/api/customers")
+    app.dependency_overrides[get_current_user] = lambda: {"tenant_id": "t1"}
+    c = TestClient(app)
+
+    res = c.get("/api/customers", params={"card_expiry_from": "2026.10.01", "card_expiry_to": ""})
+    assert res.status_code == 200 and _ids(res.json()["items"]) == ["0002", "0001"]
+    for name in ("card_expiry_from", "card_expiry_to", "passport_expiry_from", "passport_expiry_to"):
+        assert c.get("/api/customers", params={name: "2026-13-01"}).status_code == 400
+        assert c.get("/api/customers", params={name: "soon"}).status_code == 400
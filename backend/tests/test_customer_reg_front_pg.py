@@ -199,7 +199,8 @@ def test_expiry_alert_birth_from_legacy_reg_front(db):
     with db() as s:
         s.execute(text(
             "INSERT INTO customers (tenant_id, customer_id, korean_name, reg_front, "
-            "reg_back, card_expiry_date) VALUES ('t-regfront','7100','만기합성',:r,:b,:e)"
+            "reg_back, card_expiry_date, card_expiry_on) "
+            "VALUES ('t-regfront','7100','만기합성',:r,:b,:e,CAST(:e AS date))"
         ).bindparams(r="1010", b="7020304", e=exp))
         s.commit()
     cache_invalidate("t-regfront", _CACHE_EXPIRY)
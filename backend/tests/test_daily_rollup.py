@@ -0,0 +1,240 @@
+"""일일결산 일/월 롤업(daily_rollup_service) + 분석 엔드포인트 테스트.
+
+SQLite 임시 DB + FastAPI TestClient(get_current_user override). 운영 DB 불필요.
+
+검증:
+- 상태 행이 없으면 첫 조회에서 전체 재집계(lazy backfill), 이후 upsert/수정/삭제는 증분 반영.
+- 증분 결과 == 전체 재집계 결과(월/일 스칼라 + breakdown, 건수 0 키 제거).
+- 롤업이 아직 없는 테넌트의 쓰기는 롤업을 건드리지 않는다.
+- 동시 삭제는 한 번만 차감, 읽은 뒤 다른 수정이 끼어들면 다시 읽어 최신 old 로 델타 적용.
+- 결제 슬롯(memo [KID])은 쓰기 시 컬럼으로 파싱되고 롤업은 컬럼을 읽는다(import 스크립트 포함).
+- 스냅샷 import 는 롤업 상태를 무효화해 다음 조회가 재집계한다.
+- /monthly-analysis, /card-expense-summary, /income-summary, /yearly-overview 수치.
+
+실행: pytest backend/tests/test_daily_rollup.py
+"""
+import datetime
+
+import pytest
+from sqlalchemy import BigInteger, create_engine, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.services import daily_pg_service as dps
+from backend.services import daily_rollup_service as ro
+
+
+@compiles(BigInteger, "sqlite")
+def _bigint_as_integer(element, compiler, **kw):  # noqa: ANN001
+    return "INTEGER"
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_json(element, compiler, **kw):  # noqa: ANN001
+    return "JSON"
+
+
+TODAY = datetime.date.today().isoformat()
+CARD = "[KID]inc=카드;e1=카드;e1a=3000;e2=현금;e2a=500[/KID]"
+TAX = "[KID]inc=현금;tax=1[/KID]"
+
+
+@pytest.fixture
+def db(monkeypatch, tmp_path):
+    from backend.db.base import Base
+    from backend.db.models.daily import DailyEntry, DailyRollup, DailyRollupState
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'daily.db'}", future=True)
+    Base.metadata.create_all(engine, tables=[
+        DailyEntry.__table__, DailyRollup.__table__, DailyRollupState.__table__,
+    ])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=Session)
+    import backend.db.session as dbs
+    monkeypatch.setattr(dbs, "is_configured", lambda: True)
+    monkeypatch.setattr(dbs, "get_sessionmaker", lambda: SessionLocal)
+    return SessionLocal
+
+
+def _put(eid, date, *, cat="상담", time="10:30", ic=0, ie=0, ec=0, ee=0, memo="", tenant="t1"):
+    return dps.upsert_entry(tenant, {
+        "id": eid, "date": date, "time": time, "category": cat, "task": "",
+        "income_cash": ic, "income_etc": ie, "exp_cash": ec, "exp_etc": ee, "memo": memo,
+    })
+
+
+def _seed():
+    _put("a", "2023-10-02", ic=10000, time="09:10")
+    _put("b", "2023-10-02", cat="현금출금", ec=2000)
+    _put("c", "2024-10-05", ie=50000, ee=3500, memo=CARD, time="14:00")
+    _put("d", "2024-10-06", ic=20000, memo=TAX)
+    _put("e", TODAY, ic=7000, ee=1000, memo=CARD)
+
+
+def _snapshot(SessionLocal, tenant="t1"):
+    from backend.db.models.daily import DailyRollup
+    with SessionLocal() as s:
+        rows = s.scalars(select(DailyRollup).where(DailyRollup.tenant_id == tenant,
+                                                   DailyRollup.entry_count > 0)).all()
+        return {(r.grain, r.period): ro._row_to_dict(r) for r in rows}
+
+
+def _rebuilt(SessionLocal, tenant="t1"):
+    with SessionLocal() as s:
+        ro.rebuild_tenant(s, tenant)
+        s.commit()
+    return _snapshot(SessionLocal, tenant)
+
+
+def test_lazy_rebuild_then_incremental_matches_rebuild(db):
+    _seed()
+    assert _snapshot(db) == {}                      # 상태 없음 → 쓰기는 롤업 미반영
+    oct24 = ro.month_rollups("t1", ["2024-10"])["2024-10"]
+    assert oct24["card_expense"] == 3000 and oct24["card_income"] == 50000
+    assert oct24["reported_sales"] == 70000
+
+    _put("c", "2024-10-05", ie=40000, memo="", time="15:00")   # 카드 → 일반, 시간 변경
+    _put("f", "2024-09-30", cat="번역", ic=9000)
+    dps.delete_entry("t1", "a")
+    assert dps.delete_entry("t1", "a") is False
+    incremental = _snapshot(db)
+    assert incremental == _rebuilt(db)
+    assert ("month", "2023-10") in incremental and ("day", "2023-10-02") in incremental
+    oct24 = incremental[("month", "2024-10")]
+    assert "14" not in oct24["hour"] and oct24["hour"]["15"] == (40000, 1)
+
+
+def test_tenant_isolation(db):
+    _seed()
+    _put("x", "2024-10-05", ic=1, tenant="t2")
+    assert ro.month_rollups("t2") == {"2024-10": ro.month_rollups("t2")["2024-10"]}
+    assert ro.month_rollups("t1")["2024-10"]["entry_count"] == 2
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from backend.auth import get_current_user
+    from backend.routers import daily as r
+    from backend.services import fixed_expense_pg_service, monthly_tax_pg_service
+
+    monkeypatch.setattr(fixed_expense_pg_service, "list_fixed_expenses", lambda t: [])
+    monkeypatch.setattr(monthly_tax_pg_service, "get_tax_summary", lambda t, ym: None)
+    app = FastAPI()
+    app.include_router(r.router, prefix="/api/daily")
+    app.dependency_overrides[get_current_user] = lambda: {"login_id": "u1", "tenant_id": "t1"}
+    return TestClient(app)
+
+
+def test_monthly_analysis_from_rollups(client):
+    _seed()
+    body = client.get("/api/daily/monthly-analysis", params={"year": 2023, "month": 10}).json()
+    assert body["summary_table"][0] == {"month": "2023-10", "income_cash": 10000, "income_etc": 0,
+                                        "exp_cash": 2000, "exp_etc": 0, "net": 8000}
+    assert {c["name"]: c["net"] for c in body["category"]} == {"상담": 10000, "현금출금": -2000}
+    assert body["hour"] == [{"hour": "09시", "net": 10000}, {"hour": "10시", "net": -2000}]
+    assert sum(d["net"] for d in body["dow"]) == 8000 and len(body["dow"]) == 7
+
+
+def test_card_and_income_summary(client):
+    _seed()
+    card = client.get("/api/daily/card-expense-summary").json()
+    assert (card["today"], card["month"]) == (3000, 3000)
+    inc = client.get("/api/daily/income-summary").json()
+    assert inc["today"] == 7000 and inc["month"] == 7000
+
+
+def test_yearly_overview_from_rollups(client):
+    _seed()
+    body = client.get("/api/daily/yearly-overview", params={"year": 2024, "month": 10}).json()
+    assert 2023 in body["years"] and 2024 in body["years"]
+    prev = body["monthly_by_year"]["2023"][9]
+    assert (prev["sales"], prev["count"]) == (10000, 1)     # 현금출금 제외
+    cur = body["monthly_by_year"]["2024"][9]
+    assert (cur["card"], cur["net"]) == (3000, 66500)
+    tax = body["tax"]
+    assert (tax["auto_card_sales"], tax["auto_card_count"], tax["auto_reported_sales"]) == (50000, 1, 70000)
+    assert {c["name"] for c in body["category_compare"]} == {"상담"}
+
+
+def test_payment_slots_parsed_on_write(db):
+    from backend.db.models.daily import DailyEntry
+    assert dps.memo_slots("메모만") == {
+        "inc_method": None, "exp1_method": None, "exp1_amount": 0,
+        "exp2_method": None, "exp2_amount": 0, "tax_invoice": False,
+    }
+    _put("c", "2024-10-05", ie=50000, memo=CARD + " 비고")
+    _put("d", "2024-10-06", ic=20000, memo="[KID]inc=현금;e1=카드;e1a=1,200;tax=true[/KID]")
+    with db() as s:
+        rows = {r.entry_id: r for r in s.scalars(select(DailyEntry)).all()}
+    c, d = rows["c"], rows["d"]
+    assert (c.inc_method, c.exp1_method, c.exp1_amount, c.exp2_method, c.exp2_amount,
+            c.tax_invoice) == ("카드", "카드", 3000, "현금", 500, False)
+    assert (d.inc_method, d.exp1_amount, d.tax_invoice) == ("현금", 1200, True)
+    assert "inc_method" not in dps.list_entries("t1")[0]      # API 응답 형식 불변
+    oct24 = ro.month_rollups("t1", ["2024-10"])["2024-10"]
+    assert (oct24["card_expense"], oct24["card_income"], oct24["reported_sales"]) == (4200, 50000, 70000)
+
+
+def test_import_scripts_fill_payment_slots():
+    from backend.scripts.apply_missing_xlsx_rows_to_pg_cutover import _daily_fields
+    f = _daily_fields({"date": "2024-10-05", "income_etc": "50,000", "memo": CARD})
+    assert (f["inc_method"], f["exp1_method"], f["exp1_amount"], f["exp2_amount"]) == ("카드", "카드", 3000, 500)
+
+
+def test_snapshot_import_invalidates_rollups(db):
+    import openpyxl
+    from backend.db.models.daily import DailyBalance
+    from backend.scripts.import_excel_snapshot_to_pg_local import imp_daily
+
+    DailyBalance.__table__.create(db.kw["bind"])
+    _seed()
+    assert ro.month_rollups("t1", ["2024-10"])["2024-10"]["entry_count"] == 2    # 롤업 적재
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "일일결산"
+    ws.append(["id", "date", "time", "category", "income_cash", "memo"])
+    ws.append(["x", "2024-10-07", "11:00", "상담", "9000", CARD])
+    with db() as s:
+        imp_daily(s, wb, "t1", "hanwoory_customers")
+        s.commit()
+    oct24 = ro.month_rollups("t1", ["2024-10"])["2024-10"]
+    assert oct24["entry_count"] == 3 and oct24 == _rebuilt(db)[("month", "2024-10")]
+
+
+def _race(monkeypatch, competitor):
+    """첫 _entry_facts(읽은 직후) 시점에 competitor 를 끼워 넣는다 — 읽기와 쓰기 사이의 경쟁 재현."""
+    real = dps._entry_facts
+    state = {"fired": False}
+
+    def hooked(row):
+        if not state["fired"]:
+            state["fired"] = True
+            competitor()
+        return real(row)
+
+    monkeypatch.setattr(dps, "_entry_facts", hooked)
+    return state
+
+
+def test_concurrent_double_delete_subtracts_once(db, monkeypatch):
+    _seed()
+    ro.month_rollups("t1")                          # 롤업 상태 생성 → 이후 증분
+    results = []
+    _race(monkeypatch, lambda: results.append(dps.delete_entry("t1", "a")))
+    results.append(dps.delete_entry("t1", "a"))
+    assert sorted(results) == [False, True]
+    assert _snapshot(db) == _rebuilt(db)
+    assert ("month", "2023-10") in _snapshot(db)    # b 는 남아 있다
+
+
+def test_concurrent_update_applies_latest_old(db, monkeypatch):
+    _seed()
+    ro.month_rollups("t1")
+    _race(monkeypatch, lambda: _put("d", "2024-10-06", ic=5000, memo=TAX))
+    _put("d", "2024-10-07", ic=30000)
+    assert _snapshot(db) == _rebuilt(db)
+    (d,) = dps.list_entries("t1", "2024-10-07")
+    assert d["id"] == "d" and d["income_cash"] == 30000
+    assert ("day", "2024-10-06") not in _snapshot(db)
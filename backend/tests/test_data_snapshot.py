@@ -0,0 +1,71 @@
+"""정적 JSON 스냅샷(data_snapshot) 테스트.
+
+검증:
+- 문자열 멀티맵 스냅샷이 원본 dict 와 같은 get / in / 키 순회 / len 을 제공.
+- 원본 JSON 이 바뀌면(sha256 불일치) 스냅샷을 버리고 JSON 으로 폴백, refresh 로 재생성.
+- 객체 스냅샷(pickle) 왕복 + 해시 불일치 폴백.
+- addr_service 가 스냅샷 경로로 실제 addr_index 를 읽어 주소 보정이 동작.
+
+실행: pytest backend/tests/test_data_snapshot.py
+"""
+import json
+
+from backend.services import data_snapshot as ds
+
+_MAPS = {
+    "roads": {"서울특별시|강남구": ["테헤란로", "강남대로"], "부산광역시|중구": ["중앙대로"]},
+    "dongs": {"서울특별시|강남구": ["역삼동"], "empty": []},
+}
+
+
+def _write_json(path, obj):
+    path.write_text(json.dumps(obj, ensure_ascii=False), encoding="utf-8")
+
+
+def test_multimap_roundtrip_behaves_like_dict(tmp_path):
+    src, snap = tmp_path / "idx.json", tmp_path / "idx.snap"
+    _write_json(src, _MAPS)
+    assert isinstance(ds.load_json_multimaps(src, snap, refresh=True), dict)  # 최초: JSON 폴백
+    maps = ds.load_json_multimaps(src, snap)
+    roads = maps["roads"]
+    assert isinstance(roads, ds.StringMultimap)
+    assert sorted(roads) == sorted(_MAPS["roads"]) and len(roads) == 2
+    assert roads["서울특별시|강남구"] == ["테헤란로", "강남대로"]
+    assert roads.get("없는키", []) == [] and "부산광역시|중구" in roads
+    assert maps["dongs"]["empty"] == []
+
+
+def test_stale_snapshot_falls_back_and_refreshes(tmp_path):
+    src, snap = tmp_path / "idx.json", tmp_path / "idx.snap"
+    _write_json(src, _MAPS)
+    ds.load_json_multimaps(src, snap, refresh=True)
+    _write_json(src, {"roads": {"k": ["새길"]}, "dongs": {}})
+    data = ds.load_json_multimaps(src, snap)
+    assert data == {"roads": {"k": ["새길"]}, "dongs": {}}       # 해시 불일치 → JSON
+    ds.load_json_multimaps(src, snap, refresh=True)
+    assert ds.load_json_multimaps(src, snap)["roads"]["k"] == ["새길"]
+    snap.write_bytes(b"garbage")
+    assert ds.load_json_multimaps(src, snap)["roads"] == {"k": ["새길"]}
+
+
+def test_object_snapshot_roundtrip_and_invalidation(tmp_path):
+    src = tmp_path / "db.json"
+    snap = ds.snapshot_path(src, "object")
+    assert snap.name == "db.pkl.snap"
+    _write_json(src, {"master_rows": [{"row_id": "R1"}]})
+    assert ds.load_json_object(src, snap, refresh=True) == {"master_rows": [{"row_id": "R1"}]}
+    assert snap.exists()
+    assert ds.load_json_object(src, snap)["master_rows"][0]["row_id"] == "R1"
+    _write_json(src, {"master_rows": []})
+    assert ds.load_json_object(src, snap) == {"master_rows": []}
+
+
+def test_addr_service_reads_snapshot(tmp_path, monkeypatch):
+    from backend.services import addr_service as addr
+    monkeypatch.setattr(addr, "_SNAPSHOT_PATH", tmp_path / "addr_index.snap")
+    monkeypatch.setattr(addr, "_index", None)
+    addr._load_index()                                  # JSON 폴백 + 스냅샷 생성
+    monkeypatch.setattr(addr, "_index", None)
+    idx = addr._load_index()
+    assert isinstance(idx["roads"], ds.StringMultimap) and len(idx["roads"]) > 200
+    assert addr.correct_address("서울특별시 강남구 테헤란로 123") == "서울특별시 강남구 테헤란로 123"
@@ -0,0 +1,88 @@
+"""DOC N 슬롯 게이트(global_limit_sync slots=N) 테스트 — PG 미구성 process-local 경로.
+
+검증:
+- slots=2 면 동시에 2개까지 진입, 3번째는 슬롯이 빌 때까지 대기.
+- SlotLease 에 대기(wait_s)·점유(hold_s) 시간이 기록된다.
+- wait_timeout 안에 못 잡으면 ConcurrencyBusy.
+- PG 경로 슬롯 선택: slots=1 은 단일 키, slots>1 은 (key, slot) 2-키 형식.
+
+실행: pytest backend/tests/test_doc_slot_gate.py
+"""
+import threading
+import time
+
+import pytest
+
+from backend.services import global_concurrency as gc
+
+
+@pytest.fixture(autouse=True)
+def _local(monkeypatch):
+    monkeypatch.setattr(gc._db, "is_configured", lambda: False)
+    monkeypatch.setattr(gc, "_GATES", {})
+
+
+def test_two_slots_admit_two_and_queue_third():
+    inside, peak, leases = [], [0], []
+    lock = threading.Lock()
+
+    def _job():
+        with gc.global_limit_sync(4242, slots=2, wait_timeout=5) as lease:
+            with lock:
+                inside.append(1)
+                peak[0] = max(peak[0], len(inside))
+            time.sleep(0.15)
+            with lock:
+                inside.pop()
+        leases.append(lease)
+
+    threads = [threading.Thread(target=_job) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak[0] == 2
+    waits = sorted(l.wait_s for l in leases)
+    assert waits[0] < 0.05 and waits[2] >= 0.1
+    assert all(l.hold_s >= 0.15 for l in leases)
+
+
+def test_busy_after_wait_timeout():
+    with gc.global_limit_sync(4243, slots=1, wait_timeout=1):
+        got = []
+
+        def _other():
+            try:
+                with gc.global_limit_sync(4243, slots=1, wait_timeout=0.05):
+                    got.append("entered")
+            except gc.ConcurrencyBusy:
+                got.append("busy")
+
+        t = threading.Thread(target=_other)
+        t.start()
+        t.join()
+    assert got == ["busy"]
+
+
+class _Conn:
+    def __init__(self, taken):
+        self.taken, self.sql = taken, []
+
+    def execute(self, stmt, params):
+        self.sql.append((str(stmt), dict(params)))
+        slot = params.get("s", 0)
+
+        class _R:
+            def scalar(_self):
+                return slot not in self.taken
+        return _R()
+
+
+def test_pg_slot_selection_uses_two_key_form():
+    conn = _Conn(taken={0})
+    assert gc._pg_try_slot(conn, 815002, 3) == 1
+    assert [p for _, p in conn.sql] == [{"k": 815002, "s": 0}, {"k": 815002, "s": 1}]
+    one = _Conn(taken=set())
+    assert gc._pg_try_slot(one, 815002, 1) == 0
+    assert one.sql == [("SELECT pg_try_advisory_lock(:k)", {"k": 815002})]
+    assert gc._pg_try_slot(_Conn(taken={0, 1}), 815002, 2) is None
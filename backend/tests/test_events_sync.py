@@ -0,0 +1,123 @@
+"""일정 기간 조회 + 증분 동기화(events_pg_service / GET /events) 테스트.
+
+SQLite 임시 DB + get_sessionmaker monkeypatch + FastAPI TestClient(get_current_user override).
+
+검증:
+- from/to 기간 조회는 그 기간 날짜만, 버전(ETag/X-Events-Version)과 함께 반환한다.
+- 저장/삭제마다 테넌트 버전이 오르고, since=버전 조회는 바뀐 날짜만(삭제 날짜는 []) 준다.
+- 내용이 같은 저장·없는 날짜 삭제는 버전을 올리지 않는다.
+- 변경이 없으면(since=현재 버전 / If-None-Match 일치) 304.
+- 파라미터 없는 GET 은 기존 전체 맵 그대로.
+
+실행: pytest backend/tests/test_events_sync.py
+"""
+import pytest
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.services import cache_service as cs
+from backend.services import events_pg_service as ev
+
+
+@compiles(BigInteger, "sqlite")
+def _bigint_as_integer(element, compiler, **kw):  # noqa: ANN001
+    return "INTEGER"
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_json(element, compiler, **kw):  # noqa: ANN001
+    return "JSON"
+
+
+TID = "T-EV"
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    from backend.db.base import Base
+    from backend.db.models.event import Event, EventDateChange, EventSyncState
+    from backend.db.models.tenant import Tenant
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'ev.db'}", future=True)
+    Base.metadata.create_all(engine, tables=[
+        Tenant.__table__, Event.__table__, EventSyncState.__table__, EventDateChange.__table__,
+    ])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=Session)
+    import backend.db.session as dbs
+    monkeypatch.setattr(dbs, "get_sessionmaker", lambda: SessionLocal)
+    monkeypatch.setattr(cs, "_cache", cs.ResponseCache(max_entries=64, stripes=4))
+    with SessionLocal() as s:
+        s.add(Tenant(tenant_id=TID, office_name="일정사무소"))
+        s.commit()
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from backend.auth import get_current_user
+    from backend.routers import events as r
+
+    app = FastAPI()
+    app.include_router(r.router, prefix="/api/events")
+    app.dependency_overrides[get_current_user] = lambda: {"tenant_id": TID}
+    return TestClient(app)
+
+
+def _seed():
+    ev.save_events_for_date(TID, "2025-12-30", ["작년 일정"])
+    ev.save_events_for_date(TID, "2026-10-01", ["체류 연장", "출입국 방문"])
+    ev.save_events_for_date(TID, "2026-10-15", ["서류 접수"])
+    ev.save_events_for_date(TID, "2026-11-02", ["다음 달"])
+
+
+def test_range_and_changes_service(client):
+    assert ev.events_version(TID) == 0
+    _seed()
+    assert ev.events_version(TID) == 4
+
+    data, v = ev.get_events_range(TID, "2026-10-01", "2026-10-31")
+    assert data == {"2026-10-01": ["체류 연장", "출입국 방문"], "2026-10-15": ["서류 접수"]}
+    assert v == 4
+    assert ev.get_events_changes(TID, 4, "2026-10-01", "2026-10-31") == ({}, 4)
+
+    ev.save_events_for_date(TID, "2026-10-15", ["서류 접수"])        # 내용 동일 → 버전 유지
+    assert ev.delete_events_for_date(TID, "2026-10-20") == 0         # 없는 날짜 → 버전 유지
+    assert ev.events_version(TID) == 4
+
+    ev.save_events_for_date(TID, "2026-10-15", ["서류 접수", "수수료 납부"])
+    ev.delete_events_for_date(TID, "2026-10-01")
+    ev.save_events_for_date(TID, "2026-11-02", ["범위 밖 변경"])
+    changes, v = ev.get_events_changes(TID, 4, "2026-10-01", "2026-10-31")
+    assert v == 7
+    assert changes == {"2026-10-01": [], "2026-10-15": ["서류 접수", "수수료 납부"]}
+    assert ev.get_events_changes(TID, 6)[0] == {"2026-11-02": ["범위 밖 변경"]}
+
+
+def test_http_etag_since_and_304(client):
+    _seed()
+    res = client.get("/api/events", params={"from": "2026-10-01", "to": "2026-10-31"})
+    assert res.status_code == 200
+    assert set(res.json()) == {"2026-10-01", "2026-10-15"}
+    etag, ver = res.headers["etag"], res.headers["x-events-version"]
+    assert (etag, ver) == ('"ev-4"', "4")
+
+    res = client.get("/api/events", params={"from": "2026-10-01", "to": "2026-10-31"},
+                     headers={"If-None-Match": etag})
+    assert res.status_code == 304 and res.content == b""
+    assert client.get("/api/events", params={"from": "2026-10-01", "to": "2026-10-31",
+                                             "since": ver}).status_code == 304
+
+    client.delete("/api/events/2026-10-01")                 # 쓰기 → 캐시된 버전 무효화
+    res = client.get("/api/events", params={"from": "2026-10-01", "to": "2026-10-31", "since": ver})
+    assert res.status_code == 200
+    assert res.json() == {"2026-10-01": []}
+    assert res.headers["x-events-version"] == "5"
+
+
+def test_full_map_and_validation(client):
+    _seed()
+    full = client.get("/api/events")
+    assert full.status_code == 200 and len(full.json()) == 4 and "etag" not in full.headers
+    assert client.get("/api/events", params={"from": "2026/10/01"}).status_code == 400
+    assert client.get("/api/events", params={"from": "2026-11-01", "to": "2026-10-01"}).status_code == 400
+    assert client.get("/api/events", params={"since": -1}).status_code == 422
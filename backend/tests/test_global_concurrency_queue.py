@@ -0,0 +1,192 @@
+"""OCR/DOC 전역 게이트 FIFO 대기열 테스트 — process-local 경로 + PG 단계 직렬화(가짜 PG).
+
+검증:
+- 대기자는 도착 순서대로 들어가고, lease.position 은 도착 시 앞에 있던 요청 수다.
+- 반납 즉시 다음 대기자에게 인계(poll 간격만큼의 빈 지연 없음).
+- async(global_limit) 대기는 스레드를 잡지 않고, 시간 초과/취소된 대기자는 줄에서 빠진다.
+- PG 구성 시 워커 안에서는 맨 앞 1명만 PG 단계(_pg_acquire)에 들어간다.
+- PG 단계: 게이트 blocking 대기(lock_timeout) → 슬롯 없으면 LISTEN 후 NOTIFY 대기 → 게이트 반납.
+- stats() 에 키별 획득/거절, 대기·점유 시간 분포가 쌓인다.
+
+실행: pytest backend/tests/test_global_concurrency_queue.py
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.services import global_concurrency as gc
+
+
+@pytest.fixture(autouse=True)
+def _local(monkeypatch):
+    monkeypatch.setattr(gc._db, "is_configured", lambda: False)
+    monkeypatch.setattr(gc, "_GATES", {})
+    monkeypatch.setattr(gc, "_METRICS", {})
+
+
+def _start_in_order(targets):
+    threads = []
+    for fn in targets:
+        t = threading.Thread(target=fn)
+        t.start()
+        threads.append(t)
+        time.sleep(0.03)            # 도착 순서 고정
+    return threads
+
+
+def test_fifo_order_positions_and_immediate_handoff():
+    order, leases = [], {}
+
+    def _job(i):
+        def run():
+            with gc.global_limit_sync(5001, slots=1, wait_timeout=5) as lease:
+                order.append(i)
+                leases[i] = lease
+                time.sleep(0.05)
+        return run
+
+    with gc.global_limit_sync(5001, slots=1, wait_timeout=1):
+        threads = _start_in_order([_job(i) for i in range(4)])
+        time.sleep(0.05)
+        assert gc.queue_status(5001, 1) == {"slots": 1, "holding": 1, "waiting": 4, "scope": "local"}
+    for t in threads:
+        t.join()
+    assert order == [0, 1, 2, 3]
+    assert [leases[i].position for i in range(4)] == [1, 2, 3, 4]
+    # 앞 사람 점유(0.05s) 직후 인계 — poll(0.25s) 지연 없음
+    gaps = [leases[i + 1].acquired_at - leases[i].released_at for i in range(3)]
+    assert max(gaps) < 0.03
+
+
+def test_async_waiters_fifo_timeout_and_cancel():
+    async def main():
+        order = []
+        first = gc.global_limit(5002, wait_timeout=1)
+        await first.__aenter__()
+
+        async def waiter(i, timeout):
+            try:
+                async with gc.global_limit(5002, wait_timeout=timeout) as lease:
+                    order.append((i, lease.position))
+            except gc.ConcurrencyBusy:
+                order.append((i, "busy"))
+
+        t_busy = asyncio.create_task(waiter("late", 0.05))
+        await asyncio.sleep(0.01)
+        t_cancel = asyncio.create_task(waiter("gone", 5))
+        await asyncio.sleep(0.01)
+        t_ok = asyncio.create_task(waiter("ok", 5))
+        await asyncio.sleep(0.1)
+        t_cancel.cancel()
+        await asyncio.sleep(0.01)
+        assert gc._gate(5002, 1).waiting == 1
+        await first.__aexit__(None, None, None)
+        await asyncio.gather(t_busy, t_ok, return_exceptions=True)
+        return order
+
+    order = asyncio.run(main())
+    assert order == [("late", "busy"), ("ok", 3)]
+    st = gc.stats()["5002"]
+    assert (st["acquired"], st["busy"], st["holding"]) == (2, 1, 0)
+    assert st["wait"]["n"] == 2 and st["hold"]["max_ms"] >= 100
+
+
+def test_immediate_busy_when_no_wait():
+    async def main():
+        async with gc.global_limit(5003):
+            with pytest.raises(gc.ConcurrencyBusy):
+                async with gc.global_limit(5003):
+                    pass
+    asyncio.run(main())
+
+
+def test_pg_stage_entered_by_one_contender_per_worker(monkeypatch):
+    monkeypatch.setattr(gc._db, "is_configured", lambda: True)
+    inside, peak, lock = [0], [0], threading.Lock()
+    held = threading.Semaphore(1)          # 가짜 전역 슬롯 1개
+
+    def fake_acquire(key, slots, deadline):
+        with lock:
+            inside[0] += 1
+            peak[0] = max(peak[0], inside[0])
+        try:
+            if not held.acquire(timeout=max(0.0, deadline - time.monotonic())):
+                raise gc.ConcurrencyBusy()
+            return object(), 0, 2          # 다른 워커 2명이 앞에 있었다고 가정
+        finally:
+            with lock:
+                inside[0] -= 1
+
+    monkeypatch.setattr(gc, "_pg_acquire", fake_acquire)
+    monkeypatch.setattr(gc, "_pg_release", lambda conn, key, slots, slot: held.release())
+    positions = []
+
+    def _job():
+        with gc.global_limit_sync(5004, slots=1, wait_timeout=5) as lease:
+            positions.append(lease.position)
+            time.sleep(0.1)
+
+    threads = _start_in_order([_job] * 4)
+    for t in threads:
+        t.join()
+    assert peak[0] == 1
+    # 1번은 즉시, 2번은 PG 단계에서 대기(로컬 앞 0명), 3·4번은 로컬 줄에서 대기 + 다른 워커 2명
+    assert positions == [2, 2, 3, 4]
+
+
+class _PgConn:
+    """SQL 문자열로 응답하는 가짜 AUTOCOMMIT 연결."""
+
+    def __init__(self, free_after_notify=1):
+        self.sql, self.closed, self.notifies = [], False, 0
+        self.free_after_notify = free_after_notify
+
+    def execution_options(self, **kw):
+        return self
+
+    def execute(self, stmt, params=None):
+        q = str(stmt)
+        self.sql.append(q)
+        val = None
+        if "pg_try_advisory_lock(:k, :g)" in q:
+            val = False                                    # 다른 워커가 게이트 보유
+        elif "count(*)" in q:
+            val = 3
+        elif "pg_try_advisory_lock(:k)" in q:
+            val = self.notifies >= self.free_after_notify  # 반납 NOTIFY 후에야 빈다
+
+        class _R:
+            def scalar(_self):
+                return val
+        return _R()
+
+    def close(self):
+        self.closed = True
+
+
+def test_pg_acquire_gate_listen_and_handoff(monkeypatch):
+    conn = _PgConn()
+    monkeypatch.setattr(gc._db, "get_engine", lambda: type("E", (), {"connect": lambda self: conn})())
+    monkeypatch.setattr(gc, "_wait_notify", lambda c, timeout: setattr(c, "notifies", c.notifies + 1))
+    got, slot, ahead = gc._pg_acquire(815001, 1, time.monotonic() + 5)
+    assert (got, slot, ahead, conn.closed) == (conn, 0, 3, False)
+    steps = [q.split("(")[0].replace("SELECT ", "").split(" ")[0] for q in conn.sql]
+    assert steps == ["pg_try_advisory_lock", "count", "set_config", "pg_advisory_lock", "RESET",
+                     "pg_try_advisory_lock", "LISTEN", "pg_try_advisory_lock",
+                     "pg_try_advisory_lock", "UNLISTEN", "pg_advisory_unlock"]
+    gc._pg_release(conn, 815001, 1, 0)
+    assert conn.sql[-2:] == ["SELECT pg_advisory_unlock(:k)", "SELECT pg_notify(:ch, '')"]
+    assert conn.closed
+
+
+def test_pg_acquire_timeout_leaves_gate(monkeypatch):
+    conn = _PgConn(free_after_notify=99)
+    monkeypatch.setattr(gc._db, "get_engine", lambda: type("E", (), {"connect": lambda self: conn})())
+    monkeypatch.setattr(gc, "_wait_notify", lambda c, timeout: time.sleep(timeout))
+    monkeypatch.setattr(gc, "SLOT_RECHECK_SECONDS", 0.02)
+    with pytest.raises(gc.ConcurrencyBusy):
+        gc._pg_acquire(815001, 1, time.monotonic() + 0.1)
+    assert conn.sql[-2:] == ['UNLISTEN "kid_slot_815001"', "SELECT pg_advisory_unlock(:k, :g)"]
+    assert conn.closed
@@ -0,0 +1,57 @@
+"""실무지침 검색 역색인(GuidelineSearchIndex) 테스트.
+
+실제 backend/data/immigration_guidelines_db_v2.json 으로 과거 선형 검색과 결과 집합이 같은지,
+관련도 정렬·필터·결과 캐시·행 갱신(refresh_row)이 동작하는지 검증한다.
+
+실행: pytest backend/tests/test_guideline_search_index.py
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from backend.scripts.bench_guideline_search import QUERIES, linear_search
+from backend.services.guideline_search_index import GuidelineSearchIndex
+
+_DB = Path(__file__).resolve().parents[1] / "data" / "immigration_guidelines_db_v2.json"
+
+
+@pytest.fixture(scope="module")
+def rows():
+    with open(_DB, encoding="utf-8") as f:
+        return json.load(f)["master_rows"]
+
+
+@pytest.mark.parametrize("q", QUERIES + ["  F-4  ", "F-4-1", "-"])
+def test_same_result_set_as_linear_scan(rows, q):
+    idx = GuidelineSearchIndex(rows)
+    assert set(idx.search_ids(q)) == linear_search(rows, q)
+
+
+def test_code_exact_ranks_first_and_filters(rows):
+    idx = GuidelineSearchIndex(rows)
+    ids = idx.search_ids("f-4")
+    by_id = {r["row_id"]: r for r in rows}
+    exact = [i for i in ids if by_id[i]["detailed_code"].lower() == "f-4"]
+    assert exact and ids[:len(exact)] == exact
+    only_change = idx.search_ids("F-4", action_type="CHANGE")
+    assert only_change and all(by_id[i]["action_type"] == "CHANGE" for i in only_change)
+    assert set(only_change) <= set(ids)
+
+
+def test_result_cache_and_refresh_row():
+    rows = [
+        {"row_id": "R1", "detailed_code": "A-1", "business_name": "외교", "form_docs": "통합신청서"},
+        {"row_id": "R2", "detailed_code": "B-1", "business_name": "사증면제",
+         "search_keys": [{"key_value": "무비자"}]},
+    ]
+    idx = GuidelineSearchIndex(rows)
+    assert idx.search_ids("비자") == ["R2"]
+    assert idx.search_ids("비자") == ["R2"]
+    assert idx.stats()["cache_hits"] == 1
+
+    rows[0]["form_docs"] = "비자 신청서"
+    assert idx.search_ids("비자") == ["R2"]          # refresh 전: 캐시/색인 그대로
+    idx.refresh_row(rows[0])
+    assert idx.search_ids("비자") == ["R2", "R1"]    # 검색키(30) > 서류(5)
+    assert idx.search_ids("통합") == []
@@ -0,0 +1,91 @@
+"""매뉴얼 페이지 diff(manual_update_local.diff_pages) 정렬 테스트.
+
+순수 함수 — DB/node 불필요.
+
+검증:
+- 앞쪽 1쪽 삽입/삭제는 added/deleted 1행뿐, 뒤 페이지는 same(번호만 이동).
+- 정렬 밖으로 밀려난 같은 내용 페이지는 moved(moved_from=원래 baseline 페이지).
+- 크기가 다른 replace 블록은 유사한 페이지끼리 modified, 나머지는 added.
+- 변경 없는 입력은 전부 same, 유사도는 shingle 기반 0..1.
+- 삽입으로 번호만 밀린 페이지를 가리키는 manual_ref 는 새 번호로 재매핑 후보가 된다
+  (파일 기반 make_ref_candidates / PG compute_candidates 모두).
+
+실행: pytest backend/tests/test_manual_diff_pages.py
+"""
+import hashlib
+import json
+
+from backend.scripts import manual_update_local as mul
+from backend.scripts.manual_update_local import _similarity, diff_pages
+
+
+def _pages(texts):
+    return [{"rhwp_page_index": i + 1, "manual_label": "residence", "text": t,
+             "normalized_text_hash": hashlib.sha256(t.encode()).hexdigest(), "keywords": []}
+            for i, t in enumerate(texts)]
+
+
+BASE = [f"제{i}장 체류자격 변경허가 신청 요건과 제출서류 안내 {i} " * 8 for i in range(1, 21)]
+
+
+def _non_same(rows):
+    return [(r["change_type"], r["baseline_page"], r["new_page"]) for r in rows if r["change_type"] != "same"]
+
+
+def test_front_insert_only_adds_one_row():
+    rows = diff_pages(_pages(BASE), _pages(["신설 안내문"] + BASE))
+    assert _non_same(rows) == [("added", None, 1)]
+    same = [r for r in rows if r["change_type"] == "same"]
+    assert len(same) == 20 and all(r["new_page"] == r["baseline_page"] + 1 for r in same)
+
+
+def test_delete_and_modify():
+    new = BASE[:3] + BASE[4:9] + [BASE[9] + " 개정 문구 추가"] + BASE[10:]
+    assert _non_same(diff_pages(_pages(BASE), _pages(new))) == [("deleted", 4, None), ("modified", 10, 9)]
+
+
+def test_moved_block():
+    new = BASE[:2] + BASE[5:10] + BASE[2:5] + BASE[10:]
+    rows = diff_pages(_pages(BASE), _pages(new))
+    moved = [r for r in rows if r["change_type"] != "same"]
+    assert {r["change_type"] for r in moved} == {"moved"}
+    assert {(r["moved_from"], r["new_page"]) for r in moved} == {(3, 8), (4, 9), (5, 10)}
+    assert all(r["similarity"] == 1.0 for r in moved)
+
+
+def test_uneven_replace_pairs_by_similarity():
+    new = BASE[:5] + ["완전히 새로운 별표 서식"] + [BASE[5] + " 일부 수정"] + BASE[6:]
+    assert _non_same(diff_pages(_pages(BASE), _pages(new))) == [("added", None, 6), ("modified", 6, 7)]
+
+
+def test_identical_and_similarity_range():
+    assert _non_same(diff_pages(_pages(BASE), _pages(BASE))) == []
+    assert _similarity("", "") == 1.0 and _similarity("abcdef", "uvwxyz") == 0.0
+    assert 0.9 < _similarity(BASE[0], BASE[0] + "추가") < 1.0
+
+
+def test_insert_remaps_shifted_refs(monkeypatch, tmp_path):
+    from backend.services.manual_update_pg_service import compute_candidates
+
+    new_pages = _pages(BASE[:1] + ["신설 안내문"] + BASE[1:])
+    changed = diff_pages(_pages(BASE), new_pages)
+    refs = [(1, 1), (2, 3), (5, 6), (20, 20)]
+
+    pg = compute_candidates(changed, {"residence": new_pages}, [
+        {"row_id": f"R{i}", "item_index": 0, "manual_label": "residence",
+         "page_from": pf, "page_to": pt} for i, (pf, pt) in enumerate(refs)])
+    db = tmp_path / "db.json"
+    db.write_text(json.dumps({"master_rows": [
+        {"row_id": f"R{i}", "manual_ref": [{"manual": "체류민원", "page_from": pf, "page_to": pt}]}
+        for i, (pf, pt) in enumerate(refs)]}, ensure_ascii=False), encoding="utf-8")
+    monkeypatch.setattr(mul, "DB_PATH", db)
+    local = mul.make_ref_candidates(changed, {"residence": new_pages})
+
+    for cands in (pg, local):
+        got = {c["row_id"]: (c["candidate_page_from"], c["candidate_page_to"], c["change_type"])
+               for c in cands}
+        assert "R0" not in got                                   # 삽입 앞 페이지는 그대로
+        assert got["R1"][:2] == (3, 4)                           # 삽입 위치와 겹침 → 검토 + 재매핑
+        assert got["R2"] == (6, 7, "shifted") and got["R3"] == (21, 21, "shifted")
+        shifted = next(c for c in cands if c["row_id"] == "R2")
+        assert shifted["action"] == "remap_candidate" and shifted["confidence"] == "high"
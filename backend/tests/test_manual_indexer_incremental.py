@@ -0,0 +1,98 @@
+"""매뉴얼 인덱서 v6 증분 재색인(manual_indexer_v6.update_incremental) 테스트.
+
+PyMuPDF 로 만든 작은 매뉴얼 PDF + 임시 인덱스/캐시 경로. 운영 PDF/DB 불필요.
+
+검증:
+- carry_over_pages: 삽입/삭제/수정 후 변경 페이지만 None(재추출), 나머지는 번호 이동.
+- 변경 페이지만 fitz 로 다시 읽고도 전체 재구축(verify)과 같은 인덱스, 이전 대비 diff 산출.
+- 변경 목록이 PDF 와 어긋나면 그 라벨은 전체 추출로 대체.
+- 개수는 맞지만 번호 대응이 틀린 변경 목록이면 hash 가 다른 페이지만 다시 추출한다.
+
+실행: pytest backend/tests/test_manual_indexer_incremental.py
+"""
+import json
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from backend.services import manual_indexer_v6 as mi  # noqa: E402
+
+
+def _page_lines(i):
+    if i == 5:
+        return ["〔F-5-1〕 국민의 배우자", "(F-5) 체류자격 변경"]
+    if 20 <= i <= 22:
+        return ["(F-4) 재외동포", "(F-4) 체류기간 연장", "(F-4) 외국인등록"]
+    return [f"일반 안내 {i}"]
+
+
+def _write_pdf(path, pages):
+    doc = fitz.open()
+    for lines in pages:
+        pg = doc.new_page()
+        for k, line in enumerate(lines):
+            pg.insert_text((40, 40 + k * 30), line, fontname="korea")
+    doc.save(path)
+    doc.close()
+
+
+@pytest.fixture
+def manual(tmp_path, monkeypatch):
+    pdf = tmp_path / "res.pdf"
+    monkeypatch.setattr(mi, "TARGETS", {"체류민원": pdf})
+    monkeypatch.setattr(mi, "INDEX_V6", tmp_path / "index.json")
+    monkeypatch.setattr(mi, "PAGES_V6", tmp_path / "pages.json")
+    base = [_page_lines(i) for i in range(1, 31)]
+    _write_pdf(pdf, base)
+    mi.build_all()
+    return pdf, base
+
+
+def test_carry_over_pages():
+    prev = [f"h{i}" for i in range(1, 7)]
+    changed = [{"change_type": "added", "baseline_page": None, "new_page": 2},
+               {"change_type": "modified", "baseline_page": 4, "new_page": 5},
+               {"change_type": "deleted", "baseline_page": 6, "new_page": None}]
+    assert mi.carry_over_pages(prev, changed, 6) == ["h1", None, "h2", "h3", None, "h5"]
+    assert mi.carry_over_pages(prev, changed, 7) is None
+
+
+def test_incremental_matches_full_and_diffs(manual, monkeypatch):
+    pdf, base = manual
+    new = base[:1] + [["신설 안내"]] + base[1:]               # p.2 삽입 → 뒤 페이지 +1
+    new[24] = ["(F-4) 재외동포", "(F-4) 체류자격외 활동", "(F-4) 외국인등록"]   # 기준 p.24 (F-4 묶음 뒤) 수정
+    _write_pdf(pdf, new)
+    changed = [{"manual_label": "residence", "change_type": "added", "baseline_page": None, "new_page": 2},
+               {"manual_label": "residence", "change_type": "modified", "baseline_page": 24, "new_page": 25}]
+    calls = []
+    real = mi.extract_page_facts
+    monkeypatch.setattr(mi, "extract_page_facts", lambda p: calls.append(p.number + 1) or real(p))
+    res = mi.update_incremental(changed=changed)
+    assert sorted(calls) == [2, 25] and res["stats"]["체류민원"]["extracted"] == 2
+
+    monkeypatch.setattr(mi, "extract_page_facts", real)
+    again = mi.update_incremental(changed=changed, verify=True)
+    assert again["verified"] is True
+    assert "F-5-1|CHANGE" in res["diff"]["action_index"]["changed"]       # p.5 → p.6
+    assert "F-4|EXTRA_WORK" in res["diff"]["action_index"]["added"]
+    entry = json.loads(mi.INDEX_V6.read_text(encoding="utf-8"))["code_index"]["F-5-1"][0]
+    assert (entry["page_from"], entry["page_to"]) == (6, 31)
+
+
+def test_mismatched_change_list_falls_back_to_full(manual):
+    pdf, base = manual
+    _write_pdf(pdf, base + [["추가 페이지"]])
+    res = mi.update_incremental(changed=[], verify=True)
+    assert res["stats"]["체류민원"]["mode"] == "full" and res["verified"] is True
+
+
+def test_wrong_alignment_reextracts_by_hash(manual):
+    pdf, base = manual
+    new = base[:9] + [["신설 안내"]] + base[9:]                # 실제 삽입 위치는 p.10
+    _write_pdf(pdf, new)
+    changed = [{"manual_label": "residence", "change_type": "added", "baseline_page": None, "new_page": 2}]
+    res = mi.update_incremental(changed=changed, verify=True)
+    st = res["stats"]["체류민원"]
+    assert res["verified"] is True and st["mode"] == "incremental"
+    assert st["hash_mismatch"] == 8 and st["extracted"] == 9     # p.3~10 은 hash 불일치 → 재추출
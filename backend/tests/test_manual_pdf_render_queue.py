@@ -0,0 +1,117 @@
+"""매뉴얼 PDF artifact 병렬 렌더 스케줄러(manual_auto_update._run_render_queue) 테스트.
+
+node/chromium 없이 _render_batch 를 가짜로 바꿔 스케줄링만 검증한다.
+
+검증:
+- 워커 수 = min(CPU, 메모리 상한 // 슬롯), env 우선, 512MB 는 1(기존 순차 동작).
+- cgroup 상한이 "max" 면 물리 메모리로 상한을 잡는다(512 기본값은 그것도 못 읽을 때만).
+- label 을 가로질러 동시에 렌더하고(work-stealing) 모든 후보가 한 번씩 처리된다.
+- OOM 실패 batch 는 절반으로 나눠 재시도, size 1 실패는 그 후보만 failed.
+- checkpoint 에 이미 있는 row_id 는 렌더 전에 빠지고 skipped_existing 으로 센다.
+- batch 별 wall_ms/peak_rss_mb 가 out["batches"] 에 남는다.
+
+실행: pytest backend/tests/test_manual_pdf_render_queue.py
+"""
+import threading
+import time
+
+from backend.services import manual_auto_update as mu
+
+
+def _cands(label, n):
+    return [{"row_id": f"{label}{i}", "manual_label": label,
+             "candidate_page_from": i * 10 + 1, "candidate_page_to": i * 10 + 1} for i in range(n)]
+
+
+def _out():
+    return {"generated": 0, "failed": 0, "skipped_existing": 0, "retry_count": 0,
+            "artifact_ids": [], "errors": [], "failed_row_ids": [], "batches": []}
+
+
+def _run(monkeypatch, tmp_path, jobs, fake, *, workers=2, batch_size=1, checkpoint=None):
+    monkeypatch.setattr(mu, "_render_batch", fake)
+    monkeypatch.setattr(mu, "_emit_genpdf_log_tail", lambda **kw: None)
+    out = _out()
+    mu._run_render_queue(jobs={lb: {"manual": lb, "hwp": None, "cands": cs} for lb, cs in jobs.items()},
+                         workers=workers, batch_size=batch_size, page_budget=30, neighbor=1,
+                         version="v1", svc=None, tmpdir=tmp_path, out=out, memory_limit_mb=4096,
+                         share_mb=2048, batch_count=0, checkpoint=checkpoint)
+    return out
+
+
+def test_render_workers(monkeypatch):
+    monkeypatch.delenv("MANUAL_PDF_RENDER_WORKERS", raising=False)
+    monkeypatch.delenv("MANUAL_PDF_RENDER_SLOT_MB", raising=False)
+    monkeypatch.setattr(mu.os, "cpu_count", lambda: 8)
+    assert mu._render_workers(512) == 1
+    assert mu._render_workers(4096) == 4
+    assert mu._render_workers(64 * 1024) == 8
+    monkeypatch.setenv("MANUAL_PDF_RENDER_SLOT_MB", "512")
+    assert mu._render_workers(2048) == 4
+    monkeypatch.setenv("MANUAL_PDF_RENDER_WORKERS", "3")
+    assert mu._render_workers(512) == 3
+
+
+def test_memory_limit_falls_back_to_physical_memory(monkeypatch, tmp_path):
+    monkeypatch.delenv("MANUAL_PDF_MEMORY_LIMIT_MB", raising=False)
+    monkeypatch.delenv("MANUAL_PDF_RENDER_WORKERS", raising=False)
+    monkeypatch.delenv("MANUAL_PDF_RENDER_SLOT_MB", raising=False)
+    limit = tmp_path / "memory.max"
+    limit.write_text("max\n", encoding="utf-8")
+    monkeypatch.setattr(mu, "_CGROUP_MEMORY_PATHS", (str(limit), str(tmp_path / "missing")))
+    pages = {"SC_PHYS_PAGES": 2 * 1024 * 1024, "SC_PAGE_SIZE": 4096}  # 8GB
+    monkeypatch.setattr(mu.os, "sysconf", lambda name: pages[name])
+    monkeypatch.setattr(mu.os, "cpu_count", lambda: 8)
+    assert mu._detect_memory_limit_mb() == 8192
+    assert mu._render_workers(mu._detect_memory_limit_mb()) > 1
+
+    def _unsupported(name):
+        raise ValueError(name)
+    monkeypatch.setattr(mu.os, "sysconf", _unsupported)
+    assert mu._detect_memory_limit_mb() == mu._DEFAULT_MEMORY_LIMIT_MB
+
+
+def test_parallel_across_labels_with_stealing(monkeypatch, tmp_path):
+    lock = threading.Lock()
+    live = {"now": 0, "max": 0}
+    seen = []
+
+    def fake(*, label, batch, out, usage, **kw):
+        with lock:
+            live["now"] += 1
+            live["max"] = max(live["max"], live["now"])
+            seen.extend(c["row_id"] for c in batch)
+        time.sleep(0.02)
+        usage.update(wall_ms=20, peak_rss_mb=100.0)
+        out["generated"] += len(batch)
+        with lock:
+            live["now"] -= 1
+
+    out = _run(monkeypatch, tmp_path, {"residence": _cands("r", 6), "visa": _cands("v", 1)}, fake)
+    assert sorted(seen) == sorted([f"r{i}" for i in range(6)] + ["v0"])
+    assert live["max"] == 2 and out["generated"] == 7
+    assert len(out["batches"]) == 7 and all(b["peak_rss_mb"] == 100.0 for b in out["batches"])
+
+
+def test_oom_split_and_single_failure(monkeypatch, tmp_path):
+    def fake(*, batch, out, **kw):
+        if len(batch) > 1 or batch[0]["row_id"] == "r1":
+            raise RuntimeError("node failed (rc=137): killed")
+        out["generated"] += 1
+
+    out = _run(monkeypatch, tmp_path, {"residence": _cands("r", 2)}, fake, batch_size=2)
+    assert out["retry_count"] == 1 and out["generated"] == 1
+    assert out["failed"] == 1 and out["failed_row_ids"] == ["r1"]
+    assert [b["status"] for b in out["batches"]].count("failed") == 2
+
+
+def test_checkpoint_skips_done(monkeypatch, tmp_path):
+    rendered = []
+
+    def fake(*, batch, out, **kw):
+        rendered.extend(c["row_id"] for c in batch)
+        out["generated"] += len(batch)
+
+    out = _run(monkeypatch, tmp_path, {"residence": _cands("r", 3)}, fake, workers=1,
+               checkpoint=lambda: {"r1"})
+    assert rendered == ["r0", "r2"] and out["skipped_existing"] == 1
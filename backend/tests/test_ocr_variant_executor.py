@@ -0,0 +1,118 @@
+"""OCR 후보 병렬 실행기(ocr_variant_executor) + 여권 MRZ/ocr_try_all 연동 테스트.
+
+Tesseract 불필요 — OCR 호출(_tess_string / pytesseract)을 가짜 함수로 바꿔 검증한다.
+
+검증:
+- 동점은 제출 순서가 앞선 후보가 이김(직렬과 같은 결과), accept 시 대기 후보 취소.
+- 시간예산(deadline) 초과 시 그때까지의 최선 반환 + timed_out 보고.
+- 과거 승리 횟수가 많은 후보가 먼저 제출됨.
+- _passport_tess_mrz: 원래 방향이 실패하면 회전 후보에서 check digit 통과 결과 채택 + 승자 보고.
+- ocr_try_all: 격자 중 가장 긴 텍스트, 동점은 격자 순서, max_tries 는 앞에서부터.
+
+실행: pytest backend/tests/test_ocr_variant_executor.py
+"""
+import threading
+import time
+
+from PIL import Image
+
+from backend.services import ocr_service as ocr
+from backend.services import ocr_variant_executor as ex
+from backend.services import tess_engine
+from backend.services.ocr_service import _mrz_check_digit
+
+
+def _build_l2(doc, nat, birth, sex, exp, optional="<" * 14):
+    doc9 = (doc + "<" * 9)[:9]
+    opt = (optional + "<" * 14)[:14]
+    comp = (doc9 + _mrz_check_digit(doc9) + birth + _mrz_check_digit(birth)
+            + exp + _mrz_check_digit(exp) + opt + _mrz_check_digit(opt))
+    return (doc9 + _mrz_check_digit(doc9) + nat + birth + _mrz_check_digit(birth) + sex
+            + exp + _mrz_check_digit(exp) + opt + _mrz_check_digit(opt) + _mrz_check_digit(comp))
+
+
+def _v(label, value, delay=0.0):
+    def _fn():
+        time.sleep(delay)
+        return value
+    return ex.Variant(label, _fn)
+
+
+def test_tie_goes_to_earlier_variant():
+    run = ex.run_variants("t_tie", [_v("a", 3, 0.05), _v("b", 3), _v("c", 1)],
+                          evaluate=lambda x: (x, x), reorder=False)
+    assert run.best_label == "a" and run.tried == 3 and not run.accepted
+
+
+def test_accept_cancels_pending(monkeypatch):
+    monkeypatch.setattr(ex, "_pool", None)
+    monkeypatch.setattr(ex, "OCR_VARIANT_WORKERS", 1)
+    started = []
+    gate = threading.Event()
+
+    def _slow(label):
+        def _fn():
+            started.append(label)
+            gate.wait(1)
+            return 0
+        return ex.Variant(label, _fn)
+
+    try:
+        run = ex.run_variants("t_accept", [_v("win", 9), _slow("x"), _slow("y")],
+                              evaluate=lambda x: (x, x), accept=lambda x: x >= 9,
+                              reorder=False)
+        assert run.accepted and run.best_label == "win"
+        assert run.cancelled >= 1 and "y" not in started
+    finally:
+        gate.set()
+        ex._executor().shutdown(wait=True)
+
+
+def test_deadline_returns_best_so_far():
+    run = ex.run_variants("t_deadline", [_v("fast", 1), _v("slow", 5, 0.5)],
+                          evaluate=lambda x: (x, x), deadline=time.monotonic() + 0.1,
+                          reorder=False)
+    assert run.timed_out and run.best_label == "fast"
+
+
+def test_prior_winner_is_submitted_first():
+    for _ in range(2):
+        ex.record_win("t_order", "late")
+    ordered = ex.order_by_wins("t_order", [_v("early", 0), _v("late", 0)])
+    assert [v.label for v in ordered] == ["late", "early"]
+
+
+def test_passport_rotation_variant_wins(monkeypatch):
+    l1 = ("P<CHNWU<<LINHU" + "<" * 44)[:44]
+    l2 = _build_l2("EF6806032", "CHN", "791210", "M", "290312")
+    calls = []
+
+    def fake_tess(img, lang, config, timeout_s=2):
+        calls.append(img.size)
+        # 가로로 긴(=회전으로 바로 선) 밴드에서만 MRZ 가 읽힌다고 가정.
+        return f"{l1}\n{l2}" if img.size[0] > img.size[1] * 3 else "noise"
+
+    monkeypatch.setattr(tess_engine, "available", lambda: True)
+    monkeypatch.setattr(ocr, "_tess_string", fake_tess)
+    img = Image.new("L", (300, 1200), 255)        # 세로로 세워진 스캔
+    res = ocr._passport_tess_mrz(img)
+    assert res["여권"] == "EF6806032" and res["생년월일"] == "1979-12-10"
+    report = res["_ocr_report"]
+    assert report["check_ok"] and report["winner"].startswith("rot")
+    assert len(report["stages"]) == 2 and report["stages"][1]["accepted"]
+
+
+def test_ocr_try_all_longest_then_grid_order(monkeypatch):
+    class FakeTess:
+        @staticmethod
+        def image_to_string(img, lang, config, timeout=None):
+            return {"--oem 3 --psm 6": "abcd", "--oem 3 --psm 7": "wxyz"}[config]
+
+    monkeypatch.setattr(tess_engine, "tesserocr", None)
+    monkeypatch.setattr(tess_engine, "pytesseract", FakeTess)
+    img = Image.new("RGB", (40, 20), "white")
+    best = ocr.ocr_try_all(img, langs=("kor", "kor+eng"))
+    assert (best["text"], best["lang"], best["config"], best["pre"]) == (
+        "abcd", "kor", "--oem 3 --psm 6", "raw")
+    best = ocr.ocr_try_all(img, langs=("kor+eng",), pres=("binarize",), psms=(7, 6), max_tries=1)
+    assert best["config"] == "--oem 3 --psm 7" and best["pre"] == "binarize"
@@ -0,0 +1,78 @@
+"""매뉴얼 PDF 페이지 텍스트 저장소(page_text_store) 테스트.
+
+PyMuPDF 로 만든 임시 PDF + 임시 SQLite 저장소. 운영 DB/매뉴얼 불필요.
+
+검증:
+- ensure_pdf 는 같은 PDF 를 한 번만 파싱하고, 이후엔 저장소에서 읽는다.
+- get_pages 는 요청한 페이지·필드만 돌려준다(text/norm/blocks/size).
+- page_texts 는 접근한 페이지만 로드한다.
+- extract_pages(업로드 변경감지) 결과가 PyMuPDF 직접 추출과 같다.
+
+실행: pytest backend/tests/test_page_text_store.py
+"""
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from backend.services import page_text_store as pts
+
+
+def _pdf(texts):
+    doc = fitz.open()
+    for t in texts:
+        page = doc.new_page(width=300, height=400)
+        page.insert_text((40, 60), t)
+    try:
+        return doc.tobytes()
+    finally:
+        doc.close()
+
+
+@pytest.fixture
+def pdf(monkeypatch, tmp_path):
+    monkeypatch.setenv("PAGE_TEXT_STORE_PATH", str(tmp_path / "pages.sqlite3"))
+    return _pdf(["page one  text", "page two", "page three"])
+
+
+def test_parses_once(pdf, monkeypatch):
+    h, n = pts.ensure_pdf(pdf)
+    assert (h, n) == (pts.pdf_sha256(pdf), 3) and pts.page_count(h) == 3
+    monkeypatch.setattr(pts, "_extract_rows", lambda *a: (_ for _ in ()).throw(AssertionError("parsed")))
+    assert pts.ensure_pdf(pdf) == (h, 3)
+    assert pts.ensure_pdf(b"ignored", pdf_hash=h) == (h, 3)
+
+
+def test_get_pages_subset_and_fields(pdf):
+    h, _n = pts.ensure_pdf(pdf)
+    rows = pts.get_pages(h, [3, 1, 9], fields=("text", "norm", "blocks", "size"))
+    assert sorted(rows) == [1, 3]
+    assert "page one" in rows[1]["text"] and rows[1]["size"] == (300.0, 400.0)
+    from backend.scripts.manual_update_local import normalize
+    assert rows[1]["norm"] == normalize(rows[1]["text"])
+    x0, y0, _x1, _y1, text = rows[3]["blocks"][0]
+    assert text.startswith("page three") and x0 >= 40 and y0 < 60
+    assert pts.get_pages(h, []) == {} and pts.get_pages("0" * 64) == {}
+
+
+def test_page_texts_lazy(pdf, monkeypatch):
+    texts = pts.page_texts(pdf)
+    calls = []
+    real = pts.get_pages
+    monkeypatch.setattr(pts, "get_pages", lambda *a, **kw: calls.append(a[1]) or real(*a, **kw))
+    assert len(texts) == 3 and list(texts) == [1, 2, 3]
+    assert "page two" in texts[2] and "page two" in texts[2]
+    assert calls == [[2]]
+    with pytest.raises(KeyError):
+        texts[4]
+    assert sorted(texts.load_all()) == [1, 2, 3] and calls[-1] == [1, 3]
+
+
+def test_extract_pages_matches_direct(pdf):
+    from backend.services import manual_pdf_upload_service as ups
+    doc = fitz.open(stream=pdf, filetype="pdf")
+    direct = [doc.load_page(i).get_text() for i in range(doc.page_count)]
+    doc.close()
+    pages = ups.extract_pages(pdf, "체류민원")
+    assert [p["text"] for p in pages] == direct
+    assert [p["rhwp_page_index"] for p in pages] == [1, 2, 3]
+    assert pages == ups._stored_pages(pts.pdf_sha256(pdf), "체류민원")
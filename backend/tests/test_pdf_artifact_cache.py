@@ -0,0 +1,107 @@
+"""매뉴얼 PDF artifact chunk 적재 + content_hash 디스크 캐시 + Range/ETag 서빙 테스트.
+
+SQLite 임시 DB(manual_pdf_artifacts) + FastAPI TestClient. 운영 DB 불필요.
+
+검증:
+- iter_pdf_artifact_blob 이 bytea 를 chunk 단위로 잘라 읽고 이어붙이면 원본과 같다.
+- materialize 는 hash 이름 파일을 1회만 만들고, 이후엔 DB 를 읽지 않는다. hash 불일치는 캐시 안 함.
+- 용량 상한 초과 시 오래된 파일부터 축출.
+- /manual-update/pdf-artifacts/{id}/content: ETag=content_hash, If-None-Match → 304, Range → 206.
+
+실행: pytest backend/tests/test_pdf_artifact_cache.py
+"""
+import hashlib
+import os
+
+import pytest
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.services import manual_update_pg_service as svc
+from backend.services import pdf_artifact_cache as pc
+
+
+@compiles(BigInteger, "sqlite")
+def _bigint_as_integer(element, compiler, **kw):  # noqa: ANN001
+    return "INTEGER"
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_json(element, compiler, **kw):  # noqa: ANN001
+    return "JSON"
+
+
+BLOB = b"%PDF-1.4\n" + bytes(range(256)) * 40 + b"\n%%EOF"
+
+
+@pytest.fixture
+def art(monkeypatch, tmp_path):
+    from backend.db.base import Base
+    from backend.db.models.manual_update import ManualPdfArtifact
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'pdf.db'}", future=True)
+    Base.metadata.create_all(engine, tables=[ManualPdfArtifact.__table__])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=Session)
+    import backend.db.session as dbs
+    monkeypatch.setattr(dbs, "get_sessionmaker", lambda: SessionLocal)
+    monkeypatch.setattr(svc, "pg_enabled", lambda: True)
+    monkeypatch.setattr(pc, "PDF_ARTIFACT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(pc, "CHUNK_BYTES", 1000)
+    return svc.save_pdf_artifact(manual="stay", artifact_type="full_pdf", version="v1", pdf_blob=BLOB)
+
+
+def test_chunked_read_matches_blob(art):
+    chunks = list(svc.iter_pdf_artifact_blob(art["id"], 1000))
+    assert len(chunks) == -(-len(BLOB) // 1000) and max(map(len, chunks)) == 1000
+    assert b"".join(chunks) == BLOB
+    assert list(svc.iter_pdf_artifact_blob(999, 1000)) == []
+
+
+def test_materialize_once_by_content_hash(art, monkeypatch):
+    path = pc.materialize(art["id"], art["content_hash"])
+    assert os.path.basename(path) == f"{hashlib.sha256(BLOB).hexdigest()}.pdf"
+    assert open(path, "rb").read() == BLOB
+    monkeypatch.setattr(pc, "stream_chunks", lambda _id: (_ for _ in ()).throw(AssertionError("db read")))
+    assert pc.materialize(art["id"], art["content_hash"]) == path
+
+
+def test_hash_mismatch_not_cached(art):
+    assert pc.materialize(art["id"], "0" * 64) is None
+    assert pc.materialize(art["id"], None) is None
+    assert not os.path.exists(pc.path_for("0" * 64))
+
+
+def test_evicts_oldest_over_limit(art, monkeypatch):
+    monkeypatch.setattr(pc, "PDF_ARTIFACT_CACHE_MAX_MB", 0)
+    old = pc.path_for("a" * 64)
+    os.makedirs(os.path.dirname(old))
+    open(old, "wb").write(b"x")
+    os.utime(old, (1, 1))
+    path = pc.materialize(art["id"], art["content_hash"])
+    assert os.path.exists(path) and not os.path.exists(old)
+
+
+@pytest.fixture
+def client(art, monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from backend.routers import guidelines as g
+
+    monkeypatch.setattr(g, "_verify_token_flexible", lambda t, a: {"sub": "u1"})
+    app = FastAPI()
+    app.include_router(g.router, prefix="/api/guidelines")
+    return TestClient(app)
+
+
+def test_content_endpoint_range_and_etag(client, art):
+    url = f"/api/guidelines/manual-update/pdf-artifacts/{art['id']}/content"
+    full = client.get(url)
+    etag = f'"{art["content_hash"]}"'
+    assert full.status_code == 200 and full.content == BLOB and full.headers["etag"] == etag
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    part = client.get(url, headers={"Range": "bytes=100-199"})
+    assert part.status_code == 206 and part.content == BLOB[100:200]
+    assert part.headers["content-range"] == f"bytes 100-199/{len(BLOB)}"
+    assert client.get("/api/guidelines/manual-update/pdf-artifacts/999/content").status_code == 404
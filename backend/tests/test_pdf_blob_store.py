@@ -0,0 +1,127 @@
+"""매뉴얼 PDF 내용 주소 조각 저장소(manual_pdf_blobs) + page_manifest 조립 테스트.
+
+SQLite 임시 DB(manual_pdf_artifacts, manual_pdf_blobs) + PyMuPDF 로 만든 PDF. 운영 DB 불필요.
+
+검증:
+- put_pdf_blob 은 같은 내용을 1회만 저장하고 같은 hash 를 돌려준다.
+- splice_manifest 는 배포본 범위 조각 사이에 변경 조각을 끼운다(범위 밖 구간 무시).
+- compose_full_pdf_manifest 는 bytes 없이 manifest artifact 를 저장하고, 입력이 같으면 재사용.
+- 조립한 PDF 의 페이지 수/내용, /content 가 번들 manifest 를 조립해 서빙.
+
+실행: pytest backend/tests/test_pdf_blob_store.py
+"""
+import pytest
+from sqlalchemy import BigInteger, create_engine, func, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.services import manual_update_pg_service as svc
+from backend.services import pdf_artifact_cache as pc
+
+fitz = pytest.importorskip("fitz")
+
+
+@compiles(BigInteger, "sqlite")
+def _bigint_as_integer(element, compiler, **kw):  # noqa: ANN001
+    return "INTEGER"
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_json(element, compiler, **kw):  # noqa: ANN001
+    return "JSON"
+
+
+def _pdf(*labels: str) -> bytes:
+    doc = fitz.open()
+    for label in labels:
+        doc.new_page().insert_text((72, 72), label)
+    data = doc.tobytes(garbage=3, deflate=True, no_new_id=True)
+    doc.close()
+    return data
+
+
+def _texts(path_or_bytes) -> list[str]:
+    kw = {"stream": path_or_bytes, "filetype": "pdf"} if isinstance(path_or_bytes, bytes) else {"filename": path_or_bytes}
+    with fitz.open(**kw) as d:
+        return [p.get_text().strip() for p in d]
+
+
+@pytest.fixture
+def db(monkeypatch, tmp_path):
+    from backend.db.base import Base
+    from backend.db.models.manual_update import ManualPdfArtifact, ManualPdfBlob
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'pdf.db'}", future=True)
+    Base.metadata.create_all(engine, tables=[ManualPdfArtifact.__table__, ManualPdfBlob.__table__])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=Session)
+    import backend.db.session as dbs
+    monkeypatch.setattr(dbs, "get_sessionmaker", lambda: SessionLocal)
+    monkeypatch.setattr(svc, "pg_enabled", lambda: True)
+    monkeypatch.setattr(pc, "PDF_ARTIFACT_CACHE_DIR", str(tmp_path / "cache"))
+    return SessionLocal
+
+
+def _blob_count(SessionLocal) -> int:
+    from backend.db.models.manual_update import ManualPdfBlob
+    with SessionLocal() as s:
+        return s.scalar(select(func.count()).select_from(ManualPdfBlob))
+
+
+def test_put_pdf_blob_dedups(db):
+    page = _pdf("P2-new")
+    h = svc.put_pdf_blob(page)
+    assert svc.put_pdf_blob(page) == h and _blob_count(db) == 1
+    assert svc.get_pdf_blob_meta([h, "0" * 64]) == {h: {"page_count": 1, "byte_size": len(page)}}
+    assert b"".join(svc.iter_pdf_blob(h, 100)) == page
+
+
+def test_splice_manifest_replaces_ranges():
+    comps = [
+        {"page_from": 4, "page_to": 5, "segments": [{"hash": "c"}]},
+        {"page_from": 2, "page_to": 2, "segments": [{"hash": "a"}, {"hash": "b"}]},
+        {"page_from": 9, "page_to": 9, "segments": [{"hash": "z"}]},
+    ]
+    assert svc.splice_manifest("base", 6, comps) == [
+        {"hash": "base", "from": 1, "to": 1}, {"hash": "a"}, {"hash": "b"},
+        {"hash": "base", "from": 3, "to": 3}, {"hash": "c"},
+        {"hash": "base", "from": 6, "to": 6},
+    ]
+    assert svc.splice_manifest("base", 3, []) == [{"hash": "base", "from": 1, "to": 3}]
+
+
+def test_compose_full_manifest_assembles_and_reuses(db):
+    base = _pdf("P1", "P2", "P3", "P4")
+    h2 = svc.put_pdf_blob(_pdf("P2-new"))
+    svc.save_pdf_artifact(manual="stay", artifact_type="changed_page_bundle", version="v2",
+                          page_from=2, page_to=2, page_numbers=[2],
+                          page_manifest=[{"hash": h2}], page_count=1)
+    first = svc.compose_full_pdf_manifest("stay", "v2", base, "")
+    assert first["cached"] is False and first["page_count"] == 4
+    assert _blob_count(db) == 2                          # 변경 1쪽 + 배포본, 전체 PDF 는 저장 안 함
+    again = svc.compose_full_pdf_manifest("stay", "v2", base, "")
+    assert again["cached"] is True and again["artifact_id"] == first["artifact_id"]
+    assert _blob_count(db) == 2
+
+    art = svc.get_pdf_artifact(first["artifact_id"])
+    assert art["has_blob"] and art["content_hash"] == svc.manifest_hash(art["page_manifest"])
+    path = pc.materialize(art["id"], art["content_hash"], manifest=art["page_manifest"])
+    assert _texts(path) == ["P1", "P2-new", "P3", "P4"]
+    assert _texts(svc.get_pdf_artifact_blob(art["id"])) == ["P1", "P2-new", "P3", "P4"]
+
+
+def test_bundle_manifest_served_via_content(db, monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from backend.routers import guidelines as g
+
+    hs = [svc.put_pdf_blob(_pdf(f"P{n}")) for n in (7, 8)]
+    art = svc.save_pdf_artifact(manual="stay", artifact_type="changed_page_bundle", version="v2",
+                                page_from=7, page_to=8, page_numbers=[7, 8],
+                                page_manifest=[{"hash": h} for h in hs], page_count=2)
+    monkeypatch.setattr(g, "_verify_token_flexible", lambda t, a: {"sub": "u1"})
+    app = FastAPI()
+    app.include_router(g.router, prefix="/api/guidelines")
+    res = TestClient(app).get(f"/api/guidelines/manual-update/pdf-artifacts/{art['id']}/content")
+    assert res.status_code == 200 and res.headers["etag"] == f'"{art["content_hash"]}"'
+    assert _texts(res.content) == ["P7", "P8"]
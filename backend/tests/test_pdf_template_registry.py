@@ -0,0 +1,115 @@
+"""PDF 템플릿 레지스트리(pdf_template_registry) + quick_doc.fill_and_append_pdf 연동 테스트.
+
+검증:
+- 같은 템플릿 재조회는 파싱 없이 적중, 파일이 바뀌면(mtime/크기) 다시 읽음, 용량 초과 시 LRU 축출.
+- 요청별 복제본을 수정해도 캐시 원본 바이트는 그대로.
+- 관련 위젯만 로드하는 fill_and_append_pdf(acroform/field_ap)가 전체 위젯 순회(기존 방식)와
+  같은 결과(필드 값, 도장 이미지)를 낸다 — 실제 templates/*.pdf 로 확인.
+
+실행: pytest backend/tests/test_pdf_template_registry.py
+"""
+import glob
+import io
+import os
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from backend.services import pdf_template_registry as ptr  # noqa: E402
+
+_TEMPLATES = sorted(glob.glob(os.path.join(os.path.dirname(__file__), "..", "..", "templates", "*.pdf")))
+
+
+def _form_pdf(path, names):
+    doc = fitz.open()
+    page = doc.new_page()
+    for i, name in enumerate(names):
+        w = fitz.Widget()
+        w.field_name = name
+        w.field_type = fitz.PDF_WIDGET_TYPE_TEXT
+        w.rect = fitz.Rect(50, 50 + i * 30, 250, 70 + i * 30)
+        page.add_widget(w)
+    doc.save(path)
+    doc.close()
+
+
+def test_registry_hits_invalidates_and_evicts(tmp_path):
+    reg = ptr.TemplateRegistry()
+    a = str(tmp_path / "a.pdf")
+    _form_pdf(a, ["name#0", "yin"])
+    tpl = reg.get(a, lambda n: n.split("#")[0])
+    assert [w.base for w in tpl.widgets] == ["name", "yin"] and tpl.bases == {"name", "yin"}
+    assert reg.get(a, str) is tpl
+
+    _form_pdf(a, ["other"])
+    st = os.stat(a)
+    os.utime(a, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert [w.name for w in reg.get(a, str).widgets] == ["other"]
+    assert reg.stats()["hits"] == 1 and reg.stats()["misses"] == 2
+
+    b = str(tmp_path / "b.pdf")
+    _form_pdf(b, ["x"])
+    reg.max_bytes = os.path.getsize(b)
+    reg.get(b, str)
+    assert reg.stats()["templates"] == 1 and reg.get(b, str).path == b
+
+
+def test_clone_does_not_touch_cached_bytes(tmp_path):
+    a = str(tmp_path / "a.pdf")
+    _form_pdf(a, ["name"])
+    tpl = ptr.TemplateRegistry().get(a, str)
+    before = tpl.data
+    doc = tpl.open()
+    (page, (w,)), = list(tpl.iter_widgets(doc, lambda i: True))
+    w.field_value = "changed"
+    w.update()
+    doc.tobytes()
+    doc.close()
+    assert tpl.data is before
+    with tpl.open() as fresh:
+        assert next(fresh[0].widgets()).field_value in ("", None)
+
+
+def _seal_png():
+    from PIL import Image
+    buf = io.BytesIO()
+    Image.new("RGB", (20, 20), "red").save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _snapshot(doc):
+    return [
+        (sorted((w.field_name, w.field_value) for w in (page.widgets() or [])), len(page.get_images()))
+        for page in doc
+    ]
+
+
+def _fill(qd, path, values, seals, mode):
+    merged = fitz.open()
+    qd.fill_and_append_pdf(path, values, seals, merged, render_mode=mode)
+    out = fitz.open("pdf", merged.tobytes())
+    merged.close()
+    return out
+
+
+@pytest.mark.skipif(not _TEMPLATES, reason="templates/*.pdf 없음")
+@pytest.mark.parametrize("mode", ["acroform", "field_ap"])
+def test_fill_matches_full_widget_iteration(monkeypatch, mode):
+    import backend.routers.quick_doc as qd
+
+    seals = {"applicant": _seal_png(), "agent": _seal_png()}
+    checked = 0
+    for path in _TEMPLATES[:6]:
+        tpl = qd._template_registry().get(os.path.abspath(path), qd.normalize_field_name)
+        text = sorted({w.base for w in tpl.widgets if w.ftype == "Text"})
+        values = {b: f"V{i}" for i, b in enumerate(text[::2])}   # 절반만 채움 → 필터가 실제로 동작
+        new = _snapshot(_fill(qd, os.path.abspath(path), values, seals, mode))
+
+        with monkeypatch.context() as m:    # 기존 방식: 모든 페이지의 모든 위젯 순회
+            m.setattr(ptr.PreparsedTemplate, "iter_widgets",
+                      lambda self, doc, wanted: ((p, list(p.widgets() or [])) for p in doc))
+            old = _snapshot(_fill(qd, os.path.abspath(path), values, seals, mode))
+        assert new == old, path
+        checked += 1
+    assert checked
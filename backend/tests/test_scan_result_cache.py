@@ -0,0 +1,130 @@
+"""여권/등록증 스캔 결과 캐시(scan_result_cache) + /scan/passport 연동 테스트.
+
+Tesseract 불필요 — parse_passport 를 가짜 함수로 바꿔 호출 횟수만 센다.
+
+검증:
+- exact(픽셀 sha256) 적중, JPEG 재압축본 perceptual 적중, 이름만 다른 같은 양식은 미스,
+  테넌트/모드 격리.
+- TTL 만료, LRU 축출 시 결과 dict scrub, 반환값은 복사본.
+- 디스크 spill: 암호화 저장(평문 PII 없음) → 재적재, 키 없으면 spill 안 함.
+- /scan/passport 재업로드는 parse_passport 를 다시 부르지 않고 cache=hit.
+
+실행: pytest backend/tests/test_scan_result_cache.py
+"""
+import io
+import os
+
+import pytest
+from cryptography.fernet import Fernet
+from PIL import Image, ImageDraw, ImageFont
+
+os.environ.setdefault("CUSTOMER_PII_ENCRYPTION_KEY", Fernet.generate_key().decode())
+
+from backend.services import scan_result_cache as sc  # noqa: E402
+
+
+def _img(text="P<CHNWU<<LINHU"):
+    im = Image.new("RGB", (640, 400), "white")
+    d = ImageDraw.Draw(im)
+    d.rectangle((20, 300, 620, 380), fill=(30, 30, 30))
+    d.text((30, 60), text, fill="black", font=ImageFont.load_default(size=28))
+    return im
+
+
+def _jpeg_roundtrip(im):
+    buf = io.BytesIO()
+    im.save(buf, format="JPEG", quality=85)
+    return Image.open(io.BytesIO(buf.getvalue())).convert("RGB")
+
+
+RESULT = {"result": {"여권": "EF6806032", "성": "WU"}, "debug": "passport-parse-done"}
+
+
+def test_exact_and_perceptual_hits_are_tenant_and_mode_scoped():
+    cache = sc.ScanResultCache(spill_dir=None)
+    h = sc.image_hashes(_img())
+    cache.put("t1", "passport", "fast=True", h, RESULT)
+
+    assert cache.get("t1", "passport", "fast=True", h) == RESULT
+    h2 = sc.image_hashes(_jpeg_roundtrip(_img()))
+    assert h2.exact != h.exact and h2.phash == h.phash
+    assert cache.get("t1", "passport", "fast=True", h2) == RESULT
+    assert cache.get("t2", "passport", "fast=True", h) is None
+    assert cache.get("t1", "passport", "fast=False", h) is None
+    assert cache.get("t1", "arc", "fast=True", h) is None
+    assert cache.get("t1", "passport", "fast=True", sc.image_hashes(_img("P<CHNKIM<<MINSU"))) is None
+    st = cache.stats()
+    assert (st["hits_exact"], st["hits_perceptual"], st["misses"]) == (1, 1, 4)
+
+
+def test_returns_copies_ttl_and_scrub_on_eviction(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(sc.time, "monotonic", lambda: now[0])
+    cache = sc.ScanResultCache(max_entries=1, ttl_s=10, spill_dir=None)
+    ha, hb = sc.image_hashes(_img("A")), sc.image_hashes(_img("B"))
+    cache.put("t1", "arc", "m", ha, RESULT)
+    got = cache.get("t1", "arc", "m", ha)
+    got["result"]["여권"] = "changed"
+    assert cache.get("t1", "arc", "m", ha)["result"]["여권"] == "EF6806032"
+
+    held = cache._mem[("t1", "arc", "m", ha.exact)].result
+    cache.put("t1", "arc", "m", hb, RESULT)            # A 축출 → scrub
+    assert held == {} and cache.get("t1", "arc", "m", ha) is None
+    now[0] += 11
+    assert cache.get("t1", "arc", "m", hb) is None
+    assert cache.stats()["expirations"] == 1 and cache.stats()["evictions"] == 1
+
+
+def test_disk_spill_is_encrypted_and_reloads(tmp_path):
+    cache = sc.ScanResultCache(max_entries=1, spill_dir=str(tmp_path))
+    ha, hb = sc.image_hashes(_img("A")), sc.image_hashes(_img("B"))
+    cache.put("t1", "passport", "m", ha, RESULT)
+    cache.put("t1", "passport", "m", hb, RESULT)      # A → 디스크
+    files = list(tmp_path.glob("*.scan"))
+    assert len(files) == 1 and "EF6806032" not in files[0].read_text()
+    assert cache.get("t1", "passport", "m", ha) == RESULT
+    assert cache.stats()["hits_disk"] == 1
+    assert cache.invalidate_tenant("t1") == 2
+    assert list(tmp_path.glob("*.scan")) == []
+
+
+def test_no_spill_without_key(tmp_path, monkeypatch):
+    monkeypatch.setenv("HANWOORY_ENV", "server")
+    monkeypatch.delenv("CUSTOMER_PII_ENCRYPTION_KEY", raising=False)
+    cache = sc.ScanResultCache(max_entries=1, spill_dir=str(tmp_path))
+    cache.put("t1", "arc", "m", sc.image_hashes(_img("A")), RESULT)
+    cache.put("t1", "arc", "m", sc.image_hashes(_img("B")), RESULT)
+    assert list(tmp_path.glob("*.scan")) == [] and cache.stats()["spills"] == 0
+
+
+@pytest.fixture
+def client(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from backend.auth import get_current_user
+    from backend.routers import scan as r
+
+    calls = []
+
+    def fake_parse(img, fast=False):
+        calls.append(fast)
+        return {"여권": "EF6806032", "_raw_L1": "L1", "_raw_L2": "L2", "_ocr_report": {}}
+
+    monkeypatch.setattr(r, "parse_passport", fake_parse)
+    monkeypatch.setattr(r, "_ensure_tesseract", lambda: None)
+    monkeypatch.setattr(sc, "_cache", sc.ScanResultCache(spill_dir=None))
+    app = FastAPI()
+    app.include_router(r.router, prefix="/api/scan")
+    app.dependency_overrides[get_current_user] = lambda: {"login_id": "u1", "tenant_id": "t1"}
+    return TestClient(app), calls
+
+
+def test_passport_endpoint_reupload_hits_cache(client):
+    c, calls = client
+    buf = io.BytesIO()
+    _img().save(buf, format="PNG")
+    files = {"file": ("p.png", buf.getvalue(), "image/png")}
+    first = c.post("/api/scan/passport", files=files).json()
+    second = c.post("/api/scan/passport", files=files).json()
+    assert first["cache"] == "miss" and second["cache"] == "hit" and len(calls) == 1
+    assert second["result"] == {"여권": "EF6806032"} and second["raw_L1"] == "L1"
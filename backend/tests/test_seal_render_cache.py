@@ -0,0 +1,70 @@
+"""도장 렌더 캐시(seal_render_cache) + make_seal_bytes / create_seal 연동 테스트.
+
+검증:
+- 같은 이름·영문여부는 1회만 렌더(적중 시 같은 bytes), 한글/영문·이름이 다르면 별도 키.
+- 폰트/배경 파일이 바뀌면(자산 버전) 다시 렌더.
+- LRU 상한 축출, 렌더 실패(None)는 보관하지 않음, 적중률 지표.
+- create_seal 은 매번 복사본을 돌려줘 호출측 수정이 캐시에 새지 않음.
+
+실행: pytest backend/tests/test_seal_render_cache.py
+"""
+import os
+
+import pytest
+
+from backend.services import seal_render_cache as src
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    c = src.SealRenderCache(max_entries=8)
+    monkeypatch.setattr(src, "_cache", c)
+    return c
+
+
+def test_make_seal_bytes_renders_once_per_key(cache, monkeypatch):
+    import backend.routers.quick_doc as qd
+
+    calls = []
+    real = qd._render_seal_png
+    monkeypatch.setattr(qd, "_render_seal_png", lambda n, e: calls.append((n, e)) or real(n, e))
+    first = qd.make_seal_bytes("홍길동 ")
+    assert first and first.startswith(b"\x89PNG")
+    assert qd.make_seal_bytes("홍길동") is first
+    assert qd._auto_role_seal("홍길동", "", "", True) == (first, "korean")
+    assert qd.make_seal_bytes("HG", english=True) != first
+    assert calls == [("홍길동", False), ("HG", True)]
+    st = cache.stats()
+    assert (st["hits"], st["misses"], st["entries"]) == (2, 2, 2) and st["hit_rate"] == 0.5
+
+
+def test_asset_change_invalidates(tmp_path):
+    font = tmp_path / "f.ttf"
+    font.write_bytes(b"a")
+    v1 = src.asset_version(str(font), params=(200,))
+    font.write_bytes(b"ab")
+    assert src.asset_version(str(font), params=(200,)) != v1
+    assert src.asset_version(str(font), params=(300,)) != src.asset_version(str(font), params=(200,))
+
+
+def test_lru_eviction_and_failures_not_cached():
+    c = src.SealRenderCache(max_entries=2)
+    for k in ("a", "b", "c"):
+        c.get_or_render(k, lambda k=k: k.encode())
+    assert c.get_or_render("a", lambda: b"new") == b"new"
+    assert c.stats()["evictions"] == 2
+    n = []
+    assert c.get_or_render("x", lambda: n.append(1)) is None
+    assert c.get_or_render("x", lambda: n.append(1)) is None and len(n) == 2
+
+
+def test_create_seal_returns_copies(cache):
+    from utils import document as d
+
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    circle, font = os.path.join(root, d.circle_path), os.path.join(root, d.font_path)
+    a = d.create_seal(circle, "김민수", font, 120)
+    a.putpixel((0, 0), (1, 2, 3, 255))
+    b = d.create_seal(circle, "김민수", font, 120)
+    assert b.getpixel((0, 0)) != (1, 2, 3, 255) and b.size == (120, 120)
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,159 @@
+"""통합검색 SQL push-down(search_pg_service) + 라우터 랭킹/페이지네이션 테스트.
+
+SQLite 임시 DB + FastAPI TestClient(get_current_user override)로 검증(운영 DB 불필요).
+
+검증:
+- 테넌트 격리, 삭제 고객 제외, 번호(reg_back) 비검색.
+- 랭킹: 정확 일치 > 접두 일치 > 부분 일치, 동점은 소스 순서.
+- limit/offset/has_more, 소스별 timings_ms.
+- LIKE 메타문자(%, _)는 리터럴로 검색.
+- migration 0033 인덱스 식의 컬럼 구성 == search_pg_service 의 검색 문서 컬럼.
+
+실행: pytest backend/tests/test_search_pg.py
+"""
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.services import search_pg_service as svc
+
+
+@compiles(BigInteger, "sqlite")
+def _bigint_as_integer_on_sqlite(element, compiler, **kw):  # noqa: ANN001
+    return "INTEGER"
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_json_on_sqlite(element, compiler, **kw):  # noqa: ANN001
+    return "JSON"
+
+
+@pytest.fixture
+def env(monkeypatch, tmp_path):
+    from backend.db.base import Base
+    from backend.db.models.board import BoardPost
+    from backend.db.models.customer import Customer
+    from backend.db.models.memo import Memo
+    from backend.db.models.task import ActiveTask, CompletedTask, PlannedTask
+    from backend.db.models.work_data import WorkReferenceRow
+
+    # PG jsonb::text 처럼 한글을 그대로 직렬화(기본 ensure_ascii 는 \uXXXX 로 바꿔 ILIKE 불가).
+    engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}", future=True,
+                           json_serializer=lambda o: json.dumps(o, ensure_ascii=False))
+    Base.metadata.create_all(engine, tables=[
+        Customer.__table__, ActiveTask.__table__, PlannedTask.__table__,
+        CompletedTask.__table__, BoardPost.__table__, WorkReferenceRow.__table__,
+        Memo.__table__,
+    ])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=Session)
+    import backend.db.session as dbs
+    monkeypatch.setattr(dbs, "is_configured", lambda: True)
+    monkeypatch.setattr(dbs, "get_sessionmaker", lambda: SessionLocal)
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from backend.auth import get_current_user
+    from backend.routers import search as r
+
+    app = FastAPI()
+    app.include_router(r.router, prefix="/api/search")
+    app.dependency_overrides[get_current_user] = lambda: {"login_id": "u1", "tenant_id": "t1"}
+    return TestClient(app), SessionLocal
+
+
+def _seed_customers(SessionLocal):
+    from datetime import datetime, timezone
+    from backend.db.models.customer import Customer
+    with SessionLocal() as s:
+        s.add_all([
+            Customer(tenant_id="t1", customer_id="0001", korean_name="홍길동전", reg_back="1234567"),
+            Customer(tenant_id="t1", customer_id="0002", korean_name="김홍길동"),
+            Customer(tenant_id="t1", customer_id="0003", korean_name="홍길동"),
+            Customer(tenant_id="t1", customer_id="0004", korean_name="이몽룡", memo="홍길동 소개"),
+            Customer(tenant_id="t1", customer_id="0005", korean_name="홍길동",
+                     deleted_at=datetime.now(timezone.utc)),
+            Customer(tenant_id="t2", customer_id="0001", korean_name="홍길동"),
+        ])
+        s.commit()
+
+
+def test_customers_ranked_isolated_and_alive_only(env):
+    _, SessionLocal = env
+    _seed_customers(SessionLocal)
+    hits = svc.search_customers("t1", "홍길동", 10)
+    assert [h[1]["고객ID"] for h in hits] == ["0003", "0001", "0004", "0002"]
+    assert [h[0] for h in hits] == [svc.SCORE_EXACT, svc.SCORE_PREFIX,
+                                    svc.SCORE_CONTAINS, svc.SCORE_CONTAINS]
+    # 번호(reg_back)는 검색 문서에 없다.
+    assert svc.search_customers("t1", "1234567", 10) == []
+
+
+def test_like_metacharacters_are_literal(env):
+    _, SessionLocal = env
+    from backend.db.models.task import ActiveTask
+    with SessionLocal() as s:
+        s.add_all([
+            ActiveTask(tenant_id="t1", task_id="a1", name="A", work="100% 완료"),
+            ActiveTask(tenant_id="t1", task_id="a2", name="B", work="1000 완료"),
+        ])
+        s.commit()
+    assert [h[1]["id"] for h in svc.search_tasks("t1", "100%", 10)] == ["a1"]
+    assert svc.search_tasks("t1", "_", 10) == []
+
+
+def test_reference_matches_values_not_headers(env):
+    _, SessionLocal = env
+    from backend.db.models.work_data import WorkReferenceRow
+    with SessionLocal() as s:
+        s.add_all([
+            WorkReferenceRow(tenant_id="t1", sheet_name="업무참고", row_index=0,
+                             data={"구분": "체류연장", "비고": "서류"}),
+            WorkReferenceRow(tenant_id="t1", sheet_name="업무참고", row_index=1,
+                             data={"구분": "등록", "비고": "체류"}),
+        ])
+        s.commit()
+    assert [h[1]["구분"] for h in svc.search_reference("t1", "체류", 10)] == ["체류연장", "등록"]
+    assert svc.search_reference("t1", "비고", 10) == []
+
+
+def test_endpoint_pagination_and_timings(env):
+    client, SessionLocal = env
+    _seed_customers(SessionLocal)
+    r = client.get("/api/search", params={"q": "홍길동", "type": "customer", "limit": 2})
+    assert r.status_code == 200
+    body = r.json()
+    assert [x["id"] for x in body["results"]] == ["0003", "0001"]
+    assert body["has_more"] is True and body["count"] == 2 and "total" not in body
+    assert set(body["timings_ms"]) == {"customer"}
+
+    r = client.get("/api/search", params={"q": "홍길동", "type": "customer",
+                                          "limit": 2, "offset": 2})
+    body = r.json()
+    assert [x["id"] for x in body["results"]] == ["0004", "0002"]
+    assert body["has_more"] is False
+
+    r = client.get("/api/search", params={"q": "홍길동"})
+    assert set(r.json()["timings_ms"]) == {"customer", "task", "board", "reference", "memo"}
+    assert client.get("/api/search", params={"q": "x", "limit": 999}).status_code == 422
+
+
+def test_migration_index_columns_match_service():
+    path = next((Path(__file__).resolve().parents[2] / "alembic" / "versions")
+                .glob("*_0033_search_trgm_indexes.py"))
+    spec = importlib.util.spec_from_file_location("mig0033", path)
+    mig = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mig)
+    docs = {table: cols for _name, table, cols in mig._SEARCH_DOCS}
+    assert docs == {
+        "customers": svc.CUSTOMER_SEARCH_COLUMNS,
+        "active_tasks": svc.ACTIVE_TASK_SEARCH_COLUMNS,
+        "planned_tasks": svc.PLANNED_TASK_SEARCH_COLUMNS,
+        "completed_tasks": svc.COMPLETED_TASK_SEARCH_COLUMNS,
+        "board_posts": svc.BOARD_SEARCH_COLUMNS,
+    }
@@ -0,0 +1,172 @@
+"""서명 이벤트 푸시(signature_events + /signature/stream) 테스트.
+
+DB 불필요 — 저장 함수는 monkeypatch, FastAPI TestClient(get_current_user override). 허브는 테스트마다 새 인스턴스.
+
+검증:
+- 이벤트는 같은 tenant 구독자에게만, request_id 구독은 그 요청 이벤트만 받는다.
+- 구독자 큐가 넘치면 오래된 이벤트부터 버린다.
+- 버스: 다른 워커의 NOTIFY 는 전달, 자기 발행분은 무시. 켜져 있으면 발행이 outbox 에 쌓인다.
+- LISTEN 루프가 연결 오류가 아닌 예외로 죽으면 재접속을 반복하지 않는다.
+- 제출을 다른 워커가 받아도(_pending 없음) poll 이 이벤트 최근 목록으로 완료를 본다.
+- /stream 은 구독 전 도착한 제출을 재전송하고, 실시간 이벤트와 heartbeat 를 보낸 뒤 수명이 다하면 닫는다.
+
+실행: pytest backend/tests/test_signature_events.py
+"""
+import asyncio
+import json
+import threading
+
+import pytest
+
+from backend.services import signature_events as sev
+
+
+@pytest.fixture(autouse=True)
+def hub(monkeypatch):
+    h = sev._Hub()
+    monkeypatch.setattr(sev, "_hub", h)
+    return h
+
+
+@pytest.fixture
+def client(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from backend.auth import get_current_user
+    from backend.routers import signature as r
+    from backend.services import signature_service as svc
+
+    monkeypatch.setattr(svc, "compress_signature", lambda b64: b64)
+    monkeypatch.setattr(svc, "save_customer_signature", lambda *a: None)
+    monkeypatch.setattr(svc, "save_agent_signature", lambda *a: None)
+    monkeypatch.setattr(r, "_pending", {})
+    app = FastAPI()
+    app.include_router(r.router, prefix="/api/signature")
+    app.dependency_overrides[get_current_user] = lambda: {"sub": "u1", "tenant_id": "t1"}
+    return TestClient(app), r
+
+
+def _events(body: str) -> list:
+    out = []
+    for block in body.split("\n\n"):
+        lines = dict(l.split(": ", 1) for l in block.splitlines() if l.startswith(("event", "data")))
+        if "event" in lines:
+            out.append((lines["event"], json.loads(lines["data"])))
+    return out
+
+
+def test_fanout_by_tenant_and_request_id():
+    async def run():
+        loop = asyncio.get_running_loop()
+        all_t1 = sev.subscribe("t1", loop)
+        only_r1 = sev.subscribe("t1", loop, "r1")
+        other = sev.subscribe("t2", loop)
+        sev.publish("t1", "signature.submitted", {"request_id": "r1", "type": "customer"})
+        sev.publish("t1", "pad.saved", {"slot": 2})
+        await asyncio.sleep(0)
+        got = lambda s: [s.queue.get_nowait()["e"] for _ in range(s.queue.qsize())]
+        assert got(all_t1) == ["signature.submitted", "pad.saved"]
+        assert got(only_r1) == ["signature.submitted"]
+        assert got(other) == []
+        for s in (all_t1, only_r1, other):
+            sev.unsubscribe(s)
+    asyncio.run(run())
+    assert sev.stats()["subscribers"] == 0
+    assert sev.recent("t1", "r1")["data"]["type"] == "customer"
+    assert sev.recent("t2", "r1") is None                  # 다른 tenant 에는 보이지 않는다
+
+
+def test_slow_subscriber_drops_oldest(monkeypatch):
+    monkeypatch.setattr(sev, "SUBSCRIBER_QUEUE", 2)
+
+    async def run():
+        sub = sev.subscribe("t1", asyncio.get_running_loop())
+        for i in range(5):
+            sev.publish("t1", "pad.saved", {"slot": i})
+        await asyncio.sleep(0)
+        assert [sub.queue.get_nowait()["data"]["slot"] for _ in range(2)] == [3, 4]
+        assert sub.dropped == 3
+    asyncio.run(run())
+
+
+def test_bus_remote_delivery_and_outbox(monkeypatch):
+    bus = sev._Bus()
+    monkeypatch.setattr(sev, "_bus", bus)
+    bus.handle(json.dumps({"o": "other:1", "t": "t1", "e": "signature.submitted",
+                           "data": {"request_id": "r9", "type": "agent"}}))
+    assert sev.recent("t1", "r9") is not None
+    bus.handle(json.dumps({"o": bus.origin, "t": "t1", "e": "pad.saved",
+                           "data": {"request_id": "mine"}}))
+    bus.handle("not json")
+    assert sev.recent("t1", "mine") is None
+    assert sev.stats()["remote"] == 1
+
+    sev.publish("t1", "pad.saved", {"slot": 1})
+    assert not bus._outbox                                  # 꺼져 있으면 로컬 전달만
+    bus.running = True
+    sev.publish("t1", "pad.saved", {"slot": 1})
+    assert list(bus._outbox) == [("t1", {"e": "pad.saved", "data": {"slot": 1}})]
+
+
+def test_listener_stops_on_non_connection_error(monkeypatch):
+    import psycopg
+
+    connects = []
+
+    class _Conn:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, sql):
+            pass
+
+        def notifies(self, **kw):
+            raise TypeError("notifies() got an unexpected keyword argument 'timeout'")
+
+    monkeypatch.setattr(psycopg, "connect", lambda *a, **k: connects.append(1) or _Conn())
+    bus = sev._Bus()
+    monkeypatch.setattr(sev, "_bus", bus)
+    bus._listener("postgresql://x")                 # 재시도 루프 없이 반환
+    assert connects == [1] and sev.stats()["listen_failed"]
+
+
+def test_poll_sees_submission_from_other_worker(client):
+    c, r = client
+    res = c.post("/api/signature/request", json={"type": "customer", "customer_id": "C1"}).json()
+    token, rid = res["token"], res["request_id"]
+    assert c.post(f"/api/signature/submit/{token}", json={"data": "x"}).json() == {"status": "ok"}
+    r._pending.clear()                                      # poll 이 다른 워커로 갔다
+    assert c.get(f"/api/signature/poll/{token}").json() == {"status": "saved", "request_id": rid}
+
+    res = c.post("/api/signature/request", json={"type": "agent"}).json()
+    assert res["request_id"] == res["token"]
+    c.post(f"/api/signature/submit/{res['token']}", json={"data": "x"})
+    r._pending.clear()
+    assert c.get(f"/api/signature/poll/{res['token']}").json() == {"status": "done"}
+    assert c.get("/api/signature/poll/unknown").json() == {"status": "expired"}
+
+
+def test_stream_replays_and_pushes(client, monkeypatch):
+    c, r = client
+    monkeypatch.setattr(r, "_SSE_MAX_SECONDS", 0.8)
+    monkeypatch.setattr(r, "_SSE_HEARTBEAT", 0.2)
+    sev.publish("t1", "signature.submitted", {"request_id": "r1", "type": "customer"})
+
+    timer = threading.Timer(0.3, sev.publish, ("t1", "temp_slot.saved", {"slot": 3}))
+    timer.start()
+    try:
+        with c.stream("GET", "/api/signature/stream") as resp:
+            assert resp.headers["content-type"].startswith("text/event-stream")
+            body = resp.read().decode()
+    finally:
+        timer.join()
+    assert body.startswith("retry: ")
+    assert ": ping" in body
+    assert _events(body) == [("temp_slot.saved", {"slot": 3})]   # 필터 없음 → 재전송 없음
+
+    body = c.get("/api/signature/stream", params={"request_id": "r1"}).text
+    assert _events(body) == [("signature.submitted", {"request_id": "r1", "type": "customer"})]
+    assert sev.stats()["subscribers"] == 0
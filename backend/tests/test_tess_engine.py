@@ -0,0 +1,154 @@
+"""상주 Tesseract 핸들 풀(tess_engine) 테스트.
+
+tesserocr/tesseract 불필요 — 가짜 PyTessBaseAPI 모듈로 풀 동작만 검증한다.
+
+검증:
+- pytesseract config 문자열 파싱(oem/psm/-c 변수).
+- 같은 (lang, oem, psm, vars) 키는 핸들 재사용, 변수가 다르면 별도 핸들.
+- 키당 풀 크기 상한(동시 호출이 상한을 넘으면 대기).
+- 핸들 초기화 실패 키는 pytesseract 로 폴백하고 이후에도 재시도하지 않음.
+- 전역 핸들 상한: 키가 많아도 상한을 넘지 않고 가장 오래 쉰 유휴 핸들부터 닫는다.
+- timeout: Recognize(timeout=ms) 초과 시 핸들 폐기 + TesseractTimeout, 미지원이면 pytesseract 로.
+
+실행: pytest backend/tests/test_tess_engine.py
+"""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services import tess_engine as te
+
+
+class _FakeAPI:
+    created = []
+
+    def __init__(self, lang, psm, oem, variables, path=None):
+        if lang == "missing":
+            raise RuntimeError("Failed to init API")
+        self.lang, self.psm, self.variables = lang, psm, variables
+        self.ended = False
+        _FakeAPI.created.append(self)
+
+    def Recognize(self, timeout=0):
+        return self.img != "hang"
+
+    def SetImage(self, img):
+        self.img = img
+
+    def GetUTF8Text(self):
+        time.sleep(0.02)
+        return f"{self.lang}:{self.psm}:{self.variables.get('tessedit_char_whitelist', '')}"
+
+    def Clear(self):
+        pass
+
+    def End(self):
+        self.ended = True
+
+
+class _FakePyTess:
+    calls = 0
+
+    @classmethod
+    def image_to_string(cls, img, lang, config, timeout=None):
+        cls.calls += 1
+        return "fallback"
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    _FakeAPI.created = []
+    _FakePyTess.calls = 0
+    monkeypatch.setattr(te, "tesserocr", SimpleNamespace(PyTessBaseAPI=_FakeAPI))
+    monkeypatch.setattr(te, "pytesseract", _FakePyTess)
+    monkeypatch.setattr(te, "TESS_ENGINE", "auto")
+    monkeypatch.setattr(te, "TESS_POOL_SIZE", 2)
+    monkeypatch.setattr(te, "TESS_MAX_HANDLES", 8)
+    monkeypatch.setattr(te, "_recognize_timeout_supported", None)
+    monkeypatch.setattr(te, "_evictions", 0)
+    te.shutdown()
+    yield te
+    te.shutdown()
+
+
+def test_parse_config():
+    assert te.parse_config("--oem 3 --psm 7 -c tessedit_char_whitelist=0123456789-") == (
+        3, 7, (("tessedit_char_whitelist", "0123456789-"),))
+    assert te.parse_config("") == (3, 3, ())
+
+
+def test_handles_reused_per_key(engine):
+    for _ in range(3):
+        assert engine.image_to_string(None, "kor", "--oem 3 --psm 6") == "kor:6:"
+    assert engine.image_to_string(None, "eng", "--psm 7 -c tessedit_char_whitelist=0-9") == "eng:7:0-9"
+    assert len(_FakeAPI.created) == 2
+    st = engine.stats()
+    assert st["engine"] == "tesserocr" and sum(p["calls"] for p in st["pools"]) == 4
+
+
+def test_pool_size_bounds_concurrency(engine):
+    threads = [threading.Thread(target=engine.image_to_string, args=(None, "kor", "--psm 6"))
+               for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(_FakeAPI.created) == 2
+    (pool,) = engine.stats()["pools"]
+    assert pool["handles"] == 2 and pool["idle"] == 2 and pool["calls"] == 6
+
+
+def test_init_failure_falls_back_to_pytesseract(engine):
+    assert engine.image_to_string(None, "missing", "--psm 6") == "fallback"
+    assert engine.image_to_string(None, "missing", "--psm 6") == "fallback"
+    assert _FakePyTess.calls == 2 and engine.stats()["pools"][0]["broken"]
+
+
+def test_forced_pytesseract_mode(engine, monkeypatch):
+    monkeypatch.setattr(te, "TESS_ENGINE", "pytesseract")
+    assert engine.image_to_string(None, "kor", "--psm 6") == "fallback"
+    assert _FakeAPI.created == []
+
+
+def test_global_cap_evicts_lru_idle_handle(engine, monkeypatch):
+    monkeypatch.setattr(te, "TESS_MAX_HANDLES", 2)
+    engine.image_to_string(None, "kor", "--psm 6")
+    engine.image_to_string(None, "kor", "--psm 7")
+    engine.image_to_string(None, "kor", "--psm 6")          # psm 6 최근 사용 → psm 7 이 LRU
+    engine.image_to_string(None, "kor", "--psm 4")
+    psm7 = next(a for a in _FakeAPI.created if a.psm == 7)
+    assert psm7.ended
+    st = engine.stats()
+    assert st["handles"] == 2 and st["evictions"] == 1
+    assert {p["psm"]: p["handles"] for p in st["pools"]} == {6: 1, 7: 0, 4: 1}
+
+
+def test_global_cap_waits_when_no_idle(engine, monkeypatch):
+    monkeypatch.setattr(te, "TESS_MAX_HANDLES", 1)
+    threads = [threading.Thread(target=engine.image_to_string, args=(None, "kor", f"--psm {p}"))
+               for p in (6, 7, 6, 7)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    st = engine.stats()
+    assert st["handles"] == 1 and sum(p["calls"] for p in st["pools"]) == 4
+
+
+def test_timeout_discards_handle(engine):
+    with pytest.raises(te.TesseractTimeout):
+        engine.image_to_string("hang", "kor", "--psm 6", timeout=2)
+    assert _FakeAPI.created[0].ended and _FakePyTess.calls == 0
+    (pool,) = engine.stats()["pools"]
+    assert pool["handles"] == 0 and pool["timeouts"] == 1
+    assert engine.image_to_string("ok", "kor", "--psm 6", timeout=2) == "kor:6:"
+
+
+def test_timeout_without_recognize_support_uses_pytesseract(engine, monkeypatch):
+    monkeypatch.delattr(_FakeAPI, "Recognize")
+    assert engine.image_to_string("x", "kor", "--psm 6", timeout=2) == "fallback"
+    assert engine.image_to_string("x", "kor", "--psm 6", timeout=2) == "fallback"
+    assert engine.image_to_string("x", "kor", "--psm 6") == "kor:6:"   # timeout 없으면 풀 경로
+    assert _FakePyTess.calls == 2 and len(_FakeAPI.created) == 1
@@ -430,6 +430,10 @@ function PlannedTaskRow({
 const CAL_PLUGINS = [dayGridPlugin, interactionPlugin];
 const CAL_HEADER_TOOLBAR = { left: "prev", center: "title", right: "next" } as const;
 
+function calYmd(d: Date): string {
+  return `${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, "0")}-${String(d.getDate()).padStart(2, "0")}`;
+}
+
 // ── 메인 대시보드 ────────────────────────────────────────────────────────────────
 export default function DashboardPage() {
   const qc = useQueryClient();
@@ -470,13 +474,42 @@ export default function DashboardPage() {
   // 백엔드는 tenant 단위로 자동 격리되지만, 멀티-테넌트 SaaS 의 일반 원칙
   // (캐시 키에 tenant_id 포함) 을 따른다. 다른 테넌트로 로그인 전환 시 캐시
   // 충돌 방지.
+  //
+  // 달력에 보이는 기간(datesSet)만 조회한다. 같은 기간 재조회는 since=<버전> 으로 바뀐 날짜만
+  // 받아 병합하고([] = 삭제된 날짜), 변경이 없으면 서버가 304 로 본문 없이 응답한다.
   const tenantId = user?.tenant_id ?? "_anon_";
-  const eventsKey = ["events", tenantId] as const;
+  const [calRange, setCalRange] = useState<{ from: string; to: string } | null>(null);
+  const eventsVersionRef = useRef<Record<string, string>>({});
+  const eventsKey = ["events", tenantId, calRange?.from ?? "", calRange?.to ?? ""] as const;
   const { data: events = {} } = useQuery({
     queryKey: eventsKey,
-    queryFn: () => eventsApi.get().then((r) => r.data),
-    staleTime: 0,  // 캐시 없음 — 달력 내용은 항상 최신값 사용
+    enabled: calRange !== null,
+    queryFn: async () => {
+      const { from, to } = calRange!;
+      const syncKey = eventsKey.join("|");
+      const prev = qc.getQueryData<Record<string, string[]>>(eventsKey);
+      const since = prev ? eventsVersionRef.current[syncKey] : undefined;
+      const r = await eventsApi.range(from, to, since);
+      if (r.status === 304) return prev ?? {};
+      const version = r.headers["x-events-version"];
+      if (version) eventsVersionRef.current[syncKey] = String(version);
+      if (!since || !prev) return r.data;
+      const next: Record<string, string[]> = { ...prev };
+      for (const [date, lines] of Object.entries(r.data)) {
+        if (lines.length) next[date] = lines;
+        else delete next[date];
+      }
+      return next;
+    },
+    staleTime: 0,  // 매번 서버 확인 — 변경 없으면 304 라 비용이 작다
   });
+  const handleCalDatesSet = useCallback((arg: { start: Date; end: Date }) => {
+    const last = new Date(arg.end);
+    last.setDate(last.getDate() - 1);             // end 는 배타적
+    const from = calYmd(arg.start);
+    const to = calYmd(last);
+    setCalRange((prev) => (prev && prev.from === from && prev.to === to ? prev : { from, to }));
+  }, []);
   const { data: expiryData } = useQuery({
     queryKey: ["expiry-alerts"],
     queryFn: () => customersApi.expiryAlerts().then((r) => r.data),
@@ -1044,6 +1077,7 @@ export default function DashboardPage() {
               dayMaxEvents={false}
               eventContent={renderEventContent}
               eventClick={handleCalEventClick}
+              datesSet={handleCalDatesSet}
               eventDidMount={handleEventDidMount}
               headerToolbar={CAL_HEADER_TOOLBAR}
               dateClick={handleCalDateClick}
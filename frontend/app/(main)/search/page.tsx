@@ -4,7 +4,7 @@ import { useSearchParams, useRouter } from "next/navigation";
 import {
   Search, User, ClipboardList, BookOpen, BookMarked, FileText, Loader2,
 } from "lucide-react";
-import { searchApi } from "@/lib/api";
+import { searchApi, SEARCH_MAX_OFFSET } from "@/lib/api";
 
 interface SearchResult {
   id: string;
@@ -129,26 +129,51 @@ function SearchResults({
   const router = useRouter();
   const [isLoading, setIsLoading] = useState(false);
   const [results, setResults] = useState<SearchResult[]>([]);
+  const [hasMore, setHasMore] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
   useEffect(() => {
     if (!query) return;
+    let cancelled = false;
     setIsLoading(true);
     setError(null);
+    setHasMore(false);
     searchApi
       .search(query, type)
       .then((res) => {
-        const data = res.data as { results?: SearchResult[] };
-        setResults(data.results || []);
+        if (cancelled) return;
+        setResults(res.data.results || []);
+        setHasMore(!!res.data.has_more);
       })
       .catch((err) => {
+        if (cancelled) return;
         console.error("[search] API 오류:", err);
         setError("검색 중 오류가 발생했습니다. 다시 시도해주세요.");
         setResults([]);
       })
-      .finally(() => setIsLoading(false));
+      .finally(() => { if (!cancelled) setIsLoading(false); });
+    return () => { cancelled = true; };
   }, [query, type]);
 
+  // 다음 페이지 — 서버는 전체 건수를 세지 않으므로 has_more 로만 판단한다.
+  const loadMore = () => {
+    if (loadingMore) return;
+    setLoadingMore(true);
+    searchApi
+      .search(query, type, results.length)
+      .then((res) => {
+        setResults([...results, ...(res.data.results || [])]);
+        setHasMore(!!res.data.has_more);
+      })
+      .catch((err) => {
+        console.error("[search] 더 보기 오류:", err);
+        setError("추가 결과를 불러오지 못했습니다. 다시 시도해주세요.");
+      })
+      .finally(() => setLoadingMore(false));
+  };
+  const canLoadMore = hasMore && results.length <= SEARCH_MAX_OFFSET;
+
   if (!query) return null;
 
   if (isLoading) {
@@ -159,7 +184,7 @@ function SearchResults({
     );
   }
 
-  if (error) {
+  if (error && results.length === 0) {
     return (
       <div
         className="text-center py-12 rounded-xl border"
@@ -177,13 +202,38 @@ function SearchResults({
   return (
     <div>
       <div className="text-xs mb-3" style={{ color: "#718096" }}>
-        총 <strong>{results.length}</strong>개 결과
+        {hasMore ? (
+          <><strong>{results.length}</strong>개 결과 표시 중 · 더 있음</>
+        ) : (
+          <>총 <strong>{results.length}</strong>개 결과</>
+        )}
       </div>
       <div className="space-y-3">
-        {results.map((r) => (
-          <ResultCard key={`${r.type}-${r.id}`} result={r} router={router} />
+        {results.map((r, i) => (
+          <ResultCard key={`${r.type}-${r.id}-${i}`} result={r} router={router} />
         ))}
       </div>
+      {error && (
+        <div className="text-xs mt-3 text-center" style={{ color: "#C53030" }}>{error}</div>
+      )}
+      {canLoadMore && (
+        <div className="mt-4 text-center">
+          <button
+            onClick={loadMore}
+            disabled={loadingMore}
+            className="text-sm px-5 py-2 rounded-full border inline-flex items-center gap-1.5"
+            style={{ background: "#fff", borderColor: "#CBD5E0", color: "#4A5568" }}
+          >
+            {loadingMore && <Loader2 size={13} className="animate-spin" />}
+            더 보기
+          </button>
+        </div>
+      )}
+      {hasMore && !canLoadMore && (
+        <div className="text-xs mt-3 text-center" style={{ color: "#A0AEC0" }}>
+          결과가 많습니다. 검색어를 더 구체적으로 입력하거나 카테고리를 선택해 주세요.
+        </div>
+      )}
     </div>
   );
 }
@@ -2,6 +2,7 @@
 import { useEffect, useRef, useState } from "react";
 import { X } from "lucide-react";
 import { api } from "@/lib/api";
+import { STREAM_FALLBACK_POLL_MS, useSignatureEvents } from "@/lib/signatureEvents";
 import { toast } from "sonner";
 
 interface Props {
@@ -26,6 +27,7 @@ export default function SignatureModal({
   const [saveError, setSaveError] = useState<string | null>(null);
   const pollRef   = useRef<ReturnType<typeof setInterval> | null>(null);
   const doneTokenRef = useRef<string | null>(null);
+  const checkRef  = useRef<() => void>(() => {});
 
   const stopPoll = () => {
     if (pollRef.current) { clearInterval(pollRef.current); pollRef.current = null; }
@@ -64,10 +66,20 @@ export default function SignatureModal({
   // eslint-disable-next-line react-hooks/exhaustive-deps
   }, []);
 
-  // waiting 상태면 2초마다 폴링
+  // 제출 이벤트(SSE)가 오면 즉시 확인 — 스트림이 열려 있으면 폴링은 안전망으로만 느리게.
+  const streamOpen = useSignatureEvents(
+    status === "waiting" && !!token,
+    (ev) => { if (ev.event === "signature.submitted") checkRef.current(); },
+    requestId ?? token,
+  );
+
+  // waiting 상태면 2초마다 폴링 (스트림 연결 중엔 15초)
   useEffect(() => {
     if (status !== "waiting" || !token) { stopPoll(); return; }
-    pollRef.current = setInterval(async () => {
+    let checking = false;
+    const check = async () => {
+      if (checking || doneTokenRef.current === token) return;
+      checking = true;
       try {
         const pollRes = await api.get<{ status: string; data?: string; request_id?: string }>(`/api/signature/poll/${token}`);
         const json = pollRes.data;
@@ -108,10 +120,13 @@ export default function SignatureModal({
           return;
         }
       } catch { /* 폴링 통신 오류는 무시 (일시적 네트워크 끊김) */ }
-    }, 2000);
+      finally { checking = false; }
+    };
+    checkRef.current = check;
+    pollRef.current = setInterval(check, streamOpen ? STREAM_FALLBACK_POLL_MS : 2000);
     return () => stopPoll();
   // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [status, token, requestId]);
+  }, [status, token, requestId, streamOpen]);
 
   // 저장 재시도 (agent 타입 — Sheets 저장 실패 시)
   const retrySave = async () => {
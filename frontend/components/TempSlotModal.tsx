@@ -2,6 +2,7 @@
 import { useEffect, useRef, useState } from "react";
 import { X, Search } from "lucide-react";
 import { api, quickDocApi, type CustomerSearchResult } from "@/lib/api";
+import { STREAM_FALLBACK_POLL_MS, useSignatureEvents } from "@/lib/signatureEvents";
 import { toast } from "sonner";
 import { useSubmit } from "@/lib/useSubmit";
 import { SubmitButton } from "@/components/SubmitButton";
@@ -29,6 +30,7 @@ export default function TempSlotModal({ slot, hasData, memo: initMemo, onClose,
   const { submit: submitClear, isSubmitting: deleting } = useSubmit();
   const { submit: submitMap, isSubmitting: mapping } = useSubmit();
   const pollRef = useRef<ReturnType<typeof setInterval> | null>(null);
+  const checkRef = useRef<() => void>(() => {});
 
   const stopPoll = () => { if (pollRef.current) { clearInterval(pollRef.current); pollRef.current = null; } };
 
@@ -58,10 +60,20 @@ export default function TempSlotModal({ slot, hasData, memo: initMemo, onClose,
     } catch { toast.error("요청 실패"); setPhase("idle"); }
   };
 
+  // 제출 이벤트(SSE) → 즉시 확인. 스트림 연결 중엔 폴링 간격을 늘린다.
+  const streamOpen = useSignatureEvents(
+    phase === "waiting" && !!token,
+    (ev) => { if (ev.event === "signature.submitted") checkRef.current(); },
+    token,
+  );
+
   // 폴링
   useEffect(() => {
     if (phase !== "waiting" || !token) { stopPoll(); return; }
-    pollRef.current = setInterval(async () => {
+    let checking = false;
+    const check = async () => {
+      if (checking || !pollRef.current) return;
+      checking = true;
       try {
         const r = await api.get<{ status: string }>(`/api/signature/poll/${token}`);
         if (r.data.status === "expired") { stopPoll(); setPhase("idle"); toast.error("링크 만료"); }
@@ -74,10 +86,13 @@ export default function TempSlotModal({ slot, hasData, memo: initMemo, onClose,
           setTimeout(onClose, 1500);
         }
       } catch { /* ignore transient */ }
-    }, 2000);
+      finally { checking = false; }
+    };
+    checkRef.current = check;
+    pollRef.current = setInterval(check, streamOpen ? STREAM_FALLBACK_POLL_MS : 2000);
     return () => stopPoll();
   // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [phase, token]);
+  }, [phase, token, streamOpen]);
 
   // 삭제
   const handleClear = () => {
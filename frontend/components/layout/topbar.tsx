@@ -1,5 +1,5 @@
 "use client";
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import { useRouter } from "next/navigation";
 import { Bell, LogOut, Menu, PenLine, HelpCircle } from "lucide-react";
 import { getUser, clearUser } from "@/lib/auth";
@@ -7,6 +7,7 @@ import { useQuery, useQueryClient } from "@tanstack/react-query";
 import { customersApi, api, authApi } from "@/lib/api";
 import TempSlotModal from "@/components/TempSlotModal";
 import SignPadUrlModal from "@/components/SignPadUrlModal";
+import { STREAM_FALLBACK_POLL_MS, useSignatureEvents } from "@/lib/signatureEvents";
 
 interface TopbarProps {
   leftOffset: number;
@@ -62,8 +63,15 @@ export default function Topbar({ leftOffset, isMobile, onMobileMenuToggle }: Top
   // eslint-disable-next-line react-hooks/exhaustive-deps
   }, []);
 
+  // 임시서명 저장 이벤트(SSE) → 슬롯/알림 즉시 갱신. 스트림 연결 중엔 알림 폴링 간격을 늘린다.
+  const padPollRef = useRef<() => void>(() => {});
+  const streamOpen = useSignatureEvents(!!user?.login_id, (ev) => {
+    if (ev.event === "temp_slot.saved" || ev.event === "pad.saved") fetchSlots();
+    if (ev.event === "pad.saved") padPollRef.current();
+  });
+
   // ── 서명패드(/sign/pad) 임시서명 저장 알림 — tenant별 분리, 중복 방지 ──────────
-  // 5~10초 간격 polling. 백엔드는 JWT tenant 의 '서명패드' 출처 슬롯만 반환한다.
+  // 8초 간격 polling(스트림 연결 중엔 15초 안전망). 백엔드는 JWT tenant 의 '서명패드' 출처 슬롯만 반환한다.
   // localStorage(seen 키 + init 플래그)로 같은 서명 반복 알림과 첫 진입 기존-서명 알림을 막는다.
   useEffect(() => {
     // 로그인 상태에서만 동작 (Topbar 자체가 인증 레이아웃에서만 마운트되지만 방어적으로 가드).
@@ -122,11 +130,12 @@ export default function Topbar({ leftOffset, isMobile, onMobileMenuToggle }: Top
       } catch { /* 네트워크/인증 일시 오류는 무시 */ }
     };
 
+    padPollRef.current = poll;
     poll();
-    const id = setInterval(poll, 8000);
+    const id = setInterval(poll, streamOpen ? STREAM_FALLBACK_POLL_MS : 8000);
     return () => { cancelled = true; clearInterval(id); };
   // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [user?.login_id, user?.tenant_id]);
+  }, [user?.login_id, user?.tenant_id, streamOpen]);
 
   // 만기 알림 건수 (배지용)
   const { data: expiryData } = useQuery({
@@ -813,6 +813,12 @@ export const memosApi = {
 // 일정 — per-date API (전체 시트 덮어쓰기 금지)
 export const eventsApi = {
   get: () => api.get<Record<string, string[]>>("/api/events"),
+  /** 기간(from~to) 일정. since 를 주면 그 버전 이후 바뀐 날짜만([] = 삭제). 변경 없으면 304. */
+  range: (from: string, to: string, since?: string) =>
+    api.get<Record<string, string[]>>("/api/events", {
+      params: since ? { from, to, since } : { from, to },
+      validateStatus: (s) => (s >= 200 && s < 300) || s === 304,
+    }),
   save: (dateStr: string, lines: string[]) =>
     api.post("/api/events", { date_str: dateStr, lines }),
   delete: (dateStr: string) => api.delete(`/api/events/${dateStr}`),
@@ -1162,13 +1168,21 @@ export interface SearchResult {
 export interface SearchResponse {
   query: string;
   type: string;
-  total: number;
+  /** 이번 페이지 결과 수(전체 일치 수가 아님 — 더 있으면 has_more). */
+  count: number;
   results: SearchResult[];
+  offset: number;
+  limit: number;
+  has_more: boolean;
+  timings_ms?: Record<string, number>;
 }
 
+/** 서버 페이지 상한 — offset 이 이보다 크면 422. */
+export const SEARCH_MAX_OFFSET = 1000;
+
 export const searchApi = {
-  search: (q: string, type: string = "all") =>
-    api.get<SearchResponse>("/api/search", { params: { q, type } }),
+  search: (q: string, type: string = "all", offset: number = 0, limit?: number) =>
+    api.get<SearchResponse>("/api/search", { params: { q, type, offset, ...(limit ? { limit } : {}) } }),
 };
 
 // ── OCR 스캔 ─────────────────────────────────────────────────────────────────
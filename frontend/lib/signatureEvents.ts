@@ -0,0 +1,103 @@
+/**
+ * 서명 이벤트 스트림 (GET /api/signature/stream, text/event-stream)
+ *
+ * 서명 제출/임시서명 저장을 서버가 바로 알려준다 — 2~8초 폴링 대신 이벤트가 오면 즉시 확인.
+ * EventSource 는 Authorization 헤더를 못 보내므로 fetch 스트리밍으로 읽는다.
+ * 서버가 수명(기본 5분) 뒤 연결을 닫으면 다시 연결하면서 토큰을 재검증받는다.
+ * 이벤트 전달은 best-effort 라 호출측은 느린 폴링을 안전망으로 유지한다(connected 일 때 간격만 늘림).
+ */
+import { useEffect, useRef, useState } from "react";
+
+export type SignatureEventName = "signature.submitted" | "temp_slot.saved" | "pad.saved";
+
+export interface SignatureEvent {
+  event: SignatureEventName;
+  data: { request_id?: string; type?: string; slot?: number };
+}
+
+/** 스트림이 열려 있을 때의 안전망 폴링 간격(ms). */
+export const STREAM_FALLBACK_POLL_MS = 15_000;
+
+const MAX_BACKOFF_MS = 30_000;
+
+function parseBlock(block: string): SignatureEvent | null {
+  let event = "";
+  let data = "";
+  for (const line of block.split("\n")) {
+    if (line.startsWith("event:")) event = line.slice(6).trim();
+    else if (line.startsWith("data:")) data += line.slice(5).trim();
+  }
+  if (!event) return null;
+  try {
+    return { event: event as SignatureEventName, data: data ? JSON.parse(data) : {} };
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * enabled 인 동안 스트림을 유지하고 이벤트마다 onEvent 호출. 반환값 = 현재 연결 여부.
+ * requestId 를 주면 그 서명 요청의 이벤트만 받는다(구독 전에 도착한 제출도 재전송됨).
+ */
+export function useSignatureEvents(
+  enabled: boolean,
+  onEvent: (ev: SignatureEvent) => void,
+  requestId?: string | null,
+): boolean {
+  const [connected, setConnected] = useState(false);
+  const onEventRef = useRef(onEvent);
+  onEventRef.current = onEvent;
+
+  useEffect(() => {
+    if (!enabled || typeof window === "undefined") { setConnected(false); return; }
+    const ctrl = new AbortController();
+    let backoff = 1000;
+    let timer: ReturnType<typeof setTimeout> | null = null;
+
+    const connect = async () => {
+      const token = localStorage.getItem("access_token");
+      if (!token) return;
+      const qs = requestId ? `?request_id=${encodeURIComponent(requestId)}` : "";
+      try {
+        const res = await fetch(`/api/signature/stream${qs}`, {
+          headers: { Authorization: `Bearer ${token}`, Accept: "text/event-stream" },
+          signal: ctrl.signal,
+          cache: "no-store",
+        });
+        if (res.status === 401 || res.status === 403) return;   // 인증 만료 — 폴링(axios)이 처리
+        if (!res.ok || !res.body) throw new Error(`stream ${res.status}`);
+        setConnected(true);
+        backoff = 1000;
+        const reader = res.body.getReader();
+        const decoder = new TextDecoder();
+        let buf = "";
+        for (;;) {
+          const { value, done } = await reader.read();
+          if (done) break;
+          buf += decoder.decode(value, { stream: true }).replace(/\r\n/g, "\n");
+          let idx;
+          while ((idx = buf.indexOf("\n\n")) >= 0) {
+            const ev = parseBlock(buf.slice(0, idx));
+            buf = buf.slice(idx + 2);
+            if (ev) onEventRef.current(ev);
+          }
+        }
+      } catch {
+        if (ctrl.signal.aborted) return;
+        backoff = Math.min(backoff * 2, MAX_BACKOFF_MS);
+      }
+      if (ctrl.signal.aborted) return;
+      setConnected(false);
+      timer = setTimeout(connect, backoff);
+    };
+
+    connect();
+    return () => {
+      ctrl.abort();
+      if (timer) clearTimeout(timer);
+      setConnected(false);
+    };
+  }, [enabled, requestId]);
+
+  return connected;
+}
@@ -1,6 +1,6 @@
 # utils/document.py
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
 # 도장 생성용 기본 설정값
 circle_path = "templates/원형 배경.png"
@@ -34,29 +34,30 @@ def create_seal(circle_path_path: str, name: str, font_path_path: str, seal_size
     if len(name) > 4:
         name = name[:4]
 
+    # ── 같은 이름·자산(폰트/배경 파일 버전·크기) 도장은 1회만 렌더(LRU) ──
+    from backend.services import seal_render_cache as _seal_cache
+    version = _seal_cache.asset_version(circle_path_path, font_path_path, params=(seal_size_px,))
+    img = _seal_cache.get_cache().get_or_render(
+        ("utils.document", name, version),
+        lambda: _render_seal(circle_path_path, name, font_path_path, seal_size_px),
+    )
+    return img.copy()   # 호출측이 수정해도 캐시 원본은 그대로
+
+
+def _render_seal(circle_path_path: str, name: str, font_path_path: str, seal_size_px: int):
+    """create_seal 의 실제 렌더(캐시 미스 시). name 은 정리(한글만·4글자)된 값."""
+    from backend.services.seal_render_cache import get_circle, get_font
+
     n_chars = len(name)
 
     # ── 1) 기본 캔버스 생성 ───────────────────────────────────────
     canvas_size = seal_size_px
     base = Image.new("RGBA", (canvas_size, canvas_size), (0, 0, 0, 0))
 
-    # ── 2) 원형 배경 로드 + 5% 확대 후 중앙 배치 ─────────────────
-    try:
-        circle_img = Image.open(circle_path_path).convert("RGBA")
-    except Exception:
-        # 파일 없으면 간단한 빨간 원 직접 그림
-        circle_img = Image.new("RGBA", (canvas_size, canvas_size), (0, 0, 0, 0))
-        d = ImageDraw.Draw(circle_img)
-        margin = int(canvas_size * 0.08)
-        d.ellipse(
-            (margin, margin, canvas_size - margin, canvas_size - margin),
-            outline=(180, 0, 0, 255),
-            width=int(canvas_size * 0.05),
-        )
-
-    scale = 1.05  # 원 크기 5% 확대
-    circle_size = int(canvas_size * scale)
-    circle_img = circle_img.resize((circle_size, circle_size), Image.LANCZOS)
+    # ── 2) 원형 배경 로드(공유) + 5% 확대 후 중앙 배치 ─────────────
+    # 파일 없으면 간단한 빨간 원 직접 그림(get_circle 내부)
+    circle_img = get_circle(circle_path_path, canvas_size, 1.05)  # 원 크기 5% 확대
+    circle_size = circle_img.size[0]
 
     offset_x = (canvas_size - circle_size) // 2
     offset_y = (canvas_size - circle_size) // 2
@@ -99,10 +100,7 @@ def create_seal(circle_path_path: str, name: str, font_path_path: str, seal_size
         if font_size < 10:
             font_size = 10
 
-        try:
-            font = ImageFont.truetype(font_path_path, font_size)
-        except Exception:
-            font = ImageFont.load_default()
+        font = get_font(font_path_path, font_size)   # 폰트 객체는 크기별 1회 로드
 
         # 각 글자 크기 측정
         char_sizes = []